@@ -7,7 +7,7 @@ external systems like databases, APIs, file systems, etc.
 from .comfyui_folder_adapter import ComfyUIFolderAdapter
 from .file_cache_adapter import FileCacheAdapter
 
-__all__ = [
+__all__ = (
     "ComfyUIFolderAdapter",
     "FileCacheAdapter",
-]
\ No newline at end of file
+)
\ No newline at end of file
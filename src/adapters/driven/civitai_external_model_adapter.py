@@ -2,14 +2,19 @@
 
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 import aiohttp
 from aiohttp import ClientTimeout, ClientError
 
+from . import json_codec
+from .rate_limiter import TokenBucket
 from ...domain.ports.driven.external_model_port import (
     ExternalModelPort, 
+    CachedResponse, 
     ExternalAPIError, 
     RateLimitError, 
     PlatformUnavailableError
@@ -24,6 +29,120 @@ from ...domain.entities.external_model import (
 
 logger = logging.getLogger(__name__)
 
+# CivitAI to ComfyUI model type mapping, built once and read-only
+_MODEL_TYPE_MAPPING: Mapping[str, ComfyUIModelType] = MappingProxyType({
+    "Checkpoint": ComfyUIModelType.CHECKPOINT,
+    "LORA": ComfyUIModelType.LORA,
+    "LoCon": ComfyUIModelType.LORA,
+    "TextualInversion": ComfyUIModelType.EMBEDDING,
+    "Hypernetwork": ComfyUIModelType.EMBEDDING,
+    "AestheticGradient": ComfyUIModelType.EMBEDDING,
+    "VAE": ComfyUIModelType.VAE,
+    "ControlNet": ComfyUIModelType.CONTROLNET,
+    "Upscaler": ComfyUIModelType.UPSCALER,
+    "MotionModule": ComfyUIModelType.UNKNOWN,
+    "Poses": ComfyUIModelType.UNKNOWN,
+    "Wildcards": ComfyUIModelType.UNKNOWN,
+    "Other": ComfyUIModelType.UNKNOWN
+})
+
+# ComfyUI model folder mapping
+_FOLDER_MAPPING: Mapping[ComfyUIModelType, str] = MappingProxyType({
+    ComfyUIModelType.CHECKPOINT: "checkpoints",
+    ComfyUIModelType.LORA: "loras",
+    ComfyUIModelType.VAE: "vae",
+    ComfyUIModelType.EMBEDDING: "embeddings",
+    ComfyUIModelType.CONTROLNET: "controlnet",
+    ComfyUIModelType.UPSCALER: "upscale_models"
+})
+
+# Pickle-based formats are only accepted for these model types
+_LEGACY_FORMATS = ("ckpt", "pt", "bin")
+_LEGACY_FORMAT_TYPES = frozenset({
+    ComfyUIModelType.CHECKPOINT,
+    ComfyUIModelType.LORA,
+    ComfyUIModelType.VAE,
+    ComfyUIModelType.EMBEDDING
+})
+_UNSUPPORTED_TYPE_FORMATS: FrozenSet[Tuple[ComfyUIModelType, str]] = frozenset(
+    (model_type, file_format)
+    for model_type in ComfyUIModelType
+    if model_type not in _LEGACY_FORMAT_TYPES
+    for file_format in _LEGACY_FORMATS
+)
+
+# ComfyUI loader nodes needed per model type
+_REQUIRED_NODES: Mapping[ComfyUIModelType, Tuple[str, ...]] = MappingProxyType({
+    ComfyUIModelType.CHECKPOINT: ("CheckpointLoaderSimple",),
+    ComfyUIModelType.LORA: ("LoraLoader",),
+    ComfyUIModelType.VAE: ("VAELoader",),
+    ComfyUIModelType.EMBEDDING: ("CLIPTextEncode",),
+    ComfyUIModelType.CONTROLNET: ("ControlNetLoader",),
+    ComfyUIModelType.UPSCALER: ("UpscaleModelLoader",)
+})
+
+# Reverse lookups used to build search filters
+_CIVITAI_TYPES_BY_COMFYUI_TYPE: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    comfyui_type.value: tuple(
+        civitai_type for civitai_type, mapped in _MODEL_TYPE_MAPPING.items()
+        if mapped is comfyui_type
+    )
+    for comfyui_type in dict.fromkeys(_MODEL_TYPE_MAPPING.values())
+})
+_COMFYUI_COMPATIBLE_CIVITAI_TYPES: Tuple[str, ...] = tuple(
+    civitai_type for civitai_type, mapped in _MODEL_TYPE_MAPPING.items()
+    if mapped is not ComfyUIModelType.UNKNOWN
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_civitai_datetime(value: str) -> Optional[datetime]:
+    """Parse a CivitAI ISO-8601 timestamp such as ``2023-01-01T12:00:00Z``.
+    
+    Results are cached because items in one response often share
+    timestamps.
+    
+    Args:
+        value: Timestamp string from the API
+        
+    Returns:
+        The parsed datetime, or None if the value is not a valid timestamp
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compatibility_notes(
+    model_type: ComfyUIModelType, file_format: Optional[str], base_model: str
+) -> Optional[str]:
+    """Build compatibility notes; cached as search results repeat few combinations.
+    
+    Args:
+        model_type: The ComfyUI model type
+        file_format: The file format
+        base_model: The base model
+        
+    Returns:
+        Compatibility notes or None
+    """
+    notes = []
+    
+    if model_type == ComfyUIModelType.UNKNOWN:
+        notes.append("Model type not supported by ComfyUI")
+    
+    if file_format == "ckpt":
+        notes.append("Consider using safetensors version for better security")
+    
+    if base_model and "SDXL" in base_model:
+        notes.append("Requires SDXL-compatible workflow")
+    elif base_model and "SD 2" in base_model:
+        notes.append("Requires SD 2.x-compatible workflow")
+    
+    return "; ".join(notes) if notes else None
+
 
 class CivitAIExternalModelAdapter(ExternalModelPort):
     """Adapter for fetching external models from CivitAI API.
@@ -33,45 +152,41 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
     """
     
     BASE_URL = "https://civitai.com/api/v1"
+    MODEL_URL_PREFIX = f"{BASE_URL}/models/"
     DEFAULT_TIMEOUT = 30
-    RATE_LIMIT_DELAY = 1.0  # Seconds between requests
+    RATE_LIMIT_DELAY = 1.0  # Seconds between requests until CivitAI reports its quota
     MAX_RETRIES = 3
+    MAX_CONNECTIONS = 10  # Pooled connections kept by the session
+    MAX_CONNECTIONS_PER_HOST = 8
+    CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+    KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open
+    DNS_CACHE_TTL = 300  # Seconds a resolved host address is reused
     
     # CivitAI to ComfyUI model type mapping
-    MODEL_TYPE_MAPPING = {
-        "Checkpoint": ComfyUIModelType.CHECKPOINT,
-        "LORA": ComfyUIModelType.LORA,
-        "LoCon": ComfyUIModelType.LORA,
-        "TextualInversion": ComfyUIModelType.EMBEDDING,
-        "Hypernetwork": ComfyUIModelType.EMBEDDING,
-        "AestheticGradient": ComfyUIModelType.EMBEDDING,
-        "VAE": ComfyUIModelType.VAE,
-        "ControlNet": ComfyUIModelType.CONTROLNET,
-        "Upscaler": ComfyUIModelType.UPSCALER,
-        "MotionModule": ComfyUIModelType.UNKNOWN,
-        "Poses": ComfyUIModelType.UNKNOWN,
-        "Wildcards": ComfyUIModelType.UNKNOWN,
-        "Other": ComfyUIModelType.UNKNOWN
-    }
+    MODEL_TYPE_MAPPING = _MODEL_TYPE_MAPPING
     
     # ComfyUI model folder mapping
-    FOLDER_MAPPING = {
-        ComfyUIModelType.CHECKPOINT: "checkpoints",
-        ComfyUIModelType.LORA: "loras",
-        ComfyUIModelType.VAE: "vae",
-        ComfyUIModelType.EMBEDDING: "embeddings",
-        ComfyUIModelType.CONTROLNET: "controlnet",
-        ComfyUIModelType.UPSCALER: "upscale_models"
-    }
+    FOLDER_MAPPING = _FOLDER_MAPPING
     
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        connector_limit: int = MAX_CONNECTIONS,
+        limit_per_host: int = MAX_CONNECTIONS_PER_HOST
+    ):
         """Initialize CivitAI external model adapter.
         
         Args:
             timeout: HTTP request timeout in seconds
+            connector_limit: Maximum pooled connections in total
+            limit_per_host: Maximum pooled connections to one host
         """
-        self._timeout = ClientTimeout(total=timeout)
-        self._last_request_time = 0.0
+        self._timeout = ClientTimeout(
+            total=timeout, connect=self.CONNECT_TIMEOUT, sock_read=timeout
+        )
+        self._connector_limit = connector_limit
+        self._limit_per_host = limit_per_host
+        self._rate_limiter = TokenBucket(self.RATE_LIMIT_DELAY)
         self._session: Optional[aiohttp.ClientSession] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -79,6 +194,12 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self._connector_limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=self.DNS_CACHE_TTL
+                ),
                 headers={
                     "User-Agent": "ComfyUI-Asset-Manager/1.0",
                     "Accept": "application/json"
@@ -86,16 +207,6 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             )
         return self._session    
 
-    async def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
-        
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            await asyncio.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        
-        self._last_request_time = asyncio.get_event_loop().time()
-    
     async def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Make HTTP request with error handling and retries.
         
@@ -106,27 +217,68 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         Returns:
             Response data as dictionary, None if failed
             
+        Raises:
+            ExternalAPIError: If API request fails
+            RateLimitError: If rate limit is exceeded
+            PlatformUnavailableError: If platform is unavailable
+        """
+        response = await self._make_conditional_request(url, params)
+        return response.value
+    
+    async def _make_conditional_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        validators: Optional[CachedResponse] = None
+    ) -> CachedResponse[Dict[str, Any]]:
+        """Make HTTP request, sending conditional headers when validators are given.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            validators: Previous response whose ETag/Last-Modified should be sent
+            
+        Returns:
+            Cached response with the data and validators; on 304 the response
+            is marked ``not_modified`` and the body is not read
+            
         Raises:
             ExternalAPIError: If API request fails
             RateLimitError: If rate limit is exceeded
             PlatformUnavailableError: If platform is unavailable
         """
         session = await self._get_session()
+        headers = validators.conditional_headers() if validators else {}
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                await self._rate_limit()
-                
-                async with session.get(url, params=params) as response:
+                async with (
+                    self._rate_limiter.reserve(),
+                    session.get(url, params=params, headers=headers or None) as response
+                ):
+                    self._rate_limiter.update_from_headers(response.headers)
+                    # Drain error bodies too, so the keep-alive connection is
+                    # returned to the pool instead of being closed
+                    body = await response.read()
                     if response.status == 200:
-                        return await response.json()
+                        return CachedResponse.from_headers(
+                            await json_codec.loads_async(body), response.headers
+                        )
+                    elif response.status == 304 and validators:
+                        return CachedResponse(
+                            value=None,
+                            etag=validators.etag,
+                            last_modified=validators.last_modified,
+                            not_modified=True
+                        )
                     elif response.status == 404:
                         logger.debug(f"CivitAI: Model not found (404) for URL: {url}")
-                        return None
+                        return CachedResponse(value=None)
                     elif response.status == 429:
                         # Rate limited
                         retry_after = int(response.headers.get('Retry-After', 60))
                         logger.warning(f"CivitAI: Rate limited, retry after {retry_after} seconds")
+                        self._rate_limiter.back_off(retry_after)
                         raise RateLimitError("civitai", retry_after)
                     elif response.status >= 500:
                         # Server error
@@ -175,7 +327,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             
             # Extract model type and map to ComfyUI type
             model_type_str = data.get("type", "Other")
-            comfyui_model_type = self.MODEL_TYPE_MAPPING.get(model_type_str, ComfyUIModelType.UNKNOWN)
+            comfyui_model_type = _MODEL_TYPE_MAPPING.get(model_type_str, ComfyUIModelType.UNKNOWN)
             
             # Extract tags
             tags = [tag.get("name", "") for tag in data.get("tags", []) if tag.get("name")]
@@ -185,18 +337,8 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             rating = data.get("stats", {}).get("rating")
             
             # Extract dates
-            created_at_str = data.get("createdAt", "")
-            updated_at_str = data.get("updatedAt", "")
-            
-            try:
-                created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                created_at = datetime.now()
-            
-            try:
-                updated_at = datetime.fromisoformat(updated_at_str.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                updated_at = created_at
+            created_at = _parse_civitai_datetime(data.get("createdAt", "")) or datetime.now()
+            updated_at = _parse_civitai_datetime(data.get("updatedAt", "")) or created_at
             
             # Extract thumbnail
             images = data.get("modelVersions", [{}])[0].get("images", [])
@@ -235,7 +377,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             
             # Determine ComfyUI compatibility
             is_compatible = self._is_comfyui_compatible(comfyui_model_type, file_format, base_model)
-            model_folder = self.FOLDER_MAPPING.get(comfyui_model_type) if is_compatible else None
+            model_folder = _FOLDER_MAPPING.get(comfyui_model_type) if is_compatible else None
             
             compatibility = ComfyUICompatibility(
                 is_compatible=is_compatible,
@@ -310,25 +452,12 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         Returns:
             True if compatible with ComfyUI
         """
-        # Unknown types are not compatible
-        if model_type == ComfyUIModelType.UNKNOWN:
-            return False
-        
-        # Prefer safetensors format
-        if file_format == "safetensors":
-            return True
-        
-        # Accept other common formats for certain types
-        if file_format in ["ckpt", "pt", "bin"]:
-            return model_type in [
-                ComfyUIModelType.CHECKPOINT,
-                ComfyUIModelType.LORA,
-                ComfyUIModelType.VAE,
-                ComfyUIModelType.EMBEDDING
-            ]
-        
-        # Default to compatible if we can't determine format
-        return True
+        # Unknown types are not compatible; every other combination is,
+        # including unrecognized formats, unless it is listed as unsupported
+        return (
+            model_type is not ComfyUIModelType.UNKNOWN
+            and (model_type, file_format) not in _UNSUPPORTED_TYPE_FORMATS
+        )
     
     def _get_compatibility_notes(self, model_type: ComfyUIModelType, file_format: Optional[str], base_model: str) -> Optional[str]:
         """Get compatibility notes for a model.
@@ -341,20 +470,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         Returns:
             Compatibility notes or None
         """
-        notes = []
-        
-        if model_type == ComfyUIModelType.UNKNOWN:
-            notes.append("Model type not supported by ComfyUI")
-        
-        if file_format == "ckpt":
-            notes.append("Consider using safetensors version for better security")
-        
-        if base_model and "SDXL" in base_model:
-            notes.append("Requires SDXL-compatible workflow")
-        elif base_model and "SD 2" in base_model:
-            notes.append("Requires SD 2.x-compatible workflow")
-        
-        return "; ".join(notes) if notes else None
+        return _compatibility_notes(model_type, file_format, base_model)
     
     def _get_required_nodes(self, model_type: ComfyUIModelType) -> List[str]:
         """Get required ComfyUI nodes for a model type.
@@ -365,16 +481,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         Returns:
             List of required node names
         """
-        node_mapping = {
-            ComfyUIModelType.CHECKPOINT: ["CheckpointLoaderSimple"],
-            ComfyUIModelType.LORA: ["LoraLoader"],
-            ComfyUIModelType.VAE: ["VAELoader"],
-            ComfyUIModelType.EMBEDDING: ["CLIPTextEncode"],
-            ComfyUIModelType.CONTROLNET: ["ControlNetLoader"],
-            ComfyUIModelType.UPSCALER: ["UpscaleModelLoader"]
-        }
-        
-        return node_mapping.get(model_type, [])
+        return list(_REQUIRED_NODES.get(model_type, ()))
     
     async def search_models(
         self, 
@@ -417,9 +524,9 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             if "model_type" in filters:
                 # Map ComfyUI model type to CivitAI type
                 comfyui_type = filters["model_type"]
-                civitai_types = [k for k, v in self.MODEL_TYPE_MAPPING.items() if v.value == comfyui_type]
+                civitai_types = _CIVITAI_TYPES_BY_COMFYUI_TYPE.get(comfyui_type)
                 if civitai_types:
-                    params["types"] = civitai_types
+                    params["types"] = list(civitai_types)
             
             if "base_model" in filters:
                 params["baseModels"] = [filters["base_model"]]
@@ -432,9 +539,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             
             if "comfyui_compatible" in filters and filters["comfyui_compatible"]:
                 # Filter for ComfyUI-compatible types
-                compatible_types = [k for k, v in self.MODEL_TYPE_MAPPING.items() 
-                                  if v != ComfyUIModelType.UNKNOWN]
-                params["types"] = compatible_types
+                params["types"] = list(_COMFYUI_COMPATIBLE_CIVITAI_TYPES)
         
         url = f"{self.BASE_URL}/models"
         
@@ -471,7 +576,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
         if platform != ExternalPlatform.CIVITAI:
             return None
         
-        url = f"{self.BASE_URL}/models/{model_id}"
+        url = self.MODEL_URL_PREFIX + str(model_id)
         
         try:
             response_data = await self._make_request(url)
@@ -484,6 +589,50 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             logger.error(f"Failed to get CivitAI model details: {e}")
             raise
     
+    async def get_model_details_conditional(
+        self,
+        platform: ExternalPlatform,
+        model_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None
+    ) -> CachedResponse[ExternalModel]:
+        """Get model details, skipping the payload when it has not changed.
+        
+        Args:
+            platform: Must be CIVITAI
+            model_id: CivitAI model ID
+            etag: ETag returned by a previous read (optional)
+            last_modified: Last-Modified value returned by a previous read (optional)
+            
+        Returns:
+            Cached response with the model, or a ``not_modified`` response on 304
+            
+        Raises:
+            ExternalAPIError: If API request fails
+        """
+        if platform != ExternalPlatform.CIVITAI:
+            return CachedResponse(value=None)
+        
+        url = self.MODEL_URL_PREFIX + str(model_id)
+        validators = CachedResponse(value=None, etag=etag, last_modified=last_modified)
+        
+        try:
+            response = await self._make_conditional_request(
+                url, validators=validators if validators.has_validators else None
+            )
+            if response.not_modified or not response.value:
+                return response
+            
+            return CachedResponse(
+                value=self._parse_civitai_model(response.value),
+                etag=response.etag,
+                last_modified=response.last_modified
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to get CivitAI model details: {e}")
+            raise
+    
     async def get_popular_models(
         self, 
         platform: ExternalPlatform, 
@@ -578,7 +727,7 @@ class CivitAIExternalModelAdapter(ExternalModelPort):
             "model_details": True,
             "popular_models": True,
             "recent_models": True,
-            "model_types": list(self.MODEL_TYPE_MAPPING.keys()),
+            "model_types": list(_MODEL_TYPE_MAPPING),
             "supported_formats": ["safetensors", "ckpt", "pt", "bin"],
             "rate_limits": {
                 "requests_per_second": 1.0,
@@ -3,12 +3,16 @@
 import asyncio
 import hashlib
 import logging
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 import aiohttp
 from aiohttp import ClientTimeout, ClientError
 
+from . import json_codec
+from .rate_limiter import TokenBucket
 from ...domain.ports.driven.external_metadata_port import ExternalMetadataPort
 from ...domain.entities.external_metadata import ExternalMetadata, CivitAIMetadata
 
@@ -24,25 +28,58 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
     """
     
     BASE_URL = "https://civitai.com/api/v1"
+    HASH_URL_PREFIX = f"{BASE_URL}/model-versions/by-hash/"
+    MODEL_URL_PREFIX = f"{BASE_URL}/models/"
     DEFAULT_TIMEOUT = 30
-    RATE_LIMIT_DELAY = 1.0  # Seconds between requests
+    RATE_LIMIT_DELAY = 1.0  # Seconds between requests until CivitAI reports its quota
     MAX_RETRIES = 3
+    MAX_CONNECTIONS = 10  # Pooled connections kept by the session
+    MAX_CONNECTIONS_PER_HOST = 8
+    CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+    KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open
+    DNS_CACHE_TTL = 300  # Seconds a resolved host address is reused
+    METADATA_CACHE_TTL = 3600  # Seconds a found hash lookup is remembered
+    MAX_METADATA_CACHE_ENTRIES = 1024
+    MAX_CONCURRENT_LOOKUPS = 10  # Hash lookups in flight during a batch
     
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        connector_limit: int = MAX_CONNECTIONS,
+        limit_per_host: int = MAX_CONNECTIONS_PER_HOST
+    ):
         """Initialize CivitAI metadata adapter.
         
         Args:
             timeout: HTTP request timeout in seconds
+            connector_limit: Maximum pooled connections in total
+            limit_per_host: Maximum pooled connections to one host
         """
-        self._timeout = ClientTimeout(total=timeout)
-        self._last_request_time = 0.0
+        self._timeout = ClientTimeout(
+            total=timeout, connect=self.CONNECT_TIMEOUT, sock_read=timeout
+        )
+        self._connector_limit = connector_limit
+        self._limit_per_host = limit_per_host
+        self._rate_limiter = TokenBucket(self.RATE_LIMIT_DELAY)
         self._session: Optional[aiohttp.ClientSession] = None
+        # Found metadata per hash with the monotonic time it was fetched,
+        # least recently used first
+        self._metadata_cache: "OrderedDict[str, Tuple[float, CivitAIMetadata]]" = OrderedDict()
+        # Lookups currently running, by hash; concurrent callers for the
+        # same hash wait for the running lookup instead of starting one
+        self._inflight: Dict[str, "asyncio.Future[Optional[CivitAIMetadata]]"] = {}
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self._connector_limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=self.DNS_CACHE_TTL
+                ),
                 headers={
                     "User-Agent": "ComfyUI-Asset-Manager/1.0",
                     "Accept": "application/json"
@@ -52,13 +89,7 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
     
     async def _rate_limit(self) -> None:
         """Apply rate limiting between requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
-        
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            await asyncio.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        
-        self._last_request_time = asyncio.get_event_loop().time()
+        await self._rate_limiter.acquire()
     
     async def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Make HTTP request with error handling and retries.
@@ -74,19 +105,26 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                await self._rate_limit()
-                
-                async with session.get(url, params=params) as response:
+                async with self._rate_limiter.reserve(), session.get(url, params=params) as response:
+                    self._rate_limiter.update_from_headers(response.headers)
+                    # Drain error bodies too, so the keep-alive connection is
+                    # returned to the pool for the follow-up model request
+                    body = await response.read()
                     if response.status == 200:
-                        return await response.json()
+                        return await json_codec.loads_async(body)
                     elif response.status == 404:
                         logger.debug(f"CivitAI: Model not found (404) for URL: {url}")
                         return None
                     elif response.status == 429:
-                        # Rate limited, wait longer
-                        retry_after = int(response.headers.get('Retry-After', 60))
-                        logger.warning(f"CivitAI: Rate limited, waiting {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
+                        # Rate limited: hold every request until CivitAI allows
+                        # more, backing off exponentially without Retry-After
+                        retry_after = response.headers.get('Retry-After')
+                        delay = (
+                            int(retry_after) if retry_after is not None
+                            else self.RATE_LIMIT_DELAY * 2 ** (attempt + 1)
+                        )
+                        logger.warning(f"CivitAI: Rate limited, waiting {delay} seconds")
+                        self._rate_limiter.back_off(delay)
                         continue
                     else:
                         logger.warning(f"CivitAI: HTTP {response.status} for URL: {url}")
@@ -116,34 +154,29 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
         """
         try:
             # Extract model information
-            model_id = data.get("id", 0)
-            name = data.get("name", "")
-            description = data.get("description", "")
-            
-            # Extract tags
-            tags = []
-            if "tags" in data:
-                tags = [tag.get("name", "") for tag in data["tags"] if tag.get("name")]
+            get = data.get
+            model_id = get("id", 0)
+            name = get("name", "")
+            description = get("description", "")
             
-            # Extract images
-            images = []
-            if "images" in data:
-                images = [img.get("url", "") for img in data["images"] if img.get("url")]
+            # Extract tag names and image URLs, skipping blank ones
+            tags = [tag_name for tag in get("tags") or () if (tag_name := tag.get("name"))]
+            images = [url for img in get("images") or () if (url := img.get("url"))]
             
             # Extract stats
-            stats = data.get("stats", {})
+            stats = get("stats", {})
             download_count = stats.get("downloadCount", 0)
             rating = stats.get("rating", 0.0)
             
             # Extract creator info
-            creator_info = data.get("creator", {})
-            creator = creator_info.get("username", "")
+            creator = get("creator", {}).get("username", "")
             
             # Extract version info (use first version if available)
             version_name = ""
             base_model = ""
-            if "modelVersions" in data and data["modelVersions"]:
-                first_version = data["modelVersions"][0]
+            versions = get("modelVersions")
+            if versions:
+                first_version = versions[0]
                 version_name = first_version.get("name", "")
                 base_model = first_version.get("baseModel", "")
             
@@ -182,9 +215,54 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
             )
         return None
     
+    async def fetch_metadata_bulk(self, identifiers: List[str]) -> Dict[str, ExternalMetadata]:
+        """Fetch metadata for several model hashes concurrently.
+        
+        Args:
+            identifiers: Model hashes to lookup
+            
+        Returns:
+            Dictionary mapping each hash with metadata to its metadata
+        """
+        fetched = await self.fetch_civitai_metadata_many(identifiers)
+        now = datetime.now()
+        return {
+            identifier: ExternalMetadata(model_hash=identifier, civitai=civitai_metadata, cached_at=now)
+            for identifier, civitai_metadata in zip(identifiers, fetched)
+            if civitai_metadata
+        }
+    
+    async def fetch_civitai_metadata_many(
+        self,
+        model_hashes: List[str],
+        concurrency: int = MAX_CONCURRENT_LOOKUPS
+    ) -> List[Optional[CivitAIMetadata]]:
+        """Fetch metadata for several model hashes with bounded concurrency.
+        
+        At most ``concurrency`` lookups run at once; the rate limiter still
+        spaces the individual requests.
+        
+        Args:
+            model_hashes: SHA256 hashes of the model files
+            concurrency: Maximum number of lookups in flight
+            
+        Returns:
+            CivitAI metadata or None for each hash, in the same order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(model_hash: str) -> Optional[CivitAIMetadata]:
+            async with semaphore:
+                return await self.fetch_civitai_metadata(model_hash)
+        
+        return list(await asyncio.gather(*(fetch_one(model_hash) for model_hash in model_hashes)))
+    
     async def fetch_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
         """Fetch metadata from CivitAI using model hash.
         
+        Found metadata is remembered for ``METADATA_CACHE_TTL`` seconds, and
+        concurrent lookups of the same hash share one request.
+        
         Args:
             model_hash: SHA256 hash of the model file
             
@@ -195,8 +273,47 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
             logger.warning("CivitAI: Empty model hash provided")
             return None
         
+        key = model_hash.lower()
+        cached = self._metadata_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self.METADATA_CACHE_TTL:
+                self._metadata_cache.move_to_end(key)
+                return cached[1]
+            del self._metadata_cache[key]
+        
+        flight = self._inflight.get(key)
+        if flight is not None:
+            # Shield the shared lookup so a cancelled waiter does not cancel it
+            return await asyncio.shield(flight)
+        
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = flight
+        try:
+            metadata = await self._lookup_civitai_metadata(model_hash)
+            flight.set_result(metadata)
+        finally:
+            del self._inflight[key]
+            if not flight.done():
+                # The lookup was cancelled; waiters get no metadata
+                flight.set_result(None)
+        
+        if metadata is not None:
+            self._metadata_cache[key] = (time.monotonic(), metadata)
+            while len(self._metadata_cache) > self.MAX_METADATA_CACHE_ENTRIES:
+                self._metadata_cache.popitem(last=False)
+        return metadata
+    
+    async def _lookup_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
+        """Look up a model hash on CivitAI without caching.
+        
+        Args:
+            model_hash: SHA256 hash of the model file
+            
+        Returns:
+            CivitAI metadata if found, None otherwise
+        """
         # CivitAI API endpoint for hash-based lookup
-        url = f"{self.BASE_URL}/model-versions/by-hash/{model_hash}"
+        url = self.HASH_URL_PREFIX + model_hash
         
         logger.debug(f"CivitAI: Fetching metadata for hash: {model_hash}")
         
@@ -206,7 +323,7 @@ class CivitAIMetadataAdapter(ExternalMetadataPort):
                 # Get the full model data using model ID
                 model_id = response_data.get("modelId")
                 if model_id:
-                    model_url = f"{self.BASE_URL}/models/{model_id}"
+                    model_url = self.MODEL_URL_PREFIX + str(model_id)
                     model_data = await self._make_request(model_url)
                     if model_data:
                         return self._parse_civitai_response(model_data)
@@ -1,10 +1,12 @@
 """Combined external model adapter that delegates to platform-specific adapters."""
 
 import logging
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from ...domain.ports.driven.external_model_port import (
     ExternalModelPort, 
+    CachedResponse, 
     ExternalAPIError, 
     RateLimitError, 
     PlatformUnavailableError
@@ -109,6 +111,38 @@ class CombinedExternalModelAdapter(ExternalModelPort):
             logger.error(f"Get model details failed for platform {platform}: {e}")
             raise
     
+    async def get_model_details_conditional(
+        self,
+        platform: ExternalPlatform,
+        model_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None
+    ) -> CachedResponse[ExternalModel]:
+        """Get model details unless they are unchanged since a previous read.
+        
+        Args:
+            platform: The external platform to query
+            model_id: The platform-specific ID of the model
+            etag: ETag returned by a previous read (optional)
+            last_modified: Last-Modified value returned by a previous read (optional)
+            
+        Returns:
+            Cached response with the model, or a ``not_modified`` response
+            
+        Raises:
+            ExternalAPIError: If external API call fails
+        """
+        adapter = self._get_adapter(platform)
+        if not adapter:
+            logger.warning(f"No adapter available for platform: {platform}")
+            return CachedResponse(value=None)
+        
+        try:
+            return await adapter.get_model_details_conditional(platform, model_id, etag, last_modified)
+        except Exception as e:
+            logger.error(f"Get model details failed for platform {platform}: {e}")
+            raise
+    
     async def get_popular_models(
         self, 
         platform: ExternalPlatform, 
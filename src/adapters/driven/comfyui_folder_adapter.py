@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Hashable, List, Dict, Optional, Tuple
 import uuid
 
 from ...domain.ports.driven.folder_repository_port import FolderRepositoryPort
@@ -83,6 +83,16 @@ class ComfyUIFolderAdapter(FolderRepositoryPort):
         
         return folders
     
+    def _get_configured_folder_paths(self) -> List[str]:
+        """Get every configured folder path for the supported model types."""
+        paths = []
+        for folder_name in self._get_model_type_mapping():
+            try:
+                paths.extend(self._folder_paths.get_folder_paths(folder_name))
+            except Exception:
+                continue
+        return paths
+    
     def _generate_folder_id(self, folder_path: str, model_type: ModelType) -> str:
         """Generate a unique ID for a folder based on path and type."""
         # Use a combination of model type and path hash for consistent IDs
@@ -126,6 +136,28 @@ class ComfyUIFolderAdapter(FolderRepositoryPort):
         self._folders_cache = self._discover_folders()
         return list(self._folders_cache.values())
     
+    def get_change_token(self) -> Optional[Hashable]:
+        """Get a token built from the modification times of the model folders.
+        
+        Adding or removing a model file updates its folder's mtime, which
+        also changes the folder's model count, so one ``stat`` per configured
+        folder is enough to detect changes without rescanning.
+        
+        Returns:
+            Tuple of (path, mtime_ns) pairs, or None when ComfyUI is unavailable
+        """
+        if self._folder_paths is None:
+            return None
+        
+        token: List[Tuple[str, Optional[int]]] = []
+        for folder_path in self._get_configured_folder_paths():
+            try:
+                mtime_ns = os.stat(folder_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            token.append((folder_path, mtime_ns))
+        return tuple(token)
+    
     def get_folder_structure(self) -> Dict[str, Folder]:
         """Get the complete folder structure.
         
@@ -132,24 +132,18 @@ class ComfyUIOutputAdapter(FilesystemOutputAdapter):
         default_output = Path(self.comfyui_base_path) / "output"
         return str(default_output)
     
-    def extract_workflow_metadata(self, output: Output) -> Optional[Dict[str, Any]]:
-        """Extract ComfyUI workflow metadata from the output file.
+    def _enhance_workflow_metadata(self, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Add ComfyUI-specific details to extracted workflow metadata.
         
-        This method extends the base implementation with ComfyUI-specific
-        metadata extraction and enhancement.
+        Used by both ``extract_workflow_metadata`` and
+        ``extract_and_thumbnail`` of the base adapter.
         
         Args:
-            output: The output to extract metadata from
+            metadata: Non-empty metadata read from the image
             
         Returns:
-            Dictionary containing enhanced workflow metadata, or None if extraction failed
+            Dictionary containing enhanced workflow metadata
         """
-        # Get base metadata from parent class
-        metadata = super().extract_workflow_metadata(output)
-        
-        if not metadata:
-            return None
-        
         # Enhance metadata with ComfyUI-specific processing
         enhanced_metadata = metadata.copy()
         
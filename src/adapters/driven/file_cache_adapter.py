@@ -1,5 +1,6 @@
 """File-based cache adapter implementation."""
 
+import glob
 import json
 import os
 import time
@@ -17,6 +18,8 @@ class FileCacheAdapter(CachePort):
     Each cache entry is stored as a JSON file with metadata including TTL.
     """
     
+    supports_prefix_delete = True
+    
     def __init__(self, cache_dir: str = ".cache/asset_manager"):
         """Initialize the file cache adapter.
         
@@ -72,6 +75,7 @@ class FileCacheAdapter(CachePort):
         
         # Prepare cache data with metadata
         cache_data = {
+            'key': key,
             'value': value,
             'created_at': time.time(),
             'ttl': ttl
@@ -115,6 +119,42 @@ class FileCacheAdapter(CachePort):
         except OSError as e:
             logger.warn(f"Failed to clear cache directory {self._cache_dir}: {e}")
     
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every value whose key starts with a prefix.
+        
+        Candidate files are found by the sanitized prefix and then checked
+        against the original key stored in each file, so keys that only look
+        alike after sanitization are kept. Entries written before keys were
+        stored are left to expire.
+        
+        Args:
+            prefix: The key prefix to delete
+            
+        Returns:
+            Number of deleted values
+        """
+        if not self._cache_dir.exists():
+            return 0
+        
+        removed_count = 0
+        # Long keys are shortened after this many characters
+        safe_prefix = glob.escape(self._sanitize_key(prefix)[:190])
+        
+        try:
+            for cache_file in self._cache_dir.glob(f"{safe_prefix}*.json"):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        key = json.load(f).get('key')
+                except (json.JSONDecodeError, AttributeError, OSError):
+                    continue
+                if isinstance(key, str) and key.startswith(prefix):
+                    if self._delete_cache_file(cache_file):
+                        removed_count += 1
+        except OSError as e:
+            logger.warn(f"Failed to delete cache entries with prefix {prefix}: {e}")
+        
+        return removed_count
+    
     def exists(self, key: str) -> bool:
         """Check if a key exists in the cache.
         
@@ -1,16 +1,19 @@
 """File system model adapter implementation."""
 
 import hashlib
+import itertools
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Iterator, List, Optional, Dict, Set, Tuple
 import uuid
 
 from ...domain.ports.driven.model_repository_port import ModelRepositoryPort
 from ...domain.ports.driven.folder_repository_port import FolderRepositoryPort
 from ...domain.entities.model import Model, ModelType
 from ...domain.entities.folder import Folder
+from .model_search_index import TrigramIndex
 from src.utils import logger
 
 
@@ -30,8 +33,18 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         """
         self._folder_repository = folder_repository
         self._models_cache: Dict[str, Model] = {}
+        # Inverted tag index: user tag -> number of cached models carrying it
+        self._tag_counts: Counter = Counter()
+        # Sorted distinct tags, rebuilt only after the set of tags changes
+        self._sorted_tags: Optional[Tuple[str, ...]] = None
+        # Trigram index over the searchable text of cached models
+        self._search_index = TrigramIndex()
+        self._search_order: Dict[str, int] = {}
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl_seconds = 300  # 5 minutes cache TTL
+        # Folders whose models were cached by a single-folder scan while the
+        # cache as a whole was invalid, with when each scan completed
+        self._scanned_folders: Dict[str, datetime] = {}
     
     @property
     def _supported_extensions(self) -> Set[str]:
@@ -46,11 +59,59 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         time_diff = datetime.now() - self._cache_timestamp
         return time_diff.total_seconds() < self._cache_ttl_seconds
     
+    def _is_folder_scan_valid(self, folder_id: str) -> bool:
+        """Check if a single-folder scan of the folder is still cached."""
+        scanned_at = self._scanned_folders.get(folder_id)
+        if scanned_at is None:
+            return False
+        
+        return (datetime.now() - scanned_at).total_seconds() < self._cache_ttl_seconds
+    
     def _invalidate_cache(self) -> None:
         """Invalidate the models cache."""
+        self._scanned_folders.clear()
         self._models_cache.clear()
+        self._tag_counts.clear()
+        self._sorted_tags = None
+        self._search_index.clear()
+        self._search_order.clear()
         self._cache_timestamp = None
     
+    def _index_model_tags(self, model: Model, delta: int) -> None:
+        """Add (delta=1) or remove (delta=-1) a model's user tags in the tag index."""
+        for tag in set(model.user_metadata.get('tags', [])):
+            if tag not in self._tag_counts:
+                self._sorted_tags = None
+            self._tag_counts[tag] += delta
+            if self._tag_counts[tag] <= 0:
+                del self._tag_counts[tag]
+                self._sorted_tags = None
+    
+    def _index_model_search(self, model: Model) -> None:
+        """Add or replace a model's searchable text in the search index."""
+        self._search_index.add(model.id, self._searchable_texts(model))
+        self._search_order.setdefault(model.id, len(self._search_order))
+    
+    def _unindex_model_search(self, model_id: str) -> None:
+        """Remove a model from the search index."""
+        self._search_index.remove(model_id)
+        self._search_order.pop(model_id, None)
+    
+    @staticmethod
+    def _searchable_texts(model: Model) -> List[str]:
+        """Get the texts a search query is matched against."""
+        return [
+            model.name,
+            model.file_name,
+            *model.user_metadata.get('tags', []),
+            model.user_metadata.get('description', '') or ''
+        ]
+    
+    @staticmethod
+    def _matches_query(model: Model, query_lower: str) -> bool:
+        """Check whether a model's searchable text contains the query."""
+        return any(query_lower in text.lower() for text in FileSystemModelAdapter._searchable_texts(model))
+    
     def _generate_model_hash(self, file_path: str) -> str:
         """Generate SHA256 hash for a model file.
         
@@ -155,29 +216,44 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         Returns:
             List of models found in the folder
         """
-        models = []
+        return list(self._iter_folder_models(folder))
+    
+    def _iter_folder_models(self, folder: Folder) -> Iterator[Model]:
+        """Lazily scan a folder, yielding each model as soon as it is read.
         
+        Args:
+            folder: Folder to scan
+            
+        Yields:
+            Models found in the folder
+        """
         try:
             folder_path = Path(folder.path)
             
             if not folder_path.exists() or not folder_path.is_dir():
-                return models
+                return
             
             # Scan all files in the folder
-            for file_path in folder_path.iterdir():
-                if file_path.is_file():
-                    model = self._extract_model_metadata(str(file_path), folder)
-                    if model:
-                        models.append(model)
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        model = self._extract_model_metadata(
+                            str(folder_path / entry.name), folder
+                        )
+                        if model:
+                            yield model
             
         except Exception as e:
             logger.error(f"Error scanning folder {folder.path}: {e}")
-        
-        return models
     
     def _refresh_models_cache(self) -> None:
         """Refresh the models cache by scanning all folders."""
+        self._scanned_folders.clear()
         self._models_cache.clear()
+        self._tag_counts.clear()
+        self._sorted_tags = None
+        self._search_index.clear()
+        self._search_order.clear()
         
         try:
             # Get all folders from the folder repository
@@ -188,6 +264,8 @@ class FileSystemModelAdapter(ModelRepositoryPort):
                 models = self._scan_folder_for_models(folder)
                 for model in models:
                     self._models_cache[model.id] = model
+                    self._index_model_tags(model, 1)
+                    self._index_model_search(model)
             
             self._cache_timestamp = datetime.now()
             
@@ -211,6 +289,52 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         # Filter models by folder ID
         return [model for model in self._models_cache.values() if model.folder_id == folder_id]
     
+    def iter_in_folder(self, folder_id: str) -> Iterator[Model]:
+        """Lazily iterate over the models in a specific folder.
+        
+        Serves from the models cache while it is valid; otherwise scans the
+        folder incrementally instead of rebuilding the cache for all folders.
+        A scan that runs to completion caches the folder's models, so the
+        next iteration within the cache TTL does not hash the files again.
+        
+        Args:
+            folder_id: The ID of the folder to search in
+            
+        Yields:
+            Models found in the folder
+        """
+        if self._is_cache_valid() or self._is_folder_scan_valid(folder_id):
+            for model in list(self._models_cache.values()):
+                if model.folder_id == folder_id:
+                    yield model
+            return
+        
+        folder = self._folder_repository.find_by_id(folder_id)
+        if folder is None:
+            return
+        
+        scanned = []
+        for model in self._iter_folder_models(folder):
+            scanned.append(model)
+            yield model
+        
+        self._cache_folder_scan(folder_id, scanned)
+    
+    def _cache_folder_scan(self, folder_id: str, models: List[Model]) -> None:
+        """Replace a folder's cached models with the result of a full scan.
+        
+        Args:
+            folder_id: The ID of the scanned folder
+            models: Every model the scan found in the folder
+        """
+        stale_ids = [model.id for model in self._models_cache.values() if model.folder_id == folder_id]
+        for model_id in stale_ids:
+            self.delete(model_id)
+        for model in models:
+            self.save(model)
+        
+        self._scanned_folders[folder_id] = datetime.now()
+    
     def find_by_id(self, model_id: str) -> Optional[Model]:
         """Find a model by its ID.
         
@@ -226,9 +350,32 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         
         return self._models_cache.get(model_id)
     
+    def find_by_ids(self, model_ids: List[str]) -> Dict[str, Model]:
+        """Find several models by their IDs with a single cache refresh.
+        
+        Args:
+            model_ids: The IDs of the models to find
+            
+        Returns:
+            Dictionary mapping each found model ID to its model
+        """
+        # Refresh cache if needed
+        if not self._is_cache_valid():
+            self._refresh_models_cache()
+        
+        return {
+            model_id: self._models_cache[model_id]
+            for model_id in model_ids
+            if model_id in self._models_cache
+        }
+    
     def search(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
         """Search for models based on query and optional folder filter.
         
+        Queries of three or more characters are answered from the trigram
+        index, so only candidate models are checked; shorter queries fall
+        back to scanning the cached models.
+        
         Args:
             query: Search query string
             folder_id: Optional folder ID to limit search scope
@@ -236,6 +383,33 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         Returns:
             List of models matching the search criteria
         """
+        return list(self._iter_search(query, folder_id))
+    
+    def search_page(
+        self,
+        query: str,
+        folder_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Model]:
+        """Get one page of the models matching a search.
+        
+        Matching stops as soon as the page is full.
+        
+        Args:
+            query: Search query string
+            folder_id: Optional folder ID to limit search scope
+            limit: Maximum number of models to return (None for no limit)
+            offset: Number of matching models to skip
+            
+        Returns:
+            List of models matching the search criteria, in search order
+        """
+        end = None if limit is None else offset + limit
+        return list(itertools.islice(self._iter_search(query, folder_id), offset, end))
+    
+    def _iter_search(self, query: str, folder_id: Optional[str]) -> Iterator[Model]:
+        """Lazily yield the models matching a search, in search order."""
         # Refresh cache if needed
         if not self._is_cache_valid():
             self._refresh_models_cache()
@@ -243,43 +417,31 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         if not query.strip():
             # If no query, return all models (optionally filtered by folder)
             if folder_id:
-                return self.find_all_in_folder(folder_id)
+                return iter(self.find_all_in_folder(folder_id))
             else:
-                return list(self._models_cache.values())
+                return iter(list(self._models_cache.values()))
         
         query_lower = query.lower().strip()
-        matching_models = []
+        candidate_ids = self._search_index.candidates(query_lower)
         
-        # Search through all models
-        models_to_search = (
-            self.find_all_in_folder(folder_id) if folder_id 
-            else self._models_cache.values()
-        )
-        
-        for model in models_to_search:
-            # Search in model name
-            if query_lower in model.name.lower():
-                matching_models.append(model)
-                continue
-            
-            # Search in file name
-            if query_lower in model.file_name.lower():
-                matching_models.append(model)
-                continue
-            
-            # Search in user tags if available
-            user_tags = model.user_metadata.get('tags', [])
-            if any(query_lower in tag.lower() for tag in user_tags):
-                matching_models.append(model)
-                continue
-            
-            # Search in user description if available
-            user_description = model.user_metadata.get('description', '')
-            if query_lower in user_description.lower():
-                matching_models.append(model)
-                continue
+        if candidate_ids is None:
+            models_to_search = (
+                self.find_all_in_folder(folder_id) if folder_id
+                else self._models_cache.values()
+            )
+        else:
+            # Keep results in cache order, as a full scan would return them
+            models_to_search = (
+                self._models_cache[model_id]
+                for model_id in sorted(candidate_ids, key=self._search_order.__getitem__)
+                if model_id in self._models_cache
+            )
         
-        return matching_models
+        return (
+            model for model in models_to_search
+            if (not folder_id or model.folder_id == folder_id)
+            and self._matches_query(model, query_lower)
+        )
     
     def save(self, model: Model) -> None:
         """Save or update a model.
@@ -291,8 +453,13 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         Args:
             model: The model to save
         """
-        # Update the cache
+        # Update the cache, keeping the tag index in step with it
+        previous = self._models_cache.get(model.id)
+        if previous is not None:
+            self._index_model_tags(previous, -1)
         self._models_cache[model.id] = model
+        self._index_model_tags(model, 1)
+        self._index_model_search(model)
         
         # In a full implementation, this might save user metadata
         # to a separate metadata file or database
@@ -310,7 +477,8 @@ class FileSystemModelAdapter(ModelRepositoryPort):
             True if model was removed from cache, False if not found
         """
         if model_id in self._models_cache:
-            del self._models_cache[model_id]
+            self._index_model_tags(self._models_cache.pop(model_id), -1)
+            self._unindex_model_search(model_id)
             return True
         return False
     
@@ -341,20 +509,18 @@ class FileSystemModelAdapter(ModelRepositoryPort):
         
         return [model for model in self._models_cache.values() if model.model_type == model_type]
     
-    def get_all_user_tags(self) -> List[str]:
+    def get_all_user_tags(self) -> Tuple[str, ...]:
         """Get all unique user tags across all models.
         
         Returns:
-            List of unique user tags
+            Sorted tuple of unique user tags
         """
         # Refresh cache if needed
         if not self._is_cache_valid():
             self._refresh_models_cache()
         
-        all_tags = set()
-        
-        for model in self._models_cache.values():
-            user_tags = model.user_metadata.get('tags', [])
-            all_tags.update(user_tags)
-        
-        return sorted(list(all_tags))
\ No newline at end of file
+        # Served from the tag index; the sorted tuple is kept until a tag is
+        # added or its last model is removed, and shared between callers
+        if self._sorted_tags is None:
+            self._sorted_tags = tuple(sorted(self._tag_counts))
+        return self._sorted_tags
\ No newline at end of file
@@ -2,8 +2,9 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from PIL import Image, PngImagePlugin
 import hashlib
@@ -20,6 +21,10 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
     extracting metadata, and generating thumbnails.
     """
     
+    # Worker threads used to decode images when enriching a batch; PIL
+    # releases the GIL while decoding and resizing
+    ENRICH_MAX_WORKERS = 8
+    
     def __init__(self, output_directory: str, thumbnail_directory: Optional[str] = None):
         """Initialize the filesystem output adapter.
         
@@ -30,6 +35,7 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
         self.output_directory = Path(output_directory)
         self.thumbnail_directory = Path(thumbnail_directory) if thumbnail_directory else self.output_directory / "thumbnails"
         self.supported_extensions = {'.png', '.jpg', '.jpeg', '.webp'}
+        self._enrich_executor: Optional[ThreadPoolExecutor] = None
 
         # Lazily create directories only when their parent exists to avoid failures on
         # non-writable or obviously invalid absolute roots used in tests.
@@ -48,6 +54,17 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
         Returns:
             List of outputs found in the output directory
             
+        Raises:
+            IOError: If output directory cannot be accessed
+        """
+        return list(self.iter_output_directory())
+    
+    def iter_output_directory(self) -> Iterator[Output]:
+        """Lazily scan the output directory, yielding each output as it is read.
+        
+        Returns:
+            Iterator yielding outputs found in the output directory
+            
         Raises:
             IOError: If output directory cannot be accessed
         """
@@ -57,8 +74,6 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
         if not self.output_directory.is_dir():
             raise IOError(f"Output path is not a directory: {self.output_directory}")
         
-        outputs = []
-        
         try:
             # Recursively scan for image files
             for file_path in self.output_directory.rglob("*"):
@@ -73,17 +88,15 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
                 if file_path.is_file() and file_path.suffix.lower() in self.supported_extensions:
                     try:
                         output = self._create_output_from_file(file_path)
-                        if output:
-                            outputs.append(output)
                     except Exception as e:
                         # Log error but continue processing other files
                         logger.warn(f"Failed to process file {file_path}: {e}")
                         continue
+                    if output:
+                        yield output
         
         except Exception as e:
             raise IOError(f"Failed to scan output directory: {e}")
-        
-        return outputs
     
     def get_output_by_id(self, output_id: str) -> Optional[Output]:
         """Get a specific output by its ID.
@@ -94,13 +107,31 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
         Returns:
             The output if found, None otherwise
         """
-        # Since we're using file path hash as ID, we need to scan and find matching ID
-        outputs = self.scan_output_directory()
-        for output in outputs:
+        # Since we're using file path hash as ID, we need to scan and find matching ID;
+        # the lazy scan stops as soon as it is found
+        for output in self.iter_output_directory():
             if output.id == output_id:
                 return output
         return None
     
+    def get_outputs_by_ids(self, output_ids: List[str]) -> Dict[str, Output]:
+        """Get several outputs by their IDs with a single directory scan.
+        
+        Args:
+            output_ids: The IDs of the outputs to retrieve
+            
+        Returns:
+            Dictionary mapping each found output ID to its output
+        """
+        wanted_ids = set(output_ids)
+        found = {}
+        for output in self.iter_output_directory():
+            if output.id in wanted_ids:
+                found[output.id] = output
+                if len(found) == len(wanted_ids):
+                    break
+        return found
+    
     def get_outputs_by_date_range(
         self, 
         start_date: datetime, 
@@ -163,32 +194,13 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
             if not source_path.exists():
                 return None
             
-            # Generate thumbnail filename based on original file
-            thumbnail_name = f"{source_path.stem}_thumb.jpg"
-            thumbnail_path = self.thumbnail_directory / thumbnail_name
-            
             # Skip if thumbnail already exists and is newer than source
-            if (thumbnail_path.exists() and 
-                thumbnail_path.stat().st_mtime > source_path.stat().st_mtime):
+            thumbnail_path = self._thumbnail_path_for(source_path)
+            if self._is_thumbnail_fresh(thumbnail_path, source_path):
                 return str(thumbnail_path)
             
-            # Generate thumbnail
             with Image.open(source_path) as img:
-                # Convert to RGB if necessary (for PNG with transparency)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = rgb_img
-                
-                # Calculate thumbnail size (max 256x256, maintain aspect ratio)
-                img.thumbnail((256, 256), Image.Resampling.LANCZOS)
-                
-                # Save thumbnail
-                img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
-                
-                return str(thumbnail_path)
+                return self._save_thumbnail(img, thumbnail_path)
         
         except Exception as e:
             logger.warn(f"Failed to generate thumbnail for {output.file_path}: {e}")
@@ -208,42 +220,182 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
             if not file_path.exists() or file_path.suffix.lower() != '.png':
                 return None
             
-            # Extract PNG metadata
             with Image.open(file_path) as img:
-                if not isinstance(img, PngImagePlugin.PngImageFile):
-                    return None
-                
-                metadata = {}
-                
-                # Extract ComfyUI workflow metadata
-                if 'workflow' in img.text:
-                    try:
-                        workflow_data = json.loads(img.text['workflow'])
-                        metadata['workflow'] = workflow_data
-                    except json.JSONDecodeError:
-                        pass
-                
-                # Extract prompt metadata
-                if 'prompt' in img.text:
+                return self._workflow_metadata_from_image(img)
+        
+        except Exception as e:
+            logger.warn(f"Failed to extract metadata from {output.file_path}: {e}")
+            return None
+    
+    def extract_and_thumbnail(
+        self, output: Output
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Generate a thumbnail and extract workflow metadata together.
+        
+        The file is opened once: its PNG text chunks are read and the same
+        decoded image is resized into the thumbnail.
+        
+        Args:
+            output: The output to process
+            
+        Returns:
+            Tuple of the thumbnail path and the workflow metadata, each None
+            if it could not be produced
+        """
+        try:
+            source_path = Path(output.file_path)
+            if not source_path.exists():
+                return None, None
+            
+            thumbnail_path = self._thumbnail_path_for(source_path)
+            thumbnail_fresh = self._is_thumbnail_fresh(thumbnail_path, source_path)
+            is_png = source_path.suffix.lower() == '.png'
+            if thumbnail_fresh and not is_png:
+                return str(thumbnail_path), None
+            
+            with Image.open(source_path) as img:
+                metadata = None
+                if is_png:
                     try:
-                        prompt_data = json.loads(img.text['prompt'])
-                        metadata['prompt'] = prompt_data
-                        
-                        # Extract common parameters from prompt
-                        self._extract_generation_parameters(prompt_data, metadata)
-                    except json.JSONDecodeError:
-                        pass
+                        metadata = self._workflow_metadata_from_image(img)
+                    except Exception as e:
+                        logger.warn(f"Failed to extract metadata from {output.file_path}: {e}")
                 
-                # Extract other ComfyUI metadata
-                for key in ['parameters', 'model', 'seed', 'steps', 'cfg', 'sampler', 'scheduler']:
-                    if key in img.text:
-                        metadata[key] = img.text[key]
+                if thumbnail_fresh:
+                    return str(thumbnail_path), metadata
                 
-                return metadata if metadata else None
+                try:
+                    return self._save_thumbnail(img, thumbnail_path), metadata
+                except Exception as e:
+                    logger.warn(f"Failed to generate thumbnail for {output.file_path}: {e}")
+                    return None, metadata
         
         except Exception as e:
-            logger.warn(f"Failed to extract metadata from {output.file_path}: {e}")
+            logger.warn(f"Failed to read {output.file_path}: {e}")
+            return None, None
+    
+    def _thumbnail_path_for(self, source_path: Path) -> Path:
+        """Get the thumbnail location for a source image."""
+        return self.thumbnail_directory / f"{source_path.stem}_thumb.jpg"
+    
+    @staticmethod
+    def _is_thumbnail_fresh(thumbnail_path: Path, source_path: Path) -> bool:
+        """Check whether a thumbnail exists and is newer than its source."""
+        return (thumbnail_path.exists() and
+                thumbnail_path.stat().st_mtime > source_path.stat().st_mtime)
+    
+    @staticmethod
+    def _save_thumbnail(img: Image.Image, thumbnail_path: Path) -> str:
+        """Resize an opened image into a JPEG thumbnail.
+        
+        Args:
+            img: The opened source image
+            thumbnail_path: Where to write the thumbnail
+            
+        Returns:
+            Path to the written thumbnail
+        """
+        # Convert to RGB if necessary (for PNG with transparency)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            img = rgb_img
+        
+        # Calculate thumbnail size (max 256x256, maintain aspect ratio)
+        img.thumbnail((256, 256), Image.Resampling.LANCZOS)
+        
+        # Save thumbnail
+        img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
+        
+        return str(thumbnail_path)
+    
+    def _workflow_metadata_from_image(self, img: Image.Image) -> Optional[Dict[str, Any]]:
+        """Read ComfyUI workflow metadata from an opened image's PNG text chunks.
+        
+        Args:
+            img: The opened image
+            
+        Returns:
+            Dictionary containing workflow metadata, or None if there is none
+        """
+        if not isinstance(img, PngImagePlugin.PngImageFile):
             return None
+        
+        metadata = {}
+        
+        # Extract ComfyUI workflow metadata
+        if 'workflow' in img.text:
+            try:
+                workflow_data = json.loads(img.text['workflow'])
+                metadata['workflow'] = workflow_data
+            except json.JSONDecodeError:
+                pass
+        
+        # Extract prompt metadata
+        if 'prompt' in img.text:
+            try:
+                prompt_data = json.loads(img.text['prompt'])
+                metadata['prompt'] = prompt_data
+                
+                # Extract common parameters from prompt
+                self._extract_generation_parameters(prompt_data, metadata)
+            except json.JSONDecodeError:
+                pass
+        
+        # Extract other ComfyUI metadata
+        for key in ['parameters', 'model', 'seed', 'steps', 'cfg', 'sampler', 'scheduler']:
+            if key in img.text:
+                metadata[key] = img.text[key]
+        
+        return self._enhance_workflow_metadata(metadata) if metadata else None
+    
+    def _enhance_workflow_metadata(self, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Post-process extracted workflow metadata.
+        
+        Subclasses override this to add environment-specific details; the
+        base implementation returns the metadata unchanged.
+        
+        Args:
+            metadata: Non-empty metadata read from the image
+            
+        Returns:
+            The metadata to attach to the output
+        """
+        return metadata
+    
+    def enrich_batch(self, outputs: List[Output]) -> List[Output]:
+        """Attach thumbnails and workflow metadata to several outputs.
+        
+        Files are read on a small thread pool so thumbnail generation and
+        metadata extraction for a listing overlap.
+        
+        Args:
+            outputs: The outputs to enrich
+            
+        Returns:
+            Outputs in the same order, with thumbnail_path and
+            workflow_metadata filled in where they could be produced
+        """
+        if len(outputs) <= 1:
+            return super().enrich_batch(outputs)
+        
+        return list(self._get_enrich_executor().map(self._enrich_one_or_original, outputs))
+    
+    def _get_enrich_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool shared by every batch this adapter enriches."""
+        if self._enrich_executor is None:
+            self._enrich_executor = ThreadPoolExecutor(
+                max_workers=self.ENRICH_MAX_WORKERS, thread_name_prefix="output-enrich"
+            )
+        return self._enrich_executor
+    
+    def close(self) -> None:
+        """Shut down the enrichment thread pool, waiting for running batches."""
+        if self._enrich_executor is not None:
+            self._enrich_executor.shutdown()
+            self._enrich_executor = None
     
     def _create_output_from_file(self, file_path: Path) -> Optional[Output]:
         """Create an Output entity from a file path.
@@ -393,6 +545,58 @@ class FilesystemOutputAdapter(OutputRepositoryPort):
         except Exception:
             return False
     
+    def open_files_in_system(self, outputs: List[Output]) -> Dict[str, bool]:
+        """Open several output files with as few viewer processes as possible.
+        
+        macOS ``open`` and GIO's ``gio open`` accept several files, so the
+        whole selection is opened with one process. Windows opens each file
+        through ``os.startfile``, which does not spawn a shell. Elsewhere each
+        file falls back to ``open_file_in_system`` because ``xdg-open`` only
+        accepts a single path.
+        
+        Args:
+            outputs: The outputs to open
+            
+        Returns:
+            Dictionary mapping each output ID to whether it was opened
+        """
+        import shutil
+        import subprocess
+        import sys
+        
+        results = {output.id: False for output in outputs}
+        existing = [output for output in outputs if Path(output.file_path).exists()]
+        if not existing:
+            return results
+        
+        if sys.platform == "win32":
+            for output in existing:
+                try:
+                    os.startfile(str(Path(output.file_path)))
+                    results[output.id] = True
+                except OSError:
+                    pass
+            return results
+        
+        paths = [str(Path(output.file_path)) for output in existing]
+        if sys.platform == "darwin":
+            command = ["open", *paths]
+        elif shutil.which("gio"):
+            command = ["gio", "open", *paths]
+        else:
+            for output in existing:
+                results[output.id] = self.open_file_in_system(output)
+            return results
+        
+        try:
+            subprocess.run(command, check=True)
+        except Exception:
+            return results
+        
+        for output in existing:
+            results[output.id] = True
+        return results
+    
     def show_file_in_folder(self, output: Output) -> bool:
         """Open the containing folder of the output file in the system file explorer.
         
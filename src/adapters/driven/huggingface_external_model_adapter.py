@@ -10,6 +10,7 @@ from aiohttp import ClientTimeout, ClientError
 
 from ...domain.ports.driven.external_model_port import (
     ExternalModelPort, 
+    CachedResponse, 
     ExternalAPIError, 
     RateLimitError, 
     PlatformUnavailableError
@@ -36,6 +37,8 @@ class HuggingFaceExternalModelAdapter(ExternalModelPort):
     DEFAULT_TIMEOUT = 30
     RATE_LIMIT_DELAY = 0.5  # HuggingFace is more lenient
     MAX_RETRIES = 3
+    MAX_CONNECTIONS = 10  # Pooled connections kept by the session
+    KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open
     
     # HuggingFace pipeline tags to ComfyUI model type mapping
     PIPELINE_TYPE_MAPPING = {
@@ -104,6 +107,10 @@ class HuggingFaceExternalModelAdapter(ExternalModelPort):
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT
+                ),
                 headers={
                     "User-Agent": "ComfyUI-Asset-Manager/1.0",
                     "Accept": "application/json"
@@ -131,23 +138,56 @@ class HuggingFaceExternalModelAdapter(ExternalModelPort):
         Returns:
             Response data as dictionary, None if failed
             
+        Raises:
+            ExternalAPIError: If API request fails
+            RateLimitError: If rate limit is exceeded
+            PlatformUnavailableError: If platform is unavailable
+        """
+        response = await self._make_conditional_request(url, params)
+        return response.value
+    
+    async def _make_conditional_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        validators: Optional[CachedResponse] = None
+    ) -> CachedResponse[Dict[str, Any]]:
+        """Make HTTP request, sending conditional headers when validators are given.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            validators: Previous response whose ETag/Last-Modified should be sent
+            
+        Returns:
+            Cached response with the data and validators; on 304 the response
+            is marked ``not_modified`` and the body is not read
+            
         Raises:
             ExternalAPIError: If API request fails
             RateLimitError: If rate limit is exceeded
             PlatformUnavailableError: If platform is unavailable
         """
         session = await self._get_session()
+        headers = validators.conditional_headers() if validators else {}
         
         for attempt in range(self.MAX_RETRIES):
             try:
                 await self._rate_limit()
                 
-                async with session.get(url, params=params) as response:
+                async with session.get(url, params=params, headers=headers or None) as response:
                     if response.status == 200:
-                        return await response.json()
+                        return CachedResponse.from_headers(await response.json(), response.headers)
+                    elif response.status == 304 and validators:
+                        return CachedResponse(
+                            value=None,
+                            etag=validators.etag,
+                            last_modified=validators.last_modified,
+                            not_modified=True
+                        )
                     elif response.status == 404:
                         logger.debug(f"HuggingFace: Model not found (404) for URL: {url}")
-                        return None
+                        return CachedResponse(value=None)
                     elif response.status == 429:
                         # Rate limited
                         retry_after = int(response.headers.get('Retry-After', 60))
@@ -550,6 +590,50 @@ class HuggingFaceExternalModelAdapter(ExternalModelPort):
             logger.error(f"Failed to get HuggingFace model details: {e}")
             raise
     
+    async def get_model_details_conditional(
+        self,
+        platform: ExternalPlatform,
+        model_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None
+    ) -> CachedResponse[ExternalModel]:
+        """Get model details, skipping the payload when it has not changed.
+        
+        Args:
+            platform: Must be HUGGINGFACE
+            model_id: HuggingFace model ID
+            etag: ETag returned by a previous read (optional)
+            last_modified: Last-Modified value returned by a previous read (optional)
+            
+        Returns:
+            Cached response with the model, or a ``not_modified`` response on 304
+            
+        Raises:
+            ExternalAPIError: If API request fails
+        """
+        if platform != ExternalPlatform.HUGGINGFACE:
+            return CachedResponse(value=None)
+        
+        url = f"{self.BASE_URL}/models/{model_id}"
+        validators = CachedResponse(value=None, etag=etag, last_modified=last_modified)
+        
+        try:
+            response = await self._make_conditional_request(
+                url, validators=validators if validators.has_validators else None
+            )
+            if response.not_modified or not response.value:
+                return response
+            
+            return CachedResponse(
+                value=self._parse_huggingface_model(response.value),
+                etag=response.etag,
+                last_modified=response.last_modified
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to get HuggingFace model details: {e}")
+            raise
+    
     async def get_popular_models(
         self, 
         platform: ExternalPlatform, 
@@ -26,6 +26,8 @@ class HuggingFaceMetadataAdapter(ExternalMetadataPort):
     DEFAULT_TIMEOUT = 30
     RATE_LIMIT_DELAY = 0.5  # Seconds between requests (HuggingFace is more lenient)
     MAX_RETRIES = 3
+    MAX_CONNECTIONS = 10  # Pooled connections kept by the session
+    KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open
     
     def __init__(self, api_token: Optional[str] = None, timeout: int = DEFAULT_TIMEOUT):
         """Initialize HuggingFace metadata adapter.
@@ -53,6 +55,10 @@ class HuggingFaceMetadataAdapter(ExternalMetadataPort):
             
             self._session = aiohttp.ClientSession(
                 timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT
+                ),
                 headers=headers
             )
         return self._session
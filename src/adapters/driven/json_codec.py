@@ -0,0 +1,56 @@
+"""JSON decoding for HTTP adapters.
+
+Uses ``orjson`` when it is installed (``pip install orjson`` or the
+``speedups`` extra) and falls back to the standard library otherwise.
+"""
+
+import asyncio
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # Only installed with the speedups extra
+    orjson = None
+
+# Bodies larger than this are decoded off the event loop
+OFFLOAD_THRESHOLD = 256 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: Raw response body
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def loads_async(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document without blocking the event loop on large bodies.
+
+    Documents above ``OFFLOAD_THRESHOLD`` are decoded in a worker thread;
+    smaller ones are decoded inline, where a thread hop would cost more
+    than the parse.
+
+    Args:
+        data: Raw response body
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if len(data) > OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(loads, data)
+    return loads(data)
@@ -0,0 +1,96 @@
+"""In-memory trigram index for model search."""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class TrigramIndex:
+    """Inverted index from character trigrams to document IDs.
+
+    Substring queries of three or more characters are answered by
+    intersecting the posting sets of the query's trigrams, so the cost
+    depends on the number of candidates rather than the number of indexed
+    documents. Candidates can contain false positives (the trigrams may
+    come from different places in the text) and must be verified by the
+    caller. Shorter queries cannot be answered from the index.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._grams_by_id: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of indexed documents."""
+        return len(self._grams_by_id)
+
+    @classmethod
+    def _trigrams(cls, text: str) -> Set[str]:
+        """Get the set of lowercase trigrams in a text."""
+        text = text.lower()
+        return {text[i:i + cls.GRAM_SIZE] for i in range(len(text) - cls.GRAM_SIZE + 1)}
+
+    def add(self, doc_id: str, texts: Iterable[str]) -> None:
+        """Index a document, replacing any previous entry with the same ID.
+
+        Args:
+            doc_id: ID of the document
+            texts: Searchable texts of the document; trigrams never span
+                two texts
+        """
+        self.remove(doc_id)
+
+        grams: Set[str] = set()
+        for text in texts:
+            if text:
+                grams.update(self._trigrams(text))
+
+        for gram in grams:
+            self._postings[gram].add(doc_id)
+        self._grams_by_id[doc_id] = grams
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index if present."""
+        grams = self._grams_by_id.pop(doc_id, None)
+        if not grams:
+            return
+
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+
+    def clear(self) -> None:
+        """Remove every document from the index."""
+        self._postings.clear()
+        self._grams_by_id.clear()
+
+    def candidates(self, query: str) -> Optional[Set[str]]:
+        """Get IDs of documents that may contain the query as a substring.
+
+        Args:
+            query: Substring to look for
+
+        Returns:
+            Set of candidate document IDs, or None if the query is too short
+            to be answered from the index
+        """
+        grams = self._trigrams(query.strip())
+        if not grams:
+            return None
+
+        # Intersect the rarest postings first to keep intermediate sets small
+        postings: List[Set[str]] = sorted(
+            (self._postings.get(gram, set()) for gram in grams), key=len
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
@@ -0,0 +1,124 @@
+"""Token bucket rate limiter for external API adapters."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+
+class TokenBucket:
+    """Async token bucket that can follow a server's rate limit headers.
+
+    Each request takes one token; tokens refill continuously at
+    ``refill_rate`` per second up to ``capacity``. With the defaults of one
+    token and a rate of ``1 / min_delay`` it behaves like a fixed delay
+    between requests. Once a response carries ``X-RateLimit-*`` headers the
+    bucket adopts the advertised quota, so a burst of requests proceeds
+    without waiting while the server still has quota left.
+    """
+
+    # Reset header values above this are epoch timestamps, not seconds
+    EPOCH_THRESHOLD = 1_000_000_000
+
+    def __init__(self, min_delay: float):
+        """Initialize the bucket.
+
+        Args:
+            min_delay: Seconds between requests when the server does not
+                advertise its rate limit
+        """
+        self._min_delay = min_delay
+        self._capacity = 1.0
+        self._refill_rate = 1.0 / min_delay
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        # The last refill lies in the future while backing off
+        if now <= self._last_refill:
+            return
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and take a token."""
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                now = time.monotonic()
+
+            self._refill(now)
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill(time.monotonic())
+            self._tokens -= 1
+
+    def release(self) -> None:
+        """Return a token taken by a request that never completed."""
+        self._tokens = min(self._capacity, self._tokens + 1)
+
+    @asynccontextmanager
+    async def reserve(self) -> AsyncIterator[None]:
+        """Take a token for the duration of one request.
+
+        The token is returned if the request times out or is cancelled, so
+        requests that never reached the server do not drain the bucket.
+        """
+        await self.acquire()
+        try:
+            yield
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self.release()
+            raise
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt the quota advertised by ``X-RateLimit-*`` response headers.
+
+        Headers that are missing or malformed leave the bucket unchanged.
+
+        Args:
+            headers: Response headers
+        """
+        limit = self._header_number(headers, "X-RateLimit-Limit")
+        remaining = self._header_number(headers, "X-RateLimit-Remaining")
+        if limit is None or remaining is None or limit < 1:
+            return
+
+        reset = self._header_number(headers, "X-RateLimit-Reset")
+        if reset is not None and reset > self.EPOCH_THRESHOLD:
+            reset -= time.time()
+
+        self._refill(time.monotonic())
+        self._capacity = limit
+        self._tokens = min(max(remaining, 0.0), limit)
+        if reset is not None and reset > 0:
+            # Refill to the full quota by the time the window resets
+            self._refill_rate = max(limit - self._tokens, 1.0) / reset
+
+    def back_off(self, delay: float) -> None:
+        """Hold every request for ``delay`` seconds, e.g. after HTTP 429.
+
+        Args:
+            delay: Seconds to wait before the next request
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + delay)
+        self._tokens = 0.0
+        self._last_refill = now + delay
+
+    @staticmethod
+    def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+        """Read a numeric header, returning None if absent or malformed."""
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
@@ -6,4 +6,4 @@ into domain operations using the driving ports.
 
 from .web_api_adapter import WebAPIAdapter
 
-__all__ = ["WebAPIAdapter"]
\ No newline at end of file
+__all__ = ("WebAPIAdapter",)
\ No newline at end of file
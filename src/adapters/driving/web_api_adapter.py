@@ -1,5 +1,6 @@
 """Web API adapter for handling HTTP requests (driving adapter)."""
 
+import asyncio
 import json
 import inspect
 import os
@@ -16,6 +17,7 @@ from ...domain.ports.driving.output_management_port import OutputManagementPort
 from ...domain.ports.driving.external_model_management_port import ExternalModelManagementPort
 from ...domain.entities.base import ValidationError, NotFoundError, DomainError
 from ...domain.entities.external_model import ExternalPlatform
+from ...domain.entities.output_query import OutputFilter, OutputSort
 from ...domain.ports.driven.external_model_port import ExternalAPIError, RateLimitError, PlatformUnavailableError
 
 
@@ -26,6 +28,9 @@ class WebAPIAdapter:
     and uses dependency injection to access domain services through their ports.
     """
     
+    # Searches sent with the same value in this header supersede each other
+    SEARCH_SESSION_HEADER = "X-Search-Session"
+    
     def __init__(
         self,
         model_management: ModelManagementPort,
@@ -45,6 +50,9 @@ class WebAPIAdapter:
         self._folder_management = folder_management
         self._output_management = output_management
         self._external_model_management = external_model_management
+        # Most recent local model search per search session, cancelled when
+        # the same session starts a newer one
+        self._current_searches: Dict[str, asyncio.Task] = {}
     
     def register_routes(self, app: web.Application) -> None:
         """Register all API routes with the application.
@@ -55,9 +63,11 @@ class WebAPIAdapter:
         # Folder endpoints
         app.router.add_get('/asset_manager/folders', self.get_folders)
         app.router.add_get('/asset_manager/folders/{folder_id}/models', self.get_models_in_folder)
+        app.router.add_get('/asset_manager/folders/{folder_id}/models/stream', self.stream_models_in_folder)
         
         # Model endpoints
         app.router.add_get('/asset_manager/models/{model_id}', self.get_model_details)
+        app.router.add_post('/asset_manager/models/bulk-details', self.get_model_details_bulk)
         
         # Search endpoint
         app.router.add_get('/asset_manager/search', self.search_models)
@@ -74,6 +84,8 @@ class WebAPIAdapter:
         app.router.add_get('/asset_manager/outputs', self.get_outputs)
         app.router.add_get('/asset_manager/outputs/{output_id}', self.get_output_details)
         app.router.add_post('/asset_manager/outputs/refresh', self.refresh_outputs)
+        app.router.add_post('/asset_manager/outputs/bulk-details', self.get_output_details_bulk)
+        app.router.add_post('/asset_manager/outputs/open-system-bulk', self.open_system_bulk)
         app.router.add_post('/asset_manager/outputs/{output_id}/load-workflow', self.load_workflow)
         app.router.add_post('/asset_manager/outputs/{output_id}/open-system', self.open_system)
         app.router.add_post('/asset_manager/outputs/{output_id}/show-folder', self.show_folder)
@@ -87,6 +99,7 @@ class WebAPIAdapter:
         app.router.add_get('/asset_manager/external/models/{platform}/{model_id}', self.get_external_model_details)
         app.router.add_get('/asset_manager/external/popular', self.get_popular_external_models)
         app.router.add_get('/asset_manager/external/recent', self.get_recent_external_models)
+        app.router.add_get('/asset_manager/external/landing', self.get_external_landing_page)
         app.router.add_get('/asset_manager/external/platforms', self.get_supported_platforms)
         app.router.add_get('/asset_manager/external/platforms/{platform}/info', self.get_platform_info)
 
@@ -100,7 +113,9 @@ class WebAPIAdapter:
     async def get_folders(self, request: Request) -> Response:
         """Handle GET /asset_manager/folders endpoint.
         
-        Returns a list of all available model folders.
+        Returns a list of all available model folders, sorted by ID. The
+        list is read from the service's cached folder snapshot, so frequent
+        polling does not rescan the folders.
         
         Args:
             request: The HTTP request
@@ -109,8 +124,8 @@ class WebAPIAdapter:
             JSON response with list of folders
         """
         try:
-            folders = self._folder_management.get_all_folders()
-            folder_data = [folder.to_dict() for folder in folders]
+            snapshot = self._folder_management.get_folder_snapshot()
+            folder_data = [folder.to_dict() for folder in snapshot.to_structure().values()]
             
             return web.json_response({
                 "success": True,
@@ -302,7 +317,8 @@ class WebAPIAdapter:
     async def get_models_in_folder(self, request: Request) -> Response:
         """Handle GET /asset_manager/folders/{folder_id}/models endpoint.
         
-        Returns all models in the specified folder.
+        Returns all models in the specified folder. With ``?enrich=true`` the
+        models include external metadata, fetched for the folder in one batch.
         
         Args:
             request: The HTTP request with folder_id in path
@@ -312,7 +328,10 @@ class WebAPIAdapter:
         """
         try:
             folder_id = request.match_info['folder_id']
-            models = self._model_management.get_models_in_folder(folder_id)
+            if request.query.get('enrich', '').lower() == 'true':
+                models = await self._model_management.get_models_in_folder_enriched(folder_id)
+            else:
+                models = await self._model_management.get_models_in_folder(folder_id)
             model_data = [model.to_dict() for model in models]
             
             return web.json_response({
@@ -331,6 +350,51 @@ class WebAPIAdapter:
         except Exception as e:
             return self._handle_unexpected_error(e)
     
+    async def stream_models_in_folder(self, request: Request) -> web.StreamResponse:
+        """Handle GET /asset_manager/folders/{folder_id}/models/stream endpoint.
+        
+        Streams the models in the specified folder as newline-delimited JSON
+        (one model object per line), writing each model as soon as it is found.
+        
+        Args:
+            request: The HTTP request with folder_id in path
+            
+        Returns:
+            NDJSON stream of models, or a JSON error response
+        """
+        try:
+            folder_id = request.match_info['folder_id']
+            models = self._model_management.stream_models_in_folder(folder_id)
+            
+            # Pull the first model before sending headers so validation
+            # errors can still be reported as regular JSON responses
+            try:
+                first_model = await models.__anext__()
+            except StopAsyncIteration:
+                first_model = None
+            
+        except ValidationError as e:
+            return self._handle_validation_error(e)
+        except NotFoundError as e:
+            return self._handle_not_found_error(e)
+        except DomainError as e:
+            return self._handle_domain_error(e)
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+        
+        response = web.StreamResponse(
+            headers={hdrs.CONTENT_TYPE: 'application/x-ndjson'}
+        )
+        await response.prepare(request)
+        
+        if first_model is not None:
+            await response.write((json.dumps(first_model.to_dict()) + "\n").encode('utf-8'))
+            async for model in models:
+                await response.write((json.dumps(model.to_dict()) + "\n").encode('utf-8'))
+        
+        await response.write_eof()
+        return response
+    
     async def get_model_details(self, request: Request) -> Response:
         """Handle GET /asset_manager/models/{model_id} endpoint.
         
@@ -344,7 +408,7 @@ class WebAPIAdapter:
         """
         try:
             model_id = request.match_info['model_id']
-            model = self._model_management.get_model_details(model_id)
+            model = await self._model_management.get_model_details(model_id)
             
             return web.json_response({
                 "success": True,
@@ -360,6 +424,56 @@ class WebAPIAdapter:
         except Exception as e:
             return self._handle_unexpected_error(e)
     
+    async def get_model_details_bulk(self, request: Request) -> Response:
+        """Handle POST /asset_manager/models/bulk-details endpoint.
+        
+        Returns detailed information about several models in one request.
+        
+        Args:
+            request: The HTTP request with model_ids in body
+            
+        Returns:
+            JSON response mapping model IDs to model details
+        """
+        try:
+            try:
+                body = await request.json()
+            except json.JSONDecodeError:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid JSON in request body",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if not isinstance(body, dict):
+                return web.json_response({
+                    "success": False,
+                    "error": "Request body must be a JSON object",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if "model_ids" not in body:
+                return web.json_response({
+                    "success": False,
+                    "error": "Missing required field 'model_ids'",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            models = await self._model_management.get_model_details_bulk(body["model_ids"])
+            
+            return web.json_response({
+                "success": True,
+                "data": {model_id: model.to_dict() for model_id, model in models.items()},
+                "count": len(models)
+            })
+            
+        except ValidationError as e:
+            return self._handle_validation_error(e)
+        except DomainError as e:
+            return self._handle_domain_error(e)
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+    
     async def search_models(self, request: Request) -> Response:
         """Handle GET /asset_manager/search endpoint.
         
@@ -368,6 +482,12 @@ class WebAPIAdapter:
         Query parameters:
         - q: Search query string (required)
         - folder_id: Optional folder ID to limit search scope
+        - limit: Optional maximum number of results
+        - offset: Optional number of results to skip (default 0)
+        
+        A search sent with an ``X-Search-Session`` header cancels the
+        previous search of that session if it is still running; the
+        cancelled request gets HTTP 409.
         
         Args:
             request: The HTTP request with query parameters
@@ -390,7 +510,56 @@ class WebAPIAdapter:
             # Get optional folder_id parameter
             folder_id = query_params.get('folder_id')
             
-            models = self._model_management.search_models(query, folder_id)
+            # Get optional pagination parameters
+            limit = None
+            offset = 0
+            for name in ('limit', 'offset'):
+                if name not in query_params:
+                    continue
+                try:
+                    value = int(query_params[name])
+                except ValueError:
+                    return web.json_response({
+                        "success": False,
+                        "error": f"{name} must be an integer",
+                        "error_type": "validation_error",
+                        "field": name
+                    }, status=400)
+                if name == 'limit':
+                    limit = value
+                else:
+                    offset = value
+            
+            search = self._model_management.search_models(query, folder_id, limit=limit, offset=offset)
+            session = request.headers.get(self.SEARCH_SESSION_HEADER)
+            if not session:
+                # Without a session there is nothing to supersede; aiohttp
+                # cancels the handler if the client disconnects
+                models = await search
+            else:
+                # Search-as-you-type sends a request per keystroke; drop the
+                # session's previous search if it is still waiting. Work
+                # already handed to an executor thread runs to completion.
+                previous = self._current_searches.get(session)
+                if previous is not None and not previous.done():
+                    previous.cancel()
+                
+                search_task = asyncio.ensure_future(search)
+                self._current_searches[session] = search_task
+                try:
+                    models = await search_task
+                except asyncio.CancelledError:
+                    if self._current_searches.get(session) is search_task:
+                        raise
+                    return web.json_response({
+                        "success": False,
+                        "error": "Search was superseded by a newer search",
+                        "error_type": "search_superseded"
+                    }, status=409)
+                finally:
+                    if self._current_searches.get(session) is search_task:
+                        del self._current_searches[session]
+            
             model_data = [model.to_dict() for model in models]
             
             return web.json_response({
@@ -520,7 +689,7 @@ class WebAPIAdapter:
             request: The HTTP request with model_ids and metadata in body
             
         Returns:
-            JSON response with updated models
+            JSON response with updated models and the IDs that failed
         """
         try:
             # Parse request body
@@ -551,12 +720,13 @@ class WebAPIAdapter:
             model_ids = body["model_ids"]
             metadata = body["metadata"]
             
-            updated_models = self._model_management.bulk_update_metadata(model_ids, metadata)
+            result = self._model_management.bulk_update_metadata(model_ids, metadata)
             
             return web.json_response({
                 "success": True,
-                "data": [model.to_dict() for model in updated_models],
-                "count": len(updated_models)
+                "data": [model.to_dict() for model in result.updated],
+                "count": len(result.updated),
+                "failed": result.failed
             })
             
         except ValidationError as e:
@@ -648,6 +818,7 @@ class WebAPIAdapter:
         - end_date: Filter by end date (ISO format)
         - sort_by: Sort criteria (date, name, size)
         - ascending: Sort order (true/false, default: false for date, true for others)
+        - limit: Maximum number of outputs to return (optional)
         
         Args:
             request: The HTTP request
@@ -673,26 +844,42 @@ class WebAPIAdapter:
             ascending_str = query_params.get('ascending', 'false' if sort_by == 'date' else 'true')
             ascending = ascending_str.lower() in ('true', '1', 'yes')
             
-            # Get outputs based on filters
+            limit = None
+            if 'limit' in query_params:
+                try:
+                    limit = int(query_params['limit'])
+                except ValueError:
+                    return web.json_response({
+                        "success": False,
+                        "error": "limit must be an integer",
+                        "error_type": "validation_error",
+                        "field": "limit"
+                    }, status=400)
+            
+            # Date range filtering applies only when both bounds are given
+            start_date = end_date = None
             if start_date_str and end_date_str:
                 from datetime import datetime
                 try:
                     start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
                     end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                    outputs = self._output_management.get_outputs_by_date_range(start_date, end_date)
                 except ValueError:
                     return web.json_response({
                         "success": False,
                         "error": "Invalid date format. Use ISO format (YYYY-MM-DDTHH:MM:SS)",
                         "error_type": "validation_error"
                     }, status=400)
-            elif file_format:
-                outputs = self._output_management.get_outputs_by_format(file_format)
-            else:
-                outputs = self._output_management.get_all_outputs()
             
-            # Sort outputs
-            sorted_outputs = self._output_management.sort_outputs(outputs, sort_by, ascending)
+            # Filter, sort and truncate in a single service call
+            sorted_outputs = self._output_management.list_outputs(
+                output_filter=OutputFilter(
+                    file_format=file_format or None,
+                    start_date=start_date,
+                    end_date=end_date
+                ),
+                output_sort=OutputSort(sort_by=sort_by, ascending=ascending),
+                limit=limit
+            )
             
             # Build response payloads with HTTP-accessible URLs for files
             output_data = []
@@ -711,7 +898,8 @@ class WebAPIAdapter:
                     "start_date": start_date_str,
                     "end_date": end_date_str,
                     "sort_by": sort_by,
-                    "ascending": ascending
+                    "ascending": ascending,
+                    "limit": limit
                 }
             })
             
@@ -762,6 +950,70 @@ class WebAPIAdapter:
         except Exception as e:
             return self._handle_unexpected_error(e)
 
+    async def get_output_details_bulk(self, request: Request) -> Response:
+        """Handle POST /asset_manager/outputs/bulk-details endpoint.
+        
+        Returns detailed information about several outputs in one request.
+        
+        Args:
+            request: The HTTP request with output_ids in body
+            
+        Returns:
+            JSON response mapping output IDs to output details
+        """
+        if self._output_management is None:
+            return web.json_response({
+                "success": False,
+                "error": "Output management service not available",
+                "error_type": "service_unavailable"
+            }, status=503)
+        
+        try:
+            try:
+                body = await request.json()
+            except json.JSONDecodeError:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid JSON in request body",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if not isinstance(body, dict):
+                return web.json_response({
+                    "success": False,
+                    "error": "Request body must be a JSON object",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if "output_ids" not in body:
+                return web.json_response({
+                    "success": False,
+                    "error": "Missing required field 'output_ids'",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            outputs = self._output_management.get_output_details_bulk(body["output_ids"])
+            
+            output_data = {}
+            for output_id, output in outputs.items():
+                dto = output.to_dict()
+                dto['file_url'] = f"/asset_manager/outputs/{output.id}/file"
+                dto['thumbnail_url'] = f"/asset_manager/outputs/{output.id}/thumbnail"
+                output_data[output_id] = dto
+            
+            return web.json_response({
+                "success": True,
+                "data": output_data,
+                "count": len(output_data)
+            })
+            
+        except ValidationError as e:
+            return self._handle_validation_error(e)
+        except DomainError as e:
+            return self._handle_domain_error(e)
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+
     async def get_output_file(self, request: Request) -> Response:
         """Serve the original image file for an output.
         
@@ -986,6 +1238,67 @@ class WebAPIAdapter:
         except Exception as e:
             return self._handle_unexpected_error(e)
     
+    async def open_system_bulk(self, request: Request) -> Response:
+        """Handle POST /asset_manager/outputs/open-system-bulk endpoint.
+        
+        Opens several output files in the system's default image viewer.
+        
+        Args:
+            request: The HTTP request with output_ids in body
+            
+        Returns:
+            JSON response mapping output IDs to whether they were opened
+        """
+        if self._output_management is None:
+            return web.json_response({
+                "success": False,
+                "error": "Output management service not available",
+                "error_type": "service_unavailable"
+            }, status=503)
+        
+        try:
+            try:
+                body = await request.json()
+            except json.JSONDecodeError:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid JSON in request body",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if not isinstance(body, dict):
+                return web.json_response({
+                    "success": False,
+                    "error": "Request body must be a JSON object",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            if "output_ids" not in body:
+                return web.json_response({
+                    "success": False,
+                    "error": "Missing required field 'output_ids'",
+                    "error_type": "validation_error"
+                }, status=400)
+            
+            # Opening spawns viewer processes, so keep it off the event loop
+            results = await asyncio.to_thread(
+                self._output_management.open_in_system_viewer_bulk, body["output_ids"]
+            )
+            opened_count = sum(1 for opened in results.values() if opened)
+            
+            return web.json_response({
+                "success": opened_count == len(results),
+                "data": results,
+                "opened_count": opened_count
+            })
+            
+        except ValidationError as e:
+            return self._handle_validation_error(e)
+        except DomainError as e:
+            return self._handle_domain_error(e)
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+    
     async def show_folder(self, request: Request) -> Response:
         """Handle POST /asset_manager/outputs/{output_id}/show-folder endpoint.
         
@@ -1054,6 +1367,7 @@ class WebAPIAdapter:
             query = request.query.get('query', '')
             limit = int(request.query.get('limit', '20'))
             offset = int(request.query.get('offset', '0'))
+            cursor = request.query.get('cursor') or None
             
             # Parse filters
             filters = {}
@@ -1070,7 +1384,8 @@ class WebAPIAdapter:
                 query=query,
                 limit=limit,
                 offset=offset,
-                filters=filters
+                filters=filters,
+                cursor=cursor
             )
             
             return web.json_response({
@@ -1080,6 +1395,7 @@ class WebAPIAdapter:
                     "total": result["total"],
                     "has_more": result["has_more"],
                     "next_offset": result["next_offset"],
+                    "next_cursor": result.get("next_cursor"),
                     "platforms_searched": result["platforms_searched"]
                 }
             })
@@ -1129,6 +1445,7 @@ class WebAPIAdapter:
             query = request.query.get('query', '')
             limit = int(request.query.get('limit', '20'))
             offset = int(request.query.get('offset', '0'))
+            cursor = request.query.get('cursor') or None
             
             # Parse filters
             filters = {}
@@ -1145,7 +1462,8 @@ class WebAPIAdapter:
                 query=query,
                 limit=limit,
                 offset=offset,
-                filters=filters
+                filters=filters,
+                cursor=cursor
             )
             
             return web.json_response({
@@ -1155,6 +1473,7 @@ class WebAPIAdapter:
                     "total": result["total"],
                     "has_more": result["has_more"],
                     "next_offset": result["next_offset"],
+                    "next_cursor": result.get("next_cursor"),
                     "platform": platform.value
                 }
             })
@@ -1284,6 +1603,83 @@ class WebAPIAdapter:
         except Exception as e:
             return self._handle_unexpected_error(e)
     
+    async def get_external_landing_page(self, request: Request) -> Response:
+        """Handle GET /asset_manager/external/landing endpoint.
+        
+        Get the popular, recent and suggested models for the browse screen
+        in a single request.
+        
+        Query parameters:
+        - platform: Optional platform to query (queries all if omitted)
+        - popular_limit, recent_limit, suggestions_limit: Optional section sizes
+        
+        Args:
+            request: The HTTP request with query parameters
+            
+        Returns:
+            JSON response with the models of each section
+        """
+        if not self._external_model_management:
+            return web.json_response({
+                "success": False,
+                "error": "External model management not available",
+                "error_type": "service_unavailable"
+            }, status=503)
+        
+        try:
+            # Parse query parameters
+            limits = {}
+            for section in ("popular", "recent", "suggestions"):
+                if f"{section}_limit" not in request.query:
+                    continue
+                try:
+                    limits[section] = int(request.query[f"{section}_limit"])
+                except ValueError:
+                    return web.json_response({
+                        "success": False,
+                        "error": f"{section}_limit must be an integer",
+                        "error_type": "validation_error"
+                    }, status=400)
+            
+            platform = None
+            if 'platform' in request.query:
+                platform_str = request.query['platform'].upper()
+                try:
+                    platform = ExternalPlatform(platform_str.lower())
+                except ValueError:
+                    return web.json_response({
+                        "success": False,
+                        "error": f"Unsupported platform: {platform_str}",
+                        "error_type": "invalid_platform"
+                    }, status=400)
+            
+            sections = await self._external_model_management.get_landing_page(
+                platform=platform,
+                limits=limits or None
+            )
+            
+            return web.json_response({
+                "success": True,
+                "data": {
+                    section: {
+                        "models": [model.to_dict() for model in models],
+                        "count": len(models)
+                    }
+                    for section, models in sections.items()
+                }
+            })
+            
+        except ValidationError as e:
+            return self._handle_validation_error(e)
+        except (ExternalAPIError, RateLimitError, PlatformUnavailableError) as e:
+            return web.json_response({
+                "success": False,
+                "error": str(e),
+                "error_type": "external_api_error"
+            }, status=502)
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+    
     async def get_recent_external_models(self, request: Request) -> Response:
         """Handle GET /asset_manager/external/recent endpoint.
         
@@ -1418,7 +1814,7 @@ class WebAPIAdapter:
             
             return web.json_response({
                 "success": True,
-                "data": info
+                "data": info.to_dict()
             })
             
         except ValidationError as e:
@@ -1,7 +1,7 @@
 """Dependency injection container for the asset manager application."""
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from .config import ApplicationConfig, load_config
 
@@ -33,8 +33,19 @@ class DIContainer:
     
     This container follows the hexagonal architecture pattern and wires
     all dependencies according to the dependency inversion principle.
+    Services are constructed on first use by their getters.
     """
     
+    # Services and driving adapters reported by prepare_index, in wiring order
+    SERVICE_NAMES = (
+        "folder_service",
+        "model_service",
+        "metadata_service",
+        "output_service",
+        "external_model_service",
+        "web_api_adapter",
+    )
+    
     def __init__(self, config: Optional[ApplicationConfig] = None):
         """Initialize the dependency injection container.
         
@@ -78,6 +89,24 @@ class DIContainer:
     
     # Driven adapters (infrastructure)
     
+    def prepare_index(self) -> Dict[str, bool]:
+        """Get the registered services without constructing any of them.
+        
+        Returns:
+            Dictionary mapping each service name to whether it has been
+            constructed yet
+        """
+        return {name: getattr(self, f"_{name}") is not None for name in self.SERVICE_NAMES}
+    
+    def build_services(self) -> None:
+        """Construct every registered service now instead of on first use.
+        
+        Configuration errors then surface immediately rather than on the
+        first request that needs the failing service.
+        """
+        for name in self.SERVICE_NAMES:
+            getattr(self, f"get_{name}")()
+    
     def get_cache_adapter(self) -> Optional[FileCacheAdapter]:
         """Get cache adapter instance.
         
@@ -248,7 +277,10 @@ class DIContainer:
         if self._output_service is None:
             logger.info("Initializing output service")
             output_repository = self.get_output_repository()
-            self._output_service = OutputService(output_repository)
+            self._output_service = OutputService(
+                output_repository,
+                cache_port=self.get_cache_adapter()
+            )
         
         return self._output_service
     
@@ -264,7 +296,10 @@ class DIContainer:
         
         if self._external_model_service is None:
             logger.info("Initializing external model service")
-            self._external_model_service = ExternalModelService(external_model_adapter)
+            self._external_model_service = ExternalModelService(
+                external_model_adapter,
+                cache_port=self.get_cache_adapter()
+            )
         
         return self._external_model_service
     
@@ -322,8 +357,27 @@ class DIContainer:
             except Exception as e:
                 logger.warning(f"Failed to cleanup cache: {e}")
         
-        # Note: HTTP sessions in metadata adapters should be closed by their async context managers
+        # Keep output thumbnail and workflow lookups for the next start
+        if self._output_service:
+            self._output_service.save_enrichment_cache()
+        
+        # Stop the worker threads used to enrich output listings
+        if self._output_repository:
+            self._output_repository.close()
+        
+        # HTTP sessions are closed by aclose(), which needs the running event loop
         logger.info("Dependency injection container cleanup completed")
+    
+    async def aclose(self) -> None:
+        """Close the HTTP sessions held by the external API adapters."""
+        adapters = (self._civitai_adapter, self._huggingface_adapter, self._external_model_adapter)
+        for adapter in adapters:
+            if adapter is None:
+                continue
+            try:
+                await adapter.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {type(adapter).__name__}: {e}")
 
 
 # Global container instance
@@ -12,8 +12,8 @@ from .entities import *
 from . import ports
 from .ports import *
 
-__all__ = [
+__all__ = (
     # Re-export everything from entities and ports
     *entities.__all__,
     *ports.__all__
-]
\ No newline at end of file
+)
\ No newline at end of file
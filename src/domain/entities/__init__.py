@@ -10,8 +10,8 @@ from .base import (
     validate_positive_number,
     validate_file_path
 )
-from .model import Model, ModelType
-from .folder import Folder
+from .model import Model, ModelType, BulkUpdateResult
+from .folder import Folder, FolderSnapshot
 from .external_metadata import (
     ExternalMetadata,
     CivitAIMetadata,
@@ -22,11 +22,14 @@ from .external_model import (
     ExternalModel,
     ExternalPlatform,
     ComfyUIModelType,
-    ComfyUICompatibility
+    ComfyUICompatibility,
+    SearchResult,
+    PlatformInfo
 )
 from .output import Output, ImageDimensions, FileInfo
+from .output_query import OutputFilter, OutputSort
 
-__all__ = [
+__all__ = (
     # Base classes and utilities
     "Entity",
     "ValueObject",
@@ -39,7 +42,9 @@ __all__ = [
     # Domain entities
     "Model",
     "ModelType",
+    "BulkUpdateResult",
     "Folder",
+    "FolderSnapshot",
     "ExternalMetadata",
     "CivitAIMetadata",
     "HuggingFaceMetadata",
@@ -49,8 +54,12 @@ __all__ = [
     "ExternalPlatform",
     "ComfyUIModelType",
     "ComfyUICompatibility",
+    "SearchResult",
+    "PlatformInfo",
     # Output entities
     "Output",
     "ImageDimensions",
-    "FileInfo"
-]
\ No newline at end of file
+    "FileInfo",
+    "OutputFilter",
+    "OutputSort"
+)
\ No newline at end of file
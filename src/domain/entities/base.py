@@ -10,6 +10,9 @@ from datetime import datetime
 class Entity(ABC):
     """Base class for domain entities with identity."""
     
+    # Empty slots let slotted subclasses drop the per-instance __dict__
+    __slots__ = ()
+    
     id: str
     
     def __eq__(self, other: Any) -> bool:
@@ -26,7 +29,9 @@ class Entity(ABC):
 @dataclass(frozen=True)
 class ValueObject(ABC):
     """Base class for value objects - immutable objects without identity."""
-    pass
+    
+    # Empty slots let slotted subclasses drop the per-instance __dict__
+    __slots__ = ()
 
 
 class DomainError(Exception):
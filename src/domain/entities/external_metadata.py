@@ -14,7 +14,7 @@ class MetadataSource(Enum):
     HUGGINGFACE = "huggingface"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CivitAIMetadata(ValueObject):
     """Value object for CivitAI metadata."""
     
@@ -1,9 +1,10 @@
 """External model domain entity for models from external platforms."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, TypedDict
 
 from .base import Entity, ValidationError, validate_not_empty, validate_positive_number
 
@@ -149,6 +150,30 @@ class ExternalModel(Entity):
         """Get the model type name as a string."""
         return self.model_type.value if self.model_type else None
     
+    # Lowercase forms of the searchable text, computed on first use and kept
+    # for the lifetime of the instance; models are not edited after they are
+    # fetched, so relevance scoring can reuse them across pages and sorts
+    
+    @cached_property
+    def name_lower(self) -> str:
+        """Get the lowercase model name."""
+        return self.name.lower()
+    
+    @cached_property
+    def author_lower(self) -> str:
+        """Get the lowercase author name."""
+        return self.author.lower()
+    
+    @cached_property
+    def tags_lower(self) -> Tuple[str, ...]:
+        """Get the lowercase forms of all tags, including platform-specific ones."""
+        return tuple(tag.lower() for tag in self.get_all_tags())
+    
+    @cached_property
+    def description_lower(self) -> str:
+        """Get the lowercase primary description."""
+        return self.get_primary_description().lower()
+    
     def get_all_tags(self) -> List[str]:
         """Get all tags including platform-specific ones from metadata."""
         all_tags = self.tags.copy()
@@ -255,4 +280,36 @@ class ExternalModel(Entity):
             base_model=data.get("base_model"),
             file_size=data.get("file_size"),
             file_format=data.get("file_format")
-        )
\ No newline at end of file
+        )
+
+
+class SearchResult(TypedDict):
+    """Page of external models returned by search and listing operations."""
+    models: List[ExternalModel]
+    total: int
+    has_more: bool
+    next_offset: Optional[int]
+    next_cursor: Optional[str]
+    platforms_searched: List[str]
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformInfo:
+    """Information about an external platform and its capabilities."""
+    name: str
+    display_name: str
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    supported_model_types: List[str] = field(default_factory=list)
+    rate_limits: Dict[str, Any] = field(default_factory=dict)
+    is_available: bool = True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert platform information to dictionary representation."""
+        return {
+            "name": self.name,
+            "display_name": self.display_name,
+            "capabilities": dict(self.capabilities),
+            "supported_model_types": list(self.supported_model_types),
+            "rate_limits": dict(self.rate_limits),
+            "is_available": self.is_available
+        }
@@ -1,10 +1,11 @@
 """Folder domain entity."""
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
 
-from .base import Entity, ValidationError, validate_not_empty, validate_file_path, validate_positive_number
+from .base import Entity, ValueObject, ValidationError, validate_not_empty, validate_file_path, validate_positive_number
 from .model import ModelType
 
 
@@ -78,4 +79,71 @@ class Folder(Entity):
             model_type=ModelType(data["model_type"]),
             model_count=data.get("model_count", 0),
             parent_folder_id=data.get("parent_folder_id")
-        )
\ No newline at end of file
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FolderSnapshot(ValueObject):
+    """Immutable, column-oriented snapshot of the folder structure.
+    
+    Folders are stored as parallel tuples sorted by ID, so a snapshot can be
+    cached and shared by reference and looked up by binary search. ``parents``
+    holds the index of each folder's parent in ``ids`` (-1 for root folders
+    or parents outside the snapshot).
+    """
+    
+    ids: Tuple[str, ...] = ()
+    parents: Tuple[int, ...] = ()
+    names: Tuple[str, ...] = ()
+    paths: Tuple[str, ...] = ()
+    model_types: Tuple[ModelType, ...] = ()
+    model_counts: Tuple[int, ...] = ()
+    
+    @classmethod
+    def from_folders(cls, folders: Iterable[Folder]) -> "FolderSnapshot":
+        """Build a snapshot from folder entities."""
+        ordered = sorted(folders, key=lambda folder: folder.id)
+        ids = tuple(folder.id for folder in ordered)
+        index_by_id = {folder_id: index for index, folder_id in enumerate(ids)}
+        return cls(
+            ids=ids,
+            parents=tuple(
+                index_by_id.get(folder.parent_folder_id, -1) for folder in ordered
+            ),
+            names=tuple(folder.name for folder in ordered),
+            paths=tuple(folder.path for folder in ordered),
+            model_types=tuple(folder.model_type for folder in ordered),
+            model_counts=tuple(folder.model_count for folder in ordered)
+        )
+    
+    def __len__(self) -> int:
+        """Get the number of folders in the snapshot."""
+        return len(self.ids)
+    
+    def index_of(self, folder_id: str) -> int:
+        """Get the index of a folder ID, or -1 if it is not in the snapshot."""
+        index = bisect_left(self.ids, folder_id)
+        if index < len(self.ids) and self.ids[index] == folder_id:
+            return index
+        return -1
+    
+    def folder_at(self, index: int) -> Folder:
+        """Materialize the folder entity stored at an index."""
+        parent_index = self.parents[index]
+        return Folder(
+            id=self.ids[index],
+            name=self.names[index],
+            path=self.paths[index],
+            model_type=self.model_types[index],
+            model_count=self.model_counts[index],
+            parent_folder_id=self.ids[parent_index] if parent_index >= 0 else None
+        )
+    
+    def find(self, folder_id: str) -> Optional[Folder]:
+        """Find a folder by ID using binary search."""
+        index = self.index_of(folder_id)
+        return self.folder_at(index) if index >= 0 else None
+    
+    def to_structure(self) -> Dict[str, Folder]:
+        """Materialize the snapshot as a folder ID to folder dictionary."""
+        return {self.ids[index]: self.folder_at(index) for index in range(len(self.ids))}
@@ -3,10 +3,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
-from .base import Entity, ValidationError, validate_not_empty, validate_positive_number, validate_file_path
+from .base import Entity, ValueObject, ValidationError, validate_not_empty, validate_positive_number, validate_file_path
 
 
 class ModelType(Enum):
@@ -19,9 +19,12 @@ class ModelType(Enum):
     UPSCALER = "upscaler"
 
 
-@dataclass
+@dataclass(slots=True)
 class Model(Entity):
-    """Domain entity representing an AI model file."""
+    """Domain entity representing an AI model file.
+    
+    Instances are slotted because folders can hold thousands of models.
+    """
     
     name: str
     file_path: str
@@ -125,4 +128,20 @@ class Model(Entity):
             folder_id=data["folder_id"],
             thumbnail_path=data.get("thumbnail_path"),
             user_metadata=data.get("user_metadata", {})
-        )
\ No newline at end of file
+        )
+
+@dataclass(frozen=True, slots=True)
+class BulkUpdateResult(ValueObject):
+    """Per-model outcome of a bulk metadata update.
+    
+    ``failed`` holds one ``{"model_id": ..., "error": ...}`` entry per
+    requested ID that was not updated, so callers can retry just those.
+    """
+    
+    updated: List[Model] = field(default_factory=list)
+    failed: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @property
+    def failed_ids(self) -> List[Any]:
+        """Get the IDs of the models that were not updated."""
+        return [failure["model_id"] for failure in self.failed]
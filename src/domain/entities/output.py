@@ -8,6 +8,12 @@ from pathlib import Path
 from .base import Entity, ValueObject, ValidationError, validate_not_empty, validate_positive_number, validate_file_path
 
 
+SUPPORTED_OUTPUT_FORMATS = frozenset({'png', 'jpg', 'jpeg', 'webp'})
+UNSUPPORTED_FORMAT_MESSAGE = (
+    f"file_format must be one of {', '.join(sorted(SUPPORTED_OUTPUT_FORMATS))}"
+)
+
+
 @dataclass(frozen=True)
 class ImageDimensions(ValueObject):
     """Value object representing image dimensions."""
@@ -57,9 +63,13 @@ class FileInfo(ValueObject):
         return f"{size:.1f} TB"
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Output(Entity):
-    """Domain entity representing a generated output image from ComfyUI."""
+    """Domain entity representing a generated output image from ComfyUI.
+    
+    Equality and hashing are identity-based (see ``Entity``): two outputs are
+    the same if they share an ID, so set/dict dedup only hashes the ID string.
+    """
     
     filename: str
     file_path: str
@@ -95,12 +105,8 @@ class Output(Entity):
             validate_file_path(self.thumbnail_path, "thumbnail_path")
         
         # Validate supported image formats
-        supported_formats = {'png', 'jpg', 'jpeg', 'webp'}
-        if self.file_format.lower() not in supported_formats:
-            raise ValidationError(
-                f"file_format must be one of {supported_formats}", 
-                "file_format"
-            )
+        if self.file_format.lower() not in SUPPORTED_OUTPUT_FORMATS:
+            raise ValidationError(UNSUPPORTED_FORMAT_MESSAGE, "file_format")
     
     @property
     def file_name(self) -> str:
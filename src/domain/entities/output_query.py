@@ -0,0 +1,90 @@
+"""Output query value objects."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional
+
+from .base import ValueObject, ValidationError
+from .output import Output, SUPPORTED_OUTPUT_FORMATS, UNSUPPORTED_FORMAT_MESSAGE
+
+
+SUPPORTED_OUTPUT_SORT_FIELDS = frozenset({'date', 'name', 'size'})
+_UNSUPPORTED_SORT_MESSAGE = (
+    f"sort_by must be one of {', '.join(sorted(SUPPORTED_OUTPUT_SORT_FIELDS))}"
+)
+
+
+def _name_sort_key(output: Output) -> str:
+    """Sort key ordering outputs by filename, ignoring case."""
+    return output.filename.lower()
+
+
+# Shared sort key functions; sorted() calls each once per output
+_OUTPUT_SORT_KEYS: Dict[str, Callable[[Output], Any]] = {
+    'date': attrgetter('created_at'),
+    'name': _name_sort_key,
+    'size': attrgetter('file_size'),
+}
+
+
+@dataclass(frozen=True)
+class OutputFilter(ValueObject):
+    """Value object describing which outputs a listing should include.
+
+    All criteria are optional; unset criteria match every output.
+    """
+
+    file_format: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Validate and normalize filter criteria after initialization."""
+        if self.file_format is not None:
+            normalized_format = self.file_format.strip().lower()
+            if normalized_format not in SUPPORTED_OUTPUT_FORMATS:
+                raise ValidationError(UNSUPPORTED_FORMAT_MESSAGE, "file_format")
+            object.__setattr__(self, "file_format", normalized_format)
+
+        if self.start_date is not None and not isinstance(self.start_date, datetime):
+            raise ValidationError("start_date must be a datetime", "start_date")
+
+        if self.end_date is not None and not isinstance(self.end_date, datetime):
+            raise ValidationError("end_date must be a datetime", "end_date")
+
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValidationError("start_date cannot be after end_date", "date_range")
+
+    def matches(self, output: Output) -> bool:
+        """Check whether an output satisfies every filter criterion."""
+        if self.file_format is not None and output.file_format.lower() != self.file_format:
+            return False
+        if self.start_date is not None and output.created_at < self.start_date:
+            return False
+        if self.end_date is not None and output.created_at > self.end_date:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class OutputSort(ValueObject):
+    """Value object describing the order of an output listing."""
+
+    sort_by: str = 'date'
+    ascending: bool = False
+
+    def __post_init__(self):
+        """Validate and normalize sort criteria after initialization."""
+        if not self.sort_by or not self.sort_by.strip():
+            raise ValidationError("sort_by cannot be empty", "sort_by")
+
+        normalized_sort_by = self.sort_by.strip().lower()
+        if normalized_sort_by not in SUPPORTED_OUTPUT_SORT_FIELDS:
+            raise ValidationError(_UNSUPPORTED_SORT_MESSAGE, "sort_by")
+        object.__setattr__(self, "sort_by", normalized_sort_by)
+
+    @property
+    def key(self) -> Callable[[Output], Any]:
+        """Get the sort key function for the configured field."""
+        return _OUTPUT_SORT_KEYS[self.sort_by]
@@ -10,7 +10,7 @@ from .driven.folder_repository_port import FolderRepositoryPort
 from .driven.external_metadata_port import ExternalMetadataPort
 from .driven.cache_port import CachePort
 
-__all__ = [
+__all__ = (
     # Driving ports
     "ModelManagementPort",
     "FolderManagementPort",
@@ -19,4 +19,4 @@ __all__ = [
     "FolderRepositoryPort",
     "ExternalMetadataPort",
     "CachePort"
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -5,16 +5,17 @@ from .folder_repository_port import FolderRepositoryPort
 from .external_metadata_port import ExternalMetadataPort
 from .cache_port import CachePort
 from .output_repository_port import OutputRepositoryPort
-from .external_model_port import ExternalModelPort, ExternalAPIError, RateLimitError, PlatformUnavailableError
+from .external_model_port import ExternalModelPort, CachedResponse, ExternalAPIError, RateLimitError, PlatformUnavailableError
 
-__all__ = [
+__all__ = (
     "ModelRepositoryPort",
     "FolderRepositoryPort", 
     "ExternalMetadataPort",
     "CachePort",
     "OutputRepositoryPort",
     "ExternalModelPort",
+    "CachedResponse",
     "ExternalAPIError",
     "RateLimitError",
     "PlatformUnavailableError"
-]
\ No newline at end of file
+)
\ No newline at end of file
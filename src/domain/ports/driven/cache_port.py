@@ -11,6 +11,10 @@ class CachePort(ABC):
     It is implemented by driven adapters and used by domain services.
     """
     
+    # Whether delete_prefix is available; callers that need to drop a group
+    # of keys otherwise delete the keys they wrote one by one
+    supports_prefix_delete = False
+    
     @abstractmethod
     def get(self, key: str) -> Optional[Any]:
         """Get a value from the cache.
@@ -61,4 +65,19 @@ class CachePort(ABC):
         Returns:
             True if key exists, False otherwise
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every value whose key starts with a prefix.
+        
+        Caches that cannot enumerate their keys keep this default, which
+        deletes nothing. Callers must check ``supports_prefix_delete`` and,
+        when it is False, track and delete the keys they wrote themselves.
+        
+        Args:
+            prefix: The key prefix to delete
+            
+        Returns:
+            Number of deleted values
+        """
+        return 0
@@ -1,7 +1,8 @@
 """External metadata driven port (secondary interface)."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ...entities.external_metadata import ExternalMetadata, CivitAIMetadata, HuggingFaceMetadata
 
@@ -14,7 +15,7 @@ class ExternalMetadataPort(ABC):
     """
     
     @abstractmethod
-    def fetch_metadata(self, identifier: str) -> Optional[ExternalMetadata]:
+    async def fetch_metadata(self, identifier: str) -> Optional[ExternalMetadata]:
         """Fetch metadata from external source using an identifier.
         
         Args:
@@ -26,8 +27,30 @@ class ExternalMetadataPort(ABC):
         """
         pass
     
+    async def fetch_metadata_bulk(self, identifiers: List[str]) -> Dict[str, ExternalMetadata]:
+        """Fetch metadata for several identifiers in one call.
+        
+        The default implementation calls ``fetch_metadata`` for every
+        identifier concurrently; adapters backed by a batch endpoint should
+        override it.
+        
+        Args:
+            identifiers: The identifiers to use for metadata lookup
+            
+        Returns:
+            Dictionary mapping each identifier with metadata to its metadata
+        """
+        fetched = await asyncio.gather(
+            *(self.fetch_metadata(identifier) for identifier in identifiers)
+        )
+        return {
+            identifier: metadata
+            for identifier, metadata in zip(identifiers, fetched)
+            if metadata
+        }
+    
     @abstractmethod
-    def fetch_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
+    async def fetch_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
         """Fetch metadata specifically from CivitAI.
         
         Args:
@@ -39,7 +62,7 @@ class ExternalMetadataPort(ABC):
         pass
     
     @abstractmethod
-    def fetch_huggingface_metadata(self, model_name: str) -> Optional[HuggingFaceMetadata]:
+    async def fetch_huggingface_metadata(self, model_name: str) -> Optional[HuggingFaceMetadata]:
         """Fetch metadata specifically from HuggingFace.
         
         Args:
@@ -48,4 +71,11 @@ class ExternalMetadataPort(ABC):
         Returns:
             HuggingFace metadata if found, None otherwise
         """
+        pass
+    
+    async def close(self) -> None:
+        """Release resources held by the port, such as pooled HTTP connections.
+        
+        The default does nothing.
+        """
         pass
\ No newline at end of file
@@ -1,11 +1,64 @@
 """External model driven port (secondary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Generic, List, Mapping, Optional, TypeVar
 
 from ...entities.external_model import ExternalModel, ExternalPlatform
 
 
+T = TypeVar("T")
+
+
+@dataclass
+class CachedResponse(Generic[T]):
+    """Result of a conditional read from an external platform.
+    
+    Carries the validators (``ETag`` and ``Last-Modified``) returned by the
+    platform so a later read can be made conditional. When the platform
+    answers ``304 Not Modified``, ``not_modified`` is set and ``value`` is
+    None; the caller should reuse the value it already holds.
+    """
+    
+    value: Optional[T]
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+    not_modified: bool = False
+    
+    @property
+    def has_validators(self) -> bool:
+        """Check whether the response can be used for a conditional read."""
+        return bool(self.etag or self.last_modified)
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build ``If-None-Match``/``If-Modified-Since`` headers from the validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+    
+    @classmethod
+    def from_headers(cls, value: Optional[T], headers: Mapping[str, Any]) -> "CachedResponse[T]":
+        """Create a response, reading validators from HTTP response headers."""
+        etag = headers.get("ETag")
+        last_modified = None
+        raw_last_modified = headers.get("Last-Modified")
+        if isinstance(raw_last_modified, str):
+            try:
+                last_modified = parsedate_to_datetime(raw_last_modified)
+            except (TypeError, ValueError):
+                last_modified = None
+        return cls(
+            value=value,
+            etag=etag if isinstance(etag, str) else None,
+            last_modified=last_modified
+        )
+
+
 class ExternalModelPort(ABC):
     """Secondary port for external model data access.
     
@@ -57,6 +110,34 @@ class ExternalModelPort(ABC):
         """
         pass
     
+    async def get_model_details_conditional(
+        self,
+        platform: ExternalPlatform,
+        model_id: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None
+    ) -> CachedResponse[ExternalModel]:
+        """Get model details unless they are unchanged since a previous read.
+        
+        Adapters backed by HTTP should send ``If-None-Match``/``If-Modified-Since``
+        and return a ``not_modified`` response on ``304`` without parsing a
+        payload. The default implementation performs an unconditional read.
+        
+        Args:
+            platform: The external platform to query
+            model_id: The platform-specific ID of the model
+            etag: ETag returned by a previous read (optional)
+            last_modified: Last-Modified value returned by a previous read (optional)
+            
+        Returns:
+            Cached response holding the model (None if not found) and its validators
+            
+        Raises:
+            ValidationError: If model_id is invalid
+            ExternalAPIError: If external API call fails
+        """
+        return CachedResponse(value=await self.get_model_details(platform, model_id))
+    
     @abstractmethod
     async def get_popular_models(
         self, 
@@ -137,6 +218,14 @@ class ExternalModelPort(ABC):
             Dictionary containing platform capabilities and limitations
         """
         pass
+    
+    async def close(self) -> None:
+        """Release resources held by the port, such as pooled HTTP connections.
+        
+        Adapters keep one HTTP session for their lifetime so requests reuse
+        open connections; this closes it. The default does nothing.
+        """
+        pass
 
 
 class ExternalAPIError(Exception):
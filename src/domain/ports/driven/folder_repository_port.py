@@ -1,7 +1,7 @@
 """Folder repository driven port (secondary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Hashable, List, Dict, Optional
 
 from ...entities.folder import Folder
 
@@ -22,6 +22,20 @@ class FolderRepositoryPort(ABC):
         """
         pass
     
+    def get_change_token(self) -> Optional[Hashable]:
+        """Get a cheap token that changes whenever the folder list may change.
+        
+        Services compare tokens between calls to decide whether a cached
+        folder list is still valid, so computing the token must be much
+        cheaper than ``get_all_folders`` (e.g. a few ``stat`` calls).
+        The default implementation returns None, meaning the repository
+        cannot validate cached results and must be read on every call.
+        
+        Returns:
+            Hashable change token, or None if changes cannot be detected
+        """
+        return None
+    
     @abstractmethod
     def get_folder_structure(self) -> Dict[str, Folder]:
         """Get the complete folder structure.
@@ -1,7 +1,7 @@
 """Model repository driven port (secondary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Dict, Tuple
 
 from ...entities.model import Model
 
@@ -25,6 +25,20 @@ class ModelRepositoryPort(ABC):
         """
         pass
     
+    def iter_in_folder(self, folder_id: str) -> Iterator[Model]:
+        """Lazily iterate over the models in a specific folder.
+        
+        The default implementation delegates to ``find_all_in_folder``;
+        adapters that can discover models incrementally should override it.
+        
+        Args:
+            folder_id: The ID of the folder to search in
+            
+        Returns:
+            Iterator yielding the models found in the folder
+        """
+        yield from self.find_all_in_folder(folder_id)
+    
     @abstractmethod
     def find_by_id(self, model_id: str) -> Optional[Model]:
         """Find a model by its ID.
@@ -37,10 +51,32 @@ class ModelRepositoryPort(ABC):
         """
         pass
     
+    def find_by_ids(self, model_ids: List[str]) -> Dict[str, Model]:
+        """Find several models by their IDs.
+        
+        The default implementation delegates to ``find_by_id`` for each ID;
+        adapters that can resolve IDs in a single pass should override it.
+        
+        Args:
+            model_ids: The IDs of the models to find
+            
+        Returns:
+            Dictionary mapping each found model ID to its model
+        """
+        models = {}
+        for model_id in model_ids:
+            model = self.find_by_id(model_id)
+            if model is not None:
+                models[model_id] = model
+        return models
+    
     @abstractmethod
     def search(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
         """Search for models based on query and optional folder filter.
         
+        Implementations should use an index (e.g. trigrams) so the cost
+        depends on the number of matches rather than the number of models.
+        
         Args:
             query: Search query string
             folder_id: Optional folder ID to limit search scope
@@ -50,6 +86,31 @@ class ModelRepositoryPort(ABC):
         """
         pass
     
+    def search_page(
+        self,
+        query: str,
+        folder_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Model]:
+        """Get one page of the models matching a search.
+        
+        The default implementation slices the result of ``search``; adapters
+        that can stop matching once the page is full should override it.
+        
+        Args:
+            query: Search query string
+            folder_id: Optional folder ID to limit search scope
+            limit: Maximum number of models to return (None for no limit)
+            offset: Number of matching models to skip
+            
+        Returns:
+            List of models matching the search criteria, in search order
+        """
+        models = self.search(query, folder_id)
+        end = None if limit is None else offset + limit
+        return models[offset:end]
+    
     @abstractmethod
     def save(self, model: Model) -> None:
         """Save or update a model.
@@ -59,6 +120,19 @@ class ModelRepositoryPort(ABC):
         """
         pass
     
+    def save_all(self, models: List[Model]) -> None:
+        """Save or update several models.
+        
+        The default implementation delegates to ``save`` for each model;
+        adapters backed by a store with batch writes should override it.
+        When several models share an ID, only the last one is written.
+        
+        Args:
+            models: The models to save
+        """
+        for model in {model.id: model for model in models}.values():
+            self.save(model)
+    
     @abstractmethod
     def delete(self, model_id: str) -> bool:
         """Delete a model by its ID.
@@ -72,10 +146,14 @@ class ModelRepositoryPort(ABC):
         pass
     
     @abstractmethod
-    def get_all_user_tags(self) -> List[str]:
+    def get_all_user_tags(self) -> Tuple[str, ...]:
         """Get all unique user tags across all models.
         
+        Implementations should keep a tag index up to date in ``save`` and
+        ``delete`` so this does not scan every model.
+        
         Returns:
-            List of unique user tags
+            Sorted tuple of unique user tags. The tuple is immutable, so
+            implementations may return the same object on repeated calls.
         """
         pass
\ No newline at end of file
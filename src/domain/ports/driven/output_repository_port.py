@@ -1,10 +1,14 @@
 """Output repository driven port (secondary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Iterator, List, Optional, Dict, Tuple
 from datetime import datetime
+import heapq
 
 from ...entities.output import Output
+from ...entities.output_query import OutputFilter, OutputSort
 
 
 class OutputRepositoryPort(ABC):
@@ -26,6 +30,49 @@ class OutputRepositoryPort(ABC):
         """
         pass
     
+    def iter_output_directory(self) -> Iterator[Output]:
+        """Lazily scan the ComfyUI output directory for generated images.
+        
+        The default implementation delegates to ``scan_output_directory``;
+        adapters that can scan incrementally should override it.
+        
+        Returns:
+            Iterator yielding outputs found in the output directory
+            
+        Raises:
+            IOError: If output directory cannot be accessed
+        """
+        yield from self.scan_output_directory()
+    
+    def query_outputs(
+        self,
+        output_filter: OutputFilter,
+        output_sort: Optional[OutputSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Output]:
+        """Filter, order and limit outputs in a single pass over the directory.
+        
+        Outputs are returned without thumbnails or workflow metadata, so
+        callers only enrich the outputs that make the cut. The default
+        implementation filters the lazy directory scan and, with a limit,
+        keeps only the leading outputs in a bounded heap.
+        
+        Args:
+            output_filter: Criteria outputs must match
+            output_sort: Optional ordering; None keeps the scan order
+            limit: Optional maximum number of outputs to return
+            
+        Returns:
+            Matching outputs in the requested order
+        """
+        matches = (output for output in self.iter_output_directory() if output_filter.matches(output))
+        if output_sort is None:
+            return list(islice(matches, limit))
+        if limit is None:
+            return sorted(matches, key=output_sort.key, reverse=not output_sort.ascending)
+        select = heapq.nsmallest if output_sort.ascending else heapq.nlargest
+        return select(limit, matches, key=output_sort.key)
+    
     @abstractmethod
     def get_output_by_id(self, output_id: str) -> Optional[Output]:
         """Get a specific output by its ID.
@@ -38,6 +85,25 @@ class OutputRepositoryPort(ABC):
         """
         pass
     
+    def get_outputs_by_ids(self, output_ids: List[str]) -> Dict[str, Output]:
+        """Get several outputs by their IDs.
+        
+        The default implementation delegates to ``get_output_by_id`` for each
+        ID; adapters that can resolve IDs in a single scan should override it.
+        
+        Args:
+            output_ids: The IDs of the outputs to retrieve
+            
+        Returns:
+            Dictionary mapping each found output ID to its output
+        """
+        outputs = {}
+        for output_id in output_ids:
+            output = self.get_output_by_id(output_id)
+            if output is not None:
+                outputs[output_id] = output
+        return outputs
+    
     @abstractmethod
     def get_outputs_by_date_range(
         self, 
@@ -91,6 +157,63 @@ class OutputRepositoryPort(ABC):
         """
         pass
     
+    def extract_and_thumbnail(
+        self, output: Output
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Generate a thumbnail and extract workflow metadata together.
+        
+        Adapters should override this to read the output file only once.
+        The default implementation calls ``generate_thumbnail`` and
+        ``extract_workflow_metadata`` in turn.
+        
+        Args:
+            output: The output to process
+            
+        Returns:
+            Tuple of the thumbnail path and the workflow metadata, each None
+            if it could not be produced
+        """
+        return self.generate_thumbnail(output), self.extract_workflow_metadata(output)
+    
+    def enrich_batch(self, outputs: List[Output]) -> List[Output]:
+        """Attach thumbnails and workflow metadata to several outputs.
+        
+        Adapters should override this to overlap the file reads of a whole
+        listing. The default implementation enriches each output in turn.
+        Fields an output already has are kept.
+        
+        Args:
+            outputs: The outputs to enrich
+            
+        Returns:
+            Outputs in the same order, with thumbnail_path and
+            workflow_metadata filled in where they could be produced
+        """
+        return [self._enrich_one_or_original(output) for output in outputs]
+    
+    def _enrich_one_or_original(self, output: Output) -> Output:
+        """Enrich a single output, keeping it unchanged if its file cannot be read."""
+        try:
+            return self._enrich_one(output)
+        except Exception:
+            return output
+    
+    def _enrich_one(self, output: Output) -> Output:
+        """Attach a thumbnail and workflow metadata to a single output."""
+        thumbnail_path = output.thumbnail_path
+        workflow_metadata = output.workflow_metadata
+        if not thumbnail_path and not workflow_metadata:
+            thumbnail_path, workflow_metadata = self.extract_and_thumbnail(output)
+        elif not thumbnail_path:
+            thumbnail_path = self.generate_thumbnail(output)
+        elif not workflow_metadata:
+            workflow_metadata = self.extract_workflow_metadata(output)
+        thumbnail_path = thumbnail_path or output.thumbnail_path
+        workflow_metadata = workflow_metadata or output.workflow_metadata
+        if thumbnail_path is output.thumbnail_path and workflow_metadata is output.workflow_metadata:
+            return output
+        return replace(output, thumbnail_path=thumbnail_path, workflow_metadata=workflow_metadata)
+    
     @abstractmethod
     def load_workflow_to_comfyui(self, output: Output) -> bool:
         """Load the workflow from the output back into ComfyUI.
@@ -115,6 +238,21 @@ class OutputRepositoryPort(ABC):
         """
         pass
     
+    def open_files_in_system(self, outputs: List[Output]) -> Dict[str, bool]:
+        """Open several output files in the system's default image viewer.
+        
+        Adapters should override this to open all files with a single viewer
+        process where the platform supports it. The default implementation
+        opens each file separately.
+        
+        Args:
+            outputs: The outputs to open
+            
+        Returns:
+            Dictionary mapping each output ID to whether it was opened
+        """
+        return {output.id: self.open_file_in_system(output) for output in outputs}
+    
     @abstractmethod
     def show_file_in_folder(self, output: Output) -> bool:
         """Open the containing folder of the output file in the system file explorer.
@@ -5,9 +5,9 @@ from .folder_management_port import FolderManagementPort
 from .output_management_port import OutputManagementPort
 from .external_model_management_port import ExternalModelManagementPort
 
-__all__ = [
+__all__ = (
     "ModelManagementPort",
     "FolderManagementPort",
     "OutputManagementPort",
     "ExternalModelManagementPort"
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,9 +1,9 @@
 """External model management driving port (primary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from ...entities.external_model import ExternalModel, ExternalPlatform
+from ...entities.external_model import ExternalModel, ExternalPlatform, PlatformInfo, SearchResult
 
 
 class ExternalModelManagementPort(ABC):
@@ -20,29 +20,31 @@ class ExternalModelManagementPort(ABC):
         query: str = "", 
         limit: int = 20, 
         offset: int = 0,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None
+    ) -> SearchResult:
         """Search for models across external platforms.
         
+        Results are cached by their arguments; the default TTL is 6 hours.
+        
         Args:
             platform: Optional specific platform to search (searches all if None)
             query: Search query string (optional)
             limit: Maximum number of results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (deprecated, use cursor)
             filters: Platform-specific filters (optional)
+            cursor: Opaque pagination token returned as ``next_cursor`` by a
+                previous call; takes precedence over ``offset`` when given
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
             
         Returns:
-            Dictionary containing search results with metadata:
-            {
-                "models": List[ExternalModel],
-                "total": int,
-                "has_more": bool,
-                "next_offset": Optional[int],
-                "platforms_searched": List[str]
-            }
+            Search result with the page of models and pagination metadata.
+            ``next_offset`` is only set when a single platform is searched;
+            across several platforms use ``next_cursor``
             
         Raises:
-            ValidationError: If search parameters are invalid
+            ValidationError: If search parameters or the cursor are invalid
         """
         pass
     
@@ -69,14 +71,20 @@ class ExternalModelManagementPort(ABC):
         self, 
         platform: Optional[ExternalPlatform] = None,
         limit: int = 20,
-        model_type: Optional[str] = None
+        model_type: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None,
+        fast_path: bool = False
     ) -> List[ExternalModel]:
         """Get popular/trending models from external platforms.
         
+        Results are cached by their arguments; the default TTL is 48 hours.
+        
         Args:
             platform: Optional specific platform to query (queries all if None)
             limit: Maximum number of results to return
             model_type: Optional model type filter
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
+            fast_path: Stop querying platforms once ``limit`` models arrived
             
         Returns:
             List of popular external models
@@ -91,14 +99,20 @@ class ExternalModelManagementPort(ABC):
         self, 
         platform: Optional[ExternalPlatform] = None,
         limit: int = 20,
-        model_type: Optional[str] = None
+        model_type: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None,
+        fast_path: bool = False
     ) -> List[ExternalModel]:
         """Get recently published models from external platforms.
         
+        Results are cached by their arguments; the default TTL is 1 hour.
+        
         Args:
             platform: Optional specific platform to query (queries all if None)
             limit: Maximum number of results to return
             model_type: Optional model type filter
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
+            fast_path: Stop querying platforms once ``limit`` models arrived
             
         Returns:
             List of recent external models
@@ -114,28 +128,24 @@ class ExternalModelManagementPort(ABC):
         platform: Optional[ExternalPlatform] = None,
         model_type: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> SearchResult:
         """Get models that are compatible with ComfyUI.
         
         Args:
             platform: Optional specific platform to query (queries all if None)
             model_type: Optional ComfyUI model type filter
             limit: Maximum number of results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (deprecated, use cursor)
+            cursor: Opaque pagination token returned as ``next_cursor`` by a
+                previous call; takes precedence over ``offset`` when given
             
         Returns:
-            Dictionary containing compatible models with metadata:
-            {
-                "models": List[ExternalModel],
-                "total": int,
-                "has_more": bool,
-                "next_offset": Optional[int],
-                "platforms_searched": List[str]
-            }
+            Search result with the page of compatible models and pagination metadata
             
         Raises:
-            ValidationError: If parameters are invalid
+            ValidationError: If parameters or the cursor are invalid
         """
         pass
     
@@ -155,6 +165,37 @@ class ExternalModelManagementPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def check_model_availability_bulk(
+        self,
+        items: List[Tuple[ExternalPlatform, str]]
+    ) -> Dict[Tuple[ExternalPlatform, str], bool]:
+        """Check availability of several models concurrently.
+        
+        Args:
+            items: List of (platform, model_id) pairs to check
+            
+        Returns:
+            Dictionary mapping each (platform, model_id) pair to True if the
+            model is available, False otherwise
+            
+        Raises:
+            ValidationError: If items is empty or contains an invalid entry
+        """
+        pass
+    
+    @abstractmethod
+    def clear_cache_for_platform(self, platform: ExternalPlatform) -> None:
+        """Invalidate all cached query results involving a platform.
+        
+        Args:
+            platform: The external platform whose cached results are stale
+            
+        Raises:
+            ValidationError: If platform is invalid
+        """
+        pass
+    
     @abstractmethod
     def get_supported_platforms(self) -> List[ExternalPlatform]:
         """Get list of supported external platforms.
@@ -165,22 +206,14 @@ class ExternalModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def get_platform_info(self, platform: ExternalPlatform) -> Dict[str, Any]:
+    def get_platform_info(self, platform: ExternalPlatform) -> PlatformInfo:
         """Get information about a specific platform.
         
         Args:
             platform: The external platform to get info for
             
         Returns:
-            Dictionary containing platform information:
-            {
-                "name": str,
-                "display_name": str,
-                "capabilities": Dict[str, Any],
-                "supported_model_types": List[str],
-                "rate_limits": Dict[str, Any],
-                "is_available": bool
-            }
+            Immutable platform information
             
         Raises:
             ValidationError: If platform is invalid
@@ -207,4 +240,29 @@ class ExternalModelManagementPort(ABC):
         Raises:
             ValidationError: If parameters are invalid
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_landing_page(
+        self,
+        platform: Optional[ExternalPlatform] = None,
+        limits: Optional[Dict[str, int]] = None
+    ) -> Dict[str, List[ExternalModel]]:
+        """Get the popular, recent and suggested models for the browse screen in one call.
+        
+        Implementations should fetch the sections concurrently and share
+        upstream requests between sections where possible, instead of the
+        caller issuing one request per section and platform.
+        
+        Args:
+            platform: Optional specific platform to query (queries all if None)
+            limits: Optional per-section limits with keys ``popular``, ``recent``
+                and ``suggestions`` (defaults: 20, 20 and 10)
+            
+        Returns:
+            Dictionary with ``popular``, ``recent`` and ``suggestions`` model lists
+            
+        Raises:
+            ValidationError: If limits are invalid
+        """
+        pass
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict
 
-from ...entities.folder import Folder
+from ...entities.folder import Folder, FolderSnapshot
 
 
 class FolderManagementPort(ABC):
@@ -17,6 +17,11 @@ class FolderManagementPort(ABC):
     def get_all_folders(self) -> List[Folder]:
         """Get all available model folders.
         
+        This is called on every sidebar render, so implementations should
+        serve it from an in-memory result and only rescan when the folder
+        repository's change token (the modification times of the model
+        folders) differs from the one the result was built with.
+        
         Returns:
             List of all folders in the system
         """
@@ -42,8 +47,23 @@ class FolderManagementPort(ABC):
     def get_folder_structure(self) -> Dict[str, Folder]:
         """Get the complete folder structure as a hierarchical dictionary.
         
+        Deprecated: use ``get_folder_snapshot`` instead, which avoids
+        rebuilding a dictionary of folder entities on every call.
+        
         Returns:
             Dictionary mapping folder IDs to Folder objects, representing
             the complete folder hierarchy
         """
+        pass
+    
+    @abstractmethod
+    def get_folder_snapshot(self) -> FolderSnapshot:
+        """Get an immutable snapshot of the complete folder structure.
+        
+        Implementations may cache the snapshot and return the same instance
+        until the folder structure changes.
+        
+        Returns:
+            Column-oriented snapshot of all folders and their parent links
+        """
         pass
\ No newline at end of file
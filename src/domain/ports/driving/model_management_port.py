@@ -1,9 +1,9 @@
 """Model management driving port (primary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 
-from ...entities.model import Model
+from ...entities.model import Model, BulkUpdateResult
 
 
 class ModelManagementPort(ABC):
@@ -13,8 +13,10 @@ class ModelManagementPort(ABC):
     It is implemented by domain services and used by driving adapters.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
-    def get_models_in_folder(self, folder_id: str) -> List[Model]:
+    async def get_models_in_folder(self, folder_id: str) -> List[Model]:
         """Get all models in a specific folder.
         
         Args:
@@ -29,9 +31,48 @@ class ModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def get_model_details(self, model_id: str) -> Model:
+    async def get_models_in_folder_enriched(self, folder_id: str) -> List[Model]:
+        """Get all models in a specific folder with external metadata applied.
+        
+        Metadata for the whole folder is fetched in one batch before any
+        model is enriched.
+        
+        Args:
+            folder_id: The ID of the folder to get models from
+            
+        Returns:
+            List of models in the folder, enriched where metadata was found
+            
+        Raises:
+            ValidationError: If folder_id is invalid
+        """
+        pass
+    
+    @abstractmethod
+    def stream_models_in_folder(self, folder_id: str) -> AsyncIterator[Model]:
+        """Stream the models in a specific folder as they are discovered.
+        
+        Unlike ``get_models_in_folder`` this does not build the full list
+        first, so callers can forward each model as soon as it is available.
+        
+        Args:
+            folder_id: The ID of the folder to get models from
+            
+        Returns:
+            Async iterator yielding the models in the folder
+            
+        Raises:
+            ValidationError: If folder_id is invalid (raised on first iteration)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_model_details(self, model_id: str) -> Model:
         """Get detailed information about a specific model.
         
+        This is async like ``ExternalModelManagementPort.get_model_details``
+        so local and external lookups can be awaited together.
+        
         Args:
             model_id: The ID of the model to get details for
             
@@ -45,12 +86,43 @@ class ModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def search_models(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
+    async def get_model_details_bulk(self, model_ids: List[str]) -> Dict[str, Model]:
+        """Get detailed information about several models in one call.
+        
+        Implementations should resolve all IDs in a single repository pass
+        rather than issuing one lookup per ID.
+        
+        Args:
+            model_ids: List of model IDs to get details for
+            
+        Returns:
+            Dictionary mapping each found model ID to its model. IDs that
+            do not match any model are omitted.
+            
+        Raises:
+            ValidationError: If model_ids is invalid
+        """
+        pass
+    
+    @abstractmethod
+    async def search_models(
+        self,
+        query: str,
+        folder_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Model]:
         """Search for models based on query and optional folder filter.
         
+        Search runs on every keystroke, so implementations should answer it
+        from an index rather than scanning every model, and callers may
+        cancel a search that has been superseded by a newer query.
+        
         Args:
             query: Search query string
             folder_id: Optional folder ID to limit search scope
+            limit: Optional maximum number of models to return
+            offset: Number of matching models to skip
             
         Returns:
             List of models matching the search criteria
@@ -61,7 +133,7 @@ class ModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def enrich_model_metadata(self, model: Model) -> Model:
+    async def enrich_model_metadata(self, model: Model) -> Model:
         """Enrich model with external metadata.
         
         Args:
@@ -75,6 +147,21 @@ class ModelManagementPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def enrich_model_metadata_bulk(self, models: List[Model]) -> List[Model]:
+        """Enrich several models with external metadata in one call.
+        
+        Args:
+            models: The models to enrich with external metadata
+            
+        Returns:
+            Models in the same order, enriched where metadata was found
+            
+        Raises:
+            ValidationError: If models is invalid
+        """
+        pass
+    
     @abstractmethod
     def update_model_metadata(self, model_id: str, metadata: dict) -> Model:
         """Update user metadata for a specific model.
@@ -93,7 +180,7 @@ class ModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> List[Model]:
+    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> BulkUpdateResult:
         """Update metadata for multiple models at once.
         
         Args:
@@ -101,7 +188,8 @@ class ModelManagementPort(ABC):
             metadata: Dictionary containing metadata updates
             
         Returns:
-            List of updated models
+            Result with the updated models and, for every other requested
+            ID, the reason it was not updated
             
         Raises:
             ValidationError: If model_ids or metadata is invalid
@@ -109,10 +197,15 @@ class ModelManagementPort(ABC):
         pass
     
     @abstractmethod
-    def get_all_user_tags(self) -> List[str]:
+    def get_all_user_tags(self) -> Tuple[str, ...]:
         """Get all unique user tags across all models for autocomplete.
         
+        This is called on every autocomplete keystroke, so implementations
+        should serve it from an index maintained as metadata changes rather
+        than by scanning every model.
+        
         Returns:
-            List of unique user tags
+            Sorted tuple of unique user tags. The tuple is immutable, so
+            implementations may return the same object on repeated calls.
         """
         pass
\ No newline at end of file
@@ -1,10 +1,11 @@
 """Output management driving port (primary interface)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Dict
 from datetime import datetime
 
 from ...entities.output import Output
+from ...entities.output_query import OutputFilter, OutputSort
 
 
 class OutputManagementPort(ABC):
@@ -26,6 +27,47 @@ class OutputManagementPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_all_outputs(self) -> Iterator[Output]:
+        """Lazily iterate over all outputs in the output directory.
+        
+        Unlike ``get_all_outputs`` this yields each output as it is scanned,
+        so large output directories are never held in memory as a whole.
+        
+        Returns:
+            Iterator yielding all outputs found in the output directory
+            
+        Raises:
+            ValidationError: If output directory configuration is invalid
+        """
+        pass
+    
+    @abstractmethod
+    def list_outputs(
+        self,
+        output_filter: Optional[OutputFilter] = None,
+        output_sort: Optional[OutputSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Output]:
+        """List outputs matching a filter, in order, in a single pass.
+        
+        Filtering, ordering and truncation happen together so implementations
+        can avoid materializing and sorting the full output set.
+        
+        Args:
+            output_filter: Optional criteria outputs must match
+            output_sort: Optional ordering (defaults to newest first)
+            limit: Optional maximum number of outputs to return
+            
+        Returns:
+            List of matching outputs in the requested order
+            
+        Raises:
+            ValidationError: If limit is invalid or the output directory
+                configuration is invalid
+        """
+        pass
+    
     @abstractmethod
     def get_output_details(self, output_id: str) -> Output:
         """Get detailed information about a specific output.
@@ -42,6 +84,25 @@ class OutputManagementPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_output_details_bulk(self, output_ids: List[str]) -> Dict[str, Output]:
+        """Get detailed information about several outputs in one call.
+        
+        Implementations should resolve all IDs with a single directory scan
+        rather than rescanning once per ID.
+        
+        Args:
+            output_ids: List of output IDs to get details for
+            
+        Returns:
+            Dictionary mapping each found output ID to its output. IDs that
+            do not match any output are omitted.
+            
+        Raises:
+            ValidationError: If output_ids is invalid
+        """
+        pass
+    
     @abstractmethod
     def refresh_outputs(self) -> List[Output]:
         """Refresh the output list by rescanning the output directory.
@@ -62,6 +123,8 @@ class OutputManagementPort(ABC):
     ) -> List[Output]:
         """Get outputs created within a specific date range.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
             start_date: Start of the date range (inclusive)
             end_date: End of the date range (inclusive)
@@ -78,6 +141,8 @@ class OutputManagementPort(ABC):
     def get_outputs_by_format(self, file_format: str) -> List[Output]:
         """Get outputs filtered by file format.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
             file_format: File format to filter by (png, jpg, jpeg, webp)
             
@@ -92,16 +157,21 @@ class OutputManagementPort(ABC):
     @abstractmethod
     def sort_outputs(
         self, 
-        outputs: List[Output], 
+        outputs: Iterable[Output], 
         sort_by: str, 
-        ascending: bool = True
+        ascending: bool = True,
+        limit: Optional[int] = None
     ) -> List[Output]:
         """Sort outputs by specified criteria.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
-            outputs: List of outputs to sort
+            outputs: Outputs to sort (any iterable, e.g. ``iter_all_outputs()``)
             sort_by: Sort criteria (date, name, size)
             ascending: Whether to sort in ascending order
+            limit: Optional number of leading outputs to keep; only that many
+                are held in memory while consuming ``outputs``
             
         Returns:
             Sorted list of outputs
@@ -143,6 +213,25 @@ class OutputManagementPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def open_in_system_viewer_bulk(self, output_ids: List[str]) -> Dict[str, bool]:
+        """Open several output files in the system's default image viewer.
+        
+        Implementations should open the files with as few viewer processes
+        as the platform allows instead of spawning one per file.
+        
+        Args:
+            output_ids: List of output IDs to open
+            
+        Returns:
+            Dictionary mapping each requested output ID to whether it was
+            opened. IDs that do not match any output map to False.
+            
+        Raises:
+            ValidationError: If output_ids is invalid
+        """
+        pass
+    
     @abstractmethod
     def show_in_folder(self, output_id: str) -> bool:
         """Open the containing folder of the output file in the system file explorer.
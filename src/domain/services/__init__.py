@@ -6,10 +6,10 @@ from .metadata_service import MetadataService
 from .output_service import OutputService
 from .external_model_service import ExternalModelService
 
-__all__ = [
+__all__ = (
     "ModelService",
-    "FolderService", 
+    "FolderService",
     "MetadataService",
     "OutputService",
     "ExternalModelService"
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""Caching support for external model service calls."""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from ..entities.external_model import ExternalModel, ExternalPlatform
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "external_models"
+
+# Default cache lifetimes, in seconds, for external model queries
+SEARCH_CACHE_TTL = 6 * 60 * 60
+POPULAR_CACHE_TTL = 48 * 60 * 60
+RECENT_CACHE_TTL = 60 * 60
+
+# Argument that callers use to override a method's default TTL
+TTL_OVERRIDE_ARGUMENT = "cache_ttl_seconds"
+
+
+def platform_generation_key(platform: ExternalPlatform) -> str:
+    """Get the cache key holding the current cache generation of a platform.
+
+    Bumping the generation makes every cached entry that involved the
+    platform unreachable, which is how per-platform invalidation works on
+    top of a cache that can only delete exact keys.
+    """
+    return f"{CACHE_KEY_PREFIX}:generation:{platform.value}"
+
+
+def _serialize_result(result: Any) -> Any:
+    """Convert a service result into a JSON-serializable value."""
+    if isinstance(result, list):
+        return [model.to_dict() for model in result]
+    if isinstance(result, dict) and "models" in result:
+        return {**result, "models": [model.to_dict() for model in result["models"]]}
+    return result
+
+
+def _deserialize_result(data: Any) -> Any:
+    """Restore a service result from its cached representation."""
+    if isinstance(data, list):
+        return [ExternalModel.from_dict(item) for item in data]
+    if isinstance(data, dict) and "models" in data:
+        return {**data, "models": [ExternalModel.from_dict(item) for item in data["models"]]}
+    return data
+
+
+def _normalize_argument(value: Any) -> Any:
+    """Normalize an argument so equal calls produce identical cache keys."""
+    if isinstance(value, ExternalPlatform):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _normalize_argument(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_argument(v) for v in value]
+    return value
+
+
+def cached_port_call(ttl_seconds: int, partial_argument: Optional[str] = None) -> Callable:
+    """Cache the result of an async ``ExternalModelService`` method.
+
+    The cache key is a SHA-256 hash of the method name, its normalized
+    arguments and the cache generation of every platform the call covers.
+    Results are stored as JSON through the service's ``CachePort``; when the
+    service has no cache port the method is called directly. Cache reads and
+    writes run in a worker thread because the port may touch the disk.
+
+    Args:
+        ttl_seconds: Default time-to-live for cached results. Callers can
+            override it per call with a ``cache_ttl_seconds`` argument; ``0``
+            bypasses the cache.
+        partial_argument: Name of a boolean argument that makes the method
+            return a possibly incomplete result. Such calls are served from
+            the complete result when it is cached but are never stored.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache_port = getattr(self, "_cache_port", None)
+            if cache_port is None:
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                name: value for name, value in bound.arguments.items() if name != "self"
+            }
+
+            ttl = arguments.pop(TTL_OVERRIDE_ARGUMENT, None)
+            if ttl is None:
+                ttl = ttl_seconds
+            if ttl <= 0:
+                return await func(self, *args, **kwargs)
+
+            # Look partial calls up under the complete call's key
+            partial = bool(partial_argument and arguments.get(partial_argument))
+            if partial:
+                arguments[partial_argument] = False
+
+            # Resolved on the event loop: the service's platform caches are not
+            # thread-safe, and an invalid platform must raise ValidationError
+            platform = arguments.get("platform")
+            platforms = [self._coerce_platform(platform)] if platform else self.get_supported_platforms()
+            cache_key = None
+
+            def lookup():
+                key = _build_cache_key(cache_port, func.__name__, arguments, platforms)
+                return key, cache_port.get(key)
+
+            try:
+                cache_key, cached = await asyncio.to_thread(lookup)
+                if cached is not None:
+                    return _deserialize_result(cached)
+            except Exception as e:
+                logger.warning(f"Failed to read external model cache: {e}")
+
+            result = await func(self, *args, **kwargs)
+            if cache_key is None or partial:
+                return result
+
+            try:
+                await asyncio.to_thread(
+                    cache_port.set, cache_key, _serialize_result(result), ttl
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write external model cache: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _build_cache_key(
+    cache_port: Any,
+    method_name: str,
+    arguments: Dict[str, Any],
+    platforms: List[ExternalPlatform]
+) -> str:
+    """Build the cache key for a method call."""
+    generations = {
+        p.value: cache_port.get(platform_generation_key(p)) or 0 for p in platforms
+    }
+    payload = json.dumps(
+        {
+            "method": method_name,
+            "arguments": _normalize_argument(arguments),
+            "generations": generations,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{method_name}:{digest}"
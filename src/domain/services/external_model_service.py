@@ -1,12 +1,47 @@
 """External model service implementing external model management operations."""
 
 import asyncio
-from typing import List, Optional, Dict, Any
+import base64
+import binascii
+import functools
+import heapq
+import itertools
+import json
+import logging
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from ..ports.driving.external_model_management_port import ExternalModelManagementPort
-from ..ports.driven.external_model_port import ExternalModelPort, ExternalAPIError, RateLimitError, PlatformUnavailableError
-from ..entities.external_model import ExternalModel, ExternalPlatform, ComfyUIModelType
+from ..ports.driven.cache_port import CachePort
+from ..ports.driven.external_model_port import ExternalModelPort, CachedResponse, ExternalAPIError, RateLimitError, PlatformUnavailableError
+from ..entities.external_model import (
+    ExternalModel,
+    ExternalPlatform,
+    ComfyUIModelType,
+    PlatformInfo,
+    SearchResult,
+)
 from ..entities.base import ValidationError, NotFoundError
+from .external_model_cache import (
+    cached_port_call,
+    platform_generation_key,
+    SEARCH_CACHE_TTL,
+    POPULAR_CACHE_TTL,
+    RECENT_CACHE_TTL,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_model_types(platform: ExternalPlatform) -> Tuple[str, ...]:
+    """Get the model types supported by a platform."""
+    # This would typically come from platform-specific configuration
+    # For now, return all ComfyUI model types
+    return tuple(model_type.value for model_type in ComfyUIModelType)
 
 
 class ExternalModelService(ExternalModelManagementPort):
@@ -16,36 +51,83 @@ class ExternalModelService(ExternalModelManagementPort):
     and implements the ExternalModelManagementPort interface.
     """
     
-    def __init__(self, external_model_port: ExternalModelPort):
+    # Maximum concurrent availability probes against a single platform
+    MAX_CONCURRENT_CHECKS_PER_PLATFORM = 5
+    
+    # Default maximum concurrent requests to one platform across all
+    # fan-outs; platforms can lower or raise it with the ``max_concurrent``
+    # entry of their ``rate_limits`` capability
+    MAX_CONCURRENT_REQUESTS_PER_PLATFORM = 4
+    
+    # Longest wait, in seconds, before retrying a rate-limited platform
+    # call once; platforms asking for longer waits are skipped
+    MAX_RATE_LIMIT_WAIT = 5.0
+    
+    # Base delay, in seconds, of the retry backoff when a rate-limited
+    # platform does not say how long to wait
+    RATE_LIMIT_BACKOFF = 0.5
+    
+    # Maximum number of model detail responses kept for conditional reads
+    MAX_CONDITIONAL_ENTRIES = 512
+    
+    # Seconds the supported platforms and their capabilities are reused
+    # before the port is asked again
+    PLATFORMS_CACHE_TTL = 300
+    
+    # Version of the search cursor format; cursors of other versions are rejected
+    CURSOR_VERSION = 2
+    
+    # Default section sizes for the browse screen landing page
+    DEFAULT_LANDING_PAGE_LIMITS = {"popular": 20, "recent": 20, "suggestions": 10}
+    
+    def __init__(
+        self,
+        external_model_port: ExternalModelPort,
+        cache_port: Optional[CachePort] = None
+    ):
         """Initialize the external model service.
         
         Args:
             external_model_port: Port for external model data access
+            cache_port: Optional port for caching query results
         """
         self._external_model_port = external_model_port
+        self._cache_port = cache_port
+        # Last model detail response per (platform, model_id), least recently used first
+        self._model_details_responses: "OrderedDict[Tuple[ExternalPlatform, str], CachedResponse[ExternalModel]]" = OrderedDict()
+        # Platform list and capabilities with their monotonic fetch times
+        self._platforms_cache: Optional[Tuple[float, Tuple[ExternalPlatform, ...]]] = None
+        self._capabilities_cache: Dict[ExternalPlatform, Tuple[float, Dict[str, Any]]] = {}
+        # Limits concurrent fan-out requests per platform
+        self._platform_semaphores: Dict[ExternalPlatform, asyncio.Semaphore] = {}
     
+    @cached_port_call(ttl_seconds=SEARCH_CACHE_TTL)
     async def search_models(
         self, 
         platform: Optional[ExternalPlatform] = None,
         query: str = "", 
         limit: int = 20, 
         offset: int = 0,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None
+    ) -> SearchResult:
         """Search for models across external platforms.
         
         Args:
             platform: Optional specific platform to search (searches all if None)
             query: Search query string (optional)
             limit: Maximum number of results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (deprecated, use cursor)
             filters: Platform-specific filters (optional)
+            cursor: Opaque pagination token from a previous ``next_cursor``
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
             
         Returns:
-            Dictionary containing search results with metadata
+            Search result with the page of models and pagination metadata
             
         Raises:
-            ValidationError: If search parameters are invalid
+            ValidationError: If search parameters or the cursor are invalid
         """
         # Validate parameters
         if limit <= 0 or limit > 100:
@@ -61,45 +143,101 @@ class ExternalModelService(ExternalModelManagementPort):
             filters = {}
         
         # Determine which platforms to search
-        platforms_to_search = [platform] if platform else self.get_supported_platforms()
+        platform = self._coerce_platform(platform) if platform else None
+        platforms_to_search = (platform,) if platform else self._supported_platforms()
+        
+        return await self._search_platforms(
+            platforms_to_search, platform, query, limit, offset, filters, cursor
+        )
+    
+    async def _search_platforms(
+        self,
+        platforms_to_search: Sequence[ExternalPlatform],
+        platform: Optional[ExternalPlatform],
+        query: str,
+        limit: int,
+        offset: int,
+        filters: Dict[str, Any],
+        cursor: Optional[str]
+    ) -> SearchResult:
+        """Search the given platforms and merge their results into one page.
+        
+        Args:
+            platforms_to_search: Platforms to query
+            platform: Platform the caller asked for, which scopes the cursor
+            query: Search query string
+            limit: Maximum number of results to return
+            offset: Number of results to skip on every platform
+            filters: Platform-specific filters
+            cursor: Opaque pagination token from a previous ``next_cursor``
+            
+        Returns:
+            Search result with the page of models and pagination metadata
+            
+        Raises:
+            ValidationError: If the cursor is invalid
+        """
+        # Each platform is paged independently: the cursor records how many
+        # results of each platform earlier pages consumed, so every page is
+        # fetched straight from the platform instead of re-fetching and
+        # skipping everything before it. The deprecated offset applies to
+        # every platform.
+        if cursor:
+            platform_offsets = self._decode_cursor(cursor, platform)
+        else:
+            platform_offsets = {p.value: offset for p in platforms_to_search}
+        
+        # Search all platforms concurrently; failing platforms are skipped
+        platform_results = await self._gather_from_platforms(
+            platforms_to_search,
+            lambda search_platform: self._external_model_port.search_models(
+                platform=search_platform,
+                query=query,
+                limit=limit,
+                offset=platform_offsets.get(search_platform.value, 0),
+                filters=filters
+            )
+        )
         
         all_models = []
         platforms_searched = []
+        platform_exhausted = {}
+        for search_platform, platform_models in platform_results:
+            all_models.extend(platform_models)
+            platforms_searched.append(search_platform.value)
+            platform_exhausted[search_platform.value] = len(platform_models) < limit
         
-        # Search each platform
-        for search_platform in platforms_to_search:
-            try:
-                platform_models = await self._external_model_port.search_models(
-                    platform=search_platform,
-                    query=query,
-                    limit=limit,
-                    offset=offset,
-                    filters=filters
-                )
-                all_models.extend(platform_models)
-                platforms_searched.append(search_platform.value)
-            except (ExternalAPIError, RateLimitError, PlatformUnavailableError) as e:
-                # Log the error but continue with other platforms
-                # In a production system, you might want to handle this differently
-                continue
-        
-        # Sort models by relevance (download count, rating, etc.)
-        sorted_models = self._sort_models_by_relevance(all_models, query)
-        
-        # Apply pagination to the combined results
-        total_models = len(sorted_models)
-        paginated_models = sorted_models[offset:offset + limit]
-        
-        has_more = offset + len(paginated_models) < total_models
-        next_offset = offset + len(paginated_models) if has_more else None
+        # Rank models by relevance (download count, rating, etc.); one extra
+        # model is kept to tell whether results are left over
+        sorted_models = self._sort_models_by_relevance(all_models, query, limit=limit + 1)
+        paginated_models = sorted_models[:limit]
         
-        return {
-            "models": paginated_models,
-            "total": total_models,
-            "has_more": has_more,
-            "next_offset": next_offset,
-            "platforms_searched": platforms_searched
-        }
+        # Advance each platform by the number of its results on this page;
+        # results that did not make the cut are fetched again next time
+        next_offsets = dict(platform_offsets)
+        for model in paginated_models:
+            key = model.platform.value
+            next_offsets[key] = next_offsets.get(key, 0) + 1
+        
+        consumed_before = sum(platform_offsets.values())
+        total_models = consumed_before + len(all_models)
+        has_more = len(sorted_models) > limit or not all(platform_exhausted.values())
+        # A single offset cannot say how far each platform got, so across
+        # several platforms only the cursor is advertised
+        single_platform = len(platforms_to_search) == 1
+        next_offset = (
+            consumed_before + len(paginated_models) if has_more and single_platform else None
+        )
+        next_cursor = self._encode_cursor(next_offsets, platform) if has_more else None
+        
+        return SearchResult(
+            models=paginated_models,
+            total=total_models,
+            has_more=has_more,
+            next_offset=next_offset,
+            next_cursor=next_cursor,
+            platforms_searched=platforms_searched
+        )
     
     async def get_model_details(self, platform: ExternalPlatform, model_id: str) -> ExternalModel:
         """Get detailed information about a specific external model.
@@ -119,11 +257,10 @@ class ExternalModelService(ExternalModelManagementPort):
         if not model_id or not model_id.strip():
             raise ValidationError("model_id cannot be empty", "model_id")
         
-        if not isinstance(platform, ExternalPlatform):
-            raise ValidationError("platform must be a valid ExternalPlatform", "platform")
+        platform = self._coerce_platform(platform)
         
         try:
-            model = await self._external_model_port.get_model_details(platform, model_id.strip())
+            model = await self._get_model_details_conditional(platform, model_id.strip())
             if model is None:
                 raise NotFoundError("ExternalModel", f"{platform.value}:{model_id}")
             
@@ -135,11 +272,56 @@ class ExternalModelService(ExternalModelManagementPort):
             # Wrap unexpected errors
             raise ExternalAPIError(f"Failed to get model details: {str(e)}", platform.value)
     
+    async def _get_model_details_conditional(
+        self,
+        platform: ExternalPlatform,
+        model_id: str
+    ) -> Optional[ExternalModel]:
+        """Fetch model details, reusing the previous response when unchanged.
+        
+        The ETag and Last-Modified of the last response for each model are
+        kept in a bounded LRU and sent back to the platform, so an unchanged
+        model costs a ``304`` round-trip instead of a full payload parse.
+        
+        Args:
+            platform: The external platform to query
+            model_id: The cleaned platform-specific ID of the model
+            
+        Returns:
+            The external model, or None if not found
+        """
+        key = (platform, model_id)
+        previous = self._model_details_responses.get(key)
+        
+        response = await self._external_model_port.get_model_details_conditional(
+            platform,
+            model_id,
+            etag=previous.etag if previous else None,
+            last_modified=previous.last_modified if previous else None
+        )
+        
+        if response.not_modified and previous is not None:
+            self._model_details_responses.move_to_end(key)
+            return previous.value
+        
+        if response.value is not None and response.has_validators:
+            self._model_details_responses[key] = response
+            self._model_details_responses.move_to_end(key)
+            while len(self._model_details_responses) > self.MAX_CONDITIONAL_ENTRIES:
+                self._model_details_responses.popitem(last=False)
+        else:
+            self._model_details_responses.pop(key, None)
+        
+        return response.value
+    
+    @cached_port_call(ttl_seconds=POPULAR_CACHE_TTL, partial_argument="fast_path")
     async def get_popular_models(
         self, 
         platform: Optional[ExternalPlatform] = None,
         limit: int = 20,
-        model_type: Optional[str] = None
+        model_type: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None,
+        fast_path: bool = False
     ) -> List[ExternalModel]:
         """Get popular/trending models from external platforms.
         
@@ -147,6 +329,9 @@ class ExternalModelService(ExternalModelManagementPort):
             platform: Optional specific platform to query (queries all if None)
             limit: Maximum number of results to return
             model_type: Optional model type filter
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
+            fast_path: Stop querying platforms once ``limit`` models arrived,
+                trading completeness across platforms for latency
             
         Returns:
             List of popular external models
@@ -158,32 +343,31 @@ class ExternalModelService(ExternalModelManagementPort):
             raise ValidationError("limit must be between 1 and 100", "limit")
         
         # Determine which platforms to query
-        platforms_to_query = [platform] if platform else self.get_supported_platforms()
-        
-        all_models = []
+        platform = self._coerce_platform(platform) if platform else None
+        platforms_to_query = (platform,) if platform else self._supported_platforms()
         
-        # Get popular models from each platform
-        for query_platform in platforms_to_query:
-            try:
-                platform_models = await self._external_model_port.get_popular_models(
-                    platform=query_platform,
-                    limit=limit,
-                    model_type=model_type
-                )
-                all_models.extend(platform_models)
-            except (ExternalAPIError, RateLimitError, PlatformUnavailableError):
-                # Continue with other platforms if one fails
-                continue
+        # Get popular models from every platform concurrently
+        all_models = await self._collect_from_platforms(
+            platforms_to_query,
+            lambda query_platform: self._external_model_port.get_popular_models(
+                platform=query_platform,
+                limit=limit,
+                model_type=model_type
+            ),
+            min_models=limit if fast_path else None
+        )
         
         # Sort by popularity metrics and return top results
-        sorted_models = self._sort_models_by_popularity(all_models)
-        return sorted_models[:limit]
+        return self._sort_models_by_popularity(all_models, limit=limit)
     
+    @cached_port_call(ttl_seconds=RECENT_CACHE_TTL, partial_argument="fast_path")
     async def get_recent_models(
         self, 
         platform: Optional[ExternalPlatform] = None,
         limit: int = 20,
-        model_type: Optional[str] = None
+        model_type: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None,
+        fast_path: bool = False
     ) -> List[ExternalModel]:
         """Get recently published models from external platforms.
         
@@ -191,6 +375,9 @@ class ExternalModelService(ExternalModelManagementPort):
             platform: Optional specific platform to query (queries all if None)
             limit: Maximum number of results to return
             model_type: Optional model type filter
+            cache_ttl_seconds: Optional cache TTL override (0 bypasses the cache)
+            fast_path: Stop querying platforms once ``limit`` models arrived,
+                trading completeness across platforms for latency
             
         Returns:
             List of recent external models
@@ -202,44 +389,54 @@ class ExternalModelService(ExternalModelManagementPort):
             raise ValidationError("limit must be between 1 and 100", "limit")
         
         # Determine which platforms to query
-        platforms_to_query = [platform] if platform else self.get_supported_platforms()
+        platform = self._coerce_platform(platform) if platform else None
+        platforms_to_query = (platform,) if platform else self._supported_platforms()
         
-        all_models = []
+        # Get recent models from every platform concurrently
+        platform_results = await self._gather_from_platforms(
+            platforms_to_query,
+            lambda query_platform: self._external_model_port.get_recent_models(
+                platform=query_platform,
+                limit=limit,
+                model_type=model_type
+            ),
+            min_models=limit if fast_path else None
+        )
         
-        # Get recent models from each platform
-        for query_platform in platforms_to_query:
-            try:
-                platform_models = await self._external_model_port.get_recent_models(
-                    platform=query_platform,
-                    limit=limit,
-                    model_type=model_type
-                )
-                all_models.extend(platform_models)
-            except (ExternalAPIError, RateLimitError, PlatformUnavailableError):
-                # Continue with other platforms if one fails
-                continue
-        
-        # Sort by recency and return top results
-        sorted_models = sorted(all_models, key=lambda m: m.updated_at, reverse=True)
-        return sorted_models[:limit]
+        # Platforms list recent models newest first, so sorting each list is
+        # a linear check that guards against platforms that do not; the
+        # sorted lists are then merged lazily and only the top results taken
+        by_recency = operator.attrgetter("updated_at")
+        newest_first = [
+            sorted(platform_models, key=by_recency, reverse=True)
+            for _, platform_models in platform_results
+        ]
+        merged = heapq.merge(*newest_first, key=by_recency, reverse=True)
+        return list(itertools.islice(merged, limit))
     
+    @cached_port_call(ttl_seconds=SEARCH_CACHE_TTL)
     async def get_comfyui_compatible_models(
         self, 
         platform: Optional[ExternalPlatform] = None,
         model_type: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> SearchResult:
         """Get models that are compatible with ComfyUI.
         
+        When all platforms are queried, platforms whose capabilities set
+        ``supports_comfyui_filter`` to false are skipped.
+        
         Args:
             platform: Optional specific platform to query (queries all if None)
             model_type: Optional ComfyUI model type filter
             limit: Maximum number of results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (deprecated, use cursor)
+            cursor: Opaque pagination token from a previous ``next_cursor``
             
         Returns:
-            Dictionary containing compatible models with metadata
+            Search result with the page of compatible models and pagination metadata
             
         Raises:
             ValidationError: If parameters are invalid
@@ -255,13 +452,18 @@ class ExternalModelService(ExternalModelManagementPort):
         if model_type:
             filters["model_type"] = model_type
         
+        if platform:
+            platform = self._coerce_platform(platform)
+            platforms_to_search = (platform,)
+        else:
+            platforms_to_search = [
+                candidate for candidate in self._supported_platforms()
+                if self._get_platform_capabilities(candidate).get("supports_comfyui_filter", True)
+            ]
+        
         # Use the search functionality with compatibility filters
-        return await self.search_models(
-            platform=platform,
-            query="",
-            limit=limit,
-            offset=offset,
-            filters=filters
+        return await self._search_platforms(
+            platforms_to_search, platform, "", limit, offset, filters, cursor
         )
     
     async def check_model_availability(self, platform: ExternalPlatform, model_id: str) -> bool:
@@ -280,8 +482,7 @@ class ExternalModelService(ExternalModelManagementPort):
         if not model_id or not model_id.strip():
             raise ValidationError("model_id cannot be empty", "model_id")
         
-        if not isinstance(platform, ExternalPlatform):
-            raise ValidationError("platform must be a valid ExternalPlatform", "platform")
+        platform = self._coerce_platform(platform)
         
         try:
             return await self._external_model_port.check_model_availability(platform, model_id.strip())
@@ -289,39 +490,154 @@ class ExternalModelService(ExternalModelManagementPort):
             # If API call fails, assume model is unavailable
             return False
     
+    async def check_model_availability_bulk(
+        self,
+        items: List[Tuple[ExternalPlatform, str]]
+    ) -> Dict[Tuple[ExternalPlatform, str], bool]:
+        """Check availability of several models concurrently.
+        
+        Probes run in parallel, bounded per platform so a large batch does not
+        trip a single platform's rate limits.
+        
+        Args:
+            items: List of (platform, model_id) pairs to check
+            
+        Returns:
+            Dictionary mapping each (platform, model_id) pair to its availability
+            
+        Raises:
+            ValidationError: If items is empty or contains an invalid entry
+        """
+        if not isinstance(items, list) or not items:
+            raise ValidationError("items must be a non-empty list", "items")
+        
+        pairs = []
+        for item in items:
+            if not isinstance(item, tuple) or len(item) != 2:
+                raise ValidationError("each item must be a (platform, model_id) pair", "items")
+            platform, model_id = item
+            platform = self._coerce_platform(platform, "items")
+            if not isinstance(model_id, str) or not model_id.strip():
+                raise ValidationError("model_id cannot be empty", "items")
+            pairs.append((platform, model_id.strip()))
+        
+        # Drop duplicates while keeping request order
+        pairs = list(dict.fromkeys(pairs))
+        
+        semaphores = {
+            platform: asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS_PER_PLATFORM)
+            for platform, _ in pairs
+        }
+        
+        async def probe(platform: ExternalPlatform, model_id: str) -> bool:
+            async with semaphores[platform]:
+                try:
+                    return await self._external_model_port.check_model_availability(platform, model_id)
+                except (ExternalAPIError, RateLimitError, PlatformUnavailableError):
+                    # If API call fails, assume model is unavailable
+                    return False
+        
+        results = await asyncio.gather(*(probe(platform, model_id) for platform, model_id in pairs))
+        return dict(zip(pairs, results))
+    
+    def clear_cache_for_platform(self, platform: ExternalPlatform) -> None:
+        """Invalidate all cached query results involving a platform.
+        
+        Args:
+            platform: The external platform whose cached results are stale
+            
+        Raises:
+            ValidationError: If platform is invalid
+        """
+        platform = self._coerce_platform(platform)
+        
+        if not self._cache_port:
+            return
+        
+        # Entries are keyed by platform generation, so bumping it orphans
+        # every cached result for the platform; the orphans expire by TTL
+        generation_key = platform_generation_key(platform)
+        generation = self._cache_port.get(generation_key) or 0
+        self._cache_port.set(generation_key, generation + 1)
+    
     def get_supported_platforms(self) -> List[ExternalPlatform]:
         """Get list of supported external platforms.
         
+        The list is cached for ``PLATFORMS_CACHE_TTL`` seconds.
+        
         Returns:
             List of supported external platforms
         """
-        return self._external_model_port.get_supported_platforms()
+        return list(self._supported_platforms())
+    
+    def _supported_platforms(self) -> Tuple[ExternalPlatform, ...]:
+        """Get the cached supported platforms as an immutable tuple.
+        
+        Internal callers use this instead of ``get_supported_platforms`` to
+        avoid copying the list on every request.
+        """
+        now = time.monotonic()
+        if self._platforms_cache is not None:
+            fetched_at, platforms = self._platforms_cache
+            if now - fetched_at < self.PLATFORMS_CACHE_TTL:
+                return platforms
+        
+        platforms = tuple(self._external_model_port.get_supported_platforms())
+        self._platforms_cache = (now, platforms)
+        return platforms
+    
+    async def aclose(self) -> None:
+        """Close the external model port and its pooled HTTP connections."""
+        await self._external_model_port.close()
+    
+    async def __aenter__(self) -> "ExternalModelService":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
     
-    def get_platform_info(self, platform: ExternalPlatform) -> Dict[str, Any]:
+    def invalidate_platforms_cache(self) -> None:
+        """Drop the cached platform list and capabilities so the next call refetches them."""
+        self._platforms_cache = None
+        self._capabilities_cache.clear()
+    
+    def _get_platform_capabilities(self, platform: ExternalPlatform) -> Dict[str, Any]:
+        """Get the capabilities of a platform, cached for ``PLATFORMS_CACHE_TTL`` seconds."""
+        now = time.monotonic()
+        cached = self._capabilities_cache.get(platform)
+        if cached is not None and now - cached[0] < self.PLATFORMS_CACHE_TTL:
+            return cached[1]
+        
+        capabilities = self._external_model_port.get_platform_capabilities(platform)
+        self._capabilities_cache[platform] = (now, capabilities)
+        return capabilities
+    
+    def get_platform_info(self, platform: ExternalPlatform) -> PlatformInfo:
         """Get information about a specific platform.
         
         Args:
             platform: The external platform to get info for
             
         Returns:
-            Dictionary containing platform information
+            Immutable platform information
             
         Raises:
             ValidationError: If platform is invalid
         """
-        if not isinstance(platform, ExternalPlatform):
-            raise ValidationError("platform must be a valid ExternalPlatform", "platform")
+        platform = self._coerce_platform(platform)
         
-        capabilities = self._external_model_port.get_platform_capabilities(platform)
+        capabilities = self._get_platform_capabilities(platform)
         
-        return {
-            "name": platform.value,
-            "display_name": platform.value.title(),
-            "capabilities": capabilities,
-            "supported_model_types": self._get_platform_model_types(platform),
-            "rate_limits": capabilities.get("rate_limits", {}),
-            "is_available": capabilities.get("is_available", True)
-        }
+        return PlatformInfo(
+            name=platform.value,
+            display_name=platform.value.title(),
+            capabilities=capabilities,
+            supported_model_types=list(_platform_model_types(platform)),
+            rate_limits=capabilities.get("rate_limits", {}),
+            is_available=capabilities.get("is_available", True)
+        )
     
     async def get_model_suggestions(
         self, 
@@ -353,78 +669,367 @@ class ExternalModelService(ExternalModelManagementPort):
             model_type=model_type
         )
     
-    def _sort_models_by_relevance(self, models: List[ExternalModel], query: str) -> List[ExternalModel]:
-        """Sort models by relevance to the search query."""
-        if not query:
-            # If no query, sort by popularity
-            return self._sort_models_by_popularity(models)
+    async def get_landing_page(
+        self,
+        platform: Optional[ExternalPlatform] = None,
+        limits: Optional[Dict[str, int]] = None
+    ) -> Dict[str, List[ExternalModel]]:
+        """Get the popular, recent and suggested models for the browse screen in one call.
         
-        query_lower = query.lower()
+        Popular and recent models are fetched concurrently. Suggestions are
+        currently popular models, so they are taken from the popular
+        results instead of being requested again.
         
-        def relevance_score(model: ExternalModel) -> float:
-            score = 0.0
-            
-            # Name match (highest weight)
-            if query_lower in model.name.lower():
-                score += 10.0
-                if model.name.lower().startswith(query_lower):
-                    score += 5.0
-            
-            # Author match
-            if query_lower in model.author.lower():
-                score += 3.0
-            
-            # Tag match
-            for tag in model.get_all_tags():
-                if query_lower in tag.lower():
-                    score += 2.0
-            
-            # Description match
-            if query_lower in model.get_primary_description().lower():
-                score += 1.0
+        Args:
+            platform: Optional specific platform to query (queries all if None)
+            limits: Optional per-section limits with keys ``popular``, ``recent``
+                and ``suggestions`` (defaults: 20, 20 and 10)
             
-            # Boost ComfyUI compatible models
-            if model.is_comfyui_compatible:
-                score += 1.0
+        Returns:
+            Dictionary with ``popular``, ``recent`` and ``suggestions`` model lists
             
-            # Boost by popularity
-            score += min(model.download_count / 10000, 5.0)
+        Raises:
+            ValidationError: If limits are invalid
+        """
+        section_limits = dict(self.DEFAULT_LANDING_PAGE_LIMITS)
+        if limits is not None:
+            if not isinstance(limits, dict):
+                raise ValidationError("limits must be a dictionary", "limits")
+            unknown = set(limits) - set(section_limits)
+            if unknown:
+                raise ValidationError(f"unknown landing page sections: {sorted(unknown)}", "limits")
+            section_limits.update(limits)
+        
+        for section, maximum in (("popular", 100), ("recent", 100), ("suggestions", 50)):
+            value = section_limits[section]
+            if not isinstance(value, int) or value <= 0 or value > maximum:
+                raise ValidationError(f"{section} limit must be between 1 and {maximum}", "limits")
+        
+        popular_limit = max(section_limits["popular"], section_limits["suggestions"])
+        popular, recent = await asyncio.gather(
+            self.get_popular_models(platform=platform, limit=popular_limit),
+            self.get_recent_models(platform=platform, limit=section_limits["recent"])
+        )
+        
+        return {
+            "popular": popular[:section_limits["popular"]],
+            "recent": recent,
+            "suggestions": popular[:section_limits["suggestions"]]
+        }
+    
+    async def _collect_from_platforms(
+        self,
+        platforms: Sequence[ExternalPlatform],
+        fetch: Callable[[ExternalPlatform], Awaitable[List[ExternalModel]]],
+        min_models: Optional[int] = None
+    ) -> List[ExternalModel]:
+        """Run a per-platform fetch on all platforms concurrently and combine the models."""
+        all_models = []
+        for _, platform_models in await self._gather_from_platforms(platforms, fetch, min_models):
+            all_models.extend(platform_models)
+        return all_models
+    
+    async def _gather_from_platforms(
+        self,
+        platforms: Sequence[ExternalPlatform],
+        fetch: Callable[[ExternalPlatform], Awaitable[List[ExternalModel]]],
+        min_models: Optional[int] = None
+    ) -> List[Tuple[ExternalPlatform, List[ExternalModel]]]:
+        """Run a per-platform fetch on all platforms concurrently.
+        
+        Platforms whose external API fails are skipped so the others can
+        still contribute results; other errors are re-raised. Results keep
+        the order of ``platforms`` regardless of completion order.
+        
+        Args:
+            platforms: Platforms to query
+            fetch: Coroutine function fetching the models of one platform
+            min_models: Optional number of models after which the fan-out
+                stops early; fetches still running are cancelled
+        
+        Returns:
+            List of (platform, models) pairs for the platforms that succeeded
+        """
+        tasks = {
+            asyncio.ensure_future(self._call_platform(query_platform, fetch)): query_platform
+            for query_platform in platforms
+        }
+        results = {}
+        collected = 0
+        pending = set(tasks)
+        
+        try:
+            while pending and (min_models is None or collected < min_models):
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if isinstance(error, (ExternalAPIError, RateLimitError, PlatformUnavailableError)):
+                        # Continue with other platforms if one fails
+                        continue
+                    if error is not None:
+                        raise error
+                    results[tasks[task]] = task.result()
+                    collected += len(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return [
+            (query_platform, results[query_platform])
+            for query_platform in platforms if query_platform in results
+        ]
+    
+    async def _call_platform(
+        self,
+        platform: ExternalPlatform,
+        fetch: Callable[[ExternalPlatform], Awaitable[Any]]
+    ) -> Any:
+        """Call a platform within its concurrency limit, retrying once if rate limited.
+        
+        The retry waits for the platform's ``Retry-After`` or, without one,
+        an exponential backoff; waits longer than ``MAX_RATE_LIMIT_WAIT`` are
+        not attempted and the rate limit error is raised instead.
+        
+        Raises:
+            RateLimitError: If the platform is still rate limited
+        """
+        async with self._get_platform_semaphore(platform):
+            for attempt in range(2):
+                try:
+                    return await fetch(platform)
+                except RateLimitError as e:
+                    delay = e.retry_after
+                    if delay is None:
+                        delay = self.RATE_LIMIT_BACKOFF * 2 ** attempt
+                    if attempt or delay > self.MAX_RATE_LIMIT_WAIT:
+                        raise
+                    logger.warning(f"{platform.value} rate limited, retrying in {delay} seconds")
+                    # Wait while holding the slot so the platform is not hit meanwhile
+                    await asyncio.sleep(delay)
+    
+    def _get_platform_semaphore(self, platform: ExternalPlatform) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to a platform."""
+        semaphore = self._platform_semaphores.get(platform)
+        if semaphore is None:
+            rate_limits = self._get_platform_capabilities(platform).get("rate_limits", {})
+            max_concurrent = rate_limits.get("max_concurrent") if isinstance(rate_limits, dict) else None
+            if not isinstance(max_concurrent, int) or max_concurrent < 1:
+                max_concurrent = self.MAX_CONCURRENT_REQUESTS_PER_PLATFORM
+            semaphore = asyncio.Semaphore(max_concurrent)
+            self._platform_semaphores[platform] = semaphore
+        return semaphore
+    
+    @staticmethod
+    def _coerce_platform(platform: Any, field: str = "platform") -> ExternalPlatform:
+        """Convert a platform or its string value into an ``ExternalPlatform``.
+        
+        Args:
+            platform: Platform enum member or value such as ``"civitai"``
+            field: Field name reported when the platform is invalid
             
-            # Boost by rating
-            if model.rating:
-                score += model.rating
+        Returns:
+            The matching external platform
             
-            return score
+        Raises:
+            ValidationError: If platform is not a supported platform
+        """
+        if isinstance(platform, ExternalPlatform):
+            return platform
+        try:
+            return ExternalPlatform(platform.strip().lower())
+        except (AttributeError, ValueError):
+            raise ValidationError("platform must be a valid ExternalPlatform", field)
+    
+    def _encode_cursor(
+        self,
+        platform_offsets: Dict[str, int],
+        platform: Optional[ExternalPlatform]
+    ) -> str:
+        """Encode pagination state into an opaque, URL-safe cursor token."""
+        state = {
+            "v": self.CURSOR_VERSION,
+            "p": platform.value if platform else None,
+            "o": platform_offsets,
+        }
+        payload = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+    
+    def _decode_cursor(
+        self,
+        cursor: str,
+        platform: Optional[ExternalPlatform]
+    ) -> Dict[str, int]:
+        """Decode a cursor token and return the offset of every platform.
+        
+        Raises:
+            ValidationError: If the cursor is malformed, was issued by another
+                cursor version or for a different platform scope
+        """
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            cursor_version = state.get("v")
+            cursor_offsets = state["o"]
+            cursor_platform = state["p"]
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError, AttributeError):
+            raise ValidationError("cursor is invalid", "cursor")
+        
+        if cursor_version != self.CURSOR_VERSION:
+            raise ValidationError("cursor version is not supported", "cursor")
         
-        return sorted(models, key=relevance_score, reverse=True)
+        if not isinstance(cursor_offsets, dict) or not all(
+            isinstance(value, int) and value >= 0 for value in cursor_offsets.values()
+        ):
+            raise ValidationError("cursor is invalid", "cursor")
+        
+        if cursor_platform != (platform.value if platform else None):
+            raise ValidationError("cursor does not match the requested platform", "cursor")
+        
+        return cursor_offsets
     
-    def _sort_models_by_popularity(self, models: List[ExternalModel]) -> List[ExternalModel]:
-        """Sort models by popularity metrics."""
-        def popularity_score(model: ExternalModel) -> float:
-            score = 0.0
-            
-            # Download count (primary metric)
-            score += min(model.download_count / 1000, 100.0)
+    def _sort_models_by_relevance(
+        self,
+        models: List[ExternalModel],
+        query: str,
+        limit: Optional[int] = None
+    ) -> List[ExternalModel]:
+        """Sort models by relevance to the search query.
+        
+        Args:
+            models: Models to rank
+            query: Search query the models are ranked against
+            limit: Optional number of top models to return; only those are
+                ordered, which is cheaper than sorting every model
             
-            # Rating
-            if model.rating:
-                score += model.rating * 10
+        Returns:
+            Models in descending order of relevance
+        """
+        if not query:
+            # If no query, sort by popularity
+            return self._sort_models_by_popularity(models, limit=limit)
+        
+        query_lower = query.lower()
+        match_fraction = self._compile_query_matcher(query_lower)
+        
+        relevance_score = functools.partial(
+            self._relevance_score, query_lower=query_lower, match_fraction=match_fraction
+        )
+        
+        if limit is None:
+            return sorted(models, key=relevance_score, reverse=True)
+        return heapq.nlargest(limit, models, key=relevance_score)
+    
+    @staticmethod
+    def _relevance_score(
+        model: ExternalModel,
+        query_lower: str,
+        match_fraction: Callable[[str], float]
+    ) -> float:
+        """Score how well a model matches a search query.
+        
+        Args:
+            model: Model to score
+            query_lower: Lowercase search query
+            match_fraction: Matcher built by ``_compile_query_matcher``
             
-            # Boost ComfyUI compatible models
-            if model.is_comfyui_compatible:
+        Returns:
+            Relevance score; higher is more relevant
+        """
+        score = 0.0
+        
+        # Name match (highest weight)
+        name_match = match_fraction(model.name_lower)
+        if name_match:
+            score += 10.0 * name_match
+            if model.name_lower.startswith(query_lower):
                 score += 5.0
+        
+        # Author match
+        score += 3.0 * match_fraction(model.author_lower)
+        
+        # Tag match
+        for tag_lower in model.tags_lower:
+            score += 2.0 * match_fraction(tag_lower)
+        
+        # Description match
+        score += 1.0 * match_fraction(model.description_lower)
+        
+        # Boost ComfyUI compatible models
+        if model.is_comfyui_compatible:
+            score += 1.0
+        
+        # Boost by popularity
+        score += min(model.download_count / 10000, 5.0)
+        
+        # Boost by rating
+        if model.rating:
+            score += model.rating
+        
+        return score
+    
+    @staticmethod
+    def _compile_query_matcher(query_lower: str) -> Callable[[str], float]:
+        """Build a function scoring how much of a query a lowercase text contains.
+        
+        The query is tokenized once. The returned function gives the fraction
+        of distinct query tokens found in the text, so a single-token query
+        scores 1.0 or 0.0 like a plain substring check.
+        
+        Args:
+            query_lower: Lowercase search query
             
-            # Boost recent models slightly
-            days_since_update = (model.updated_at - model.created_at).days
-            if days_since_update < 30:
-                score += 2.0
-            
-            return score
+        Returns:
+            Function mapping a lowercase text to a match fraction in [0, 1]
+        """
+        tokens = tuple(dict.fromkeys(query_lower.split()))
+        if len(tokens) <= 1:
+            needle = tokens[0] if tokens else query_lower
+            return lambda text: 1.0 if needle in text else 0.0
+        
+        token_weight = 1.0 / len(tokens)
+        
+        def match_fraction(text: str) -> float:
+            return sum(token_weight for token in tokens if token in text)
         
-        return sorted(models, key=popularity_score, reverse=True)
+        return match_fraction
     
-    def _get_platform_model_types(self, platform: ExternalPlatform) -> List[str]:
-        """Get supported model types for a platform."""
-        # This would typically come from platform-specific configuration
-        # For now, return all ComfyUI model types
-        return [model_type.value for model_type in ComfyUIModelType]
\ No newline at end of file
+    @staticmethod
+    def _popularity_score(model: ExternalModel) -> float:
+        """Score a model by download count, rating, compatibility and freshness."""
+        score = 0.0
+        
+        # Download count (primary metric)
+        score += min(model.download_count / 1000, 100.0)
+        
+        # Rating
+        if model.rating:
+            score += model.rating * 10
+        
+        # Boost ComfyUI compatible models
+        if model.is_comfyui_compatible:
+            score += 5.0
+        
+        # Boost recent models slightly
+        days_since_update = (model.updated_at - model.created_at).days
+        if days_since_update < 30:
+            score += 2.0
+        
+        return score
+    
+    def _sort_models_by_popularity(
+        self,
+        models: List[ExternalModel],
+        limit: Optional[int] = None
+    ) -> List[ExternalModel]:
+        """Sort models by popularity metrics.
+        
+        Args:
+            models: Models to rank
+            limit: Optional number of top models to return; only those are
+                ordered, which is cheaper than sorting every model
+            
+        Returns:
+            Models in descending order of popularity
+        """
+        if limit is None:
+            return sorted(models, key=self._popularity_score, reverse=True)
+        return heapq.nlargest(limit, models, key=self._popularity_score)
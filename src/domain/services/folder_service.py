@@ -1,10 +1,12 @@
 """Folder service implementing folder management operations."""
 
-from typing import List, Dict
+from datetime import datetime, timedelta
+from typing import Hashable, List, Dict, Optional
+import threading
 
 from ..ports.driving.folder_management_port import FolderManagementPort
 from ..ports.driven.folder_repository_port import FolderRepositoryPort
-from ..entities.folder import Folder
+from ..entities.folder import Folder, FolderSnapshot
 from ..entities.base import ValidationError, NotFoundError
 
 
@@ -15,21 +17,47 @@ class FolderService(FolderManagementPort):
     and implements the FolderManagementPort interface.
     """
     
-    def __init__(self, folder_repository: FolderRepositoryPort):
+    def __init__(self, folder_repository: FolderRepositoryPort, snapshot_ttl_seconds: int = 300):
         """Initialize the folder service.
         
         Args:
             folder_repository: Repository for folder data access
+            snapshot_ttl_seconds: Time-to-live for the cached folder snapshot
+                in seconds (default: 5 minutes)
         """
         self._folder_repository = folder_repository
+        self._snapshot_ttl = timedelta(seconds=snapshot_ttl_seconds)
+        self._folders: Optional[List[Folder]] = None
+        self._folders_token: Optional[Hashable] = None
+        self._snapshot: Optional[FolderSnapshot] = None
+        self._snapshot_token: Optional[Hashable] = None
+        self._snapshot_timestamp: Optional[datetime] = None
+        self._cache_lock = threading.RLock()
     
     def get_all_folders(self) -> List[Folder]:
         """Get all available model folders.
         
+        The folder list is cached and reused while the repository's change
+        token is unchanged, so repeated calls cost one token check instead
+        of a folder scan. Repositories without a change token are read on
+        every call.
+        
         Returns:
             List of all folders in the system
         """
-        return self._folder_repository.get_all_folders()
+        token = self._folder_repository.get_change_token()
+        with self._cache_lock:
+            if token is not None and self._folders is not None and token == self._folders_token:
+                return list(self._folders)
+        
+        folders = self._folder_repository.get_all_folders()
+        
+        if token is not None:
+            with self._cache_lock:
+                self._folders = list(folders)
+                self._folders_token = token
+        
+        return folders
     
     def get_folder_by_id(self, folder_id: str) -> Folder:
         """Get a specific folder by its ID.
@@ -47,7 +75,13 @@ class FolderService(FolderManagementPort):
         if not folder_id or not folder_id.strip():
             raise ValidationError("folder_id cannot be empty", "folder_id")
         
-        folder = self._folder_repository.find_by_id(folder_id.strip())
+        folder_id = folder_id.strip()
+        
+        # Binary search the snapshot (built on first use); fall back to the
+        # repository for folders that appeared after it was taken
+        folder = self.get_folder_snapshot().find(folder_id)
+        if folder is None:
+            folder = self._folder_repository.find_by_id(folder_id)
         if folder is None:
             raise NotFoundError("Folder", folder_id)
         
@@ -56,8 +90,54 @@ class FolderService(FolderManagementPort):
     def get_folder_structure(self) -> Dict[str, Folder]:
         """Get the complete folder structure as a hierarchical dictionary.
         
+        Deprecated: use ``get_folder_snapshot`` instead.
+        
         Returns:
             Dictionary mapping folder IDs to Folder objects, representing
             the complete folder hierarchy
         """
-        return self._folder_repository.get_folder_structure()
\ No newline at end of file
+        return self._folder_repository.get_folder_structure()
+    
+    def get_folder_snapshot(self) -> FolderSnapshot:
+        """Get an immutable snapshot of the complete folder structure.
+        
+        The snapshot is cached and the same instance is returned until it
+        expires, the repository's change token changes or
+        ``invalidate_folder_snapshot`` is called.
+        
+        Returns:
+            Column-oriented snapshot of all folders and their parent links
+        """
+        with self._cache_lock:
+            snapshot = self._get_valid_snapshot()
+            if snapshot is None:
+                token = self._folder_repository.get_change_token()
+                snapshot = FolderSnapshot.from_folders(self.get_all_folders())
+                self._snapshot = snapshot
+                self._snapshot_token = token
+                self._snapshot_timestamp = datetime.now()
+            return snapshot
+    
+    def invalidate_folder_snapshot(self) -> None:
+        """Drop the cached folders and snapshot so the next call rebuilds them."""
+        with self._cache_lock:
+            self._folders = None
+            self._folders_token = None
+            self._snapshot = None
+            self._snapshot_token = None
+            self._snapshot_timestamp = None
+    
+    def _get_valid_snapshot(self) -> Optional[FolderSnapshot]:
+        """Get the cached snapshot if it exists and is still current."""
+        with self._cache_lock:
+            if self._snapshot is None or self._snapshot_timestamp is None:
+                return None
+            if (
+                datetime.now() - self._snapshot_timestamp > self._snapshot_ttl
+                or self._folder_repository.get_change_token() != self._snapshot_token
+            ):
+                self._snapshot = None
+                self._snapshot_token = None
+                self._snapshot_timestamp = None
+                return None
+            return self._snapshot
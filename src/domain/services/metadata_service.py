@@ -1,8 +1,11 @@
 """Metadata service for external metadata enrichment."""
 
-from typing import Optional, List
+from typing import Any, Callable, Dict, Optional, List, Set
 from datetime import datetime, timedelta
+import asyncio
 import logging
+import threading
+import time
 
 from ..ports.driven.external_metadata_port import ExternalMetadataPort
 from ..ports.driven.cache_port import CachePort
@@ -13,6 +16,18 @@ from ..entities.base import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Cache entry field holding the fetch time as a Unix timestamp, so entries
+# can be checked for expiry without rebuilding the metadata objects
+CACHED_AT_EPOCH_KEY = "cached_at_epoch"
+
+# Cache entries are envelopes of a small header and the metadata payload
+CACHE_ENTRY_VERSION = 1
+CACHE_VERSION_KEY = "v"
+CACHE_PAYLOAD_KEY = "payload"
+
+# Prefix shared by every metadata cache key
+CACHE_KEY_PREFIX = "metadata:"
+
 
 class MetadataService:
     """Service for enriching models with external metadata.
@@ -41,8 +56,25 @@ class MetadataService:
         self._huggingface_port = huggingface_port
         self._cache_port = cache_port
         self._cache_ttl = cache_ttl
+        # Fetches currently running, by model hash; concurrent callers for
+        # the same hash wait for the running fetch instead of starting one
+        self._inflight: Dict[str, "asyncio.Future[Optional[ExternalMetadata]]"] = {}
+        # Keys written by this service, for caches that cannot delete by
+        # prefix. Cache writes run in executor threads, so the set is only
+        # touched under its lock
+        self._tracked_keys: Set[str] = set()
+        self._tracked_keys_lock = threading.Lock()
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking cache call off the event loop.
+        
+        Cache ports are synchronous and may touch the file system, so async
+        paths hand them to the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
     
-    def enrich_metadata(self, model: Model) -> Optional[ExternalMetadata]:
+    async def enrich_metadata(self, model: Model) -> Optional[ExternalMetadata]:
         """Enrich model with external metadata from available sources.
         
         Args:
@@ -62,14 +94,44 @@ class MetadataService:
             return None
         
         # Try to get from cache first
-        cached_metadata = self._get_cached_metadata(model.hash)
+        cached_metadata = await self._run_blocking(self._get_cached_metadata, model.hash)
         if cached_metadata:
             logger.debug(f"Using cached metadata for model {model.id}")
             return cached_metadata
         
-        # Fetch from external sources
-        civitai_metadata = self._fetch_civitai_metadata(model)
-        huggingface_metadata = self._fetch_huggingface_metadata(model)
+        flight = self._inflight.get(model.hash)
+        if flight is not None:
+            logger.debug(f"Waiting for in-flight metadata fetch for model {model.id}")
+            # Shield the shared fetch so a cancelled waiter does not cancel it
+            return await asyncio.shield(flight)
+        
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[model.hash] = flight
+        try:
+            flight.set_result(await self._fetch_external_metadata(model))
+        finally:
+            del self._inflight[model.hash]
+            if not flight.done():
+                # The fetch failed or was cancelled; waiters get no metadata
+                flight.set_result(None)
+        
+        return flight.result()
+    
+    async def _fetch_external_metadata(self, model: Model) -> Optional[ExternalMetadata]:
+        """Fetch metadata for a model from every source and cache it.
+        
+        Both sources are queried concurrently.
+        
+        Args:
+            model: The model to fetch metadata for
+            
+        Returns:
+            External metadata if any source had it, None otherwise
+        """
+        civitai_metadata, huggingface_metadata = await asyncio.gather(
+            self._fetch_civitai_metadata(model),
+            self._fetch_huggingface_metadata(model)
+        )
         
         # If we have any metadata, create ExternalMetadata object
         if civitai_metadata or huggingface_metadata:
@@ -81,7 +143,7 @@ class MetadataService:
             )
             
             # Cache the result
-            self._cache_metadata(model.hash, external_metadata)
+            await self._run_blocking(self._cache_metadata, model.hash, external_metadata)
             
             logger.info(f"Successfully enriched metadata for model {model.id}")
             return external_metadata
@@ -110,9 +172,18 @@ class MetadataService:
         """Clear all cached metadata."""
         if self._cache_port:
             try:
-                # Clear all metadata cache entries
-                # Since we don't have a way to clear by prefix, we'll clear the entire cache
-                self._cache_port.clear()
+                # Only metadata entries are removed; other users of the cache
+                # keep their entries
+                if self._cache_port.supports_prefix_delete:
+                    self._cache_port.delete_prefix(CACHE_KEY_PREFIX)
+                    with self._tracked_keys_lock:
+                        self._tracked_keys.clear()
+                else:
+                    with self._tracked_keys_lock:
+                        tracked_keys = list(self._tracked_keys)
+                        self._tracked_keys.clear()
+                    for cache_key in tracked_keys:
+                        self._cache_port.delete(cache_key)
                 logger.info("Metadata cache cleared")
             except Exception as e:
                 logger.warning(f"Failed to clear metadata cache: {e}")
@@ -133,11 +204,13 @@ class MetadataService:
             try:
                 cache_key = self._get_cache_key(model_hash.strip())
                 self._cache_port.delete(cache_key)
+                with self._tracked_keys_lock:
+                    self._tracked_keys.discard(cache_key)
                 logger.debug(f"Invalidated cache for model hash {model_hash}")
             except Exception as e:
                 logger.warning(f"Failed to invalidate cache for model hash {model_hash}: {e}")
     
-    def _fetch_civitai_metadata(self, model: Model) -> Optional[CivitAIMetadata]:
+    async def _fetch_civitai_metadata(self, model: Model) -> Optional[CivitAIMetadata]:
         """Fetch metadata from CivitAI.
         
         Args:
@@ -151,20 +224,20 @@ class MetadataService:
         
         try:
             logger.debug(f"Fetching CivitAI metadata for model {model.id}")
-            external_metadata = self._civitai_port.fetch_metadata(model.hash)
+            external_metadata = await self._civitai_port.fetch_metadata(model.hash)
             if external_metadata and external_metadata.civitai:
                 return external_metadata.civitai
             
             # Try the specific CivitAI method if available
             if hasattr(self._civitai_port, 'fetch_civitai_metadata'):
-                return self._civitai_port.fetch_civitai_metadata(model.hash)
+                return await self._civitai_port.fetch_civitai_metadata(model.hash)
                 
         except Exception as e:
             logger.warning(f"Failed to fetch CivitAI metadata for model {model.id}: {e}")
         
         return None
     
-    def _fetch_huggingface_metadata(self, model: Model) -> Optional[HuggingFaceMetadata]:
+    async def _fetch_huggingface_metadata(self, model: Model) -> Optional[HuggingFaceMetadata]:
         """Fetch metadata from HuggingFace.
         
         Args:
@@ -184,12 +257,12 @@ class MetadataService:
             
             # Try the specific HuggingFace method if available
             if hasattr(self._huggingface_port, 'fetch_huggingface_metadata'):
-                hf_metadata = self._huggingface_port.fetch_huggingface_metadata(model_identifier)
+                hf_metadata = await self._huggingface_port.fetch_huggingface_metadata(model_identifier)
                 if hf_metadata:
                     return hf_metadata
             
             # Fall back to generic fetch_metadata
-            external_metadata = self._huggingface_port.fetch_metadata(model_identifier)
+            external_metadata = await self._huggingface_port.fetch_metadata(model_identifier)
             if external_metadata and external_metadata.huggingface:
                 return external_metadata.huggingface
                 
@@ -214,20 +287,29 @@ class MetadataService:
             cache_key = self._get_cache_key(model_hash)
             cached_data = self._cache_port.get(cache_key)
             
-            if cached_data:
-                # Check if cached data is still valid
-                if isinstance(cached_data, dict):
-                    external_metadata = ExternalMetadata.from_dict(cached_data)
-                    
-                    # Check if cache is expired (if cached_at is available)
-                    if external_metadata.cached_at:
-                        cache_age = datetime.now() - external_metadata.cached_at
-                        if cache_age.total_seconds() > self._cache_ttl:
-                            logger.debug(f"Cache expired for model hash {model_hash}")
-                            self._cache_port.delete(cache_key)
-                            return None
-                    
-                    return external_metadata
+            if cached_data and isinstance(cached_data, dict):
+                if CACHE_PAYLOAD_KEY in cached_data:
+                    if cached_data.get(CACHE_VERSION_KEY) != CACHE_ENTRY_VERSION:
+                        logger.debug(f"Unsupported cache entry version for model hash {model_hash}")
+                        self._cache_port.delete(cache_key)
+                        return None
+                    payload = cached_data[CACHE_PAYLOAD_KEY]
+                else:
+                    # Entries written before the envelope stored the payload inline
+                    payload = cached_data
+                
+                # Check expiry on the header before rebuilding the metadata
+                cached_at_epoch = cached_data.get(CACHED_AT_EPOCH_KEY)
+                if cached_at_epoch is None and payload.get("cached_at"):
+                    # Entries written before the epoch field was stored
+                    cached_at_epoch = datetime.fromisoformat(payload["cached_at"]).timestamp()
+                
+                if cached_at_epoch is not None and time.time() - cached_at_epoch > self._cache_ttl:
+                    logger.debug(f"Cache expired for model hash {model_hash}")
+                    self._cache_port.delete(cache_key)
+                    return None
+                
+                return ExternalMetadata.from_dict(payload)
                 
         except Exception as e:
             logger.warning(f"Failed to get cached metadata for model hash {model_hash}: {e}")
@@ -246,8 +328,16 @@ class MetadataService:
         
         try:
             cache_key = self._get_cache_key(model_hash)
-            cache_data = metadata.to_dict()
+            cache_data = {
+                CACHE_VERSION_KEY: CACHE_ENTRY_VERSION,
+                CACHED_AT_EPOCH_KEY: (
+                    metadata.cached_at.timestamp() if metadata.cached_at else time.time()
+                ),
+                CACHE_PAYLOAD_KEY: metadata.to_dict(),
+            }
             self._cache_port.set(cache_key, cache_data, self._cache_ttl)
+            with self._tracked_keys_lock:
+                self._tracked_keys.add(cache_key)
             logger.debug(f"Cached metadata for model hash {model_hash}")
         except Exception as e:
             logger.warning(f"Failed to cache metadata for model hash {model_hash}: {e}")
@@ -261,7 +351,13 @@ class MetadataService:
         Returns:
             Cache key string
         """
-        return f"metadata:{model_hash}"
+        return f"{CACHE_KEY_PREFIX}{model_hash}"
+    
+    async def aclose(self) -> None:
+        """Close the external metadata ports and their pooled HTTP connections."""
+        ports = {id(port): port for port in (self._civitai_port, self._huggingface_port) if port}
+        for port in ports.values():
+            await port.close()
     
     @property
     def has_civitai_support(self) -> bool:
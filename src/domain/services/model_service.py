@@ -1,14 +1,56 @@
 """Model service implementing model management operations."""
 
-from typing import List, Optional
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, FrozenSet, Iterator, List, Optional, Dict, Tuple
 
 from ..ports.driving.model_management_port import ModelManagementPort
 from ..ports.driven.model_repository_port import ModelRepositoryPort
 from ..ports.driven.external_metadata_port import ExternalMetadataPort
-from ..entities.model import Model
+from ..entities.model import Model, BulkUpdateResult
+from ..entities.external_metadata import ExternalMetadata
 from ..entities.base import ValidationError, NotFoundError
 
 
+_STRIP = str.strip
+
+
+def _require_nonblank(value: Optional[str], field: str, message: Optional[str] = None) -> str:
+    """Return a string argument stripped of surrounding whitespace.
+    
+    Args:
+        value: The argument to check
+        field: Name of the argument, reported in the error
+        message: Optional error message (defaults to "<field> cannot be empty")
+        
+    Raises:
+        ValidationError: If value is not a string or is blank
+    """
+    cleaned = value.strip() if isinstance(value, str) else ""
+    if not cleaned:
+        raise ValidationError(message or f"{field} cannot be empty", field)
+    return cleaned
+
+
+def _next_batch(iterator: Iterator[Any], size: int) -> List[Any]:
+    """Take up to ``size`` items from an iterator (empty once it is exhausted)."""
+    return list(itertools.islice(iterator, size))
+
+
+def _optional_nonblank(value: Optional[str], field: str) -> Optional[str]:
+    """Return an optional string argument stripped, or None when omitted.
+    
+    Raises:
+        ValidationError: If value is provided but is not a string or is blank
+    """
+    if value is None:
+        return None
+    return _require_nonblank(value, field, f"{field} cannot be empty when provided")
+
+
 class ModelService(ModelManagementPort):
     """Domain service implementing model management operations.
     
@@ -16,21 +58,54 @@ class ModelService(ModelManagementPort):
     and implements the ModelManagementPort interface.
     """
     
+    __slots__ = (
+        "_model_repository",
+        "_external_metadata_port",
+        "_enrichment_ttl_seconds",
+        "_metadata_cache",
+        "_enriched_models",
+    )
+    
+    # Number of models a streamed folder scan reads per executor call
+    STREAM_BATCH_SIZE = 8
+    
+    # Maximum number of model hashes whose external metadata is kept in memory
+    MAX_METADATA_CACHE_ENTRIES = 1024
+    
     def __init__(
         self,
         model_repository: ModelRepositoryPort,
-        external_metadata_port: Optional[ExternalMetadataPort] = None
+        external_metadata_port: Optional[ExternalMetadataPort] = None,
+        enrichment_ttl_seconds: float = 3600
     ):
         """Initialize the model service.
         
         Args:
             model_repository: Repository for model data access
             external_metadata_port: Optional port for external metadata enrichment
+            enrichment_ttl_seconds: How long get_model_details reuses a model's
+                enrichment before enriching it again
         """
         self._model_repository = model_repository
         self._external_metadata_port = external_metadata_port
+        self._enrichment_ttl_seconds = enrichment_ttl_seconds
+        # External metadata by model hash, least recently used first. Misses
+        # are not remembered: the port also returns None on transient errors
+        self._metadata_cache: "OrderedDict[str, ExternalMetadata]" = OrderedDict()
+        # Models returned by get_model_details by ID, with when they were
+        # enriched and the repository state they were enriched from
+        self._enriched_models: "OrderedDict[str, Tuple[float, Tuple[Any, ...], Model]]" = OrderedDict()
     
-    def get_models_in_folder(self, folder_id: str) -> List[Model]:
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking repository or metadata call off the event loop.
+        
+        This is the single place where the service hands blocking work to the
+        default executor, so callers of the async port methods never need to.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
+    async def get_models_in_folder(self, folder_id: str) -> List[Model]:
         """Get all models in a specific folder.
         
         Args:
@@ -42,12 +117,51 @@ class ModelService(ModelManagementPort):
         Raises:
             ValidationError: If folder_id is invalid
         """
-        if not folder_id or not folder_id.strip():
-            raise ValidationError("folder_id cannot be empty", "folder_id")
+        folder_id = _require_nonblank(folder_id, "folder_id")
         
-        return self._model_repository.find_all_in_folder(folder_id.strip())
+        return await self._run_blocking(self._model_repository.find_all_in_folder, folder_id)
     
-    def get_model_details(self, model_id: str) -> Model:
+    async def get_models_in_folder_enriched(self, folder_id: str) -> List[Model]:
+        """Get all models in a specific folder with external metadata applied.
+        
+        The folder's distinct hashes are resolved through one bulk metadata
+        request, so enriching a folder does not make a call per model.
+        
+        Args:
+            folder_id: The ID of the folder to get models from
+            
+        Returns:
+            List of models in the folder, enriched where metadata was found
+            
+        Raises:
+            ValidationError: If folder_id is invalid
+        """
+        models = await self.get_models_in_folder(folder_id)
+        return await self.enrich_model_metadata_bulk(models)
+    
+    async def stream_models_in_folder(self, folder_id: str) -> AsyncIterator[Model]:
+        """Stream the models in a specific folder as they are discovered.
+        
+        The repository is read in small batches off the event loop, since a
+        cold scan hashes every model file it finds.
+        
+        Args:
+            folder_id: The ID of the folder to get models from
+            
+        Yields:
+            Models in the folder, one at a time
+            
+        Raises:
+            ValidationError: If folder_id is invalid
+        """
+        folder_id = _require_nonblank(folder_id, "folder_id")
+        
+        models = self._model_repository.iter_in_folder(folder_id)
+        while batch := await self._run_blocking(_next_batch, models, self.STREAM_BATCH_SIZE):
+            for model in batch:
+                yield model
+    
+    async def get_model_details(self, model_id: str) -> Model:
         """Get detailed information about a specific model.
         
         Args:
@@ -60,51 +174,99 @@ class ModelService(ModelManagementPort):
             ValidationError: If model_id is invalid
             NotFoundError: If model is not found
         """
-        if not model_id or not model_id.strip():
-            raise ValidationError("model_id cannot be empty", "model_id")
+        model_id = _require_nonblank(model_id, "model_id")
         
-        model = self._model_repository.find_by_id(model_id.strip())
+        model = await self._run_blocking(self._model_repository.find_by_id, model_id)
         if model is None:
             raise NotFoundError("Model", model_id)
         
-        # Try to enrich with external metadata if available
+        if self._external_metadata_port is None:
+            return model
+        
+        # Reuse a recent enrichment of the same repository state
+        fresh = self._fresh_enriched_model(model)
+        if fresh is not None:
+            return fresh
+        
+        # Enrichment already falls back to the model if the lookup fails
+        enriched = await self.enrich_model_metadata(model)
+        self._remember_enriched_model(model, enriched)
+        return enriched
+    
+    async def get_model_details_bulk(self, model_ids: List[str]) -> Dict[str, Model]:
+        """Get detailed information about several models in one call.
+        
+        Args:
+            model_ids: List of model IDs to get details for
+            
+        Returns:
+            Dictionary mapping each found model ID to its model. IDs that
+            do not match any model are omitted.
+            
+        Raises:
+            ValidationError: If model_ids is invalid
+        """
+        if not isinstance(model_ids, list) or not model_ids:
+            raise ValidationError("model_ids must be a non-empty list", "model_ids")
+        
+        cleaned_ids = []
+        for model_id in model_ids:
+            cleaned_ids.append(
+                _require_nonblank(model_id, "model_ids", "each model_id must be a non-empty string")
+            )
+        
+        # Resolve all IDs with a single repository call, dropping duplicates
+        models = await self._run_blocking(
+            self._model_repository.find_by_ids, list(dict.fromkeys(cleaned_ids))
+        )
+        
         if self._external_metadata_port:
-            try:
-                enriched_model = self.enrich_model_metadata(model)
-                return enriched_model
-            except Exception:
-                # If enrichment fails, return the original model
-                # This ensures graceful fallback
-                pass
+            enriched_models = await self.enrich_model_metadata_bulk(list(models.values()))
+            models = {model.id: model for model in enriched_models}
         
-        return model
+        return models
     
-    def search_models(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
+    async def search_models(
+        self,
+        query: str,
+        folder_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Model]:
         """Search for models based on query and optional folder filter.
         
         Args:
             query: Search query string
             folder_id: Optional folder ID to limit search scope
+            limit: Optional maximum number of models to return
+            offset: Number of matching models to skip
             
         Returns:
             List of models matching the search criteria
             
         Raises:
-            ValidationError: If query is invalid
+            ValidationError: If query or pagination parameters are invalid
         """
-        if not query or not query.strip():
-            raise ValidationError("query cannot be empty", "query")
+        cleaned_query = _require_nonblank(query, "query")
+        cleaned_folder_id = _optional_nonblank(folder_id, "folder_id")
+        
+        if limit is not None and limit <= 0:
+            raise ValidationError("limit must be positive", "limit")
         
-        # Validate folder_id if provided
-        if folder_id is not None and (not folder_id or not folder_id.strip()):
-            raise ValidationError("folder_id cannot be empty when provided", "folder_id")
+        if offset < 0:
+            raise ValidationError("offset must be non-negative", "offset")
         
-        cleaned_query = query.strip()
-        cleaned_folder_id = folder_id.strip() if folder_id else None
+        if limit is None and offset == 0:
+            return await self._run_blocking(
+                self._model_repository.search, cleaned_query, cleaned_folder_id
+            )
         
-        return self._model_repository.search(cleaned_query, cleaned_folder_id)
+        # Let the repository stop matching once the page is full
+        return await self._run_blocking(
+            self._model_repository.search_page, cleaned_query, cleaned_folder_id, limit, offset
+        )
     
-    def enrich_model_metadata(self, model: Model) -> Model:
+    async def enrich_model_metadata(self, model: Model) -> Model:
         """Enrich model with external metadata.
         
         Args:
@@ -123,53 +285,195 @@ class ModelService(ModelManagementPort):
         if self._external_metadata_port is None:
             return model
         
+        # Metadata is looked up by hash, so a model without one has nothing to find
+        if not model.hash:
+            return model
+        
+        # Only the lookup may fail for external reasons; if it does, fall back
+        # to the model without enrichment
         try:
-            # Try to fetch external metadata using model hash
-            external_metadata = self._external_metadata_port.fetch_metadata(model.hash)
+            external_metadata = await self._fetch_metadata_cached(model.hash)
+        except Exception:
+            return model
+        
+        if not external_metadata:
+            return model
+        
+        return self._apply_external_metadata(model, external_metadata)
+    
+    async def enrich_model_metadata_bulk(self, models: List[Model]) -> List[Model]:
+        """Enrich several models with external metadata in one call.
+        
+        Metadata is fetched once per distinct model hash through a single
+        bulk request to the external metadata port.
+        
+        Args:
+            models: The models to enrich with external metadata
+            
+        Returns:
+            Models in the same order, enriched where metadata was found
             
+        Raises:
+            ValidationError: If models is invalid
+        """
+        if not isinstance(models, list):
+            raise ValidationError("models must be a list", "models")
+        
+        if any(model is None for model in models):
+            raise ValidationError("models cannot contain None", "models")
+        
+        if self._external_metadata_port is None or not models:
+            return list(models)
+        
+        # Bound once; these are used for every model in the batch
+        metadata_cache = self._metadata_cache
+        remember_metadata = self._remember_metadata
+        apply_external_metadata = self._apply_external_metadata
+        
+        hashes = list(dict.fromkeys(model.hash for model in models if model.hash))
+        metadata_by_hash = {}
+        missing_hashes = []
+        for model_hash in hashes:
+            if model_hash in metadata_cache:
+                metadata_cache.move_to_end(model_hash)
+                metadata_by_hash[model_hash] = metadata_cache[model_hash]
+            else:
+                missing_hashes.append(model_hash)
+        
+        if missing_hashes:
+            try:
+                fetched = await self._external_metadata_port.fetch_metadata_bulk(missing_hashes)
+            except Exception:
+                # If the bulk fetch fails, return the models without enrichment
+                return list(models)
+            
+            for model_hash in missing_hashes:
+                external_metadata = fetched.get(model_hash)
+                if external_metadata is not None:
+                    metadata_by_hash[model_hash] = external_metadata
+                    remember_metadata(model_hash, external_metadata)
+        
+        enriched_models = []
+        for model in models:
+            external_metadata = metadata_by_hash.get(model.hash)
             if external_metadata:
-                # Create a copy of the model with enriched metadata
-                enriched_user_metadata = model.user_metadata.copy()
-                
-                # Add external metadata to user_metadata
-                enriched_user_metadata["external_metadata"] = external_metadata.to_dict()
-                
-                # If external metadata has tags, merge them with existing user tags
-                external_tags = external_metadata.get_all_tags()
-                if external_tags:
-                    existing_tags = enriched_user_metadata.get("tags", [])
-                    all_tags = list(set(existing_tags + external_tags))
-                    enriched_user_metadata["tags"] = all_tags
-                
-                # If external metadata has a description and model doesn't have one, use it
-                if not enriched_user_metadata.get("description"):
-                    external_description = external_metadata.get_primary_description()
-                    if external_description:
-                        enriched_user_metadata["description"] = external_description
-                
-                # Create new model instance with enriched metadata
-                enriched_model = Model(
-                    id=model.id,
-                    name=model.name,
-                    file_path=model.file_path,
-                    file_size=model.file_size,
-                    created_at=model.created_at,
-                    modified_at=model.modified_at,
-                    model_type=model.model_type,
-                    hash=model.hash,
-                    folder_id=model.folder_id,
-                    thumbnail_path=model.thumbnail_path,
-                    user_metadata=enriched_user_metadata
-                )
-                
-                return enriched_model
+                model = apply_external_metadata(model, external_metadata)
+            enriched_models.append(model)
+        
+        return enriched_models
+    
+    async def _fetch_metadata_cached(self, model_hash: str) -> Optional[ExternalMetadata]:
+        """Fetch external metadata for a model hash, reusing earlier results.
+        
+        Args:
+            model_hash: The model hash to fetch metadata for
             
-        except Exception:
-            # If external metadata fetching fails, gracefully fall back
-            # to returning the original model without enrichment
-            pass
+        Returns:
+            External metadata if found, None otherwise
+        """
+        metadata_cache = self._metadata_cache
+        if model_hash in metadata_cache:
+            metadata_cache.move_to_end(model_hash)
+            return metadata_cache[model_hash]
+        
+        external_metadata = await self._external_metadata_port.fetch_metadata(model_hash)
+        if external_metadata is not None:
+            self._remember_metadata(model_hash, external_metadata)
+        return external_metadata
+    
+    def _remember_metadata(self, model_hash: str, external_metadata: ExternalMetadata) -> None:
+        """Store fetched metadata, evicting the least recently used entries."""
+        self._metadata_cache[model_hash] = external_metadata
+        self._metadata_cache.move_to_end(model_hash)
+        while len(self._metadata_cache) > self.MAX_METADATA_CACHE_ENTRIES:
+            self._metadata_cache.popitem(last=False)
+    
+    def invalidate_metadata_cache(self, model_hash: Optional[str] = None) -> None:
+        """Drop remembered external metadata so the next enrichment refetches it.
         
-        return model
+        Args:
+            model_hash: Hash of the model to forget, or None to forget every model
+        """
+        if model_hash is None:
+            self._metadata_cache.clear()
+            self._enriched_models.clear()
+        else:
+            self._metadata_cache.pop(model_hash, None)
+            stale_ids = [
+                model_id for model_id, (_, source, _) in self._enriched_models.items()
+                if source[0] == model_hash
+            ]
+            for model_id in stale_ids:
+                del self._enriched_models[model_id]
+    
+    @staticmethod
+    def _enrichment_source(model: Model) -> Tuple[Any, ...]:
+        """Describe the repository state an enrichment was built from."""
+        return (model.hash, model.modified_at, dict(model.user_metadata))
+    
+    def _fresh_enriched_model(self, model: Model) -> Optional[Model]:
+        """Return the model's enrichment if it is within the TTL and still current."""
+        entry = self._enriched_models.get(model.id)
+        if entry is None:
+            return None
+        enriched_at, source, enriched = entry
+        if (
+            time.monotonic() - enriched_at >= self._enrichment_ttl_seconds
+            or source != self._enrichment_source(model)
+        ):
+            del self._enriched_models[model.id]
+            return None
+        self._enriched_models.move_to_end(model.id)
+        return enriched
+    
+    def _remember_enriched_model(self, model: Model, enriched: Model) -> None:
+        """Store an enrichment, evicting the least recently used entries."""
+        self._enriched_models[model.id] = (time.monotonic(), self._enrichment_source(model), enriched)
+        self._enriched_models.move_to_end(model.id)
+        while len(self._enriched_models) > self.MAX_METADATA_CACHE_ENTRIES:
+            self._enriched_models.popitem(last=False)
+    
+    def _apply_external_metadata(self, model: Model, external_metadata: ExternalMetadata) -> Model:
+        """Create a copy of a model with external metadata merged in.
+        
+        Args:
+            model: The model to enrich
+            external_metadata: Metadata fetched for the model's hash
+            
+        Returns:
+            New model instance with enriched user metadata, or the model
+            itself if it already carries the metadata
+        """
+        user_metadata = model.user_metadata
+        changes = {}
+        
+        # Add external metadata to user_metadata
+        external_metadata_dict = external_metadata.to_dict()
+        if user_metadata.get("external_metadata") != external_metadata_dict:
+            changes["external_metadata"] = external_metadata_dict
+        
+        # If external metadata has tags, merge them with existing user tags
+        external_tags = external_metadata.get_all_tags()
+        if external_tags:
+            # Deduplicate while keeping user tags first, in a stable order
+            existing_tags = user_metadata.get("tags", [])
+            merged_tags = dict.fromkeys(existing_tags)
+            merged_tags.update(dict.fromkeys(external_tags))
+            merged_tags = list(merged_tags)
+            if merged_tags != existing_tags:
+                changes["tags"] = merged_tags
+        
+        # If external metadata has a description and model doesn't have one, use it
+        if not user_metadata.get("description"):
+            external_description = external_metadata.get_primary_description()
+            if external_description:
+                changes["description"] = external_description
+        
+        if not changes:
+            return model
+        
+        # Create new model instance with enriched metadata
+        return replace(model, user_metadata={**user_metadata, **changes})
     
     def update_model_metadata(self, model_id: str, metadata: dict) -> Model:
         """Update user metadata for a specific model.
@@ -185,18 +489,88 @@ class ModelService(ModelManagementPort):
             ValidationError: If model_id or metadata is invalid
             NotFoundError: If model is not found
         """
-        if not model_id or not model_id.strip():
-            raise ValidationError("model_id cannot be empty", "model_id")
+        model_id = _require_nonblank(model_id, "model_id")
         
-        if not isinstance(metadata, dict):
-            raise ValidationError("metadata must be a dictionary", "metadata")
+        patch = self._validate_metadata_patch(metadata)
         
-        model = self._model_repository.find_by_id(model_id.strip())
+        model = self._model_repository.find_by_id(model_id)
         if model is None:
             raise NotFoundError("Model", model_id)
         
-        # Validate and apply metadata updates
-        updated_metadata = model.user_metadata.copy()
+        updated_model = self._apply_metadata_patch(model, patch)
+        
+        # Save the updated model
+        self._model_repository.save(updated_model)
+        
+        return updated_model
+    
+    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> BulkUpdateResult:
+        """Update metadata for multiple models at once.
+        
+        The models are fetched and saved in one repository call each, and
+        the metadata is validated once for the whole batch. Repeated IDs
+        are updated once. IDs that are empty or not found are reported as
+        failed instead of aborting the batch.
+        
+        Args:
+            model_ids: List of model IDs to update
+            metadata: Dictionary containing metadata updates
+            
+        Returns:
+            Result with the updated models and the IDs that failed
+            
+        Raises:
+            ValidationError: If model_ids or metadata is invalid
+        """
+        if not isinstance(model_ids, list) or not model_ids:
+            raise ValidationError("model_ids must be a non-empty list", "model_ids")
+        
+        patch = self._validate_metadata_patch(metadata)
+        
+        requested_ids = []
+        failed = []
+        for model_id in model_ids:
+            if isinstance(model_id, str) and (cleaned_id := model_id.strip()):
+                requested_ids.append(cleaned_id)
+            else:
+                failed.append({"model_id": model_id, "error": "model_id must be a non-empty string"})
+        
+        requested_ids = list(dict.fromkeys(requested_ids))
+        repository = self._model_repository
+        apply_metadata_patch = self._apply_metadata_patch
+        models_by_id = repository.find_by_ids(requested_ids)
+        
+        updated_models = []
+        for model_id in requested_ids:
+            if model_id in models_by_id:
+                updated_models.append(apply_metadata_patch(models_by_id[model_id], patch))
+            else:
+                failed.append({"model_id": model_id, "error": "Model not found"})
+        
+        # Failed IDs do not abort the batch; the successful updates are still saved
+        if updated_models:
+            repository.save_all(updated_models)
+        
+        return BulkUpdateResult(updated=updated_models, failed=failed)
+    
+    def _validate_metadata_patch(self, metadata: dict) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """Validate and normalize a user metadata update.
+        
+        Args:
+            metadata: Dictionary containing metadata updates
+            
+        Returns:
+            Tuple of the normalized field values to set and the names of
+            the fields to remove
+            
+        Raises:
+            ValidationError: If metadata is invalid
+        """
+        if not isinstance(metadata, dict):
+            raise ValidationError("metadata must be a dictionary", "metadata")
+        
+        updates = {}
+        removals = set()
         
         # Handle tags update
         if "tags" in metadata:
@@ -204,94 +578,64 @@ class ModelService(ModelManagementPort):
             if not isinstance(tags, list):
                 raise ValidationError("tags must be a list", "tags")
             
-            # Validate each tag
-            for tag in tags:
-                if not isinstance(tag, str) or not tag.strip():
-                    raise ValidationError("each tag must be a non-empty string", "tags")
-            
-            updated_metadata["tags"] = [tag.strip() for tag in tags]
+            # Validate each tag; a non-string maps to "" so a single scan
+            # finds the first invalid entry
+            cleaned_tags = [_STRIP(tag) if type(tag) is str else "" for tag in tags]
+            if not all(cleaned_tags):
+                raise ValidationError(
+                    f"each tag must be a non-empty string (tag {cleaned_tags.index('')})", "tags"
+                )
+            updates["tags"] = cleaned_tags
         
         # Handle description update
         if "description" in metadata:
             description = metadata["description"]
-            if description is not None:
-                if not isinstance(description, str):
-                    raise ValidationError("description must be a string", "description")
-                updated_metadata["description"] = description.strip()
+            if description is None:
+                removals.add("description")
+            elif not isinstance(description, str):
+                raise ValidationError("description must be a string", "description")
             else:
-                updated_metadata.pop("description", None)
+                updates["description"] = description.strip()
         
         # Handle rating update
         if "rating" in metadata:
             rating = metadata["rating"]
-            if rating is not None:
-                if not isinstance(rating, int) or not 1 <= rating <= 5:
-                    raise ValidationError("rating must be an integer between 1 and 5", "rating")
-                updated_metadata["rating"] = rating
+            if rating is None:
+                removals.add("rating")
+            elif type(rating) is not int or not 1 <= rating <= 5:
+                # bool is a subclass of int, so isinstance would accept True
+                raise ValidationError("rating must be an integer between 1 and 5", "rating")
             else:
-                updated_metadata.pop("rating", None)
-        
-        # Create updated model
-        updated_model = Model(
-            id=model.id,
-            name=model.name,
-            file_path=model.file_path,
-            file_size=model.file_size,
-            created_at=model.created_at,
-            modified_at=model.modified_at,
-            model_type=model.model_type,
-            hash=model.hash,
-            folder_id=model.folder_id,
-            thumbnail_path=model.thumbnail_path,
-            user_metadata=updated_metadata
-        )
+                updates["rating"] = rating
         
-        # Save the updated model
-        self._model_repository.save(updated_model)
-        
-        return updated_model
+        return updates, frozenset(removals)
     
-    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> List[Model]:
-        """Update metadata for multiple models at once.
+    def _apply_metadata_patch(
+        self,
+        model: Model,
+        patch: Tuple[Dict[str, Any], FrozenSet[str]]
+    ) -> Model:
+        """Create a copy of a model with a validated metadata update applied.
         
         Args:
-            model_ids: List of model IDs to update
-            metadata: Dictionary containing metadata updates
+            model: The model to update
+            patch: Updates returned by ``_validate_metadata_patch``
             
         Returns:
-            List of updated models
-            
-        Raises:
-            ValidationError: If model_ids or metadata is invalid
+            Updated model with new metadata
         """
-        if not isinstance(model_ids, list) or not model_ids:
-            raise ValidationError("model_ids must be a non-empty list", "model_ids")
-        
-        if not isinstance(metadata, dict):
-            raise ValidationError("metadata must be a dictionary", "metadata")
-        
-        updated_models = []
-        failed_updates = []
+        updates, removals = patch
+        updated_metadata = model.user_metadata.copy()
+        updated_metadata.update(updates)
+        for key in removals:
+            updated_metadata.pop(key, None)
         
-        for model_id in model_ids:
-            try:
-                updated_model = self.update_model_metadata(model_id, metadata)
-                updated_models.append(updated_model)
-            except (ValidationError, NotFoundError) as e:
-                failed_updates.append({"model_id": model_id, "error": str(e)})
-        
-        # If some updates failed, include that information
-        if failed_updates:
-            # For now, we'll log the failures but still return successful updates
-            # In a production system, you might want to handle this differently
-            pass
-        
-        return updated_models
+        return replace(model, user_metadata=updated_metadata)
     
-    def get_all_user_tags(self) -> List[str]:
+    def get_all_user_tags(self) -> Tuple[str, ...]:
         """Get all unique user tags across all models for autocomplete.
         
         Returns:
-            List of unique user tags
+            Sorted tuple of unique user tags
         """
         return self._model_repository.get_all_user_tags()
\ No newline at end of file
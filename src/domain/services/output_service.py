@@ -1,15 +1,32 @@
 """Output service implementing output management operations."""
 
-from typing import List, Optional, Dict, Any
+import copy
+import os
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import heapq
+import logging
 import threading
+import time
 
 from ..ports.driving.output_management_port import OutputManagementPort
 from ..ports.driven.output_repository_port import OutputRepositoryPort
-from ..entities.output import Output
+from ..ports.driven.cache_port import CachePort
+from ..entities.output import Output, SUPPORTED_OUTPUT_FORMATS, UNSUPPORTED_FORMAT_MESSAGE
+from ..entities.output_query import OutputFilter, OutputSort
 from ..entities.base import ValidationError, NotFoundError
 
 
+logger = logging.getLogger(__name__)
+
+# Identifies one version of an output file: (file_path, mtime timestamp, size)
+EnrichmentKey = Tuple[str, float, int]
+
+_EMPTY_OUTPUT_ID_MESSAGE = "output_id cannot be empty"
+
+
 class OutputService(OutputManagementPort):
     """Domain service implementing output management operations.
     
@@ -17,18 +34,52 @@ class OutputService(OutputManagementPort):
     and implements the OutputManagementPort interface.
     """
     
-    def __init__(self, output_repository: OutputRepositoryPort, cache_ttl_seconds: int = 300):
+    # Maximum number of output file versions whose enrichment is remembered
+    MAX_ENRICHMENT_CACHE_ENTRIES = 4096
+    
+    # Cache port key under which remembered enrichment is persisted, the
+    # layout version of the stored blob and how long it is kept
+    ENRICHMENT_CACHE_KEY = "outputs:enrichment"
+    ENRICHMENT_CACHE_VERSION = 1
+    ENRICHMENT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+    
+    # Most distinct outputs one bulk open may launch viewers for
+    MAX_BULK_OPEN = 20
+    
+    # Recently resolved outputs, so a details view followed by an action on
+    # the same output fetches it from the repository only once
+    MAX_RESOLVED_OUTPUT_ENTRIES = 64
+    RESOLVED_OUTPUT_TTL_SECONDS = 5.0
+    
+    def __init__(
+        self,
+        output_repository: OutputRepositoryPort,
+        cache_ttl_seconds: int = 300,
+        cache_port: Optional[CachePort] = None
+    ):
         """Initialize the output service.
         
         Args:
             output_repository: Repository for output data access
             cache_ttl_seconds: Time-to-live for cache entries in seconds (default: 5 minutes)
+            cache_port: Optional cache used to persist thumbnail and workflow
+                metadata lookups across restarts
         """
         self._output_repository = output_repository
         self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
         self._cache: Dict[str, Any] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
         self._cache_lock = threading.RLock()
+        self._cache_port = cache_port
+        # Thumbnail path and workflow metadata per output file version, least
+        # recently used first
+        self._enrichment_cache: "OrderedDict[EnrichmentKey, Tuple[Optional[str], Dict[str, Any]]]" = OrderedDict()
+        self._enrichment_hits = 0
+        self._enrichment_misses = 0
+        # Output per stripped ID with the monotonic time it was fetched,
+        # least recently used first
+        self._resolved_outputs: "OrderedDict[str, Tuple[float, Output]]" = OrderedDict()
+        self._load_enrichment_cache()
     
     def get_all_outputs(self) -> List[Output]:
         """Get all outputs from the output directory.
@@ -50,10 +101,7 @@ class OutputService(OutputManagementPort):
             outputs = self._output_repository.scan_output_directory()
             
             # Enrich outputs with thumbnails and metadata if available
-            enriched_outputs = []
-            for output in outputs:
-                enriched_output = self._enrich_output(output)
-                enriched_outputs.append(enriched_output)
+            enriched_outputs = self._enrich_outputs(outputs)
             
             # Cache the results
             self._set_cache(cache_key, enriched_outputs)
@@ -62,6 +110,88 @@ class OutputService(OutputManagementPort):
         except IOError as e:
             raise ValidationError(f"Failed to access output directory: {str(e)}", "output_directory")
     
+    def iter_all_outputs(self) -> Iterator[Output]:
+        """Lazily iterate over all outputs in the output directory.
+        
+        Serves the cached output list when available; otherwise streams
+        enriched outputs straight from the repository scan without caching
+        them, so memory use stays flat on large output directories.
+        
+        Returns:
+            Iterator yielding all outputs found in the output directory
+            
+        Raises:
+            ValidationError: If output directory configuration is invalid
+        """
+        cached_outputs = self._get_from_cache("all_outputs")
+        if cached_outputs is not None:
+            yield from cached_outputs
+            return
+        
+        try:
+            for output in self._output_repository.iter_output_directory():
+                yield self._enrich_output(output)
+        except IOError as e:
+            raise ValidationError(f"Failed to access output directory: {str(e)}", "output_directory")
+    
+    def list_outputs(
+        self,
+        output_filter: Optional[OutputFilter] = None,
+        output_sort: Optional[OutputSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Output]:
+        """List outputs matching a filter, in order, in a single pass.
+        
+        With a ``limit`` and a cold cache the filter, order and limit are
+        pushed down to the repository in one query, so only the selected
+        outputs are held in memory and enriched. Without a limit the cached
+        full listing is used.
+        
+        Args:
+            output_filter: Optional criteria outputs must match
+            output_sort: Optional ordering (defaults to newest first)
+            limit: Optional maximum number of outputs to return
+            
+        Returns:
+            List of matching outputs in the requested order
+            
+        Raises:
+            ValidationError: If limit is invalid or the output directory
+                configuration is invalid
+        """
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise ValidationError("limit must be a non-negative integer", "limit")
+        
+        output_filter = output_filter or OutputFilter()
+        output_sort = output_sort or OutputSort()
+        
+        cached_outputs = self._get_from_cache("all_outputs")
+        if cached_outputs is None and limit is not None:
+            # Only enrich the outputs that make the cut
+            try:
+                selected = self._output_repository.query_outputs(output_filter, output_sort, limit)
+            except IOError as e:
+                raise ValidationError(f"Failed to access output directory: {str(e)}", "output_directory")
+            return self._enrich_outputs(selected)
+        
+        if cached_outputs is None:
+            cached_outputs = self.get_all_outputs()
+        
+        candidates = (output for output in cached_outputs if output_filter.matches(output))
+        return self._select_outputs(candidates, output_sort, limit)
+    
+    def _select_outputs(
+        self,
+        outputs: Iterable[Output],
+        output_sort: OutputSort,
+        limit: Optional[int]
+    ) -> List[Output]:
+        """Order outputs, keeping only the leading ``limit`` when given."""
+        if limit is None:
+            return sorted(outputs, key=output_sort.key, reverse=not output_sort.ascending)
+        select = heapq.nsmallest if output_sort.ascending else heapq.nlargest
+        return select(limit, outputs, key=output_sort.key)
+    
     def get_output_details(self, output_id: str) -> Output:
         """Get detailed information about a specific output.
         
@@ -75,17 +205,39 @@ class OutputService(OutputManagementPort):
             ValidationError: If output_id is invalid
             NotFoundError: If output is not found
         """
-        if not output_id or not output_id.strip():
-            raise ValidationError("output_id cannot be empty", "output_id")
-        
-        output = self._output_repository.get_output_by_id(output_id.strip())
-        if output is None:
-            raise NotFoundError("Output", output_id)
+        output = self._resolve_output(output_id)
         
         # Enrich with additional metadata and thumbnail
         enriched_output = self._enrich_output(output)
         return enriched_output
     
+    def get_output_details_bulk(self, output_ids: List[str]) -> Dict[str, Output]:
+        """Get detailed information about several outputs in one call.
+        
+        Args:
+            output_ids: List of output IDs to get details for
+            
+        Returns:
+            Dictionary mapping each found output ID to its output. IDs that
+            do not match any output are omitted.
+            
+        Raises:
+            ValidationError: If output_ids is invalid
+        """
+        if not isinstance(output_ids, list) or not output_ids:
+            raise ValidationError("output_ids must be a non-empty list", "output_ids")
+        
+        cleaned_ids = []
+        for output_id in output_ids:
+            if not isinstance(output_id, str) or not output_id.strip():
+                raise ValidationError("each output_id must be a non-empty string", "output_ids")
+            cleaned_ids.append(output_id.strip())
+        
+        # Resolve all IDs with a single repository scan, dropping duplicates
+        outputs = self._output_repository.get_outputs_by_ids(list(dict.fromkeys(cleaned_ids)))
+        
+        return dict(zip(outputs, self._enrich_outputs(list(outputs.values()))))
+    
     def refresh_outputs(self) -> List[Output]:
         """Refresh the output list by rescanning the output directory.
         
@@ -108,6 +260,8 @@ class OutputService(OutputManagementPort):
     ) -> List[Output]:
         """Get outputs created within a specific date range.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
             start_date: Start of the date range (inclusive)
             end_date: End of the date range (inclusive)
@@ -118,14 +272,12 @@ class OutputService(OutputManagementPort):
         Raises:
             ValidationError: If date range is invalid
         """
-        if not isinstance(start_date, datetime):
-            raise ValidationError("start_date must be a datetime", "start_date")
-        
-        if not isinstance(end_date, datetime):
-            raise ValidationError("end_date must be a datetime", "end_date")
-        
-        if start_date > end_date:
-            raise ValidationError("start_date cannot be after end_date", "date_range")
+        if not (
+            isinstance(start_date, datetime)
+            and isinstance(end_date, datetime)
+            and start_date <= end_date
+        ):
+            raise self._date_range_error(start_date, end_date)
         
         cache_key = f"date_range_{start_date.isoformat()}_{end_date.isoformat()}"
         
@@ -137,19 +289,35 @@ class OutputService(OutputManagementPort):
         outputs = self._output_repository.get_outputs_by_date_range(start_date, end_date)
         
         # Enrich outputs with thumbnails and metadata
-        enriched_outputs = []
-        for output in outputs:
-            enriched_output = self._enrich_output(output)
-            enriched_outputs.append(enriched_output)
+        enriched_outputs = self._enrich_outputs(outputs)
         
         # Cache the results
         self._set_cache(cache_key, enriched_outputs)
         
         return enriched_outputs
     
+    @staticmethod
+    def _date_range_error(start_date: Any, end_date: Any) -> ValidationError:
+        """Describe why a date range was rejected.
+        
+        Args:
+            start_date: Rejected start of the date range
+            end_date: Rejected end of the date range
+            
+        Returns:
+            ValidationError naming the offending field
+        """
+        if not isinstance(start_date, datetime):
+            return ValidationError("start_date must be a datetime", "start_date")
+        if not isinstance(end_date, datetime):
+            return ValidationError("end_date must be a datetime", "end_date")
+        return ValidationError("start_date cannot be after end_date", "date_range")
+    
     def get_outputs_by_format(self, file_format: str) -> List[Output]:
         """Get outputs filtered by file format.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
             file_format: File format to filter by (png, jpg, jpeg, webp)
             
@@ -163,14 +331,10 @@ class OutputService(OutputManagementPort):
             raise ValidationError("file_format cannot be empty", "file_format")
         
         # Validate supported formats
-        supported_formats = {'png', 'jpg', 'jpeg', 'webp'}
         normalized_format = file_format.strip().lower()
         
-        if normalized_format not in supported_formats:
-            raise ValidationError(
-                f"file_format must be one of {supported_formats}", 
-                "file_format"
-            )
+        if normalized_format not in SUPPORTED_OUTPUT_FORMATS:
+            raise ValidationError(UNSUPPORTED_FORMAT_MESSAGE, "file_format")
         
         cache_key = f"format_{normalized_format}"
         
@@ -182,10 +346,7 @@ class OutputService(OutputManagementPort):
         outputs = self._output_repository.get_outputs_by_format(normalized_format)
         
         # Enrich outputs with thumbnails and metadata
-        enriched_outputs = []
-        for output in outputs:
-            enriched_output = self._enrich_output(output)
-            enriched_outputs.append(enriched_output)
+        enriched_outputs = self._enrich_outputs(outputs)
         
         # Cache the results
         self._set_cache(cache_key, enriched_outputs)
@@ -194,49 +355,39 @@ class OutputService(OutputManagementPort):
     
     def sort_outputs(
         self, 
-        outputs: List[Output], 
+        outputs: Iterable[Output], 
         sort_by: str, 
-        ascending: bool = True
+        ascending: bool = True,
+        limit: Optional[int] = None
     ) -> List[Output]:
         """Sort outputs by specified criteria.
         
+        Deprecated: use ``list_outputs`` instead.
+        
         Args:
-            outputs: List of outputs to sort
+            outputs: Outputs to sort (any iterable, e.g. ``iter_all_outputs()``)
             sort_by: Sort criteria (date, name, size)
             ascending: Whether to sort in ascending order
+            limit: Optional number of leading outputs to keep; only that many
+                are held in memory while consuming ``outputs``
             
         Returns:
             Sorted list of outputs
             
         Raises:
-            ValidationError: If sort_by is invalid
+            ValidationError: If sort_by or limit is invalid
         """
-        if not isinstance(outputs, list):
-            raise ValidationError("outputs must be a list", "outputs")
-        
-        if not sort_by or not sort_by.strip():
-            raise ValidationError("sort_by cannot be empty", "sort_by")
+        if isinstance(outputs, (str, bytes)) or not isinstance(outputs, Iterable):
+            raise ValidationError("outputs must be an iterable of outputs", "outputs")
         
-        valid_sort_options = {'date', 'name', 'size'}
-        normalized_sort_by = sort_by.strip().lower()
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise ValidationError("limit must be a non-negative integer", "limit")
         
-        if normalized_sort_by not in valid_sort_options:
-            raise ValidationError(
-                f"sort_by must be one of {valid_sort_options}", 
-                "sort_by"
-            )
-        
-        # Define sort key functions
-        sort_key_functions = {
-            'date': lambda output: output.created_at,
-            'name': lambda output: output.filename.lower(),
-            'size': lambda output: output.file_size
-        }
-        
-        sort_key = sort_key_functions[normalized_sort_by]
+        output_sort = OutputSort(sort_by=sort_by, ascending=ascending)
         
         try:
-            return sorted(outputs, key=sort_key, reverse=not ascending)
+            # With a limit only the top outputs are kept instead of sorting everything
+            return self._select_outputs(outputs, output_sort, limit)
         except Exception as e:
             raise ValidationError(f"Failed to sort outputs: {str(e)}", "sort_operation")
     
@@ -249,42 +400,179 @@ class OutputService(OutputManagementPort):
         Returns:
             Enriched output with thumbnail and metadata
         """
+        return self._enrich_outputs([output])[0]
+    
+    def _enrich_outputs(self, outputs: List[Output]) -> List[Output]:
+        """Enrich several outputs with thumbnails and workflow metadata.
+        
+        Thumbnail paths and workflow metadata are remembered per
+        (file_path, modified_at, file_size), so a file is only decoded again
+        after it changes on disk or its thumbnail is deleted. Outputs not
+        seen before are enriched with a single repository batch call.
+        
+        Args:
+            outputs: The outputs to enrich
+            
+        Returns:
+            Outputs in the same order, enriched where possible
+        """
+        enriched_outputs = list(outputs)
+        misses = []
+        
+        with self._cache_lock:
+            for index, output in enumerate(outputs):
+                if output.thumbnail_path and output.workflow_metadata:
+                    continue
+                
+                key = self._enrichment_key(output)
+                cached = self._enrichment_cache.get(key)
+                if cached is not None and not self._thumbnail_exists(cached[0]):
+                    # The thumbnail was removed since, so generate it again
+                    del self._enrichment_cache[key]
+                    cached = None
+                if cached is None:
+                    self._enrichment_misses += 1
+                    misses.append(index)
+                    continue
+                
+                self._enrichment_cache.move_to_end(key)
+                self._enrichment_hits += 1
+                enriched_outputs[index] = self._with_enrichment(output, *cached)
+        
+        if not misses:
+            return enriched_outputs
+        
+        # Decode outside the lock; a concurrent miss on the same file only
+        # repeats the work
+        try:
+            fetched = list(self._output_repository.enrich_batch([outputs[index] for index in misses]))
+            if len(fetched) != len(misses):
+                raise ValueError("enrich_batch returned a different number of outputs")
+        except Exception as e:
+            # Retry one output at a time so a single unreadable file only
+            # leaves that output unenriched
+            logger.warning(f"Failed to enrich outputs as a batch, enriching one at a time: {e}")
+            fetched = [self._enrich_single(outputs[index]) for index in misses]
+        
+        with self._cache_lock:
+            for index, enriched in zip(misses, fetched):
+                if enriched is None:
+                    continue
+                enriched_outputs[index] = enriched
+                key = self._enrichment_key(outputs[index])
+                # Keep a private copy so callers mutating the output cannot change the cache
+                self._enrichment_cache[key] = (
+                    enriched.thumbnail_path, copy.deepcopy(enriched.workflow_metadata or {})
+                )
+                self._enrichment_cache.move_to_end(key)
+            while len(self._enrichment_cache) > self.MAX_ENRICHMENT_CACHE_ENTRIES:
+                self._enrichment_cache.popitem(last=False)
+        
+        return enriched_outputs
+    
+    def _enrich_single(self, output: Output) -> Optional[Output]:
+        """Enrich one output, returning None if its enrichment fails."""
+        try:
+            enriched = list(self._output_repository.enrich_batch([output]))
+        except Exception as e:
+            logger.warning(f"Failed to enrich output {output.id}: {e}")
+            return None
+        return enriched[0] if len(enriched) == 1 else None
+    
+    @staticmethod
+    def _enrichment_key(output: Output) -> EnrichmentKey:
+        """Get the key identifying the on-disk version of an output file."""
+        return (output.file_path, output.modified_at.timestamp(), output.file_size)
+    
+    @staticmethod
+    def _thumbnail_exists(thumbnail_path: Optional[str]) -> bool:
+        """Check that a remembered thumbnail is still on disk (True if there is none)."""
+        return not thumbnail_path or os.path.exists(thumbnail_path)
+    
+    @staticmethod
+    def _with_enrichment(
+        output: Output,
+        thumbnail_path: Optional[str],
+        workflow_metadata: Dict[str, Any]
+    ) -> Output:
+        """Fill in an output's missing thumbnail and workflow metadata.
+        
+        Cached workflow metadata is copied, so the returned output never
+        shares it with the cache.
+        """
+        # Falling back to the output's own (empty) values keeps their identity,
+        # so the no-op case is detected without comparing metadata dicts
+        thumbnail_path = output.thumbnail_path or thumbnail_path or output.thumbnail_path
+        workflow_metadata = (
+            output.workflow_metadata
+            or (copy.deepcopy(workflow_metadata) if workflow_metadata else None)
+            or output.workflow_metadata
+        )
+        if thumbnail_path is output.thumbnail_path and workflow_metadata is output.workflow_metadata:
+            return output
+        return replace(output, thumbnail_path=thumbnail_path, workflow_metadata=workflow_metadata)
+    
+    def _load_enrichment_cache(self) -> None:
+        """Restore remembered enrichment from the cache port, if any.
+        
+        A blob written with another layout version is ignored, and entries
+        whose thumbnail no longer exists are dropped.
+        """
+        if self._cache_port is None:
+            return
+        
         try:
-            # Try to generate thumbnail if not already present
-            thumbnail_path = output.thumbnail_path
-            if not thumbnail_path:
-                thumbnail_path = self._output_repository.generate_thumbnail(output)
-            
-            # Try to extract workflow metadata if not already present
-            workflow_metadata = output.workflow_metadata or {}
-            if not workflow_metadata:
-                extracted_metadata = self._output_repository.extract_workflow_metadata(output)
-                if extracted_metadata:
-                    workflow_metadata = extracted_metadata
-            
-            # Create enriched output if any enrichment was successful
-            if thumbnail_path != output.thumbnail_path or workflow_metadata != output.workflow_metadata:
-                enriched_output = Output(
-                    id=output.id,
-                    filename=output.filename,
-                    file_path=output.file_path,
-                    file_size=output.file_size,
-                    created_at=output.created_at,
-                    modified_at=output.modified_at,
-                    image_width=output.image_width,
-                    image_height=output.image_height,
-                    file_format=output.file_format,
-                    thumbnail_path=thumbnail_path,
-                    workflow_metadata=workflow_metadata
+            stored = self._cache_port.get(self.ENRICHMENT_CACHE_KEY)
+            if not isinstance(stored, dict) or stored.get("version") != self.ENRICHMENT_CACHE_VERSION:
+                return
+            for file_path, modified_at, file_size, thumbnail_path, workflow_metadata in stored["entries"]:
+                if not self._thumbnail_exists(thumbnail_path):
+                    continue
+                self._enrichment_cache[(file_path, modified_at, file_size)] = (
+                    thumbnail_path, workflow_metadata or {}
                 )
-                return enriched_output
-            
-        except Exception:
-            # If enrichment fails, return original output
-            # This ensures graceful fallback
-            pass
+        except Exception as e:
+            logger.warning(f"Failed to load output enrichment cache: {e}")
+            self._enrichment_cache.clear()
+    
+    def save_enrichment_cache(self) -> None:
+        """Persist remembered enrichment through the cache port, if any.
         
-        return output
+        Called on shutdown so the next start does not decode every output again.
+        """
+        if self._cache_port is None:
+            return
+        
+        with self._cache_lock:
+            entries = [
+                [file_path, modified_at, file_size, thumbnail_path, workflow_metadata]
+                for (file_path, modified_at, file_size), (thumbnail_path, workflow_metadata)
+                in self._enrichment_cache.items()
+            ]
+        
+        try:
+            self._cache_port.set(
+                self.ENRICHMENT_CACHE_KEY,
+                {"version": self.ENRICHMENT_CACHE_VERSION, "entries": entries},
+                self.ENRICHMENT_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save output enrichment cache: {e}")
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get statistics about the thumbnail and workflow metadata cache.
+        
+        Returns:
+            Dictionary with the number of entries, the entry limit and the
+            hit and miss counts since startup
+        """
+        with self._cache_lock:
+            return {
+                "entries": len(self._enrichment_cache),
+                "max_entries": self.MAX_ENRICHMENT_CACHE_ENTRIES,
+                "hits": self._enrichment_hits,
+                "misses": self._enrichment_misses
+            }
     
     def load_workflow(self, output_id: str) -> bool:
         """Load the workflow from the specified output back into ComfyUI.
@@ -299,12 +587,7 @@ class OutputService(OutputManagementPort):
             ValidationError: If output_id is invalid
             NotFoundError: If output is not found
         """
-        if not output_id or not output_id.strip():
-            raise ValidationError("output_id cannot be empty", "output_id")
-        
-        output = self._output_repository.get_output_by_id(output_id.strip())
-        if output is None:
-            raise NotFoundError("Output", output_id)
+        output = self._resolve_output(output_id)
         
         try:
             return self._output_repository.load_workflow_to_comfyui(output)
@@ -325,12 +608,7 @@ class OutputService(OutputManagementPort):
             ValidationError: If output_id is invalid
             NotFoundError: If output is not found
         """
-        if not output_id or not output_id.strip():
-            raise ValidationError("output_id cannot be empty", "output_id")
-        
-        output = self._output_repository.get_output_by_id(output_id.strip())
-        if output is None:
-            raise NotFoundError("Output", output_id)
+        output = self._resolve_output(output_id)
         
         try:
             return self._output_repository.open_file_in_system(output)
@@ -338,6 +616,51 @@ class OutputService(OutputManagementPort):
             # If system operation fails, return False rather than raising
             return False
     
+    def open_in_system_viewer_bulk(self, output_ids: List[str]) -> Dict[str, bool]:
+        """Open several output files in the system's default image viewer.
+        
+        Args:
+            output_ids: List of output IDs to open
+            
+        Returns:
+            Dictionary mapping each requested output ID to whether it was
+            opened. IDs that do not match any output map to False.
+            
+        Raises:
+            ValidationError: If output_ids is invalid or names more than
+                MAX_BULK_OPEN distinct outputs
+        """
+        if not isinstance(output_ids, list) or not output_ids:
+            raise ValidationError("output_ids must be a non-empty list", "output_ids")
+        
+        cleaned_ids = []
+        for output_id in output_ids:
+            if not isinstance(output_id, str) or not output_id.strip():
+                raise ValidationError("each output_id must be a non-empty string", "output_ids")
+            cleaned_ids.append(output_id.strip())
+        
+        unique_ids = list(dict.fromkeys(cleaned_ids))
+        if len(unique_ids) > self.MAX_BULK_OPEN:
+            raise ValidationError(
+                f"at most {self.MAX_BULK_OPEN} outputs can be opened at once", "output_ids"
+            )
+        results = {output_id: False for output_id in unique_ids}
+        
+        outputs = self._output_repository.get_outputs_by_ids(unique_ids)
+        if not outputs:
+            return results
+        
+        try:
+            opened = self._output_repository.open_files_in_system(list(outputs.values()))
+        except Exception:
+            # If system operation fails, report every file as not opened
+            return results
+        
+        for output_id in outputs:
+            results[output_id] = bool(opened.get(output_id, False))
+        
+        return results
+    
     def show_in_folder(self, output_id: str) -> bool:
         """Open the containing folder of the output file in the system file explorer.
         
@@ -351,12 +674,7 @@ class OutputService(OutputManagementPort):
             ValidationError: If output_id is invalid
             NotFoundError: If output is not found
         """
-        if not output_id or not output_id.strip():
-            raise ValidationError("output_id cannot be empty", "output_id")
-        
-        output = self._output_repository.get_output_by_id(output_id.strip())
-        if output is None:
-            raise NotFoundError("Output", output_id)
+        output = self._resolve_output(output_id)
         
         try:
             return self._output_repository.show_file_in_folder(output)
@@ -364,6 +682,41 @@ class OutputService(OutputManagementPort):
             # If system operation fails, return False rather than raising
             return False
     
+    def _resolve_output(self, output_id: str) -> Output:
+        """Validate an output ID and fetch the output it identifies.
+        
+        Args:
+            output_id: The output ID to resolve
+            
+        Returns:
+            The output with the given ID
+            
+        Raises:
+            ValidationError: If output_id is invalid
+            NotFoundError: If output is not found
+        """
+        stripped_id = output_id.strip() if output_id else ""
+        if not stripped_id:
+            raise ValidationError(_EMPTY_OUTPUT_ID_MESSAGE, "output_id")
+        
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._resolved_outputs.get(stripped_id)
+            if cached is not None and now - cached[0] < self.RESOLVED_OUTPUT_TTL_SECONDS:
+                self._resolved_outputs.move_to_end(stripped_id)
+                return cached[1]
+        
+        output = self._output_repository.get_output_by_id(stripped_id)
+        if output is None:
+            raise NotFoundError("Output", output_id)
+        
+        with self._cache_lock:
+            self._resolved_outputs[stripped_id] = (now, output)
+            self._resolved_outputs.move_to_end(stripped_id)
+            while len(self._resolved_outputs) > self.MAX_RESOLVED_OUTPUT_ENTRIES:
+                self._resolved_outputs.popitem(last=False)
+        return output
+    
     def _get_from_cache(self, key: str) -> Optional[List[Output]]:
         """Get data from cache if it exists and is not expired.
         
@@ -406,6 +759,7 @@ class OutputService(OutputManagementPort):
         with self._cache_lock:
             self._cache.clear()
             self._cache_timestamps.clear()
+            self._resolved_outputs.clear()
     
     def _invalidate_cache_key(self, key: str) -> None:
         """Invalidate a specific cache key.
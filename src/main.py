@@ -4,8 +4,11 @@ This module provides the main entry point for the asset manager application
 and handles the wiring of all dependencies using the dependency injection container.
 """
 
+import asyncio
+import json
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 from aiohttp import web
 
 from .container import get_container, reset_container, DIContainer
@@ -14,6 +17,17 @@ from .config import ApplicationConfig
 
 logger = logging.getLogger(__name__)
 
+# Body of every unhandled-error response, serialized once
+_INTERNAL_ERROR_BODY = json.dumps({
+    "success": False,
+    "error": "An internal server error occurred",
+    "error_type": "internal_error"
+}).encode()
+
+# Health statuses served with HTTP 200; "ready" means some services are
+# still waiting to be built on first use
+SERVING_STATUSES = ("healthy", "ready")
+
 
 class AssetManagerApplication:
     """Main application class for the asset manager.
@@ -21,6 +35,11 @@ class AssetManagerApplication:
     This class encapsulates the entire application and provides methods
     for initialization, startup, and shutdown.
     """
+
+    # Health reports are reused for this long before being recomputed
+    HEALTH_TTL_SECONDS = 1.0
+    # A failed recomputation keeps serving the last report up to this age
+    HEALTH_STALE_IF_ERROR_SECONDS = 30.0
     
     def __init__(self, config: Optional[ApplicationConfig] = None):
         """Initialize the asset manager application.
@@ -31,6 +50,8 @@ class AssetManagerApplication:
         self._container = get_container(config)
         self._web_app: Optional[web.Application] = None
         self._initialized = False
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_refresh: Optional[asyncio.Task] = None
     
     @property
     def container(self) -> DIContainer:
@@ -42,8 +63,13 @@ class AssetManagerApplication:
         """Get the application configuration."""
         return self._container.config
     
-    def initialize(self) -> None:
-        """Initialize the application and all its components."""
+    def initialize(self, eager: bool = False) -> None:
+        """Initialize the application and all its components.
+        
+        Args:
+            eager: Build every service now so configuration errors fail
+                at startup instead of on first use
+        """
         if self._initialized:
             logger.warning("Application already initialized")
             return
@@ -51,23 +77,21 @@ class AssetManagerApplication:
         logger.info("Initializing asset manager application")
         
         try:
-            # Initialize core services to ensure they're properly configured
-            folder_service = self._container.get_folder_service()
-            model_service = self._container.get_model_service()
-            metadata_service = self._container.get_metadata_service()
-            output_service = self._container.get_output_service()
+            # Services are built by the container on first use, so startup
+            # only records which ones are registered
+            services = self._container.prepare_index()
+            logger.info("Registered services: %s", ", ".join(services))
             
-            logger.info("Core services initialized successfully")
-            
-            # Initialize web API adapter
-            web_api_adapter = self._container.get_web_api_adapter()
-            logger.info("Web API adapter initialized successfully")
+            if eager:
+                self._container.build_services()
+                logger.info("Services built eagerly")
             
             self._initialized = True
+            self._health_cache = None
             logger.info("Asset manager application initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize application: {e}")
+            logger.error("Failed to initialize application: %s", e)
             raise
     
     def register_routes(self, app: web.Application) -> None:
@@ -88,7 +112,7 @@ class AssetManagerApplication:
             logger.info("API routes registered successfully")
             
         except Exception as e:
-            logger.error(f"Failed to register routes: {e}")
+            logger.error("Failed to register routes: %s", e)
             raise
     
     def create_web_app(self) -> web.Application:
@@ -130,40 +154,42 @@ class AssetManagerApplication:
             # Re-raise HTTP exceptions (they're handled properly by aiohttp)
             raise
         except Exception as e:
-            logger.error(f"Unhandled error in request {request.method} {request.path}: {e}")
+            logger.error("Unhandled error in request %s %s: %s", request.method, request.path, e)
             
             # Return a generic error response
-            return web.json_response({
-                "success": False,
-                "error": "An internal server error occurred",
-                "error_type": "internal_error"
-            }, status=500)
+            return web.Response(
+                body=_INTERNAL_ERROR_BODY, status=500, content_type="application/json"
+            )
     
     async def _logging_middleware(self, request: web.Request, handler) -> web.Response:
         """Middleware for logging requests in debug mode."""
-        start_time = request.loop.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await handler(request)
+        
+        start_time = time.perf_counter()
         
         try:
             response = await handler(request)
-            process_time = request.loop.time() - start_time
             
             logger.debug(
-                f"{request.method} {request.path} -> {response.status} "
-                f"({process_time:.3f}s)"
+                "%s %s -> %s (%.3fs)",
+                request.method, request.path, response.status, time.perf_counter() - start_time
             )
             
             return response
         
         except Exception as e:
-            process_time = request.loop.time() - start_time
             logger.debug(
-                f"{request.method} {request.path} -> ERROR: {e} "
-                f"({process_time:.3f}s)"
+                "%s %s -> ERROR: %s (%.3fs)",
+                request.method, request.path, e, time.perf_counter() - start_time
             )
             raise
     
     def get_health_status(self) -> dict:
         """Get application health status.
+
+        The report is cached for ``HEALTH_TTL_SECONDS`` so frequent probes
+        do not walk the container on every call.
         
         Returns:
             Dictionary with health status information
@@ -174,49 +200,115 @@ class AssetManagerApplication:
                 "initialized": False,
                 "services": {}
             }
-        
+
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < self.HEALTH_TTL_SECONDS:
+            return cached[1]
+        return self._refresh_health_status()
+
+    async def get_health_status_async(self) -> dict:
+        """Get application health status without waiting for a refresh.
+
+        A stale cached report is returned immediately while a background
+        task recomputes it (stale-while-revalidate).
+
+        Returns:
+            Dictionary with health status information
+        """
+        cached = self._health_cache
+        if not self._initialized or cached is None:
+            return self.get_health_status()
+
+        if time.monotonic() - cached[0] >= self.HEALTH_TTL_SECONDS:
+            refresh = self._health_refresh
+            if refresh is None or refresh.done():
+                self._health_refresh = asyncio.get_running_loop().create_task(
+                    self._refresh_health()
+                )
+        return cached[1]
+
+    async def _refresh_health(self) -> None:
+        """Recompute the cached health report off the event loop."""
+        await asyncio.to_thread(self._refresh_health_status)
+
+    def _refresh_health_status(self) -> dict:
+        """Recompute the health report and cache it.
+
+        If the computation fails while the cached report is younger than
+        ``HEALTH_STALE_IF_ERROR_SECONDS``, the cached report is returned.
+
+        Returns:
+            Dictionary with health status information
+        """
         try:
-            # Check core services
-            folder_service = self._container.get_folder_service()
-            model_service = self._container.get_model_service()
-            metadata_service = self._container.get_metadata_service()
-            output_service = self._container.get_output_service()
-            
-            # Get cache statistics if caching is enabled
-            cache_stats = {}
-            cache_adapter = self._container.get_cache_adapter()
-            if cache_adapter:
-                cache_stats = cache_adapter.get_cache_stats()
-            
-            return {
-                "status": "healthy",
-                "initialized": True,
-                "services": {
-                    "folder_service": "available",
-                    "model_service": "available",
-                    "metadata_service": "available",
-                    "output_service": "available",
-                    "civitai_enabled": self.config.external_apis.civitai_enabled,
-                    "huggingface_enabled": self.config.external_apis.huggingface_enabled,
-                    "cache_enabled": self.config.cache.enabled
-                },
-                "cache_stats": cache_stats
-            }
-            
+            status = self._compute_health_status()
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {
+            logger.error("Health check failed: %s", e)
+            cached = self._health_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.HEALTH_STALE_IF_ERROR_SECONDS
+            ):
+                return cached[1]
+            status = {
                 "status": "unhealthy",
                 "initialized": True,
                 "error": str(e),
                 "services": {}
             }
+
+        self._health_cache = (time.monotonic(), status)
+        return status
+
+    def _compute_health_status(self) -> dict:
+        """Build a fresh health report for an initialized application.
+
+        Returns:
+            Dictionary with health status information
+        """
+        # Report services without constructing the ones not used yet
+        external_enabled = (
+            self.config.external_apis.civitai_enabled
+            or self.config.external_apis.huggingface_enabled
+        )
+        services = {
+            name: "available" if constructed else "not_loaded"
+            for name, constructed in self._container.prepare_index().items()
+        }
+        if not external_enabled:
+            services["external_model_service"] = "disabled"
+        
+        # Get cache statistics if caching is enabled
+        cache_stats = {}
+        cache_adapter = self._container.get_cache_adapter()
+        if cache_adapter:
+            cache_stats = cache_adapter.get_cache_stats()
+        if services["output_service"] == "available":
+            cache_stats["outputs"] = self._container.get_output_service().get_cache_stats()
+        
+        return {
+            "status": "ready" if "not_loaded" in services.values() else "healthy",
+            "initialized": True,
+            "services": {
+                **services,
+                "civitai_enabled": self.config.external_apis.civitai_enabled,
+                "huggingface_enabled": self.config.external_apis.huggingface_enabled,
+                "cache_enabled": self.config.cache.enabled
+            },
+            "cache_stats": cache_stats
+        }
     
     def shutdown(self) -> None:
         """Shutdown the application and cleanup resources."""
         logger.info("Shutting down asset manager application")
         
         try:
+            # Stop any health refresh still running in the background
+            refresh = self._health_refresh
+            if refresh is not None and not refresh.done():
+                refresh.cancel()
+            self._health_refresh = None
+            
             # Cleanup the container
             self._container.cleanup()
             
@@ -224,10 +316,16 @@ class AssetManagerApplication:
             reset_container()
             
             self._initialized = False
+            self._health_cache = None
             logger.info("Asset manager application shutdown completed")
             
         except Exception as e:
-            logger.error(f"Error during application shutdown: {e}")
+            logger.error("Error during application shutdown: %s", e)
+    
+    async def ashutdown(self) -> None:
+        """Close HTTP connections, then shutdown the application."""
+        await self._container.aclose()
+        self.shutdown()
 
 
 # Global application instance
@@ -277,16 +375,22 @@ def register_with_comfyui(comfyui_app: web.Application) -> None:
         
         # Add a health check endpoint
         async def health_check(request: web.Request) -> web.Response:
-            health_status = app.get_health_status()
-            status_code = 200 if health_status["status"] == "healthy" else 503
+            health_status = await app.get_health_status_async()
+            status_code = 200 if health_status["status"] in SERVING_STATUSES else 503
             return web.json_response(health_status, status=status_code)
         
         comfyui_app.router.add_get('/asset_manager/health', health_check)
         
+        # Close pooled HTTP connections when ComfyUI's server stops
+        async def close_connections(_app: web.Application) -> None:
+            await app.container.aclose()
+        
+        comfyui_app.on_cleanup.append(close_connections)
+        
         logger.info("Asset manager registered with ComfyUI successfully")
         
     except Exception as e:
-        logger.error(f"Failed to register asset manager with ComfyUI: {e}")
+        logger.error("Failed to register asset manager with ComfyUI: %s", e)
         raise
 
 
@@ -297,12 +401,14 @@ if __name__ == "__main__":
     
     async def main():
         app_instance = get_application()
+        # Fail fast on configuration errors when running standalone
+        app_instance.initialize(eager=True)
         web_app = app_instance.create_web_app()
         
         # Add health check endpoint
         async def health_check(request: web.Request) -> web.Response:
-            health_status = app_instance.get_health_status()
-            status_code = 200 if health_status["status"] == "healthy" else 503
+            health_status = await app_instance.get_health_status_async()
+            status_code = 200 if health_status["status"] in SERVING_STATUSES else 503
             return web.json_response(health_status, status=status_code)
         
         web_app.router.add_get('/health', health_check)
@@ -325,6 +431,6 @@ if __name__ == "__main__":
             logger.info("Shutting down...")
         finally:
             await runner.cleanup()
-            app_instance.shutdown()
+            await app_instance.ashutdown()
     
     asyncio.run(main())
\ No newline at end of file
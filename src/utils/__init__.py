@@ -1,7 +1,7 @@
 from . import logger
 
-__all__ = [
+__all__ = (
     "logger",
-]
+)
 
 
@@ -12,9 +12,13 @@ def _format_message(*args: Any, sep: str = " ") -> str:
 
 
 def log(*args: Any, sep: str = " ", end: str = "\n", file=None) -> None:  # noqa: A002 - allow 'file' like print
-    message = _format_message(*args, sep=sep)
+    # Look the stream up per call: ComfyUI and test harnesses swap sys.stdout
     stream = file if file is not None else sys.stdout
-    print(f"{PREFIX} {message}", end=end, file=stream)
+    if stream is None:
+        # Like print, stay silent when there is no console (e.g. pythonw)
+        return
+    # A single write takes the stream lock once; print writes message and end separately
+    stream.write(f"{PREFIX} {_format_message(*args, sep=sep)}{end}")
 
 
 def info(*args: Any, sep: str = " ", end: str = "\n") -> None:
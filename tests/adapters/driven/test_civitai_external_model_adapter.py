@@ -2,12 +2,20 @@
 
 import pytest
 from unittest.mock import AsyncMock, patch
-from datetime import datetime
+from datetime import datetime, timezone
 from aiohttp import ClientError
 
-from src.adapters.driven.civitai_external_model_adapter import CivitAIExternalModelAdapter
+from src.adapters.driven.civitai_external_model_adapter import (
+    CivitAIExternalModelAdapter,
+    _compatibility_notes
+)
 from src.domain.entities.external_model import ExternalPlatform, ComfyUIModelType
-from src.domain.ports.driven.external_model_port import ExternalAPIError, RateLimitError, PlatformUnavailableError
+from src.domain.ports.driven.external_model_port import (
+    CachedResponse,
+    ExternalAPIError,
+    RateLimitError,
+    PlatformUnavailableError
+)
 
 
 class TestCivitAIExternalModelAdapter:
@@ -128,6 +136,39 @@ class TestCivitAIExternalModelAdapter:
             
             assert model is None
     
+    @pytest.mark.asyncio
+    async def test_get_model_details_conditional_parses_fresh_payload(self, adapter, sample_civitai_response):
+        """Test that a fresh response is parsed and keeps its validators."""
+        model_data = sample_civitai_response["items"][0]
+        
+        with patch.object(adapter, '_make_conditional_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = CachedResponse(value=model_data, etag='"abc"')
+            
+            response = await adapter.get_model_details_conditional(ExternalPlatform.CIVITAI, "12345")
+            
+            assert response.value.id == "civitai:12345"
+            assert response.etag == '"abc"'
+            assert not response.not_modified
+            mock_request.assert_called_once_with(
+                "https://civitai.com/api/v1/models/12345", validators=None
+            )
+    
+    @pytest.mark.asyncio
+    async def test_get_model_details_conditional_not_modified(self, adapter):
+        """Test that a 304 response is passed through without parsing."""
+        with patch.object(adapter, '_make_conditional_request', new_callable=AsyncMock) as mock_request, \
+                patch.object(adapter, '_parse_civitai_model') as mock_parse:
+            mock_request.return_value = CachedResponse(value=None, etag='"abc"', not_modified=True)
+            
+            response = await adapter.get_model_details_conditional(
+                ExternalPlatform.CIVITAI, "12345", etag='"abc"'
+            )
+            
+            assert response.not_modified
+            mock_parse.assert_not_called()
+            validators = mock_request.call_args.kwargs["validators"]
+            assert validators.conditional_headers() == {"If-None-Match": '"abc"'}
+    
     @pytest.mark.asyncio
     async def test_get_model_details_wrong_platform(self, adapter):
         """Test model details with wrong platform returns None."""
@@ -178,7 +219,7 @@ class TestCivitAIExternalModelAdapter:
     async def test_check_model_availability_true(self, adapter):
         """Test model availability check returns True."""
         with patch.object(adapter, 'get_model_details', new_callable=AsyncMock) as mock_details:
-            mock_details.return_value = AsyncMock()  # Non-None model
+            mock_details.return_value = object()  # Non-None model
             
             available = await adapter.check_model_availability(ExternalPlatform.CIVITAI, "12345")
             
@@ -242,6 +283,40 @@ class TestCivitAIExternalModelAdapter:
         assert adapter.FOLDER_MAPPING[ComfyUIModelType.LORA] == "loras"
         assert adapter.FOLDER_MAPPING[ComfyUIModelType.VAE] == "vae"
     
+    def test_parse_civitai_model_dates(self, adapter, sample_civitai_response):
+        """Test that UTC timestamps are parsed and a bad updatedAt falls back to createdAt."""
+        item = dict(sample_civitai_response["items"][0], updatedAt="not a date")
+        
+        model = adapter._parse_civitai_model(item)
+        
+        assert model.created_at == datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert model.updated_at == model.created_at
+    
+    def test_mappings_are_read_only(self, adapter):
+        """Test that the shared type and folder mappings cannot be mutated."""
+        with pytest.raises(TypeError):
+            adapter.MODEL_TYPE_MAPPING["Custom"] = ComfyUIModelType.LORA
+        with pytest.raises(TypeError):
+            adapter.FOLDER_MAPPING[ComfyUIModelType.LORA] = "other"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filters,expected_types", [
+        ({"model_type": "lora"}, ["LORA", "LoCon"]),
+        ({"comfyui_compatible": True}, [
+            "Checkpoint", "LORA", "LoCon", "TextualInversion", "Hypernetwork",
+            "AestheticGradient", "VAE", "ControlNet", "Upscaler"
+        ]),
+    ])
+    async def test_search_models_maps_type_filters(self, adapter, filters, expected_types):
+        """Test that ComfyUI type filters become CivitAI type parameters."""
+        with patch.object(adapter, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"items": []}
+            
+            await adapter.search_models(ExternalPlatform.CIVITAI, filters=filters)
+        
+        params = mock_request.call_args.args[1]
+        assert params["types"] == expected_types
+    
     def test_is_comfyui_compatible(self, adapter):
         """Test ComfyUI compatibility detection."""
         # Unknown type should not be compatible
@@ -255,6 +330,10 @@ class TestCivitAIExternalModelAdapter:
         
         # Default should be compatible
         assert adapter._is_comfyui_compatible(ComfyUIModelType.CHECKPOINT, None, "SD 1.5") is True
+        
+        # Legacy formats are only accepted for some model types
+        assert adapter._is_comfyui_compatible(ComfyUIModelType.CONTROLNET, "pt", "SD 1.5") is False
+        assert adapter._is_comfyui_compatible(ComfyUIModelType.UPSCALER, "onnx", "SD 1.5") is True
     
     def test_get_compatibility_notes(self, adapter):
         """Test compatibility notes generation."""
@@ -275,4 +354,21 @@ class TestCivitAIExternalModelAdapter:
         assert adapter._get_required_nodes(ComfyUIModelType.CHECKPOINT) == ["CheckpointLoaderSimple"]
         assert adapter._get_required_nodes(ComfyUIModelType.LORA) == ["LoraLoader"]
         assert adapter._get_required_nodes(ComfyUIModelType.VAE) == ["VAELoader"]
-        assert adapter._get_required_nodes(ComfyUIModelType.UNKNOWN) == []
\ No newline at end of file
+        assert adapter._get_required_nodes(ComfyUIModelType.UNKNOWN) == []
+    
+    def test_required_nodes_are_independent_copies(self, adapter):
+        """Test that callers cannot change the shared node mapping."""
+        nodes = adapter._get_required_nodes(ComfyUIModelType.LORA)
+        nodes.append("Extra")
+        
+        assert adapter._get_required_nodes(ComfyUIModelType.LORA) == ["LoraLoader"]
+    
+    def test_compatibility_notes_are_memoized(self, adapter):
+        """Test that repeated notes lookups are served from the cache."""
+        hits = _compatibility_notes.cache_info().hits
+        
+        first = adapter._get_compatibility_notes(ComfyUIModelType.LORA, "ckpt", "SDXL 1.0")
+        second = adapter._get_compatibility_notes(ComfyUIModelType.LORA, "ckpt", "SDXL 1.0")
+        
+        assert first == second
+        assert _compatibility_notes.cache_info().hits > hits
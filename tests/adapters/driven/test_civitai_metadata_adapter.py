@@ -97,6 +97,26 @@ class TestCivitAIMetadataAdapter:
         assert result.version_name == ""
         assert result.base_model == ""
     
+    @pytest.mark.unit
+    def test_parse_civitai_response_skips_blank_tags_and_images(self, adapter):
+        """Test that blank tag names and image URLs are dropped."""
+        response = {
+            "id": 123,
+            "name": "Model",
+            "description": "Description",
+            "tags": [{"name": "anime"}, {"name": ""}, {}],
+            "images": [{"url": ""}, {"url": "https://example.com/a.jpg"}],
+            "modelVersions": [],
+        }
+        
+        result = adapter._parse_civitai_response(response)
+        
+        assert result.tags == ["anime"]
+        assert result.images == ["https://example.com/a.jpg"]
+        assert result.version_name == ""
+        # Slotted value objects carry no per-instance __dict__
+        assert not hasattr(result, "__dict__")
+    
     @pytest.mark.unit
     def test_parse_civitai_response_invalid_data(self, adapter):
         """Test parsing with invalid data."""
@@ -153,6 +173,38 @@ class TestCivitAIMetadataAdapter:
         
         assert result is None
     
+    @pytest.mark.unit
+    async def test_make_request_drains_error_body(self, adapter):
+        """Test that a 404 body is read so the connection can be reused."""
+        response = MagicMock(status=404, headers={})
+        response.read = AsyncMock(return_value=b'{"error": "Not found"}')
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.get.return_value = request
+        adapter._session = session
+        
+        result = await adapter._make_request("http://test.com")
+        
+        assert result is None
+        response.read.assert_awaited_once()
+    
+    @pytest.mark.unit
+    async def test_make_request_timeout_returns_rate_limit_token(self, adapter):
+        """Test that a timed-out request does not use up rate limit quota."""
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(side_effect=asyncio.TimeoutError())
+        request.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.get.return_value = request
+        adapter._session = session
+        
+        result = await adapter._make_request("http://test.com")
+        
+        assert result is None
+        assert adapter._rate_limiter._tokens == 1.0
+    
     @pytest.mark.unit
     async def test_fetch_civitai_metadata_success(self, adapter, sample_version_response, sample_civitai_response):
         """Test successful metadata fetching."""
@@ -177,6 +229,68 @@ class TestCivitAIMetadataAdapter:
         actual_calls = [call[0] for call in mock_request.call_args_list]
         assert actual_calls == expected_calls
     
+    @pytest.mark.unit
+    async def test_fetch_civitai_metadata_cached(self, adapter, sample_version_response, sample_civitai_response):
+        """Test that a found hash is served from memory on the next lookup."""
+        with patch.object(adapter, '_make_request') as mock_request:
+            mock_request.side_effect = [sample_version_response, sample_civitai_response]
+            
+            first = await adapter.fetch_civitai_metadata("abc123def456")
+            second = await adapter.fetch_civitai_metadata("ABC123DEF456")
+        
+        assert second is first
+        assert mock_request.call_count == 2
+    
+    @pytest.mark.unit
+    async def test_fetch_civitai_metadata_shares_concurrent_lookups(
+        self, adapter, sample_version_response, sample_civitai_response
+    ):
+        """Test that simultaneous lookups of one hash issue a single lookup."""
+        async def slow_request(url):
+            await asyncio.sleep(0.01)
+            return sample_version_response if "by-hash" in url else sample_civitai_response
+        
+        with patch.object(adapter, '_make_request', side_effect=slow_request) as mock_request:
+            results = await asyncio.gather(
+                *(adapter.fetch_civitai_metadata("abc123def456") for _ in range(10))
+            )
+        
+        assert all(result is results[0] for result in results)
+        assert mock_request.call_count == 2
+    
+    @pytest.mark.unit
+    async def test_fetch_civitai_metadata_many_runs_lookups_concurrently(
+        self, adapter, sample_version_response, sample_civitai_response
+    ):
+        """Test that a batch of hashes takes a few round trips, not one per hash."""
+        async def slow_request(url):
+            await asyncio.sleep(0.05)
+            return sample_version_response if "by-hash" in url else sample_civitai_response
+        
+        hashes = [f"{i:040d}" for i in range(20)]
+        loop = asyncio.get_running_loop()
+        
+        with patch.object(adapter, '_make_request', side_effect=slow_request):
+            start = loop.time()
+            results = await adapter.fetch_civitai_metadata_many(hashes, concurrency=10)
+            elapsed = loop.time() - start
+        
+        assert len(results) == 20
+        assert all(isinstance(result, CivitAIMetadata) for result in results)
+        # Two rounds of two requests each, far below 20 serial lookups
+        assert elapsed < 20 * 2 * 0.05 / 4
+    
+    @pytest.mark.unit
+    async def test_fetch_metadata_bulk_skips_missing_hashes(self, adapter, sample_civitai_response):
+        """Test that bulk fetching maps only hashes with metadata."""
+        found = adapter._parse_civitai_response(sample_civitai_response)
+        
+        with patch.object(adapter, 'fetch_civitai_metadata', side_effect=[found, None]):
+            result = await adapter.fetch_metadata_bulk(["abc", "def"])
+        
+        assert list(result) == ["abc"]
+        assert result["abc"].civitai is found
+    
     @pytest.mark.unit
     async def test_fetch_civitai_metadata_not_found(self, adapter):
         """Test metadata fetching when model not found."""
@@ -231,10 +345,27 @@ class TestCivitAIMetadataAdapter:
         """Test async context manager functionality."""
         async with adapter as ctx_adapter:
             assert ctx_adapter is adapter
+            session = await adapter._get_session()
+            
+            # Requests inside the context share one pooled session
+            assert await adapter._get_session() is session
+            assert adapter._session is session
         
         # Session should be closed after context exit
-        # We can't easily test this without mocking, but the method should exist
-        assert hasattr(adapter, 'close')
+        assert session.closed
+    
+    @pytest.mark.unit
+    async def test_session_connector_uses_configured_limits(self):
+        """Test that connection limits passed to the adapter reach the connector."""
+        adapter = CivitAIMetadataAdapter(timeout=10, connector_limit=4, limit_per_host=2)
+        
+        async with adapter:
+            session = await adapter._get_session()
+            
+            assert session.connector.limit == 4
+            assert session.connector.limit_per_host == 2
+            assert session.timeout.connect == adapter.CONNECT_TIMEOUT
+            assert session.timeout.total == 10
     
     @pytest.mark.unit
     async def test_close_session(self, adapter):
@@ -32,43 +32,35 @@ class TestComfyUIFolderAdapter:
     def temp_model_folders(self):
         """Create temporary folders with model files for testing."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create checkpoint folder with model files
-            checkpoint_dir = temp_path / "checkpoints"
-            checkpoint_dir.mkdir()
-            (checkpoint_dir / "model1.safetensors").touch()
-            (checkpoint_dir / "model2.ckpt").touch()
-            (checkpoint_dir / "readme.txt").touch()  # Non-model file
-            
-            # Create lora folder with model files
-            lora_dir = temp_path / "loras"
-            lora_dir.mkdir()
-            (lora_dir / "lora1.safetensors").touch()
+            # Checkpoints include a non-model file; the vae folder stays empty
+            files_by_folder = {
+                "checkpoints": ("model1.safetensors", "model2.ckpt", "readme.txt"),
+                "loras": ("lora1.safetensors",),
+                "vae": (),
+            }
             
-            # Create empty vae folder
-            vae_dir = temp_path / "vae"
-            vae_dir.mkdir()
+            folders = {}
+            for folder_name, file_names in files_by_folder.items():
+                folder = os.path.join(temp_dir, folder_name)
+                os.mkdir(folder)
+                for file_name in file_names:
+                    open(os.path.join(folder, file_name), "wb").close()
+                folders[folder_name] = folder
             
-            yield {
-                "checkpoints": str(checkpoint_dir),
-                "loras": str(lora_dir),
-                "vae": str(vae_dir)
-            }
+            yield folders
     
     def test_initialization_with_folder_paths_available(self):
         """Test adapter initialization when folder_paths is available."""
-        with patch('builtins.__import__') as mock_import:
-            mock_folder_paths = Mock()
-            mock_import.return_value = mock_folder_paths
-            
+        mock_folder_paths = Mock()
+        with patch.dict('sys.modules', {'folder_paths': mock_folder_paths}):
             adapter = ComfyUIFolderAdapter()
-            assert adapter._folder_paths == mock_folder_paths
+            assert adapter._folder_paths is mock_folder_paths
             assert adapter._folders_cache == {}
     
     def test_initialization_without_folder_paths(self):
         """Test adapter initialization when folder_paths is not available."""
-        with patch('builtins.__import__', side_effect=ImportError):
+        # A None entry in sys.modules makes the import raise ImportError
+        with patch.dict('sys.modules', {'folder_paths': None}):
             adapter = ComfyUIFolderAdapter()
             assert adapter._folder_paths is None
             assert adapter._folders_cache == {}
@@ -200,6 +192,28 @@ class TestComfyUIFolderAdapter:
             assert folders[0].name == "Test Folder"
             assert adapter_with_mock._folders_cache == mock_folders
     
+    def test_get_change_token_tracks_folder_mtimes(self, adapter_with_mock, mock_folder_paths, temp_model_folders):
+        """Test that the change token changes when a model folder changes."""
+        mock_folder_paths.get_folder_paths.side_effect = lambda name: (
+            [temp_model_folders[name]] if name in temp_model_folders else []
+        )
+        
+        first = adapter_with_mock.get_change_token()
+        assert first == adapter_with_mock.get_change_token()
+        
+        lora_dir = temp_model_folders["loras"]
+        stat = os.stat(lora_dir)
+        os.utime(lora_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert adapter_with_mock.get_change_token() != first
+    
+    def test_get_change_token_without_folder_paths(self):
+        """Test that no change token is available without ComfyUI."""
+        adapter = ComfyUIFolderAdapter()
+        adapter._folder_paths = None
+        
+        assert adapter.get_change_token() is None
+    
     def test_get_folder_structure(self, adapter_with_mock):
         """Test get_folder_structure method."""
         mock_folders = {
@@ -1,37 +1,34 @@
 """Tests for ComfyUIOutputAdapter."""
 
+import io
 import pytest
 import tempfile
-import shutil
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from unittest.mock import patch, MagicMock
 import sys
 
 from src.adapters.driven.comfyui_output_adapter import ComfyUIOutputAdapter
 
 
+@lru_cache(maxsize=16)
+def _png_bytes(color: str, workflow_json: Optional[str] = None) -> bytes:
+    """Encode a 512x512 PNG once per color and embedded workflow."""
+    from PIL import Image, PngImagePlugin
+    
+    pnginfo = PngImagePlugin.PngInfo()
+    if workflow_json is not None:
+        pnginfo.add_text("workflow", workflow_json)
+    
+    buffer = io.BytesIO()
+    Image.new('RGB', (512, 512), color=color).save(buffer, 'PNG', pnginfo=pnginfo)
+    return buffer.getvalue()
+
+
 class TestComfyUIOutputAdapter:
     """Test cases for ComfyUIOutputAdapter."""
     
-    @pytest.fixture
-    def temp_comfyui_dir(self):
-        """Create a temporary ComfyUI directory structure for testing."""
-        temp_dir = tempfile.mkdtemp()
-        comfyui_dir = Path(temp_dir) / "ComfyUI"
-        comfyui_dir.mkdir()
-        
-        # Create ComfyUI indicator files
-        (comfyui_dir / "main.py").write_text("# ComfyUI main file")
-        (comfyui_dir / "nodes.py").write_text("# ComfyUI nodes")
-        (comfyui_dir / "execution.py").write_text("# ComfyUI execution")
-        (comfyui_dir / "folder_paths.py").write_text("# ComfyUI folder paths")
-        (comfyui_dir / "custom_nodes").mkdir()
-        (comfyui_dir / "models").mkdir()
-        (comfyui_dir / "output").mkdir()
-        
-        yield str(comfyui_dir)
-        shutil.rmtree(temp_dir)
-    
     def test_discover_comfyui_path_with_provided_path(self, temp_comfyui_dir):
         """Test ComfyUI path discovery with explicitly provided path."""
         adapter = ComfyUIOutputAdapter(temp_comfyui_dir)
@@ -116,23 +113,18 @@ class TestComfyUIOutputAdapter:
     def test_extract_workflow_metadata_enhanced(self, temp_comfyui_dir):
         """Test that ComfyUI adapter enhances metadata extraction."""
         # Create a test PNG with metadata
-        from PIL import Image, PngImagePlugin
         import json
         
         output_dir = Path(temp_comfyui_dir) / "output"
         image_path = output_dir / "test_enhanced.png"
         
-        img = Image.new('RGB', (512, 512), color='green')
-        pnginfo = PngImagePlugin.PngInfo()
-        
         workflow_data = {
             "1": {
                 "class_type": "CheckpointLoaderSimple",
                 "inputs": {"ckpt_name": "enhanced_model.safetensors"}
             }
         }
-        pnginfo.add_text("workflow", json.dumps(workflow_data))
-        img.save(image_path, 'PNG', pnginfo=pnginfo)
+        image_path.write_bytes(_png_bytes('green', json.dumps(workflow_data)))
         
         adapter = ComfyUIOutputAdapter(temp_comfyui_dir)
         outputs = adapter.scan_output_directory()
@@ -253,23 +245,18 @@ class TestComfyUIOutputAdapter:
     
     def test_get_workflow_for_loading_valid(self, temp_comfyui_dir):
         """Test getting workflow data for loading into ComfyUI."""
-        from PIL import Image, PngImagePlugin
         import json
         
         output_dir = Path(temp_comfyui_dir) / "output"
         image_path = output_dir / "test_workflow.png"
         
-        img = Image.new('RGB', (512, 512), color='blue')
-        pnginfo = PngImagePlugin.PngInfo()
-        
         workflow_data = {
             "1": {
                 "class_type": "CheckpointLoaderSimple",
                 "inputs": {"ckpt_name": "model.safetensors"}
             }
         }
-        pnginfo.add_text("workflow", json.dumps(workflow_data))
-        img.save(image_path, 'PNG', pnginfo=pnginfo)
+        image_path.write_bytes(_png_bytes('blue', json.dumps(workflow_data)))
         
         adapter = ComfyUIOutputAdapter(temp_comfyui_dir)
         outputs = adapter.scan_output_directory()
@@ -284,13 +271,9 @@ class TestComfyUIOutputAdapter:
     
     def test_get_workflow_for_loading_no_metadata(self, temp_comfyui_dir):
         """Test getting workflow data when no metadata exists."""
-        from PIL import Image
-        
         output_dir = Path(temp_comfyui_dir) / "output"
         image_path = output_dir / "test_no_workflow.png"
-        
-        img = Image.new('RGB', (512, 512), color='red')
-        img.save(image_path, 'PNG')
+        image_path.write_bytes(_png_bytes('red'))
         
         adapter = ComfyUIOutputAdapter(temp_comfyui_dir)
         outputs = adapter.scan_output_directory()
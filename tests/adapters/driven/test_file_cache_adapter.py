@@ -86,6 +86,30 @@ class TestFileCacheAdapter:
         result = cache_adapter.delete("nonexistent_key")
         assert result is False
     
+    def test_delete_prefix(self, cache_adapter):
+        """Test deleting only the entries under a key prefix."""
+        cache_adapter.set("metadata:abc", "value1")
+        cache_adapter.set("metadata:def", "value2")
+        cache_adapter.set("external_models:abc", "value3")
+        
+        result = cache_adapter.delete_prefix("metadata:")
+        
+        assert result == 2
+        assert cache_adapter.exists("metadata:abc") is False
+        assert cache_adapter.exists("metadata:def") is False
+        assert cache_adapter.exists("external_models:abc") is True
+    
+    def test_delete_prefix_keeps_keys_that_collide_after_sanitizing(self, cache_adapter):
+        """Test that a key only matching the sanitized prefix is not deleted."""
+        cache_adapter.set("metadata:abc", "value1")
+        cache_adapter.set("metadata_other:abc", "value2")
+        
+        result = cache_adapter.delete_prefix("metadata:")
+        
+        assert result == 1
+        assert cache_adapter.exists("metadata:abc") is False
+        assert cache_adapter.get("metadata_other:abc") == "value2"
+    
     def test_clear_cache(self, cache_adapter):
         """Test clearing all cache entries."""
         # Set multiple values
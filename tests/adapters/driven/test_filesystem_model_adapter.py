@@ -1,6 +1,7 @@
 """Tests for FileSystemModelAdapter."""
 
 import hashlib
+from dataclasses import replace
 import os
 import tempfile
 from datetime import datetime, timedelta
@@ -283,6 +284,46 @@ class TestFileSystemModelAdapter:
             assert model.folder_id == "checkpoint_folder"
             assert model.model_type == ModelType.CHECKPOINT
     
+    def test_iter_in_folder_scans_single_folder(self, adapter, temp_model_files, mock_folder_repository):
+        """Test lazily iterating a folder without rebuilding the whole cache."""
+        checkpoint_folder = Folder(
+            id="checkpoint_folder",
+            name="Checkpoints",
+            path=temp_model_files["checkpoint_dir"],
+            model_type=ModelType.CHECKPOINT,
+            model_count=0
+        )
+        
+        mock_folder_repository.find_by_id.return_value = checkpoint_folder
+        
+        models = list(adapter.iter_in_folder("checkpoint_folder"))
+        
+        assert len(models) == 3
+        assert all(model.folder_id == "checkpoint_folder" for model in models)
+        mock_folder_repository.get_all_folders.assert_not_called()
+        assert adapter._cache_timestamp is None
+    
+    def test_iter_in_folder_caches_completed_scan(self, adapter, temp_model_files, mock_folder_repository):
+        """Test that a completed single-folder scan is served from the cache next time."""
+        checkpoint_folder = Folder(
+            id="checkpoint_folder",
+            name="Checkpoints",
+            path=temp_model_files["checkpoint_dir"],
+            model_type=ModelType.CHECKPOINT,
+            model_count=0
+        )
+        
+        mock_folder_repository.find_by_id.return_value = checkpoint_folder
+        
+        first = list(adapter.iter_in_folder("checkpoint_folder"))
+        
+        with patch.object(adapter, "_extract_model_metadata") as extract:
+            second = list(adapter.iter_in_folder("checkpoint_folder"))
+        
+        extract.assert_not_called()
+        assert sorted(model.id for model in second) == sorted(model.id for model in first)
+        assert adapter._cache_timestamp is None
+    
     def test_find_by_id(self, adapter, temp_model_files, mock_folder_repository):
         """Test finding model by ID."""
         # Set up test data
@@ -354,6 +395,24 @@ class TestFileSystemModelAdapter:
         
         assert len(results) == 3  # All models contain "model"
     
+    def test_search_page(self, adapter, temp_model_files, mock_folder_repository):
+        """Test that a search page is a slice of the full search results."""
+        checkpoint_folder = Folder(
+            id="checkpoint_folder",
+            name="Checkpoints",
+            path=temp_model_files["checkpoint_dir"],
+            model_type=ModelType.CHECKPOINT,
+            model_count=0
+        )
+        
+        mock_folder_repository.get_all_folders.return_value = [checkpoint_folder]
+        
+        all_results = adapter.search("model")
+        
+        assert adapter.search_page("model", limit=2) == all_results[:2]
+        assert adapter.search_page("model", limit=2, offset=2) == all_results[2:]
+        assert adapter.search_page("model", offset=1) == all_results[1:]
+    
     def test_search_with_folder_filter(self, adapter, temp_model_files, mock_folder_repository):
         """Test search with folder filter."""
         # Set up test data
@@ -409,7 +468,7 @@ class TestFileSystemModelAdapter:
         test_model.set_user_description("A great model for portraits")
         
         # Update cache
-        adapter._models_cache[test_model.id] = test_model
+        adapter.save(test_model)
         
         # Search by tag
         results = adapter.search("anime")
@@ -469,6 +528,60 @@ class TestFileSystemModelAdapter:
         result = adapter.delete("non_existent")
         assert result is False
     
+    def test_user_tag_index_tracks_save_and_delete(self, adapter):
+        """Test that the tag index follows saved and deleted models."""
+        def make_model(model_id, tags):
+            return Model(
+                id=model_id,
+                name="Test Model",
+                file_path=f"/test/{model_id}.safetensors",
+                file_size=1024,
+                created_at=datetime.now(),
+                modified_at=datetime.now(),
+                model_type=ModelType.CHECKPOINT,
+                hash="test_hash",
+                folder_id="test_folder",
+                user_metadata={"tags": tags}
+            )
+        
+        # Keep the cache valid so the index is not rebuilt from disk
+        adapter._cache_timestamp = datetime.now()
+        
+        adapter.save(make_model("a", ["anime", "style"]))
+        adapter.save(make_model("b", ["anime"]))
+        assert adapter.get_all_user_tags() == ("anime", "style")
+        
+        # Re-saving replaces the model's previous tags
+        adapter.save(make_model("a", ["portrait"]))
+        assert adapter.get_all_user_tags() == ("anime", "portrait")
+        
+        adapter.delete("b")
+        assert adapter.get_all_user_tags() == ("portrait",)
+
+    def test_get_all_user_tags_reuses_sorted_tuple_until_tags_change(self, adapter):
+        """Test that the sorted tag tuple is shared until the tag set changes."""
+        model = Model(
+            id="a",
+            name="Test Model",
+            file_path="/test/a.safetensors",
+            file_size=1024,
+            created_at=datetime.now(),
+            modified_at=datetime.now(),
+            model_type=ModelType.CHECKPOINT,
+            hash="test_hash",
+            folder_id="test_folder",
+            user_metadata={"tags": ["style"]}
+        )
+        adapter._cache_timestamp = datetime.now()
+        adapter.save(model)
+
+        tags = adapter.get_all_user_tags()
+        assert tags == ("style",)
+        assert adapter.get_all_user_tags() is tags
+
+        adapter.save(replace(model, user_metadata={"tags": ["anime", "style"]}))
+        assert adapter.get_all_user_tags() == ("anime", "style")
+
     def test_get_all_models(self, adapter, temp_model_files, mock_folder_repository):
         """Test getting all models."""
         # Set up test data
@@ -1,9 +1,11 @@
 """Tests for FilesystemOutputAdapter."""
 
+import os
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 from PIL import Image, PngImagePlugin
@@ -11,6 +13,7 @@ import json
 
 from src.adapters.driven.filesystem_output_adapter import FilesystemOutputAdapter
 from src.domain.entities.output import Output
+from src.domain.entities.output_query import OutputFilter, OutputSort
 
 
 class TestFilesystemOutputAdapter:
@@ -156,6 +159,15 @@ class TestFilesystemOutputAdapter:
         assert found_output.id == output_id
         assert found_output.filename == "test_image.png"
     
+    def test_iter_output_directory_is_lazy(self, adapter, sample_image_path):
+        """Test that the lazy scan yields outputs one at a time."""
+        iterator = adapter.iter_output_directory()
+        
+        first = next(iterator)
+        
+        assert first.filename == "test_image.png"
+        assert next(iterator, None) is None
+    
     def test_get_output_by_nonexistent_id(self, adapter):
         """Test getting output by non-existent ID returns None."""
         found_output = adapter.get_output_by_id("nonexistent_id")
@@ -180,6 +192,19 @@ class TestFilesystemOutputAdapter:
         assert len(jpg_outputs) == 1
         assert jpg_outputs[0].file_format == 'jpeg'  # PIL normalizes to 'jpeg'
     
+    def test_query_outputs_filters_sorts_and_limits(self, adapter, temp_output_dir):
+        """Test querying outputs applies the filter, order and limit in one call."""
+        for name in ["b.png", "a.png", "c.png"]:
+            Image.new('RGB', (100, 100), color='red').save(Path(temp_output_dir) / name, 'PNG')
+        Image.new('RGB', (100, 100), color='blue').save(Path(temp_output_dir) / "a.jpg", 'JPEG')
+        
+        outputs = adapter.query_outputs(
+            OutputFilter(file_format="png"), OutputSort("name", ascending=True), limit=2
+        )
+        
+        assert [o.filename for o in outputs] == ["a.png", "b.png"]
+        assert all(o.thumbnail_path is None for o in outputs)
+    
     def test_get_outputs_by_date_range(self, adapter, sample_image_path):
         """Test filtering outputs by date range."""
         # Get the file's creation time
@@ -274,6 +299,82 @@ class TestFilesystemOutputAdapter:
         metadata = adapter.extract_workflow_metadata(output)
         assert metadata is None
     
+    def test_extract_and_thumbnail_opens_file_once(self, adapter, sample_image_with_metadata):
+        """Test that the thumbnail and metadata come from a single file open."""
+        output = adapter._create_output_from_file(Path(sample_image_with_metadata))
+
+        with patch(
+            'src.adapters.driven.filesystem_output_adapter.Image.open', wraps=Image.open
+        ) as mock_open:
+            thumbnail_path, metadata = adapter.extract_and_thumbnail(output)
+
+        mock_open.assert_called_once()
+        assert Path(thumbnail_path).exists()
+        assert metadata == adapter.extract_workflow_metadata(output)
+        assert metadata["seed"] == 12345
+
+    def test_extract_and_thumbnail_skips_open_for_fresh_non_png(self, adapter, temp_output_dir):
+        """Test that a fresh thumbnail of a non-PNG file needs no decode."""
+        jpg_path = Path(temp_output_dir) / "photo.jpg"
+        Image.new('RGB', (64, 64), color='green').save(jpg_path, 'JPEG')
+        os.utime(jpg_path, (1_600_000_000, 1_600_000_000))
+        output = adapter._create_output_from_file(jpg_path)
+        existing = adapter.generate_thumbnail(output)
+
+        with patch('src.adapters.driven.filesystem_output_adapter.Image.open') as mock_open:
+            assert adapter.extract_and_thumbnail(output) == (existing, None)
+
+        mock_open.assert_not_called()
+
+    def test_enrich_batch(self, adapter, sample_image_path, sample_image_with_metadata):
+        """Test enriching several outputs keeps their order and fills in both fields."""
+        outputs = sorted(adapter.scan_output_directory(), key=lambda o: o.filename)
+
+        enriched = adapter.enrich_batch(outputs)
+
+        assert [o.id for o in enriched] == [o.id for o in outputs]
+        assert all(o.thumbnail_path and Path(o.thumbnail_path).exists() for o in enriched)
+        with_metadata = next(o for o in enriched if o.filename == "test_with_metadata.png")
+        assert with_metadata.workflow_metadata["seed"] == 12345
+        plain = next(o for o in enriched if o.filename == "test_image.png")
+        assert plain.workflow_metadata == {}
+
+    def test_enrich_batch_keeps_unreadable_outputs_and_reuses_executor(
+        self, adapter, sample_image_path, temp_output_dir
+    ):
+        """Test that a corrupt file does not fail the batch and the pool is shared."""
+        outputs = adapter.scan_output_directory()
+        broken = replace(outputs[0], id="broken", file_path=str(Path(temp_output_dir) / "broken.png"))
+        extract_and_thumbnail = adapter.extract_and_thumbnail
+        
+        def extract(output):
+            if output.id == "broken":
+                raise OSError("corrupt")
+            return extract_and_thumbnail(output)
+        
+        with patch.object(adapter, "extract_and_thumbnail", side_effect=extract):
+            enriched = adapter.enrich_batch([broken, outputs[0]])
+        executor = adapter._get_enrich_executor()
+        adapter.enrich_batch([outputs[0], outputs[0]])
+        
+        assert enriched[0] is broken
+        assert enriched[1].thumbnail_path
+        assert adapter._get_enrich_executor() is executor
+
+    def test_close_shuts_down_enrich_executor(self, adapter, sample_image_path):
+        """Test that close stops the pool and a later batch starts a new one."""
+        outputs = adapter.scan_output_directory()
+        adapter.enrich_batch([outputs[0], outputs[0]])
+        executor = adapter._get_enrich_executor()
+        
+        adapter.close()
+        adapter.close()
+        
+        assert executor._shutdown
+        assert adapter._enrich_executor is None
+        assert adapter._get_enrich_executor() is not executor
+        adapter.close()
+
     def test_generate_output_id_consistency(self, adapter):
         """Test that output ID generation is consistent."""
         file_path = "/path/to/test.png"
@@ -452,6 +553,33 @@ class TestFilesystemOutputAdapter:
         assert call_args[0] == "open"
         assert sample_image_path in str(call_args)
     
+    @patch('sys.platform', 'darwin')
+    @patch('subprocess.run')
+    def test_open_files_in_system_macos_uses_single_process(self, mock_subprocess, adapter, sample_image_path):
+        """Test that several files are opened with one viewer process on macOS."""
+        outputs = adapter.scan_output_directory()
+        
+        results = adapter.open_files_in_system(outputs)
+        
+        mock_subprocess.assert_called_once()
+        call_args = mock_subprocess.call_args[0][0]
+        assert call_args[0] == "open"
+        assert len(call_args) == len(outputs) + 1
+        assert all(results[output.id] for output in outputs)
+    
+    @patch('sys.platform', 'linux')
+    @patch('shutil.which', return_value=None)
+    @patch('subprocess.run')
+    def test_open_files_in_system_linux_falls_back_without_gio(self, mock_subprocess, mock_which, adapter, sample_image_path):
+        """Test that each file is opened separately when gio is unavailable."""
+        outputs = adapter.scan_output_directory()
+        
+        results = adapter.open_files_in_system(outputs)
+        
+        assert mock_subprocess.call_count == len(outputs)
+        assert all(call[0][0][0] == "xdg-open" for call in mock_subprocess.call_args_list)
+        assert all(results[output.id] for output in outputs)
+    
     @patch('sys.platform', 'linux')
     @patch('subprocess.run')
     def test_open_file_in_system_linux(self, mock_subprocess, adapter, sample_image_path):
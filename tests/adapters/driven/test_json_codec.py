@@ -0,0 +1,48 @@
+"""Tests for JSON decoding used by HTTP adapters."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.driven import json_codec
+
+
+class TestJsonCodec:
+    """Test cases for json_codec.loads."""
+    
+    def test_loads_response_bytes(self):
+        """Test that a raw response body decodes like the standard library."""
+        payload = {"id": 12345, "modelVersions": [{"files": [{"sizeKB": 2048.5}]}], "nsfw": False}
+        
+        assert json_codec.loads(json.dumps(payload).encode()) == payload
+    
+    def test_falls_back_to_standard_library(self, monkeypatch):
+        """Test that decoding works without orjson installed."""
+        monkeypatch.setattr(json_codec, "orjson", None)
+        
+        assert json_codec.loads(b'{"name": "Test Model"}') == {"name": "Test Model"}
+    
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed bodies raise ValueError with either parser."""
+        with pytest.raises(ValueError):
+            json_codec.loads(b"<html>")
+
+    
+    async def test_loads_async_decodes_small_body_inline(self):
+        """Test that small bodies skip the worker thread."""
+        with patch("asyncio.to_thread") as to_thread:
+            assert await json_codec.loads_async(b'{"id": 1}') == {"id": 1}
+        
+        to_thread.assert_not_called()
+    
+    async def test_loads_async_offloads_large_body(self, monkeypatch):
+        """Test that bodies above the threshold are decoded in a worker thread."""
+        monkeypatch.setattr(json_codec, "OFFLOAD_THRESHOLD", 8)
+        payload = {"modelVersions": [{"name": "v1"}] * 100}
+        
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await json_codec.loads_async(json.dumps(payload).encode()) == payload
+        
+        to_thread.assert_called_once()
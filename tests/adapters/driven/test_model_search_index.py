@@ -0,0 +1,45 @@
+"""Tests for the model search trigram index."""
+
+from src.adapters.driven.model_search_index import TrigramIndex
+
+
+class TestTrigramIndex:
+    """Test cases for TrigramIndex."""
+    
+    def test_candidates_contain_substring_matches(self):
+        """Test that every document containing the query is a candidate."""
+        index = TrigramIndex()
+        index.add("a", ["Realistic Vision", "realisticVision_v5.safetensors"])
+        index.add("b", ["Anime Mix", "anime_mix.ckpt"])
+        
+        assert index.candidates("vision") == {"a"}
+        assert index.candidates("MIX") == {"b"}
+        assert index.candidates("missing") == set()
+    
+    def test_trigrams_do_not_span_texts(self):
+        """Test that separate texts are indexed separately."""
+        index = TrigramIndex()
+        index.add("a", ["ab", "cd"])
+        
+        assert index.candidates("abc") == set()
+    
+    def test_short_query_is_not_answered(self):
+        """Test that queries shorter than a trigram fall back to the caller."""
+        index = TrigramIndex()
+        index.add("a", ["anime"])
+        
+        assert index.candidates("an") is None
+    
+    def test_add_replaces_and_remove_deletes(self):
+        """Test re-indexing and removing documents."""
+        index = TrigramIndex()
+        index.add("a", ["anime"])
+        index.add("a", ["portrait"])
+        
+        assert index.candidates("anime") == set()
+        assert index.candidates("portrait") == {"a"}
+        
+        index.remove("a")
+        
+        assert len(index) == 0
+        assert index.candidates("portrait") == set()
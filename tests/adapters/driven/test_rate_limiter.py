@@ -0,0 +1,87 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.adapters.driven.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    @pytest.mark.asyncio
+    async def test_spaces_requests_without_quota_headers(self):
+        """Test that requests are spaced by the minimum delay by default."""
+        bucket = TokenBucket(min_delay=0.05)
+        
+        start = time.monotonic()
+        await bucket.acquire()
+        first = time.monotonic()
+        await bucket.acquire()
+        second = time.monotonic()
+        
+        assert first - start < 0.05
+        assert second - first >= 0.04
+    
+    @pytest.mark.asyncio
+    async def test_advertised_quota_allows_bursts(self):
+        """Test that remaining quota from headers is spent without waiting."""
+        bucket = TokenBucket(min_delay=10.0)
+        bucket.update_from_headers({
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "5",
+            "X-RateLimit-Reset": "60",
+        })
+        
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        
+        assert time.monotonic() - start < 1.0
+    
+    def test_missing_or_malformed_headers_are_ignored(self):
+        """Test that the bucket keeps its defaults without usable headers."""
+        bucket = TokenBucket(min_delay=1.0)
+        
+        bucket.update_from_headers({})
+        bucket.update_from_headers({"X-RateLimit-Limit": "abc", "X-RateLimit-Remaining": "1"})
+        
+        assert bucket._capacity == 1.0
+        assert bucket._refill_rate == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_back_off_holds_requests(self):
+        """Test that backing off delays the next request and empties the bucket."""
+        bucket = TokenBucket(min_delay=0.01)
+        bucket.update_from_headers({"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "10"})
+        bucket.back_off(0.05)
+        bucket.update_from_headers({"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "0"})
+        
+        start = time.monotonic()
+        await bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.04
+    
+    @pytest.mark.asyncio
+    async def test_reserve_returns_token_on_timeout(self):
+        """Test that a timed-out request gives its token back."""
+        bucket = TokenBucket(min_delay=10.0)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            async with bucket.reserve():
+                raise asyncio.TimeoutError()
+        
+        assert bucket._tokens == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_reserve_keeps_token_on_completed_request(self):
+        """Test that requests ending normally or with other errors spend their token."""
+        bucket = TokenBucket(min_delay=10.0)
+        
+        with pytest.raises(ValueError):
+            async with bucket.reserve():
+                raise ValueError("bad response")
+        
+        assert bucket._tokens < 1.0
@@ -1,5 +1,6 @@
 """Integration tests for Web API adapter."""
 
+import asyncio
 import json
 import pytest
 from datetime import datetime
@@ -11,7 +12,7 @@ from src.adapters.driving.web_api_adapter import WebAPIAdapter
 from src.domain.ports.driving.model_management_port import ModelManagementPort
 from src.domain.ports.driving.folder_management_port import FolderManagementPort
 from src.domain.entities.model import Model, ModelType
-from src.domain.entities.folder import Folder
+from src.domain.entities.folder import Folder, FolderSnapshot
 from src.domain.entities.base import ValidationError, NotFoundError, DomainError
 
 
@@ -67,8 +68,9 @@ class TestWebAPIAdapter(AioHTTPTestCase):
     async def test_get_folders_success(self):
         """Test successful folder listing."""
         # Arrange
-        folders = [self.sample_folder]
-        self.mock_folder_management.get_all_folders.return_value = folders
+        self.mock_folder_management.get_folder_snapshot.return_value = (
+            FolderSnapshot.from_folders([self.sample_folder])
+        )
         
         # Act
         resp = await self.client.request("GET", "/asset_manager/folders")
@@ -86,13 +88,14 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         self.assertEqual(folder_data["name"], "Checkpoints")
         self.assertEqual(folder_data["model_type"], "checkpoint")
         
-        self.mock_folder_management.get_all_folders.assert_called_once()
+        self.mock_folder_management.get_folder_snapshot.assert_called_once()
+        self.mock_folder_management.get_all_folders.assert_not_called()
     
     @unittest_run_loop
     async def test_get_folders_domain_error(self):
         """Test folder listing with domain error."""
         # Arrange
-        self.mock_folder_management.get_all_folders.side_effect = DomainError("Test error")
+        self.mock_folder_management.get_folder_snapshot.side_effect = DomainError("Test error")
         
         # Act
         resp = await self.client.request("GET", "/asset_manager/folders")
@@ -132,6 +135,22 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         
         self.mock_model_management.get_models_in_folder.assert_called_once_with("folder-1")
     
+    @unittest_run_loop
+    async def test_get_models_in_folder_enriched(self):
+        """Test that enrich=true lists the folder with external metadata."""
+        # Arrange
+        self.mock_model_management.get_models_in_folder_enriched.return_value = [self.sample_model]
+        
+        # Act
+        resp = await self.client.request("GET", "/asset_manager/folders/folder-1/models?enrich=true")
+        
+        # Assert
+        self.assertEqual(resp.status, 200)
+        data = await resp.json()
+        self.assertEqual(data["count"], 1)
+        self.mock_model_management.get_models_in_folder_enriched.assert_called_once_with("folder-1")
+        self.mock_model_management.get_models_in_folder.assert_not_called()
+    
     @unittest_run_loop
     async def test_get_models_in_folder_validation_error(self):
         """Test model listing with validation error."""
@@ -152,6 +171,49 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         self.assertEqual(data["field"], "folder_id")
         self.assertEqual(data["error"], "folder_id cannot be empty")
     
+    @unittest_run_loop
+    async def test_stream_models_in_folder_success(self):
+        """Test streaming models in a folder as NDJSON."""
+        # Arrange
+        async def stream(folder_id):
+            yield self.sample_model
+            yield self.sample_model
+        
+        self.mock_model_management.stream_models_in_folder.side_effect = stream
+        
+        # Act
+        resp = await self.client.request("GET", "/asset_manager/folders/folder-1/models/stream")
+        
+        # Assert
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(resp.headers["Content-Type"], "application/x-ndjson")
+        lines = (await resp.text()).strip().split("\n")
+        
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["id"], "model-1")
+        
+        self.mock_model_management.stream_models_in_folder.assert_called_once_with("folder-1")
+    
+    @unittest_run_loop
+    async def test_stream_models_in_folder_validation_error(self):
+        """Test streaming models reports validation errors as JSON."""
+        # Arrange
+        async def stream(folder_id):
+            raise ValidationError("folder_id cannot be empty", "folder_id")
+            yield
+        
+        self.mock_model_management.stream_models_in_folder.side_effect = stream
+        
+        # Act
+        resp = await self.client.request("GET", "/asset_manager/folders/%20/models/stream")
+        
+        # Assert
+        self.assertEqual(resp.status, 400)
+        data = await resp.json()
+        
+        self.assertFalse(data["success"])
+        self.assertEqual(data["field"], "folder_id")
+    
     @unittest_run_loop
     async def test_get_model_details_success(self):
         """Test successful model details retrieval."""
@@ -195,6 +257,64 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         self.assertEqual(data["entity_type"], "Model")
         self.assertEqual(data["identifier"], "nonexistent-model")
     
+    @unittest_run_loop
+    async def test_get_model_details_bulk_success(self):
+        """Test successful bulk model details retrieval."""
+        # Arrange
+        self.mock_model_management.get_model_details_bulk.return_value = {
+            "model-1": self.sample_model
+        }
+        
+        # Act
+        resp = await self.client.request(
+            "POST",
+            "/asset_manager/models/bulk-details",
+            json={"model_ids": ["model-1", "missing"]}
+        )
+        
+        # Assert
+        self.assertEqual(resp.status, 200)
+        data = await resp.json()
+        
+        self.assertTrue(data["success"])
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["data"]["model-1"]["name"], "Test Model")
+        self.assertNotIn("missing", data["data"])
+        
+        self.mock_model_management.get_model_details_bulk.assert_called_once_with(
+            ["model-1", "missing"]
+        )
+    
+    @unittest_run_loop
+    async def test_get_model_details_bulk_missing_ids(self):
+        """Test bulk model details retrieval without model_ids."""
+        # Act
+        resp = await self.client.request(
+            "POST", "/asset_manager/models/bulk-details", json={}
+        )
+        
+        # Assert
+        self.assertEqual(resp.status, 400)
+        data = await resp.json()
+        
+        self.assertFalse(data["success"])
+        self.mock_model_management.get_model_details_bulk.assert_not_called()
+    
+    @unittest_run_loop
+    async def test_get_model_details_bulk_non_object_body(self):
+        """Test bulk model details retrieval with a non-object JSON body."""
+        # Act
+        resp = await self.client.request(
+            "POST", "/asset_manager/models/bulk-details", json="model-1"
+        )
+        
+        # Assert
+        self.assertEqual(resp.status, 400)
+        data = await resp.json()
+        
+        self.assertEqual(data["error_type"], "validation_error")
+        self.mock_model_management.get_model_details_bulk.assert_not_called()
+    
     @unittest_run_loop
     async def test_search_models_success(self):
         """Test successful model search."""
@@ -217,7 +337,65 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         model_data = data["data"][0]
         self.assertEqual(model_data["id"], "model-1")
         
-        self.mock_model_management.search_models.assert_called_once_with("test", None)
+        self.mock_model_management.search_models.assert_called_once_with(
+            "test", None, limit=None, offset=0
+        )
+    
+    @unittest_run_loop
+    async def test_search_models_cancels_superseded_search(self):
+        """Test that a newer search cancels one that is still running."""
+        first_started = asyncio.Event()
+        
+        async def search(query, folder_id, limit=None, offset=0):
+            if query == "te":
+                first_started.set()
+                await asyncio.sleep(10)
+            return [self.sample_model]
+        
+        self.mock_model_management.search_models.side_effect = search
+        
+        headers = {"X-Search-Session": "tab-1"}
+        first = asyncio.ensure_future(
+            self.client.request("GET", "/asset_manager/search?q=te", headers=headers)
+        )
+        await first_started.wait()
+        second = await self.client.request("GET", "/asset_manager/search?q=test", headers=headers)
+        first = await first
+        
+        self.assertEqual(second.status, 200)
+        self.assertEqual(first.status, 409)
+        data = await first.json()
+        self.assertEqual(data["error_type"], "search_superseded")
+    
+    @unittest_run_loop
+    async def test_concurrent_searches_from_different_clients_both_succeed(self):
+        """Test that searches from other sessions or without one are not superseded."""
+        release = asyncio.Event()
+        started = []
+        
+        async def search(query, folder_id, limit=None, offset=0):
+            started.append(query)
+            await release.wait()
+            return [self.sample_model]
+        
+        self.mock_model_management.search_models.side_effect = search
+        
+        requests = [
+            asyncio.ensure_future(self.client.request(
+                "GET", "/asset_manager/search?q=a", headers={"X-Search-Session": "tab-1"}
+            )),
+            asyncio.ensure_future(self.client.request(
+                "GET", "/asset_manager/search?q=b", headers={"X-Search-Session": "tab-2"}
+            )),
+            asyncio.ensure_future(self.client.request("GET", "/asset_manager/search?q=c")),
+            asyncio.ensure_future(self.client.request("GET", "/asset_manager/search?q=d")),
+        ]
+        while len(started) < len(requests):
+            await asyncio.sleep(0.01)
+        release.set()
+        responses = await asyncio.gather(*requests)
+        
+        self.assertEqual([resp.status for resp in responses], [200, 200, 200, 200])
     
     @unittest_run_loop
     async def test_search_models_with_folder_filter(self):
@@ -237,7 +415,36 @@ class TestWebAPIAdapter(AioHTTPTestCase):
         self.assertEqual(data["query"], "test")
         self.assertEqual(data["folder_id"], "folder-1")
         
-        self.mock_model_management.search_models.assert_called_once_with("test", "folder-1")
+        self.mock_model_management.search_models.assert_called_once_with(
+            "test", "folder-1", limit=None, offset=0
+        )
+    
+    @unittest_run_loop
+    async def test_search_models_with_pagination(self):
+        """Test model search passes limit and offset to the domain service."""
+        # Arrange
+        self.mock_model_management.search_models.return_value = [self.sample_model]
+        
+        # Act
+        resp = await self.client.request("GET", "/asset_manager/search?q=test&limit=10&offset=20")
+        
+        # Assert
+        self.assertEqual(resp.status, 200)
+        self.mock_model_management.search_models.assert_called_once_with(
+            "test", None, limit=10, offset=20
+        )
+    
+    @unittest_run_loop
+    async def test_search_models_invalid_limit(self):
+        """Test model search rejects a non-integer limit."""
+        # Act
+        resp = await self.client.request("GET", "/asset_manager/search?q=test&limit=ten")
+        
+        # Assert
+        self.assertEqual(resp.status, 400)
+        data = await resp.json()
+        self.assertEqual(data["field"], "limit")
+        self.mock_model_management.search_models.assert_not_called()
     
     @unittest_run_loop
     async def test_search_models_missing_query(self):
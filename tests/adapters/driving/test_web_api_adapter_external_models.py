@@ -6,7 +6,7 @@ from aiohttp import web
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 
 from src.adapters.driving.web_api_adapter import WebAPIAdapter
-from src.domain.entities.external_model import ExternalModel, ExternalPlatform, ComfyUIModelType, ComfyUICompatibility
+from src.domain.entities.external_model import ExternalModel, ExternalPlatform, ComfyUIModelType, ComfyUICompatibility, PlatformInfo
 from src.domain.ports.driven.external_model_port import ExternalAPIError
 from datetime import datetime
 
@@ -91,7 +91,8 @@ class TestWebAPIAdapterExternalModels(AioHTTPTestCase):
             query="test",
             limit=10,
             offset=0,
-            filters={}
+            filters={},
+            cursor=None
         )
     
     @unittest_run_loop
@@ -148,7 +149,8 @@ class TestWebAPIAdapterExternalModels(AioHTTPTestCase):
             query="test",
             limit=20,
             offset=0,
-            filters={}
+            filters={},
+            cursor=None
         )
     
     @unittest_run_loop
@@ -223,6 +225,45 @@ class TestWebAPIAdapterExternalModels(AioHTTPTestCase):
             model_type=None
         )
     
+    @unittest_run_loop
+    async def test_get_external_landing_page(self):
+        """Test getting all browse screen sections in one request."""
+        sample_model = self.create_sample_external_model()
+        self.mock_external_model_management.get_landing_page.return_value = {
+            "popular": [sample_model],
+            "recent": [],
+            "suggestions": [sample_model]
+        }
+        
+        resp = await self.client.request(
+            "GET", "/asset_manager/external/landing?platform=civitai&recent_limit=5"
+        )
+        
+        assert resp.status == 200
+        data = await resp.json()
+        assert data["success"] is True
+        assert data["data"]["popular"]["count"] == 1
+        assert data["data"]["recent"]["count"] == 0
+        assert data["data"]["suggestions"]["count"] == 1
+        
+        self.mock_external_model_management.get_landing_page.assert_called_once_with(
+            platform=ExternalPlatform.CIVITAI,
+            limits={"recent": 5}
+        )
+    
+    @unittest_run_loop
+    async def test_get_external_landing_page_invalid_limit(self):
+        """Test that a non-integer section limit is rejected."""
+        resp = await self.client.request(
+            "GET", "/asset_manager/external/landing?popular_limit=many"
+        )
+        
+        assert resp.status == 400
+        data = await resp.json()
+        assert data["error_type"] == "validation_error"
+        assert "popular_limit" in data["error"]
+        self.mock_external_model_management.get_landing_page.assert_not_called()
+    
     @unittest_run_loop
     async def test_get_recent_external_models(self):
         """Test getting recent external models."""
@@ -269,12 +310,12 @@ class TestWebAPIAdapterExternalModels(AioHTTPTestCase):
     async def test_get_platform_info(self):
         """Test getting platform information."""
         # Arrange
-        platform_info = {
-            "name": "civitai",
-            "display_name": "CivitAI",
-            "capabilities": {"search": True},
-            "is_available": True
-        }
+        platform_info = PlatformInfo(
+            name="civitai",
+            display_name="CivitAI",
+            capabilities={"search": True},
+            is_available=True
+        )
         self.mock_external_model_management.get_platform_info.return_value = platform_info
         
         # Act
@@ -7,7 +7,7 @@ from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
 
 from src.adapters.driving.web_api_adapter import WebAPIAdapter
-from src.domain.entities.model import Model, ModelType
+from src.domain.entities.model import Model, ModelType, BulkUpdateResult
 from src.domain.entities.base import ValidationError, NotFoundError
 from datetime import datetime
 
@@ -168,7 +168,10 @@ class TestBulkUpdateMetadata:
             model_type=ModelType.LORA, hash="hash2", folder_id="folder1"
         )
         
-        mock_model_management.bulk_update_metadata.return_value = [model1, model2]
+        mock_model_management.bulk_update_metadata.return_value = BulkUpdateResult(
+            updated=[model1, model2],
+            failed=[{"model_id": "missing", "error": "Model not found"}]
+        )
         
         request_body = {
             "model_ids": ["model-1", "model-2"],
@@ -186,6 +189,7 @@ class TestBulkUpdateMetadata:
         assert response_data["success"] is True
         assert "data" in response_data
         assert response_data["count"] == 2
+        assert response_data["failed"] == [{"model_id": "missing", "error": "Model not found"}]
         mock_model_management.bulk_update_metadata.assert_called_once_with(
             ["model-1", "model-2"], {"tags": ["bulk"], "rating": 4}
         )
@@ -273,8 +277,8 @@ class TestGetAllUserTags:
     async def test_get_all_user_tags_success(self, web_api_adapter, mock_model_management):
         """Test successful retrieval of all user tags."""
         # Arrange
-        expected_tags = ["character", "style", "anime", "realistic"]
-        mock_model_management.get_all_user_tags.return_value = expected_tags
+        expected_tags = ["anime", "character", "realistic", "style"]
+        mock_model_management.get_all_user_tags.return_value = tuple(expected_tags)
         
         request = make_mocked_request('GET', '/asset_manager/tags')
         
@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 from aiohttp import web
@@ -9,6 +10,7 @@ from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 
 from src.adapters.driving.web_api_adapter import WebAPIAdapter
 from src.domain.entities.output import Output
+from src.domain.entities.output_query import OutputFilter, OutputSort
 from src.domain.entities.base import ValidationError, NotFoundError
 
 
@@ -63,8 +65,7 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
             self.create_sample_output("output_1"),
             self.create_sample_output("output_2")
         ]
-        self.mock_output_management.get_all_outputs.return_value = sample_outputs
-        self.mock_output_management.sort_outputs.return_value = sample_outputs
+        self.mock_output_management.list_outputs.return_value = sample_outputs
         
         # Make request
         resp = await self.client.request("GET", "/asset_manager/outputs")
@@ -86,17 +87,19 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         assert "created_at" in output_data
         assert "workflow_metadata" in output_data
         
-        # Verify service calls
-        self.mock_output_management.get_all_outputs.assert_called_once()
-        self.mock_output_management.sort_outputs.assert_called_once()
+        # Verify service call
+        self.mock_output_management.list_outputs.assert_called_once_with(
+            output_filter=OutputFilter(),
+            output_sort=OutputSort(sort_by="date", ascending=False),
+            limit=None
+        )
     
     @unittest_run_loop
     async def test_get_outputs_with_format_filter(self):
         """Test getting outputs with format filter."""
         # Setup mock
         sample_outputs = [self.create_sample_output()]
-        self.mock_output_management.get_outputs_by_format.return_value = sample_outputs
-        self.mock_output_management.sort_outputs.return_value = sample_outputs
+        self.mock_output_management.list_outputs.return_value = sample_outputs
         
         # Make request with format filter
         resp = await self.client.request("GET", "/asset_manager/outputs?format=png")
@@ -109,15 +112,15 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         assert data["filters"]["format"] == "png"
         
         # Verify service call
-        self.mock_output_management.get_outputs_by_format.assert_called_once_with("png")
+        call_kwargs = self.mock_output_management.list_outputs.call_args.kwargs
+        assert call_kwargs["output_filter"] == OutputFilter(file_format="png")
     
     @unittest_run_loop
     async def test_get_outputs_with_date_range_filter(self):
         """Test getting outputs with date range filter."""
         # Setup mock
         sample_outputs = [self.create_sample_output()]
-        self.mock_output_management.get_outputs_by_date_range.return_value = sample_outputs
-        self.mock_output_management.sort_outputs.return_value = sample_outputs
+        self.mock_output_management.list_outputs.return_value = sample_outputs
         
         # Make request with date range filter
         start_date = "2024-01-01T00:00:00"
@@ -136,7 +139,11 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         assert data["filters"]["end_date"] == end_date
         
         # Verify service call
-        self.mock_output_management.get_outputs_by_date_range.assert_called_once()
+        call_kwargs = self.mock_output_management.list_outputs.call_args.kwargs
+        assert call_kwargs["output_filter"] == OutputFilter(
+            start_date=datetime(2024, 1, 1, 0, 0, 0),
+            end_date=datetime(2024, 1, 31, 23, 59, 59)
+        )
     
     @unittest_run_loop
     async def test_get_outputs_with_invalid_date_format(self):
@@ -160,13 +167,12 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         """Test getting outputs with custom sorting."""
         # Setup mock
         sample_outputs = [self.create_sample_output()]
-        self.mock_output_management.get_all_outputs.return_value = sample_outputs
-        self.mock_output_management.sort_outputs.return_value = sample_outputs
+        self.mock_output_management.list_outputs.return_value = sample_outputs
         
         # Make request with sorting parameters
         resp = await self.client.request(
             "GET", 
-            "/asset_manager/outputs?sort_by=name&ascending=true"
+            "/asset_manager/outputs?sort_by=name&ascending=true&limit=10"
         )
         
         # Verify response
@@ -178,15 +184,18 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         assert data["filters"]["ascending"] is True
         
         # Verify service call
-        self.mock_output_management.sort_outputs.assert_called_once_with(
-            sample_outputs, "name", True
+        assert data["filters"]["limit"] == 10
+        self.mock_output_management.list_outputs.assert_called_once_with(
+            output_filter=OutputFilter(),
+            output_sort=OutputSort(sort_by="name", ascending=True),
+            limit=10
         )
     
     @unittest_run_loop
     async def test_get_outputs_validation_error(self):
         """Test get outputs with validation error."""
         # Setup mock to raise validation error
-        self.mock_output_management.get_all_outputs.side_effect = ValidationError(
+        self.mock_output_management.list_outputs.side_effect = ValidationError(
             "Invalid output directory", "output_directory"
         )
         
@@ -288,11 +297,110 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         assert data["error"] == "Output directory not accessible"
         assert data["error_type"] == "validation_error"
     
+    @unittest_run_loop
+    async def test_open_system_bulk_success(self):
+        """Test opening several outputs in the system viewer."""
+        self.mock_output_management.open_in_system_viewer_bulk.return_value = {
+            "output_1": True,
+            "output_2": False
+        }
+        
+        resp = await self.client.request(
+            "POST",
+            "/asset_manager/outputs/open-system-bulk",
+            json={"output_ids": ["output_1", "output_2"]}
+        )
+        
+        assert resp.status == 200
+        data = await resp.json()
+        
+        assert data["success"] is False
+        assert data["opened_count"] == 1
+        assert data["data"] == {"output_1": True, "output_2": False}
+        self.mock_output_management.open_in_system_viewer_bulk.assert_called_once_with(
+            ["output_1", "output_2"]
+        )
+    
+    @unittest_run_loop
+    async def test_open_system_bulk_runs_off_event_loop(self):
+        """Test that opening files does not block the event loop thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+        
+        def open_bulk(output_ids):
+            threads.append(threading.get_ident())
+            return {output_id: True for output_id in output_ids}
+        
+        self.mock_output_management.open_in_system_viewer_bulk.side_effect = open_bulk
+        
+        resp = await self.client.request(
+            "POST",
+            "/asset_manager/outputs/open-system-bulk",
+            json={"output_ids": ["output_1"]}
+        )
+        
+        assert resp.status == 200
+        assert threads and threads[0] != loop_thread
+    
+    @unittest_run_loop
+    async def test_open_system_bulk_missing_ids(self):
+        """Test bulk open without output_ids in the body."""
+        resp = await self.client.request(
+            "POST", "/asset_manager/outputs/open-system-bulk", json={}
+        )
+        
+        assert resp.status == 400
+        data = await resp.json()
+        assert data["error_type"] == "validation_error"
+        self.mock_output_management.open_in_system_viewer_bulk.assert_not_called()
+    
+    @unittest_run_loop
+    async def test_open_system_bulk_non_object_body(self):
+        """Test bulk open with a JSON body that is not an object."""
+        for body in (5, "output_ids", ["output_1"]):
+            resp = await self.client.request(
+                "POST", "/asset_manager/outputs/open-system-bulk", json=body
+            )
+            
+            assert resp.status == 400
+            data = await resp.json()
+            assert data["error_type"] == "validation_error"
+        self.mock_output_management.open_in_system_viewer_bulk.assert_not_called()
+    
+    @unittest_run_loop
+    async def test_open_system_bulk_too_many_ids(self):
+        """Test that the service's bulk open limit becomes a 400 response."""
+        self.mock_output_management.open_in_system_viewer_bulk.side_effect = ValidationError(
+            "at most 20 outputs can be opened at once", "output_ids"
+        )
+        
+        resp = await self.client.request(
+            "POST",
+            "/asset_manager/outputs/open-system-bulk",
+            json={"output_ids": [f"output_{i}" for i in range(21)]}
+        )
+        
+        assert resp.status == 400
+        data = await resp.json()
+        assert data["error_type"] == "validation_error"
+    
+    @unittest_run_loop
+    async def test_get_output_details_bulk_non_object_body(self):
+        """Test bulk output details with a JSON body that is not an object."""
+        resp = await self.client.request(
+            "POST", "/asset_manager/outputs/bulk-details", json=["output_1"]
+        )
+        
+        assert resp.status == 400
+        data = await resp.json()
+        assert data["error_type"] == "validation_error"
+        self.mock_output_management.get_output_details_bulk.assert_not_called()
+    
     @unittest_run_loop
     async def test_get_outputs_unexpected_error(self):
         """Test get outputs with unexpected error."""
         # Setup mock to raise unexpected error
-        self.mock_output_management.get_all_outputs.side_effect = Exception("Unexpected error")
+        self.mock_output_management.list_outputs.side_effect = Exception("Unexpected error")
         
         # Make request
         resp = await self.client.request("GET", "/asset_manager/outputs")
@@ -322,8 +430,7 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
             elif "outputs/test_id" in path:
                 self.mock_output_management.get_output_details.return_value = self.create_sample_output()
             else:
-                self.mock_output_management.get_all_outputs.return_value = []
-                self.mock_output_management.sort_outputs.return_value = []
+                self.mock_output_management.list_outputs.return_value = []
             
             # Make request
             resp = await self.client.request(method, path)
@@ -336,8 +443,7 @@ class TestWebAPIAdapterOutputs(AioHTTPTestCase):
         """Test that get outputs response has correct structure."""
         # Setup mock
         sample_output = self.create_sample_output()
-        self.mock_output_management.get_all_outputs.return_value = [sample_output]
-        self.mock_output_management.sort_outputs.return_value = [sample_output]
+        self.mock_output_management.list_outputs.return_value = [sample_output]
         
         # Make request
         resp = await self.client.request("GET", "/asset_manager/outputs")
@@ -0,0 +1,52 @@
+"""Shared pytest configuration."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+COMFYUI_SKELETON_DIRS = ("custom_nodes", "models", "output")
+COMFYUI_SKELETON_FILES = (
+    ("main.py", b"# ComfyUI main file"),
+    ("nodes.py", b"# ComfyUI nodes"),
+    ("execution.py", b"# ComfyUI execution"),
+    ("folder_paths.py", b"# ComfyUI folder paths"),
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point configuration loaded from the environment at a per-test cache."""
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture(scope="session")
+def comfyui_skeleton():
+    """Create the ComfyUI directory structure once for the whole session."""
+    temp_dir = tempfile.mkdtemp()
+    comfyui_dir = Path(temp_dir) / "ComfyUI"
+    for name in COMFYUI_SKELETON_DIRS:
+        os.makedirs(comfyui_dir / name)
+    
+    # Create ComfyUI indicator files
+    for name, content in COMFYUI_SKELETON_FILES:
+        (comfyui_dir / name).write_bytes(content)
+    
+    yield comfyui_dir
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def temp_comfyui_dir(comfyui_skeleton):
+    """Provide the shared ComfyUI directory, removing whatever a test adds."""
+    before = set(comfyui_skeleton.rglob("*"))
+    yield str(comfyui_skeleton)
+    
+    # Children sort after their parents, so reverse order empties directories first
+    for path in sorted(set(comfyui_skeleton.rglob("*")) - before, reverse=True):
+        if path.is_dir() and not path.is_symlink():
+            path.rmdir()
+        else:
+            path.unlink()
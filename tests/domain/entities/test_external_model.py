@@ -315,6 +315,18 @@ class TestExternalModel:
         
         assert model.get_primary_description() == "A test model for unit testing"
     
+    def test_lowercase_search_fields(self, valid_external_model_data):
+        """Test the cached lowercase forms of the searchable text."""
+        valid_external_model_data["name"] = "Test MODEL"
+        valid_external_model_data["metadata"] = {"tags": ["Platform_Tag"], "description": "Platform DESCRIPTION"}
+        model = ExternalModel(**valid_external_model_data)
+        
+        assert model.name_lower == "test model"
+        assert model.author_lower == model.author.lower()
+        assert "platform_tag" in model.tags_lower
+        assert model.description_lower == "platform description"
+        assert model.tags_lower is model.tags_lower
+    
     def test_to_dict(self, valid_external_model_data):
         """Test converting external model to dictionary."""
         model = ExternalModel(**valid_external_model_data)
@@ -0,0 +1,57 @@
+"""Tests for folder entities."""
+
+from src.domain.entities.folder import Folder, FolderSnapshot
+from src.domain.entities.model import ModelType
+
+
+def make_folders():
+    """Create a small folder hierarchy."""
+    return [
+        Folder(id="b-child", name="SD1.5", path="/models/checkpoints/sd15",
+               model_type=ModelType.CHECKPOINT, model_count=3, parent_folder_id="a-root"),
+        Folder(id="a-root", name="Checkpoints", path="/models/checkpoints",
+               model_type=ModelType.CHECKPOINT, model_count=1),
+        Folder(id="c-lora", name="LoRAs", path="/models/loras",
+               model_type=ModelType.LORA, model_count=7),
+    ]
+
+
+class TestFolderSnapshot:
+    """Test cases for FolderSnapshot."""
+    
+    def test_from_folders_sorts_by_id_and_links_parents(self):
+        """Test that the snapshot is sorted by ID with parent indexes."""
+        snapshot = FolderSnapshot.from_folders(make_folders())
+        
+        assert snapshot.ids == ("a-root", "b-child", "c-lora")
+        assert snapshot.parents == (-1, 0, -1)
+        assert snapshot.names == ("Checkpoints", "SD1.5", "LoRAs")
+        assert snapshot.model_counts == (1, 3, 7)
+        assert len(snapshot) == 3
+    
+    def test_index_of_and_find(self):
+        """Test binary search lookups."""
+        snapshot = FolderSnapshot.from_folders(make_folders())
+        
+        assert snapshot.index_of("c-lora") == 2
+        assert snapshot.index_of("missing") == -1
+        assert snapshot.find("missing") is None
+        
+        child = snapshot.find("b-child")
+        assert child.parent_folder_id == "a-root"
+        assert child.model_type == ModelType.CHECKPOINT
+    
+    def test_to_structure_round_trips(self):
+        """Test that the snapshot materializes the original folders."""
+        folders = make_folders()
+        snapshot = FolderSnapshot.from_folders(folders)
+        
+        assert snapshot.to_structure() == {folder.id: folder for folder in folders}
+    
+    def test_empty_snapshot(self):
+        """Test an empty snapshot."""
+        snapshot = FolderSnapshot.from_folders([])
+        
+        assert len(snapshot) == 0
+        assert snapshot.find("anything") is None
+        assert snapshot.to_structure() == {}
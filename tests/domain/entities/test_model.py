@@ -169,4 +169,12 @@ def test_model_properties(sample_model):
     # Test with different file extension
     sample_model.file_path = "/path/to/model.ckpt"
     assert sample_model.file_name == "model.ckpt"
-    assert sample_model.file_extension == ".ckpt"
\ No newline at end of file
+    assert sample_model.file_extension == ".ckpt"
+
+
+def test_model_is_slotted(sample_model):
+    """Test that models carry no per-instance attribute dictionary."""
+    assert not hasattr(sample_model, "__dict__")
+    
+    with pytest.raises(AttributeError):
+        sample_model.unknown_attribute = "value"
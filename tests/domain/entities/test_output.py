@@ -282,4 +282,25 @@ class TestOutput:
         valid_output_data["id"] = "output-2"
         output2 = Output(**valid_output_data)
         
-        assert output1 != output2
\ No newline at end of file
+        assert output1 != output2
+    
+    def test_entity_equality_ignores_non_id_fields(self, valid_output_data):
+        """Test that outputs with the same ID are equal even if other fields differ."""
+        output1 = Output(**valid_output_data)
+        
+        valid_output_data["filename"] = "renamed.png"
+        valid_output_data["file_size"] = 42
+        output2 = Output(**valid_output_data)
+        
+        assert output1 == output2
+        assert hash(output1) == hash(output2)
+    
+    def test_outputs_are_hashable_for_set_dedup(self, valid_output_data):
+        """Test that outputs can be deduplicated in sets by ID."""
+        output1 = Output(**valid_output_data)
+        output2 = Output(**valid_output_data)
+        
+        valid_output_data["id"] = "output-2"
+        output3 = Output(**valid_output_data)
+        
+        assert len({output1, output2, output3}) == 2
@@ -0,0 +1,93 @@
+"""Tests for output query value objects."""
+
+import pytest
+from datetime import datetime
+from src.domain.entities.output import Output
+from src.domain.entities.output_query import OutputFilter, OutputSort
+from src.domain.entities.base import ValidationError
+
+
+def make_output(file_format="png", created_at=datetime(2024, 1, 15)):
+    """Create an output for filter tests."""
+    return Output(
+        id="output-1",
+        filename=f"image.{file_format}",
+        file_path=f"/outputs/image.{file_format}",
+        file_size=1024,
+        created_at=created_at,
+        modified_at=created_at,
+        image_width=512,
+        image_height=512,
+        file_format=file_format
+    )
+
+
+class TestOutputFilter:
+    """Test cases for OutputFilter value object."""
+    
+    def test_empty_filter_matches_everything(self):
+        """Test that a filter without criteria matches any output."""
+        assert OutputFilter().matches(make_output())
+    
+    def test_format_is_normalized(self):
+        """Test that the file format is normalized to lower case."""
+        output_filter = OutputFilter(file_format=" PNG ")
+        
+        assert output_filter.file_format == "png"
+        assert output_filter.matches(make_output("png"))
+        assert not output_filter.matches(make_output("jpg"))
+    
+    def test_date_range(self):
+        """Test matching on an inclusive date range."""
+        output_filter = OutputFilter(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 15)
+        )
+        
+        assert output_filter.matches(make_output(created_at=datetime(2024, 1, 15)))
+        assert not output_filter.matches(make_output(created_at=datetime(2024, 2, 1)))
+    
+    def test_invalid_format(self):
+        """Test validation of unsupported formats."""
+        with pytest.raises(ValidationError) as exc_info:
+            OutputFilter(file_format="gif")
+        
+        assert exc_info.value.field == "file_format"
+    
+    def test_start_after_end(self):
+        """Test validation of an inverted date range."""
+        with pytest.raises(ValidationError) as exc_info:
+            OutputFilter(start_date=datetime(2024, 2, 1), end_date=datetime(2024, 1, 1))
+        
+        assert exc_info.value.field == "date_range"
+
+
+class TestOutputSort:
+    """Test cases for OutputSort value object."""
+    
+    def test_defaults_to_newest_first(self):
+        """Test default sort order."""
+        output_sort = OutputSort()
+        
+        assert output_sort.sort_by == "date"
+        assert output_sort.ascending is False
+    
+    def test_key_functions(self):
+        """Test sort keys for each supported field."""
+        output = make_output()
+        
+        assert OutputSort("date").key(output) == output.created_at
+        assert OutputSort("NAME").key(output) == "image.png"
+        assert OutputSort("size").key(output) == 1024
+    
+    def test_key_functions_are_shared(self):
+        """Test that sort keys are not rebuilt for every sort."""
+        assert OutputSort("date").key is OutputSort("date", ascending=True).key
+    
+    def test_invalid_sort_by(self):
+        """Test validation of unsupported sort fields."""
+        with pytest.raises(ValidationError) as exc_info:
+            OutputSort("invalid")
+        
+        assert "sort_by must be one of" in str(exc_info.value)
+        assert exc_info.value.field == "sort_by"
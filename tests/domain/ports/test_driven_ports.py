@@ -2,7 +2,8 @@
 
 import pytest
 from abc import ABC
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from unittest.mock import Mock
 
 from src.domain.ports.driven import (
     ModelRepositoryPort,
@@ -93,12 +94,46 @@ class TestModelRepositoryPort:
             def delete(self, model_id: str) -> bool:
                 return False
             
-            def get_all_user_tags(self) -> List[str]:
-                return ["tag1", "tag2"]
+            def get_all_user_tags(self) -> Tuple[str, ...]:
+                return ("tag1", "tag2")
         
         # Should be able to instantiate the implementation
         repo = TestModelRepository()
         assert isinstance(repo, ModelRepositoryPort)
+    
+    def test_save_all_default_writes_each_id_once(self):
+        """Test that the default save_all keeps only the last model per ID."""
+        
+        class RecordingModelRepository(ModelRepositoryPort):
+            def __init__(self):
+                self.saved = []
+            
+            def find_all_in_folder(self, folder_id: str) -> List[Model]:
+                return []
+            
+            def find_by_id(self, model_id: str) -> Optional[Model]:
+                return None
+            
+            def search(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
+                return []
+            
+            def save(self, model: Model) -> None:
+                self.saved.append(model)
+            
+            def delete(self, model_id: str) -> bool:
+                return False
+            
+            def get_all_user_tags(self) -> Tuple[str, ...]:
+                return ()
+        
+        first = Mock(id="model-1")
+        second = Mock(id="model-2")
+        replacement = Mock(id="model-1")
+        repo = RecordingModelRepository()
+        
+        repo.save_all([first, second, replacement])
+        
+        assert repo.saved == [replacement, second]
 
 
 class TestFolderRepositoryPort:
@@ -226,13 +261,13 @@ class TestExternalMetadataPort:
         from src.domain.entities.external_metadata import CivitAIMetadata, HuggingFaceMetadata
         
         class TestExternalMetadataAdapter(ExternalMetadataPort):
-            def fetch_metadata(self, identifier: str) -> Optional[ExternalMetadata]:
+            async def fetch_metadata(self, identifier: str) -> Optional[ExternalMetadata]:
                 return None
             
-            def fetch_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
+            async def fetch_civitai_metadata(self, model_hash: str) -> Optional[CivitAIMetadata]:
                 return None
             
-            def fetch_huggingface_metadata(self, model_name: str) -> Optional[HuggingFaceMetadata]:
+            async def fetch_huggingface_metadata(self, model_name: str) -> Optional[HuggingFaceMetadata]:
                 return None
         
         # Should be able to instantiate the implementation
@@ -315,4 +350,8 @@ class TestCachePort:
         
         # Should be able to instantiate the implementation
         cache = TestCacheAdapter()
-        assert isinstance(cache, CachePort)
\ No newline at end of file
+        assert isinstance(cache, CachePort)
+        
+        # Without prefix support, deleting by prefix is a no-op
+        assert cache.supports_prefix_delete is False
+        assert cache.delete_prefix("metadata:") == 0
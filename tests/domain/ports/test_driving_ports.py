@@ -2,10 +2,10 @@
 
 import pytest
 from abc import ABC
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 
 from src.domain.ports.driving import ModelManagementPort, FolderManagementPort
-from src.domain.entities import Model, Folder
+from src.domain.entities import Model, Folder, FolderSnapshot, BulkUpdateResult
 
 
 def test_model_management_port_is_abstract():
@@ -30,9 +30,13 @@ def test_model_management_port_has_required_methods():
     """Test that ModelManagementPort defines all required abstract methods."""
     required_methods = [
         'get_models_in_folder',
+        'get_models_in_folder_enriched',
+        'stream_models_in_folder',
         'get_model_details', 
+        'get_model_details_bulk',
         'search_models',
         'enrich_model_metadata',
+        'enrich_model_metadata_bulk',
         'update_model_metadata',
         'bulk_update_metadata',
         'get_all_user_tags'
@@ -49,7 +53,8 @@ def test_folder_management_port_has_required_methods():
     required_methods = [
         'get_all_folders',
         'get_folder_by_id',
-        'get_folder_structure'
+        'get_folder_structure',
+        'get_folder_snapshot'
     ]
     
     for method_name in required_methods:
@@ -106,12 +111,12 @@ def test_model_management_port_method_signatures():
     assert annotations['model_ids'] == List[str]
     assert 'metadata' in annotations
     assert annotations['metadata'] == dict
-    assert annotations['return'] == List[Model]
+    assert annotations['return'] == BulkUpdateResult
     
     # Check get_all_user_tags signature
     method = ModelManagementPort.get_all_user_tags
     annotations = method.__annotations__
-    assert annotations['return'] == List[str]
+    assert annotations['return'] == Tuple[str, ...]
 
 
 def test_folder_management_port_method_signatures():
@@ -137,10 +142,20 @@ def test_folder_management_port_method_signatures():
 class MockModelManagementPort(ModelManagementPort):
     """Mock implementation for testing purposes."""
     
-    def get_models_in_folder(self, folder_id: str) -> List[Model]:
+    async def get_models_in_folder(self, folder_id: str) -> List[Model]:
         return []
     
-    def get_model_details(self, model_id: str) -> Model:
+    async def get_models_in_folder_enriched(self, folder_id: str) -> List[Model]:
+        return await self.enrich_model_metadata_bulk(await self.get_models_in_folder(folder_id))
+    
+    async def stream_models_in_folder(self, folder_id: str) -> AsyncIterator[Model]:
+        for model in await self.get_models_in_folder(folder_id):
+            yield model
+    
+    async def get_model_details(self, model_id: str) -> Model:
+        return self._make_model(model_id)
+    
+    def _make_model(self, model_id: str) -> Model:
         from datetime import datetime
         from src.domain.entities.model import ModelType
         return Model(
@@ -155,12 +170,18 @@ class MockModelManagementPort(ModelManagementPort):
             folder_id="test-folder"
         )
     
-    def search_models(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
+    async def get_model_details_bulk(self, model_ids: List[str]) -> Dict[str, Model]:
+        return {model_id: self._make_model(model_id) for model_id in model_ids}
+    
+    async def search_models(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
         return []
     
-    def enrich_model_metadata(self, model: Model) -> Model:
+    async def enrich_model_metadata(self, model: Model) -> Model:
         return model
     
+    async def enrich_model_metadata_bulk(self, models: List[Model]) -> List[Model]:
+        return [await self.enrich_model_metadata(model) for model in models]
+    
     def update_model_metadata(self, model_id: str, metadata: dict) -> Model:
         # Return a mock updated model
         from datetime import datetime
@@ -178,11 +199,11 @@ class MockModelManagementPort(ModelManagementPort):
             user_metadata=metadata
         )
     
-    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> List[Model]:
+    def bulk_update_metadata(self, model_ids: List[str], metadata: dict) -> BulkUpdateResult:
         # Return mock updated models
         from datetime import datetime
         from src.domain.entities.model import ModelType
-        return [
+        return BulkUpdateResult(updated=[
             Model(
                 id=model_id,
                 name=f"Updated Test Model {i}",
@@ -196,10 +217,10 @@ class MockModelManagementPort(ModelManagementPort):
                 user_metadata=metadata
             )
             for i, model_id in enumerate(model_ids)
-        ]
+        ])
     
-    def get_all_user_tags(self) -> List[str]:
-        return ["tag1", "tag2", "test-tag"]
+    def get_all_user_tags(self) -> Tuple[str, ...]:
+        return ("tag1", "tag2", "test-tag")
 
 
 class MockFolderManagementPort(FolderManagementPort):
@@ -219,23 +240,29 @@ class MockFolderManagementPort(FolderManagementPort):
     
     def get_folder_structure(self) -> Dict[str, Folder]:
         return {}
+    
+    def get_folder_snapshot(self) -> FolderSnapshot:
+        return FolderSnapshot.from_folders(self.get_all_folders())
 
 
-def test_can_implement_model_management_port():
+async def test_can_implement_model_management_port():
     """Test that ModelManagementPort can be properly implemented."""
     mock_port = MockModelManagementPort()
     
     # Should be able to call all methods
-    models = mock_port.get_models_in_folder("test-folder")
+    models = await mock_port.get_models_in_folder("test-folder")
     assert isinstance(models, list)
     
-    model = mock_port.get_model_details("test-model")
+    model = await mock_port.get_model_details("test-model")
     assert isinstance(model, Model)
     
-    search_results = mock_port.search_models("test query")
+    models_by_id = await mock_port.get_model_details_bulk(["model1", "model2"])
+    assert set(models_by_id) == {"model1", "model2"}
+    
+    search_results = await mock_port.search_models("test query")
     assert isinstance(search_results, list)
     
-    enriched_model = mock_port.enrich_model_metadata(model)
+    enriched_model = await mock_port.enrich_model_metadata(model)
     assert isinstance(enriched_model, Model)
     
     # Test new methods
@@ -244,12 +271,12 @@ def test_can_implement_model_management_port():
     assert updated_model.user_metadata["rating"] == 5
     
     bulk_updated = mock_port.bulk_update_metadata(["model1", "model2"], {"tag": "bulk"})
-    assert isinstance(bulk_updated, list)
-    assert len(bulk_updated) == 2
-    assert all(isinstance(m, Model) for m in bulk_updated)
+    assert isinstance(bulk_updated, BulkUpdateResult)
+    assert len(bulk_updated.updated) == 2
+    assert all(isinstance(m, Model) for m in bulk_updated.updated)
     
     tags = mock_port.get_all_user_tags()
-    assert isinstance(tags, list)
+    assert isinstance(tags, tuple)
     assert all(isinstance(tag, str) for tag in tags)
 
 
@@ -265,4 +292,7 @@ def test_can_implement_folder_management_port():
     assert isinstance(folder, Folder)
     
     structure = mock_port.get_folder_structure()
-    assert isinstance(structure, dict)
\ No newline at end of file
+    assert isinstance(structure, dict)
+    
+    snapshot = mock_port.get_folder_snapshot()
+    assert isinstance(snapshot, FolderSnapshot)
\ No newline at end of file
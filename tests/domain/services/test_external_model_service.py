@@ -1,11 +1,16 @@
 """Tests for external model service."""
 
+import asyncio
+import base64
 import pytest
+import threading
 from unittest.mock import AsyncMock, MagicMock
+from dataclasses import replace
 from datetime import datetime
 from src.domain.services.external_model_service import ExternalModelService
 from src.domain.ports.driven.external_model_port import (
     ExternalModelPort, 
+    CachedResponse, 
     ExternalAPIError, 
     RateLimitError, 
     PlatformUnavailableError
@@ -14,9 +19,11 @@ from src.domain.entities.external_model import (
     ExternalModel,
     ExternalPlatform,
     ComfyUIModelType,
-    ComfyUICompatibility
+    ComfyUICompatibility,
+    PlatformInfo
 )
 from src.domain.entities.base import ValidationError, NotFoundError
+from src.adapters.driven.file_cache_adapter import FileCacheAdapter
 
 
 class TestExternalModelService:
@@ -113,6 +120,100 @@ class TestExternalModelService:
         # Should be called once for each platform
         assert mock_external_model_port.search_models.call_count == 2
     
+    async def test_search_models_queries_platforms_concurrently(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that platforms are searched concurrently and failures are skipped."""
+        both_started = asyncio.Event()
+        started = []
+        
+        async def search(platform, query, limit, offset, filters):
+            started.append(platform)
+            if len(started) == 2:
+                both_started.set()
+            # Only completes if the other platform's search runs at the same time
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            if platform == ExternalPlatform.CIVITAI:
+                raise RateLimitError("civitai", retry_after=60)
+            return [sample_external_model]
+        
+        mock_external_model_port.search_models.side_effect = search
+        mock_external_model_port.get_supported_platforms.return_value = [
+            ExternalPlatform.CIVITAI,
+            ExternalPlatform.HUGGINGFACE
+        ]
+        
+        result = await external_model_service.search_models(query="test")
+        
+        assert result["platforms_searched"] == ["huggingface"]
+        assert len(result["models"]) == 1
+    
+    async def test_search_models_retries_rate_limited_platform_once(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that a short Retry-After is waited out and the call retried."""
+        mock_external_model_port.search_models.side_effect = [
+            RateLimitError("civitai", retry_after=0),
+            [sample_external_model],
+        ]
+        
+        result = await external_model_service.search_models(platform=ExternalPlatform.CIVITAI)
+        
+        assert result["platforms_searched"] == ["civitai"]
+        assert mock_external_model_port.search_models.call_count == 2
+    
+    async def test_search_models_limits_concurrency_per_platform(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that concurrent searches respect the platform's max_concurrent."""
+        mock_external_model_port.get_platform_capabilities.return_value = {
+            "rate_limits": {"max_concurrent": 1}
+        }
+        active = []
+        max_active = 0
+        
+        async def search(platform, query, limit, offset, filters):
+            nonlocal max_active
+            active.append(platform)
+            max_active = max(max_active, len(active))
+            await asyncio.sleep(0)
+            active.remove(platform)
+            return [sample_external_model]
+        
+        mock_external_model_port.search_models.side_effect = search
+        
+        await asyncio.gather(*(
+            external_model_service.search_models(platform=ExternalPlatform.CIVITAI, query=str(i))
+            for i in range(3)
+        ))
+        
+        assert max_active == 1
+        assert mock_external_model_port.search_models.call_count == 3
+    
+    async def test_get_comfyui_compatible_models_skips_unsupported_platforms(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that platforms without a ComfyUI filter are not queried."""
+        mock_external_model_port.get_supported_platforms.return_value = [
+            ExternalPlatform.CIVITAI,
+            ExternalPlatform.HUGGINGFACE
+        ]
+        mock_external_model_port.get_platform_capabilities.side_effect = lambda platform: {
+            "supports_comfyui_filter": platform == ExternalPlatform.CIVITAI
+        }
+        mock_external_model_port.search_models.return_value = [sample_external_model]
+        
+        result = await external_model_service.get_comfyui_compatible_models(model_type="checkpoint")
+        
+        assert result["platforms_searched"] == ["civitai"]
+        mock_external_model_port.search_models.assert_called_once_with(
+            platform=ExternalPlatform.CIVITAI,
+            query="",
+            limit=20,
+            offset=0,
+            filters={"comfyui_compatible": True, "model_type": "checkpoint"}
+        )
+    
     async def test_search_models_invalid_limit(self, external_model_service):
         """Test search models with invalid limit."""
         with pytest.raises(ValidationError) as exc_info:
@@ -121,6 +222,131 @@ class TestExternalModelService:
         assert "limit must be between 1 and 100" in str(exc_info.value)
         assert exc_info.value.field == "limit"
     
+    async def test_search_models_cursor_pagination(self, external_model_service, mock_external_model_port, sample_external_model):
+        """Test that next_cursor resumes where the previous page ended."""
+        # Arrange
+        catalog = [sample_external_model] * 3
+        mock_external_model_port.search_models.side_effect = (
+            lambda platform, query, limit, offset, filters: catalog[offset:offset + limit]
+        )
+        
+        # Act
+        first_page = await external_model_service.search_models(
+            platform=ExternalPlatform.CIVITAI,
+            limit=2
+        )
+        second_page = await external_model_service.search_models(
+            platform=ExternalPlatform.CIVITAI,
+            limit=2,
+            cursor=first_page["next_cursor"]
+        )
+        
+        # Assert
+        assert first_page["has_more"] is True
+        assert first_page["next_offset"] == 2
+        assert first_page["next_cursor"] is not None
+        assert len(second_page["models"]) == 1
+        assert second_page["has_more"] is False
+        assert second_page["next_cursor"] is None
+        assert mock_external_model_port.search_models.call_args.kwargs["offset"] == 2
+    
+    async def test_search_models_cursor_tracks_platform_offsets(self, external_model_service, mock_external_model_port, sample_external_model):
+        """Test that the cursor advances each platform by its own consumed results."""
+        # Arrange
+        hf_model = ExternalModel(
+            id="huggingface:test/model",
+            name="HF Model",
+            description="A Hugging Face model",
+            author="HFAuthor",
+            platform=ExternalPlatform.HUGGINGFACE,
+            thumbnail_url=None,
+            tags=[],
+            download_count=10,
+            rating=None,
+            created_at=datetime(2023, 1, 1),
+            updated_at=datetime(2023, 1, 2),
+            metadata={},
+            comfyui_compatibility=sample_external_model.comfyui_compatibility
+        )
+        catalogs = {
+            ExternalPlatform.CIVITAI: [sample_external_model] * 3,
+            ExternalPlatform.HUGGINGFACE: [hf_model] * 3,
+        }
+        mock_external_model_port.get_supported_platforms.return_value = list(catalogs)
+        mock_external_model_port.search_models.side_effect = (
+            lambda platform, query, limit, offset, filters: catalogs[platform][offset:offset + limit]
+        )
+        
+        # Act
+        first_page = await external_model_service.search_models(limit=2)
+        await external_model_service.search_models(limit=2, cursor=first_page["next_cursor"])
+        
+        # Assert
+        assert [m.platform for m in first_page["models"]] == [ExternalPlatform.CIVITAI] * 2
+        assert first_page["has_more"] is True
+        # Only the cursor can resume several platforms at once
+        assert first_page["next_offset"] is None
+        offsets = {
+            c.kwargs["platform"]: c.kwargs["offset"]
+            for c in mock_external_model_port.search_models.call_args_list[-2:]
+        }
+        assert offsets == {ExternalPlatform.CIVITAI: 2, ExternalPlatform.HUGGINGFACE: 0}
+    
+    async def test_search_models_invalid_cursor(self, external_model_service, mock_external_model_port, sample_external_model):
+        """Test search models with a malformed or mismatched cursor."""
+        mock_external_model_port.search_models.return_value = [sample_external_model] * 3
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.search_models(cursor="not-a-cursor")
+        assert exc_info.value.field == "cursor"
+        
+        page = await external_model_service.search_models(
+            platform=ExternalPlatform.CIVITAI,
+            limit=1
+        )
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.search_models(
+                platform=ExternalPlatform.HUGGINGFACE,
+                cursor=page["next_cursor"]
+            )
+        assert exc_info.value.field == "cursor"
+        
+        legacy_cursor = external_model_service._encode_cursor({"civitai": 1}, None).encode("ascii")
+        legacy_cursor = base64.urlsafe_b64encode(
+            base64.urlsafe_b64decode(legacy_cursor).replace(b'"v":2', b'"v":1')
+        ).decode("ascii")
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.search_models(cursor=legacy_cursor)
+        assert "version" in str(exc_info.value)
+    
+    def test_sort_models_by_relevance_multi_token_query(self, external_model_service, sample_external_model):
+        """Test that models matching more query tokens rank higher."""
+        # Arrange
+        models = [
+            replace(sample_external_model, id=f"civitai:{i}", name=name, description="Checkpoint", tags=[])
+            for i, name in enumerate(["Realistic Vision", "Anime Base", "Style Anime Mix"])
+        ]
+        
+        # Act
+        result = external_model_service._sort_models_by_relevance(models, "anime style")
+        
+        # Assert
+        assert [model.name for model in result] == ["Style Anime Mix", "Anime Base", "Realistic Vision"]
+    
+    def test_sort_models_with_limit_matches_full_sort(self, external_model_service, sample_external_model):
+        """Test that ranking only the top models gives the full ranking's prefix."""
+        # Arrange
+        models = [
+            replace(sample_external_model, id=f"civitai:{i}", download_count=count)
+            for i, count in enumerate([500, 90000, 2000, 2000, 70000, 10])
+        ]
+        
+        # Act & Assert
+        for query in ("", "test"):
+            full = external_model_service._sort_models_by_relevance(models, query)
+            top = external_model_service._sort_models_by_relevance(models, query, limit=3)
+            assert top == full[:3]
+    
     async def test_search_models_invalid_offset(self, external_model_service):
         """Test search models with invalid offset."""
         with pytest.raises(ValidationError) as exc_info:
@@ -132,7 +358,9 @@ class TestExternalModelService:
     async def test_get_model_details_success(self, external_model_service, mock_external_model_port, sample_external_model):
         """Test getting model details successfully."""
         # Arrange
-        mock_external_model_port.get_model_details.return_value = sample_external_model
+        mock_external_model_port.get_model_details_conditional.return_value = CachedResponse(
+            value=sample_external_model
+        )
         
         # Act
         result = await external_model_service.get_model_details(
@@ -144,15 +372,70 @@ class TestExternalModelService:
         assert result.id == "civitai:12345"
         assert result.name == "Test Model"
         
-        mock_external_model_port.get_model_details.assert_called_once_with(
+        mock_external_model_port.get_model_details_conditional.assert_called_once_with(
             ExternalPlatform.CIVITAI, 
-            "12345"
+            "12345",
+            etag=None,
+            last_modified=None
         )
     
+    async def test_get_model_details_accepts_platform_value(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that a platform given by its string value is normalized."""
+        mock_external_model_port.get_model_details_conditional.return_value = CachedResponse(
+            value=sample_external_model
+        )
+        
+        await external_model_service.get_model_details("CivitAI", "12345")
+        
+        call = mock_external_model_port.get_model_details_conditional.call_args
+        assert call.args[0] is ExternalPlatform.CIVITAI
+    
+    async def test_get_model_details_rejects_unknown_platform(self, external_model_service):
+        """Test that an unknown platform value raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.get_model_details("unknown", "12345")
+        
+        assert exc_info.value.field == "platform"
+    
+    async def test_get_model_details_reuses_model_when_not_modified(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that a 304 response reuses the previously fetched model."""
+        mock_external_model_port.get_model_details_conditional.side_effect = [
+            CachedResponse(value=sample_external_model, etag='"v1"'),
+            CachedResponse(value=None, etag='"v1"', not_modified=True),
+        ]
+        
+        first = await external_model_service.get_model_details(ExternalPlatform.CIVITAI, "12345")
+        second = await external_model_service.get_model_details(ExternalPlatform.CIVITAI, "12345")
+        
+        assert second is first
+        second_call = mock_external_model_port.get_model_details_conditional.call_args_list[1]
+        assert second_call.kwargs["etag"] == '"v1"'
+    
+    async def test_get_model_details_conditional_entries_are_bounded(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that stored validators are evicted least recently used first."""
+        external_model_service.MAX_CONDITIONAL_ENTRIES = 2
+        mock_external_model_port.get_model_details_conditional.return_value = CachedResponse(
+            value=sample_external_model, etag='"v1"'
+        )
+        
+        for model_id in ["1", "2", "3"]:
+            await external_model_service.get_model_details(ExternalPlatform.CIVITAI, model_id)
+        
+        assert list(external_model_service._model_details_responses) == [
+            (ExternalPlatform.CIVITAI, "2"),
+            (ExternalPlatform.CIVITAI, "3"),
+        ]
+    
     async def test_get_model_details_not_found(self, external_model_service, mock_external_model_port):
         """Test getting model details when model is not found."""
         # Arrange
-        mock_external_model_port.get_model_details.return_value = None
+        mock_external_model_port.get_model_details_conditional.return_value = CachedResponse(value=None)
         
         # Act & Assert
         with pytest.raises(NotFoundError) as exc_info:
@@ -198,6 +481,117 @@ class TestExternalModelService:
             model_type="checkpoint"
         )
     
+    async def test_get_popular_models_fast_path_cancels_slow_platforms(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that the fast path stops waiting once enough models arrived."""
+        slow_platform_cancelled = asyncio.Event()
+        
+        async def popular(platform, limit, model_type):
+            if platform == ExternalPlatform.HUGGINGFACE:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    slow_platform_cancelled.set()
+                    raise
+            return [sample_external_model]
+        
+        mock_external_model_port.get_popular_models.side_effect = popular
+        mock_external_model_port.get_supported_platforms.return_value = [
+            ExternalPlatform.CIVITAI, ExternalPlatform.HUGGINGFACE
+        ]
+        
+        result = await asyncio.wait_for(
+            external_model_service.get_popular_models(limit=1, fast_path=True), timeout=1
+        )
+        
+        assert [model.id for model in result] == ["civitai:12345"]
+        await asyncio.wait_for(slow_platform_cancelled.wait(), timeout=1)
+    
+    async def test_get_popular_models_skips_failing_platform(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that a failing platform does not hide other platforms' results."""
+        async def popular(platform, limit, model_type):
+            if platform == ExternalPlatform.HUGGINGFACE:
+                raise PlatformUnavailableError("huggingface")
+            return [sample_external_model]
+        
+        mock_external_model_port.get_popular_models.side_effect = popular
+        mock_external_model_port.get_supported_platforms.return_value = [
+            ExternalPlatform.CIVITAI, ExternalPlatform.HUGGINGFACE
+        ]
+        
+        result = await external_model_service.get_popular_models(limit=10)
+        
+        assert [model.id for model in result] == ["civitai:12345"]
+        assert mock_external_model_port.get_popular_models.call_count == 2
+    
+    async def test_get_landing_page(self, external_model_service, mock_external_model_port, sample_external_model):
+        """Test that the landing page reuses popular results for suggestions."""
+        mock_external_model_port.get_popular_models.return_value = [sample_external_model]
+        mock_external_model_port.get_recent_models.return_value = [sample_external_model]
+        
+        result = await external_model_service.get_landing_page(
+            platform=ExternalPlatform.CIVITAI,
+            limits={"popular": 5, "suggestions": 10}
+        )
+        
+        assert set(result) == {"popular", "recent", "suggestions"}
+        assert result["suggestions"] == result["popular"] == [sample_external_model]
+        mock_external_model_port.get_popular_models.assert_called_once_with(
+            platform=ExternalPlatform.CIVITAI,
+            limit=10,
+            model_type=None
+        )
+        mock_external_model_port.get_recent_models.assert_called_once_with(
+            platform=ExternalPlatform.CIVITAI,
+            limit=20,
+            model_type=None
+        )
+    
+    async def test_get_landing_page_invalid_limits(self, external_model_service):
+        """Test landing page limit validation."""
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.get_landing_page(limits={"trending": 5})
+        assert exc_info.value.field == "limits"
+        
+        with pytest.raises(ValidationError):
+            await external_model_service.get_landing_page(limits={"suggestions": 51})
+    
+    async def test_context_manager_closes_port(self, mock_external_model_port):
+        """Test leaving the service context closes the external model port."""
+        async with ExternalModelService(mock_external_model_port):
+            pass
+        
+        mock_external_model_port.close.assert_awaited_once()
+    
+    async def test_get_recent_models_merges_platforms_by_recency(
+        self, external_model_service, mock_external_model_port, sample_external_model
+    ):
+        """Test that per-platform results are merged newest first."""
+        def model_updated_on(platform, day):
+            return replace(
+                sample_external_model,
+                id=f"{platform.value}:{day}",
+                platform=platform,
+                updated_at=datetime(2023, 1, day)
+            )
+        
+        recent = {
+            ExternalPlatform.CIVITAI: [model_updated_on(ExternalPlatform.CIVITAI, day) for day in (9, 5, 2)],
+            # Out of order to check that each platform's list is not trusted blindly
+            ExternalPlatform.HUGGINGFACE: [model_updated_on(ExternalPlatform.HUGGINGFACE, day) for day in (3, 8)],
+        }
+        mock_external_model_port.get_supported_platforms.return_value = list(recent)
+        mock_external_model_port.get_recent_models.side_effect = (
+            lambda platform, limit, model_type: recent[platform]
+        )
+        
+        result = await external_model_service.get_recent_models(limit=4)
+        
+        assert [model.updated_at.day for model in result] == [9, 8, 5, 3]
+    
     async def test_get_recent_models(self, external_model_service, mock_external_model_port, sample_external_model):
         """Test getting recent models."""
         # Arrange
@@ -255,6 +649,141 @@ class TestExternalModelService:
         # Assert - Should return False when API fails
         assert result is False
     
+    async def test_check_model_availability_bulk(self, external_model_service, mock_external_model_port):
+        """Test checking availability of several models concurrently."""
+        # Arrange
+        async def availability(platform, model_id):
+            if model_id == "broken":
+                raise ExternalAPIError("API error", platform.value)
+            return model_id != "gone"
+        
+        mock_external_model_port.check_model_availability.side_effect = availability
+        items = [
+            (ExternalPlatform.CIVITAI, "12345"),
+            (ExternalPlatform.CIVITAI, "gone"),
+            (ExternalPlatform.HUGGINGFACE, "broken"),
+            (ExternalPlatform.CIVITAI, "12345"),
+        ]
+        
+        # Act
+        result = await external_model_service.check_model_availability_bulk(items)
+        
+        # Assert
+        assert result == {
+            (ExternalPlatform.CIVITAI, "12345"): True,
+            (ExternalPlatform.CIVITAI, "gone"): False,
+            (ExternalPlatform.HUGGINGFACE, "broken"): False,
+        }
+        assert mock_external_model_port.check_model_availability.call_count == 3
+    
+    async def test_check_model_availability_bulk_invalid_items(self, external_model_service):
+        """Test bulk availability check with invalid items."""
+        with pytest.raises(ValidationError) as exc_info:
+            await external_model_service.check_model_availability_bulk([])
+        assert exc_info.value.field == "items"
+        
+        with pytest.raises(ValidationError):
+            await external_model_service.check_model_availability_bulk([("unknown", "123")])
+    
+    async def test_popular_models_are_served_from_cache(self, mock_external_model_port, sample_external_model, tmp_path):
+        """Test repeated queries hit the cache instead of the external port."""
+        # Arrange
+        service = ExternalModelService(mock_external_model_port, cache_port=FileCacheAdapter(str(tmp_path)))
+        mock_external_model_port.get_popular_models.return_value = [sample_external_model]
+        
+        # Act
+        first = await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5)
+        second = await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5)
+        
+        # Assert
+        assert [m.id for m in second] == [m.id for m in first] == ["civitai:12345"]
+        assert second[0].created_at == sample_external_model.created_at
+        assert mock_external_model_port.get_popular_models.call_count == 1
+    
+    async def test_fast_path_results_are_not_cached(self, mock_external_model_port, sample_external_model, tmp_path):
+        """Test that a possibly truncated fast-path result never reaches the cache."""
+        service = ExternalModelService(mock_external_model_port, cache_port=FileCacheAdapter(str(tmp_path)))
+        mock_external_model_port.get_popular_models.return_value = [sample_external_model]
+        mock_external_model_port.get_recent_models.return_value = [sample_external_model]
+        
+        await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5, fast_path=True)
+        await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5)
+        assert mock_external_model_port.get_popular_models.call_count == 2
+        
+        # Once the complete result is cached, fast-path calls are served from it
+        await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5, fast_path=True)
+        await service.get_recent_models(platform=ExternalPlatform.CIVITAI, limit=5, fast_path=True)
+        await service.get_recent_models(platform=ExternalPlatform.CIVITAI, limit=5, fast_path=True)
+        assert mock_external_model_port.get_popular_models.call_count == 2
+        assert mock_external_model_port.get_recent_models.call_count == 2
+    
+    async def test_cache_io_runs_off_event_loop(self, mock_external_model_port, sample_external_model, tmp_path):
+        """Test that file cache reads and writes do not run on the loop thread."""
+        cache = FileCacheAdapter(str(tmp_path))
+        threads = set()
+        
+        def record(method):
+            def wrapper(*args, **kwargs):
+                threads.add(threading.get_ident())
+                return method(*args, **kwargs)
+            return wrapper
+        
+        cache.get = record(cache.get)
+        cache.set = record(cache.set)
+        service = ExternalModelService(mock_external_model_port, cache_port=cache)
+        mock_external_model_port.get_popular_models.return_value = [sample_external_model]
+        
+        await service.get_popular_models(platform=ExternalPlatform.CIVITAI, limit=5)
+        
+        assert threads and threading.get_ident() not in threads
+    
+    async def test_cached_call_resolves_platforms_on_event_loop(self, mock_external_model_port,
+                                                                sample_external_model, tmp_path):
+        """Test that platform lookups stay on the loop thread and invalid platforms still raise."""
+        service = ExternalModelService(mock_external_model_port, cache_port=FileCacheAdapter(str(tmp_path)))
+        mock_external_model_port.get_popular_models.return_value = [sample_external_model]
+        threads = []
+        
+        def supported_platforms():
+            threads.append(threading.get_ident())
+            return [ExternalPlatform.CIVITAI]
+        
+        mock_external_model_port.get_supported_platforms.side_effect = supported_platforms
+        
+        await service.get_popular_models(limit=5)
+        
+        assert threads == [threading.get_ident()]
+        with pytest.raises(ValidationError):
+            await service.search_models(platform="unknown", query="test")
+    
+    async def test_cache_ttl_override_zero_bypasses_cache(self, mock_external_model_port, sample_external_model, tmp_path):
+        """Test cache_ttl_seconds=0 always queries the external port."""
+        service = ExternalModelService(mock_external_model_port, cache_port=FileCacheAdapter(str(tmp_path)))
+        mock_external_model_port.search_models.return_value = [sample_external_model]
+        
+        await service.search_models(platform=ExternalPlatform.CIVITAI, query="test", cache_ttl_seconds=0)
+        await service.search_models(platform=ExternalPlatform.CIVITAI, query="test", cache_ttl_seconds=0)
+        
+        assert mock_external_model_port.search_models.call_count == 2
+    
+    async def test_clear_cache_for_platform(self, mock_external_model_port, sample_external_model, tmp_path):
+        """Test clearing a platform's cache only invalidates queries involving it."""
+        # Arrange
+        service = ExternalModelService(mock_external_model_port, cache_port=FileCacheAdapter(str(tmp_path)))
+        mock_external_model_port.search_models.return_value = [sample_external_model]
+        
+        await service.search_models(platform=ExternalPlatform.CIVITAI, query="test")
+        await service.search_models(platform=ExternalPlatform.HUGGINGFACE, query="test")
+        assert mock_external_model_port.search_models.call_count == 2
+        
+        # Act
+        service.clear_cache_for_platform(ExternalPlatform.CIVITAI)
+        await service.search_models(platform=ExternalPlatform.CIVITAI, query="test")
+        await service.search_models(platform=ExternalPlatform.HUGGINGFACE, query="test")
+        
+        # Assert - only the CivitAI query went back to the external port
+        assert mock_external_model_port.search_models.call_count == 3
+    
     def test_get_supported_platforms(self, external_model_service, mock_external_model_port):
         """Test getting supported platforms."""
         # Arrange
@@ -268,6 +797,42 @@ class TestExternalModelService:
         assert result == expected_platforms
         mock_external_model_port.get_supported_platforms.assert_called_once()
     
+    def test_platforms_and_capabilities_are_cached(self, external_model_service, mock_external_model_port):
+        """Test that platform lookups reuse cached results until invalidated."""
+        # Arrange
+        mock_external_model_port.get_supported_platforms.return_value = [ExternalPlatform.CIVITAI]
+        mock_external_model_port.get_platform_capabilities.return_value = {"search": True}
+        
+        # Act
+        external_model_service.get_supported_platforms()
+        external_model_service.get_supported_platforms()
+        external_model_service.get_platform_info(ExternalPlatform.CIVITAI)
+        external_model_service.get_platform_info(ExternalPlatform.CIVITAI)
+        external_model_service.invalidate_platforms_cache()
+        external_model_service.get_supported_platforms()
+        external_model_service.get_platform_info(ExternalPlatform.CIVITAI)
+        
+        # Assert
+        assert mock_external_model_port.get_supported_platforms.call_count == 2
+        assert mock_external_model_port.get_platform_capabilities.call_count == 2
+    
+    def test_platforms_cache_expires(self, external_model_service, mock_external_model_port, monkeypatch):
+        """Test that the cached platform list is refetched after its TTL."""
+        # Arrange
+        mock_external_model_port.get_supported_platforms.return_value = [ExternalPlatform.CIVITAI]
+        now = [1000.0]
+        monkeypatch.setattr(
+            "src.domain.services.external_model_service.time.monotonic", lambda: now[0]
+        )
+        
+        # Act
+        external_model_service.get_supported_platforms()
+        now[0] += ExternalModelService.PLATFORMS_CACHE_TTL
+        external_model_service.get_supported_platforms()
+        
+        # Assert
+        assert mock_external_model_port.get_supported_platforms.call_count == 2
+    
     def test_get_platform_info(self, external_model_service, mock_external_model_port):
         """Test getting platform information."""
         # Arrange
@@ -281,11 +846,14 @@ class TestExternalModelService:
         result = external_model_service.get_platform_info(ExternalPlatform.CIVITAI)
         
         # Assert
-        assert result["name"] == "civitai"
-        assert result["display_name"] == "Civitai"
-        assert result["capabilities"] == mock_capabilities
-        assert result["is_available"] is True
-        assert isinstance(result["supported_model_types"], list)
+        assert isinstance(result, PlatformInfo)
+        assert result.name == "civitai"
+        assert result.display_name == "Civitai"
+        assert result.capabilities == mock_capabilities
+        assert result.rate_limits == {"requests_per_minute": 60}
+        assert result.is_available is True
+        assert isinstance(result.supported_model_types, list)
+        assert result.to_dict()["name"] == "civitai"
         
         mock_external_model_port.get_platform_capabilities.assert_called_once_with(
             ExternalPlatform.CIVITAI
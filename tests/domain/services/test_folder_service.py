@@ -12,7 +12,10 @@ from src.domain.entities.base import ValidationError, NotFoundError
 @pytest.fixture
 def mock_folder_repository():
     """Mock folder repository for testing."""
-    return Mock()
+    repository = Mock()
+    # Folder lookups build the snapshot from the listing first
+    repository.get_all_folders.return_value = []
+    return repository
 
 
 @pytest.fixture
@@ -172,4 +175,108 @@ class TestFolderService:
         assert result == folder_structure
         assert result["parent-1"].is_root_folder
         assert not result["child-1"].is_root_folder
-        assert result["child-1"].parent_folder_id == "parent-1"
\ No newline at end of file
+        assert result["child-1"].parent_folder_id == "parent-1"
+    
+    def test_get_folder_snapshot_is_cached(self, mock_folder_repository, sample_folder):
+        """Test that the folder snapshot is built once and shared by reference."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        service = FolderService(mock_folder_repository)
+        
+        first = service.get_folder_snapshot()
+        second = service.get_folder_snapshot()
+        
+        assert first is second
+        assert first.ids == ("folder-1",)
+        mock_folder_repository.get_all_folders.assert_called_once()
+    
+    def test_invalidate_folder_snapshot_rebuilds(self, mock_folder_repository, sample_folder):
+        """Test that invalidating the snapshot forces a rebuild."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        service = FolderService(mock_folder_repository)
+        
+        first = service.get_folder_snapshot()
+        service.invalidate_folder_snapshot()
+        second = service.get_folder_snapshot()
+        
+        assert first is not second
+        assert mock_folder_repository.get_all_folders.call_count == 2
+    
+    def test_get_folder_snapshot_expires(self, mock_folder_repository, sample_folder):
+        """Test that an expired snapshot is rebuilt."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        service = FolderService(mock_folder_repository, snapshot_ttl_seconds=0)
+        
+        first = service.get_folder_snapshot()
+        second = service.get_folder_snapshot()
+        
+        assert first is not second
+    
+    def test_get_folder_by_id_builds_snapshot_on_demand(self, mock_folder_repository, sample_folder):
+        """Test that folder lookups build and then reuse the snapshot."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        service = FolderService(mock_folder_repository)
+        
+        first = service.get_folder_by_id("folder-1")
+        second = service.get_folder_by_id("folder-1")
+        
+        assert first == second == sample_folder
+        mock_folder_repository.get_all_folders.assert_called_once()
+        mock_folder_repository.find_by_id.assert_not_called()
+    
+    def test_get_folder_by_id_falls_back_on_snapshot_miss(self, mock_folder_repository, sample_folder):
+        """Test that folders missing from the snapshot are looked up in the repository."""
+        new_folder = Folder(
+            id="folder-9",
+            name="VAE",
+            path="/path/to/vae",
+            model_type=ModelType.VAE
+        )
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        mock_folder_repository.find_by_id.return_value = new_folder
+        service = FolderService(mock_folder_repository)
+        service.get_folder_snapshot()
+        
+        result = service.get_folder_by_id("folder-9")
+        
+        assert result == new_folder
+        mock_folder_repository.find_by_id.assert_called_once_with("folder-9")
+    
+    def test_get_all_folders_cached_while_change_token_matches(self, mock_folder_repository, sample_folder):
+        """Test that folders are rescanned only when the change token changes."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        mock_folder_repository.get_change_token.return_value = ("root", 1)
+        service = FolderService(mock_folder_repository)
+        
+        service.get_all_folders()
+        result = service.get_all_folders()
+        
+        assert result == [sample_folder]
+        mock_folder_repository.get_all_folders.assert_called_once()
+        
+        mock_folder_repository.get_change_token.return_value = ("root", 2)
+        service.get_all_folders()
+        
+        assert mock_folder_repository.get_all_folders.call_count == 2
+    
+    def test_get_all_folders_not_cached_without_change_token(self, mock_folder_repository, sample_folder):
+        """Test that repositories without a change token are read every call."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        mock_folder_repository.get_change_token.return_value = None
+        service = FolderService(mock_folder_repository)
+        
+        service.get_all_folders()
+        service.get_all_folders()
+        
+        assert mock_folder_repository.get_all_folders.call_count == 2
+    
+    def test_get_folder_snapshot_rebuilt_when_change_token_changes(self, mock_folder_repository, sample_folder):
+        """Test that a change token change invalidates the snapshot."""
+        mock_folder_repository.get_all_folders.return_value = [sample_folder]
+        mock_folder_repository.get_change_token.return_value = ("root", 1)
+        service = FolderService(mock_folder_repository)
+        
+        first = service.get_folder_snapshot()
+        mock_folder_repository.get_change_token.return_value = ("root", 2)
+        second = service.get_folder_snapshot()
+        
+        assert first is not second
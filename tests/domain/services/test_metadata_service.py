@@ -1,8 +1,11 @@
 """Unit tests for MetadataService."""
 
+import asyncio
+import threading
+import time
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.domain.services.metadata_service import MetadataService
 from src.domain.entities.model import Model, ModelType
@@ -13,13 +16,13 @@ from src.domain.entities.base import ValidationError
 @pytest.fixture
 def mock_civitai_port():
     """Mock CivitAI metadata port for testing."""
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_huggingface_port():
     """Mock HuggingFace metadata port for testing."""
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -106,44 +109,44 @@ class TestMetadataService:
         assert service._cache_port == mock_cache_port
         assert service._cache_ttl == 7200
     
-    def test_enrich_metadata_none_model(self):
+    async def test_enrich_metadata_none_model(self):
         """Test enrich_metadata with None model raises ValidationError."""
         service = MetadataService()
         
         with pytest.raises(ValidationError) as exc_info:
-            service.enrich_metadata(None)
+            await service.enrich_metadata(None)
         
         assert exc_info.value.field == "model"
     
-    def test_enrich_metadata_no_hash(self, sample_model):
+    async def test_enrich_metadata_no_hash(self, sample_model):
         """Test enrich_metadata with model that has no hash."""
         sample_model.hash = ""
         service = MetadataService()
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is None
     
-    def test_enrich_metadata_no_ports(self, sample_model):
+    async def test_enrich_metadata_no_ports(self, sample_model):
         """Test enrich_metadata with no external ports configured."""
         service = MetadataService()
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is None
     
-    def test_enrich_metadata_cached_result(self, sample_model, sample_external_metadata, mock_cache_port):
+    async def test_enrich_metadata_cached_result(self, sample_model, sample_external_metadata, mock_cache_port):
         """Test enrich_metadata returns cached result when available."""
         mock_cache_port.get.return_value = sample_external_metadata.to_dict()
         service = MetadataService(cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.model_hash == sample_external_metadata.model_hash
         mock_cache_port.get.assert_called_once_with("metadata:abc123")
     
-    def test_enrich_metadata_expired_cache(self, sample_model, sample_external_metadata, mock_cache_port):
+    async def test_enrich_metadata_expired_cache(self, sample_model, sample_external_metadata, mock_cache_port):
         """Test enrich_metadata handles expired cache correctly."""
         # Create expired metadata
         expired_metadata = ExternalMetadata(
@@ -155,13 +158,74 @@ class TestMetadataService:
         mock_cache_port.get.return_value = expired_metadata.to_dict()
         service = MetadataService(cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         # Should delete expired cache and return None (no external ports)
         assert result is None
         mock_cache_port.delete.assert_called_once_with("metadata:abc123")
     
-    def test_enrich_metadata_civitai_only(self, sample_model, sample_civitai_metadata, 
+    async def test_cache_lookup_runs_off_the_event_loop(self, sample_model, mock_cache_port):
+        """Test that the blocking cache read does not run on the event loop thread."""
+        lookup_threads = []
+        mock_cache_port.get.side_effect = lambda key: lookup_threads.append(threading.get_ident())
+        service = MetadataService(cache_port=mock_cache_port)
+        
+        await service.enrich_metadata(sample_model)
+        
+        assert lookup_threads and lookup_threads[0] != threading.get_ident()
+    
+    async def test_expired_cache_entry_is_not_deserialized(self, sample_model, sample_external_metadata,
+                                                     mock_cache_port):
+        """Test that a stale entry is rejected from its header alone."""
+        cached_data = {
+            "v": 1,
+            "cached_at_epoch": time.time() - 7200,
+            "payload": sample_external_metadata.to_dict(),
+        }
+        mock_cache_port.get.return_value = cached_data
+        service = MetadataService(cache_port=mock_cache_port)
+        
+        with patch.object(ExternalMetadata, "from_dict") as from_dict:
+            result = await service.enrich_metadata(sample_model)
+        
+        assert result is None
+        from_dict.assert_not_called()
+        mock_cache_port.delete.assert_called_once_with("metadata:abc123")
+    
+    async def test_cache_entry_stores_epoch(self, sample_model, sample_civitai_metadata,
+                                      mock_civitai_port, mock_cache_port):
+        """Test that cached metadata records its fetch time as a timestamp."""
+        mock_civitai_port.fetch_metadata.return_value = ExternalMetadata(
+            model_hash="abc123",
+            civitai=sample_civitai_metadata
+        )
+        mock_cache_port.get.return_value = None
+        service = MetadataService(civitai_port=mock_civitai_port, cache_port=mock_cache_port)
+        
+        result = await service.enrich_metadata(sample_model)
+        
+        cached_data = mock_cache_port.set.call_args.args[1]
+        assert cached_data["v"] == 1
+        assert cached_data["cached_at_epoch"] == pytest.approx(result.cached_at.timestamp())
+        assert cached_data["payload"]["model_hash"] == "abc123"
+    
+    async def test_cache_entry_with_unknown_version_is_discarded(self, sample_model,
+                                                           sample_external_metadata,
+                                                           mock_cache_port):
+        """Test that entries written in an unknown format are not deserialized."""
+        mock_cache_port.get.return_value = {
+            "v": 99,
+            "cached_at_epoch": time.time(),
+            "payload": sample_external_metadata.to_dict(),
+        }
+        service = MetadataService(cache_port=mock_cache_port)
+        
+        result = await service.enrich_metadata(sample_model)
+        
+        assert result is None
+        mock_cache_port.delete.assert_called_once_with("metadata:abc123")
+    
+    async def test_enrich_metadata_civitai_only(self, sample_model, sample_civitai_metadata, 
                                         mock_civitai_port, mock_cache_port):
         """Test enrich_metadata with CivitAI metadata only."""
         civitai_external = ExternalMetadata(
@@ -173,14 +237,14 @@ class TestMetadataService:
         
         service = MetadataService(civitai_port=mock_civitai_port, cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.civitai == sample_civitai_metadata
         assert result.huggingface is None
         mock_cache_port.set.assert_called_once()
     
-    def test_enrich_metadata_huggingface_only(self, sample_model, sample_huggingface_metadata,
+    async def test_enrich_metadata_huggingface_only(self, sample_model, sample_huggingface_metadata,
                                             mock_huggingface_port, mock_cache_port):
         """Test enrich_metadata with HuggingFace metadata only."""
         hf_external = ExternalMetadata(
@@ -188,19 +252,19 @@ class TestMetadataService:
             huggingface=sample_huggingface_metadata
         )
         mock_huggingface_port.fetch_metadata.return_value = hf_external
-        mock_huggingface_port.fetch_huggingface_metadata = Mock(return_value=None)
+        mock_huggingface_port.fetch_huggingface_metadata = AsyncMock(return_value=None)
         mock_cache_port.get.return_value = None
         
         service = MetadataService(huggingface_port=mock_huggingface_port, cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.huggingface == sample_huggingface_metadata
         assert result.civitai is None
         mock_cache_port.set.assert_called_once()
     
-    def test_enrich_metadata_both_sources(self, sample_model, sample_civitai_metadata,
+    async def test_enrich_metadata_both_sources(self, sample_model, sample_civitai_metadata,
                                         sample_huggingface_metadata, mock_civitai_port,
                                         mock_huggingface_port, mock_cache_port):
         """Test enrich_metadata with both CivitAI and HuggingFace metadata."""
@@ -215,7 +279,7 @@ class TestMetadataService:
         
         mock_civitai_port.fetch_metadata.return_value = civitai_external
         mock_huggingface_port.fetch_metadata.return_value = hf_external
-        mock_huggingface_port.fetch_huggingface_metadata = Mock(return_value=None)
+        mock_huggingface_port.fetch_huggingface_metadata = AsyncMock(return_value=None)
         mock_cache_port.get.return_value = None
         
         service = MetadataService(
@@ -224,48 +288,98 @@ class TestMetadataService:
             cache_port=mock_cache_port
         )
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.civitai == sample_civitai_metadata
         assert result.huggingface == sample_huggingface_metadata
         mock_cache_port.set.assert_called_once()
     
-    def test_enrich_metadata_external_service_failure(self, sample_model, mock_civitai_port):
+    async def test_enrich_metadata_external_service_failure(self, sample_model, mock_civitai_port):
         """Test enrich_metadata handles external service failures gracefully."""
         mock_civitai_port.fetch_metadata.side_effect = Exception("API Error")
         service = MetadataService(civitai_port=mock_civitai_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         # Should return None when all external services fail
         assert result is None
     
-    def test_enrich_metadata_specific_civitai_method(self, sample_model, sample_civitai_metadata,
+    async def test_enrich_metadata_coalesces_concurrent_fetches(self, sample_model, sample_civitai_metadata,
+                                                              mock_civitai_port):
+        """Test that concurrent enrich_metadata calls for one hash share a single fetch."""
+        release_fetch = asyncio.Event()
+        
+        async def slow_fetch(model_hash):
+            await release_fetch.wait()
+            return ExternalMetadata(model_hash=model_hash, civitai=sample_civitai_metadata)
+        
+        mock_civitai_port.fetch_metadata.side_effect = slow_fetch
+        service = MetadataService(civitai_port=mock_civitai_port)
+        
+        calls = [asyncio.create_task(service.enrich_metadata(sample_model)) for _ in range(4)]
+        await asyncio.sleep(0)
+        release_fetch.set()
+        results = await asyncio.gather(*calls)
+        
+        assert all(result.civitai == sample_civitai_metadata for result in results)
+        mock_civitai_port.fetch_metadata.assert_called_once_with("abc123")
+    
+    async def test_enrich_metadata_fetches_sources_concurrently(self, sample_model, sample_civitai_metadata,
+                                                               sample_huggingface_metadata,
+                                                               mock_civitai_port, mock_huggingface_port):
+        """Test that CivitAI and HuggingFace are queried at the same time."""
+        started = []
+        both_started = asyncio.Event()
+        
+        async def wait_for_other_source(source):
+            started.append(source)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+        
+        async def fetch_civitai(model_hash):
+            await wait_for_other_source("civitai")
+            return ExternalMetadata(model_hash=model_hash, civitai=sample_civitai_metadata)
+        
+        async def fetch_huggingface(model_name):
+            await wait_for_other_source("huggingface")
+            return sample_huggingface_metadata
+        
+        mock_civitai_port.fetch_metadata.side_effect = fetch_civitai
+        mock_huggingface_port.fetch_huggingface_metadata.side_effect = fetch_huggingface
+        service = MetadataService(civitai_port=mock_civitai_port, huggingface_port=mock_huggingface_port)
+        
+        result = await service.enrich_metadata(sample_model)
+        
+        assert result.civitai == sample_civitai_metadata
+        assert result.huggingface == sample_huggingface_metadata
+    
+    async def test_enrich_metadata_specific_civitai_method(self, sample_model, sample_civitai_metadata,
                                                    mock_civitai_port, mock_cache_port):
         """Test enrich_metadata uses specific CivitAI method when available."""
         mock_civitai_port.fetch_metadata.return_value = None
-        mock_civitai_port.fetch_civitai_metadata = Mock(return_value=sample_civitai_metadata)
+        mock_civitai_port.fetch_civitai_metadata = AsyncMock(return_value=sample_civitai_metadata)
         mock_cache_port.get.return_value = None
         
         service = MetadataService(civitai_port=mock_civitai_port, cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.civitai == sample_civitai_metadata
         mock_civitai_port.fetch_civitai_metadata.assert_called_once_with("abc123")
     
-    def test_enrich_metadata_specific_huggingface_method(self, sample_model, sample_huggingface_metadata,
+    async def test_enrich_metadata_specific_huggingface_method(self, sample_model, sample_huggingface_metadata,
                                                        mock_huggingface_port, mock_cache_port):
         """Test enrich_metadata uses specific HuggingFace method when available."""
         mock_huggingface_port.fetch_metadata.return_value = None
-        mock_huggingface_port.fetch_huggingface_metadata = Mock(return_value=sample_huggingface_metadata)
+        mock_huggingface_port.fetch_huggingface_metadata = AsyncMock(return_value=sample_huggingface_metadata)
         mock_cache_port.get.return_value = None
         
         service = MetadataService(huggingface_port=mock_huggingface_port, cache_port=mock_cache_port)
         
-        result = service.enrich_metadata(sample_model)
+        result = await service.enrich_metadata(sample_model)
         
         assert result is not None
         assert result.huggingface == sample_huggingface_metadata
@@ -314,7 +428,43 @@ class TestMetadataService:
         
         service.clear_cache()
         
-        mock_cache_port.clear.assert_called_once()
+        mock_cache_port.delete_prefix.assert_called_once_with("metadata:")
+        mock_cache_port.clear.assert_not_called()
+    
+    async def test_clear_cache_deletes_tracked_keys_without_prefix_support(
+        self, sample_model, sample_external_metadata, mock_civitai_port, mock_cache_port
+    ):
+        """Test clear_cache deletes only the keys it wrote when prefixes are unsupported."""
+        mock_civitai_port.fetch_metadata.return_value = sample_external_metadata
+        mock_cache_port.get.return_value = None
+        mock_cache_port.supports_prefix_delete = False
+        service = MetadataService(civitai_port=mock_civitai_port, cache_port=mock_cache_port)
+        await service.enrich_metadata(sample_model)
+        
+        service.clear_cache()
+        
+        mock_cache_port.delete.assert_called_once_with("metadata:abc123")
+        mock_cache_port.delete_prefix.assert_not_called()
+        mock_cache_port.clear.assert_not_called()
+    
+    def test_clear_cache_tolerates_keys_added_while_clearing(
+        self, sample_external_metadata, mock_cache_port
+    ):
+        """Test that a key cached during clear_cache neither breaks it nor is lost."""
+        mock_cache_port.supports_prefix_delete = False
+        service = MetadataService(cache_port=mock_cache_port)
+        service._cache_metadata("abc123", sample_external_metadata)
+        service._cache_metadata("def456", sample_external_metadata)
+        
+        # Another thread caches metadata while the tracked keys are deleted
+        mock_cache_port.delete.side_effect = (
+            lambda key: service._cache_metadata("ghi789", sample_external_metadata)
+        )
+        service.clear_cache()
+        
+        deleted = {call.args[0] for call in mock_cache_port.delete.call_args_list}
+        assert deleted == {"metadata:abc123", "metadata:def456"}
+        assert service._tracked_keys == {"metadata:ghi789"}
     
     def test_clear_cache_no_cache_port(self):
         """Test clear_cache without cache port."""
@@ -323,9 +473,17 @@ class TestMetadataService:
         # Should not raise an exception
         service.clear_cache()
     
+    async def test_aclose_closes_each_port_once(self, mock_civitai_port):
+        """Test aclose closes the metadata ports, sharing a port only once."""
+        service = MetadataService(civitai_port=mock_civitai_port, huggingface_port=mock_civitai_port)
+        
+        await service.aclose()
+        
+        mock_civitai_port.close.assert_awaited_once()
+    
     def test_clear_cache_failure(self, mock_cache_port):
         """Test clear_cache handles failures gracefully."""
-        mock_cache_port.clear.side_effect = Exception("Cache error")
+        mock_cache_port.delete_prefix.side_effect = Exception("Cache error")
         service = MetadataService(cache_port=mock_cache_port)
         
         # Should not raise an exception
@@ -1,13 +1,41 @@
 """Unit tests for ModelService."""
 
+import threading
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
 from src.domain.services.model_service import ModelService
 from src.domain.entities.model import Model, ModelType
 from src.domain.entities.external_metadata import ExternalMetadata, CivitAIMetadata
 from src.domain.entities.base import ValidationError, NotFoundError
+from src.domain.ports.driven.model_repository_port import ModelRepositoryPort
+
+
+class InMemoryModelRepository(ModelRepositoryPort):
+    """Dict-backed model repository that stores what it is given."""
+    
+    def __init__(self, models: List[Model]):
+        self._models: Dict[str, Model] = {model.id: model for model in models}
+    
+    def find_all_in_folder(self, folder_id: str) -> List[Model]:
+        return [model for model in self._models.values() if model.folder_id == folder_id]
+    
+    def find_by_id(self, model_id: str) -> Optional[Model]:
+        return self._models.get(model_id)
+    
+    def search(self, query: str, folder_id: Optional[str] = None) -> List[Model]:
+        return [model for model in self._models.values() if query.lower() in model.name.lower()]
+    
+    def save(self, model: Model) -> None:
+        self._models[model.id] = model
+    
+    def delete(self, model_id: str) -> bool:
+        return self._models.pop(model_id, None) is not None
+    
+    def get_all_user_tags(self) -> Tuple[str, ...]:
+        return ()
 
 
 @pytest.fixture
@@ -19,7 +47,7 @@ def mock_model_repository():
 @pytest.fixture
 def mock_external_metadata_port():
     """Mock external metadata port for testing."""
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -70,83 +98,126 @@ class TestModelService:
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         assert service._model_repository == mock_model_repository
         assert service._external_metadata_port == mock_external_metadata_port
-    
-    def test_get_models_in_folder_success(self, mock_model_repository, sample_model):
+
+    def test_service_is_slotted(self, mock_model_repository):
+        """Test that the service stores its state in slots, not an instance dict."""
+        service = ModelService(mock_model_repository)
+        assert not hasattr(service, "__dict__")
+
+    async def test_get_models_in_folder_success(self, mock_model_repository, sample_model):
         """Test successful retrieval of models in folder."""
         mock_model_repository.find_all_in_folder.return_value = [sample_model]
         service = ModelService(mock_model_repository)
         
-        result = service.get_models_in_folder("folder-1")
+        result = await service.get_models_in_folder("folder-1")
         
         assert result == [sample_model]
         mock_model_repository.find_all_in_folder.assert_called_once_with("folder-1")
     
-    def test_get_models_in_folder_empty_folder_id(self, mock_model_repository):
+    async def test_get_models_in_folder_empty_folder_id(self, mock_model_repository):
         """Test get_models_in_folder with empty folder_id raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.get_models_in_folder("")
+            await service.get_models_in_folder("")
         
         assert exc_info.value.field == "folder_id"
         assert "cannot be empty" in exc_info.value.message
     
-    def test_get_models_in_folder_whitespace_folder_id(self, mock_model_repository):
+    async def test_get_models_in_folder_whitespace_folder_id(self, mock_model_repository):
         """Test get_models_in_folder with whitespace folder_id raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.get_models_in_folder("   ")
+            await service.get_models_in_folder("   ")
         
         assert exc_info.value.field == "folder_id"
     
-    def test_get_models_in_folder_strips_whitespace(self, mock_model_repository, sample_model):
+    async def test_get_models_in_folder_strips_whitespace(self, mock_model_repository, sample_model):
         """Test get_models_in_folder strips whitespace from folder_id."""
         mock_model_repository.find_all_in_folder.return_value = [sample_model]
         service = ModelService(mock_model_repository)
         
-        service.get_models_in_folder("  folder-1  ")
+        await service.get_models_in_folder("  folder-1  ")
         
         mock_model_repository.find_all_in_folder.assert_called_once_with("folder-1")
     
-    def test_get_model_details_success(self, mock_model_repository, sample_model):
+    async def test_stream_models_in_folder_success(self, mock_model_repository, sample_model):
+        """Test streaming models in a folder yields repository models lazily."""
+        mock_model_repository.iter_in_folder.return_value = iter([sample_model])
+        service = ModelService(mock_model_repository)
+        
+        result = [model async for model in service.stream_models_in_folder("  folder-1  ")]
+        
+        assert result == [sample_model]
+        mock_model_repository.iter_in_folder.assert_called_once_with("folder-1")
+    
+    async def test_stream_models_in_folder_scans_off_event_loop(self, mock_model_repository, sample_model):
+        """Test that the repository scan runs in the executor, in batches."""
+        loop_thread = threading.get_ident()
+        scan_threads = []
+        
+        def scan():
+            for _ in range(ModelService.STREAM_BATCH_SIZE + 1):
+                scan_threads.append(threading.get_ident())
+                yield sample_model
+        
+        mock_model_repository.iter_in_folder.return_value = scan()
+        service = ModelService(mock_model_repository)
+        
+        result = [model async for model in service.stream_models_in_folder("folder-1")]
+        
+        assert len(result) == ModelService.STREAM_BATCH_SIZE + 1
+        assert loop_thread not in scan_threads
+    
+    async def test_stream_models_in_folder_empty_folder_id(self, mock_model_repository):
+        """Test stream_models_in_folder with empty folder_id raises ValidationError."""
+        service = ModelService(mock_model_repository)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await service.stream_models_in_folder("").__anext__()
+        
+        assert exc_info.value.field == "folder_id"
+        mock_model_repository.iter_in_folder.assert_not_called()
+    
+    async def test_get_model_details_success(self, mock_model_repository, sample_model):
         """Test successful retrieval of model details."""
         mock_model_repository.find_by_id.return_value = sample_model
         service = ModelService(mock_model_repository)
         
-        result = service.get_model_details("model-1")
+        result = await service.get_model_details("model-1")
         
         assert result == sample_model
         mock_model_repository.find_by_id.assert_called_once_with("model-1")
     
-    def test_get_model_details_not_found(self, mock_model_repository):
+    async def test_get_model_details_not_found(self, mock_model_repository):
         """Test get_model_details when model is not found."""
         mock_model_repository.find_by_id.return_value = None
         service = ModelService(mock_model_repository)
         
         with pytest.raises(NotFoundError) as exc_info:
-            service.get_model_details("nonexistent")
+            await service.get_model_details("nonexistent")
         
         assert exc_info.value.entity_type == "Model"
         assert exc_info.value.identifier == "nonexistent"
     
-    def test_get_model_details_empty_model_id(self, mock_model_repository):
+    async def test_get_model_details_empty_model_id(self, mock_model_repository):
         """Test get_model_details with empty model_id raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.get_model_details("")
+            await service.get_model_details("")
         
         assert exc_info.value.field == "model_id"
     
-    def test_get_model_details_with_enrichment(self, mock_model_repository, mock_external_metadata_port, 
+    async def test_get_model_details_with_enrichment(self, mock_model_repository, mock_external_metadata_port, 
                                              sample_model, sample_external_metadata):
         """Test get_model_details with metadata enrichment."""
         mock_model_repository.find_by_id.return_value = sample_model
         mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.get_model_details("model-1")
+        result = await service.get_model_details("model-1")
         
         # Should have external metadata in user_metadata
         assert "external_metadata" in result.user_metadata
@@ -157,72 +228,228 @@ class TestModelService:
         assert "test" in result.user_metadata["tags"]
         assert "model" in result.user_metadata["tags"]
     
-    def test_get_model_details_enrichment_fails_gracefully(self, mock_model_repository, 
+    async def test_get_model_details_skips_enrichment_when_fresh(self, mock_external_metadata_port,
+                                                        sample_model, sample_external_metadata):
+        """Test get_model_details reuses an enrichment made within the TTL."""
+        repository = InMemoryModelRepository([sample_model])
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        service = ModelService(repository, mock_external_metadata_port)
+        
+        first = await service.get_model_details("model-1")
+        second = await service.get_model_details("model-1")
+        
+        assert second is first
+        assert "external_metadata" in second.user_metadata
+        assert set(second.user_metadata) <= {"external_metadata", "tags", "description"}
+        assert "external_metadata" not in repository.find_by_id("model-1").user_metadata
+        assert mock_external_metadata_port.fetch_metadata.await_count == 1
+    
+    async def test_get_model_details_reenriches_after_ttl_or_change(self, mock_external_metadata_port,
+                                                           sample_model, sample_external_metadata):
+        """Test get_model_details enriches again once the TTL passes or the model changes."""
+        repository = InMemoryModelRepository([sample_model])
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        
+        expired = ModelService(repository, mock_external_metadata_port, enrichment_ttl_seconds=0)
+        first = await expired.get_model_details("model-1")
+        assert await expired.get_model_details("model-1") is not first
+        
+        service = ModelService(repository, mock_external_metadata_port)
+        await service.get_model_details("model-1")
+        service.update_model_metadata("model-1", {"rating": 5})
+        updated = await service.get_model_details("model-1")
+        
+        assert updated.user_metadata["rating"] == 5
+        assert "external_metadata" in updated.user_metadata
+    
+    async def test_get_model_details_enrichment_fails_gracefully(self, mock_model_repository, 
                                                          mock_external_metadata_port, sample_model):
         """Test get_model_details falls back gracefully when enrichment fails."""
         mock_model_repository.find_by_id.return_value = sample_model
         mock_external_metadata_port.fetch_metadata.side_effect = Exception("API Error")
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.get_model_details("model-1")
+        result = await service.get_model_details("model-1")
         
         # Should return original model when enrichment fails
         assert result == sample_model
+
+    async def test_get_model_details_does_not_hide_merge_errors(self, mock_model_repository,
+                                                        mock_external_metadata_port, sample_model):
+        """Test that only lookup failures are swallowed, not errors merging the metadata."""
+        broken_metadata = Mock()
+        broken_metadata.to_dict.side_effect = RuntimeError("bug")
+        mock_model_repository.find_by_id.return_value = sample_model
+        mock_external_metadata_port.fetch_metadata.return_value = broken_metadata
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+
+        with pytest.raises(RuntimeError):
+            await service.get_model_details("model-1")
+
+    async def test_get_model_details_bulk_success(self, mock_model_repository, sample_model):
+        """Test bulk retrieval resolves all IDs with a single repository call."""
+        mock_model_repository.find_by_ids.return_value = {"model-1": sample_model}
+        service = ModelService(mock_model_repository)
+        
+        result = await service.get_model_details_bulk([" model-1 ", "model-1", "missing"])
+        
+        assert result == {"model-1": sample_model}
+        mock_model_repository.find_by_ids.assert_called_once_with(["model-1", "missing"])
+        mock_model_repository.find_by_id.assert_not_called()
+    
+    async def test_get_model_details_bulk_with_enrichment(self, mock_model_repository, mock_external_metadata_port,
+                                                    sample_model, sample_external_metadata):
+        """Test bulk retrieval enriches each found model."""
+        mock_model_repository.find_by_ids.return_value = {"model-1": sample_model}
+        mock_external_metadata_port.fetch_metadata_bulk.return_value = {
+            sample_model.hash: sample_external_metadata
+        }
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        result = await service.get_model_details_bulk(["model-1"])
+        
+        assert "external_metadata" in result["model-1"].user_metadata
+    
+    async def test_enrich_model_metadata_bulk_fetches_each_hash_once(self, mock_model_repository,
+                                                               mock_external_metadata_port,
+                                                               sample_model, sample_external_metadata):
+        """Test bulk enrichment issues one bulk fetch for distinct hashes."""
+        unknown_model = Model(
+            id="model-2",
+            name="Unknown Model",
+            file_path="/path/to/unknown.safetensors",
+            file_size=2048,
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            modified_at=datetime(2024, 1, 1, 12, 0, 0),
+            model_type=ModelType.LORA,
+            hash="def456",
+            folder_id="folder-1"
+        )
+        mock_external_metadata_port.fetch_metadata_bulk.return_value = {
+            sample_model.hash: sample_external_metadata
+        }
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        result = await service.enrich_model_metadata_bulk([sample_model, unknown_model, sample_model])
+        
+        assert [model.id for model in result] == ["model-1", "model-2", "model-1"]
+        assert "external_metadata" in result[0].user_metadata
+        assert result[1] is unknown_model
+        mock_external_metadata_port.fetch_metadata_bulk.assert_called_once_with(["abc123", "def456"])
+        mock_external_metadata_port.fetch_metadata.assert_not_called()
+    
+    async def test_get_models_in_folder_enriched_uses_one_bulk_fetch(self, mock_model_repository,
+                                                              mock_external_metadata_port,
+                                                              sample_model, sample_external_metadata):
+        """Test that a folder is enriched through a single bulk metadata fetch."""
+        mock_model_repository.find_all_in_folder.return_value = [sample_model]
+        mock_external_metadata_port.fetch_metadata_bulk.return_value = {
+            sample_model.hash: sample_external_metadata
+        }
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        result = await service.get_models_in_folder_enriched("folder-1")
+        
+        assert "external_metadata" in result[0].user_metadata
+        mock_external_metadata_port.fetch_metadata_bulk.assert_called_once_with(["abc123"])
+        mock_external_metadata_port.fetch_metadata.assert_not_called()
+    
+    async def test_enrich_model_metadata_bulk_invalid_models(self, mock_model_repository):
+        """Test bulk enrichment rejects non-list input."""
+        service = ModelService(mock_model_repository)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await service.enrich_model_metadata_bulk(None)
+        assert exc_info.value.field == "models"
     
-    def test_search_models_success(self, mock_model_repository, sample_model):
+    async def test_get_model_details_bulk_invalid_ids(self, mock_model_repository):
+        """Test bulk retrieval with invalid ID lists raises ValidationError."""
+        service = ModelService(mock_model_repository)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await service.get_model_details_bulk([])
+        assert exc_info.value.field == "model_ids"
+        
+        with pytest.raises(ValidationError):
+            await service.get_model_details_bulk(["model-1", ""])
+    
+    async def test_search_models_success(self, mock_model_repository, sample_model):
         """Test successful model search."""
         mock_model_repository.search.return_value = [sample_model]
         service = ModelService(mock_model_repository)
         
-        result = service.search_models("test query")
+        result = await service.search_models("test query")
         
         assert result == [sample_model]
         mock_model_repository.search.assert_called_once_with("test query", None)
     
-    def test_search_models_with_folder_filter(self, mock_model_repository, sample_model):
+    async def test_search_models_with_folder_filter(self, mock_model_repository, sample_model):
         """Test model search with folder filter."""
         mock_model_repository.search.return_value = [sample_model]
         service = ModelService(mock_model_repository)
         
-        result = service.search_models("test query", "folder-1")
+        result = await service.search_models("test query", "folder-1")
         
         assert result == [sample_model]
         mock_model_repository.search.assert_called_once_with("test query", "folder-1")
     
-    def test_search_models_empty_query(self, mock_model_repository):
+    async def test_search_models_empty_query(self, mock_model_repository):
         """Test search_models with empty query raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.search_models("")
+            await service.search_models("")
         
         assert exc_info.value.field == "query"
     
-    def test_search_models_empty_folder_id(self, mock_model_repository):
+    async def test_search_models_empty_folder_id(self, mock_model_repository):
         """Test search_models with empty folder_id raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.search_models("test", "")
+            await service.search_models("test", "")
         
         assert exc_info.value.field == "folder_id"
     
-    def test_search_models_strips_whitespace(self, mock_model_repository, sample_model):
+    async def test_search_models_strips_whitespace(self, mock_model_repository, sample_model):
         """Test search_models strips whitespace from parameters."""
         mock_model_repository.search.return_value = [sample_model]
         service = ModelService(mock_model_repository)
         
-        service.search_models("  test query  ", "  folder-1  ")
+        await service.search_models("  test query  ", "  folder-1  ")
         
         mock_model_repository.search.assert_called_once_with("test query", "folder-1")
     
-    def test_enrich_model_metadata_success(self, mock_model_repository, mock_external_metadata_port,
+    async def test_search_models_paginated(self, mock_model_repository, sample_model):
+        """Test search_models asks the repository for a single page."""
+        mock_model_repository.search_page.return_value = [sample_model]
+        service = ModelService(mock_model_repository)
+        
+        result = await service.search_models("test", limit=10, offset=20)
+        
+        assert result == [sample_model]
+        mock_model_repository.search_page.assert_called_once_with("test", None, 10, 20)
+        mock_model_repository.search.assert_not_called()
+    
+    async def test_search_models_invalid_pagination(self, mock_model_repository):
+        """Test search_models rejects a non-positive limit and a negative offset."""
+        service = ModelService(mock_model_repository)
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await service.search_models("test", limit=0)
+        assert exc_info.value.field == "limit"
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await service.search_models("test", offset=-1)
+        assert exc_info.value.field == "offset"
+    
+    async def test_enrich_model_metadata_success(self, mock_model_repository, mock_external_metadata_port,
                                          sample_model, sample_external_metadata):
         """Test successful model metadata enrichment."""
         mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should have external metadata
         assert "external_metadata" in result.user_metadata
@@ -236,36 +463,36 @@ class TestModelService:
         # Should have description from external metadata
         assert result.user_metadata["description"] == "A test model"
     
-    def test_enrich_model_metadata_no_external_port(self, mock_model_repository, sample_model):
+    async def test_enrich_model_metadata_no_external_port(self, mock_model_repository, sample_model):
         """Test enrich_model_metadata without external metadata port."""
         service = ModelService(mock_model_repository)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should return original model unchanged
         assert result == sample_model
     
-    def test_enrich_model_metadata_no_external_data(self, mock_model_repository, mock_external_metadata_port,
+    async def test_enrich_model_metadata_no_external_data(self, mock_model_repository, mock_external_metadata_port,
                                                    sample_model):
         """Test enrich_model_metadata when no external data is found."""
         mock_external_metadata_port.fetch_metadata.return_value = None
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should return original model unchanged
         assert result == sample_model
     
-    def test_enrich_model_metadata_none_model(self, mock_model_repository):
+    async def test_enrich_model_metadata_none_model(self, mock_model_repository):
         """Test enrich_model_metadata with None model raises ValidationError."""
         service = ModelService(mock_model_repository)
         
         with pytest.raises(ValidationError) as exc_info:
-            service.enrich_model_metadata(None)
+            await service.enrich_model_metadata(None)
         
         assert exc_info.value.field == "model"
     
-    def test_enrich_model_metadata_preserves_existing_tags(self, mock_model_repository, 
+    async def test_enrich_model_metadata_preserves_existing_tags(self, mock_model_repository, 
                                                           mock_external_metadata_port,
                                                           sample_model, sample_external_metadata):
         """Test that enrichment preserves existing user tags."""
@@ -275,7 +502,7 @@ class TestModelService:
         mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should have both existing and external tags
         tags = result.user_metadata["tags"]
@@ -284,7 +511,102 @@ class TestModelService:
         assert "test" in tags
         assert "model" in tags
     
-    def test_enrich_model_metadata_preserves_existing_description(self, mock_model_repository,
+    async def test_enrich_model_metadata_reuses_fetched_metadata(self, mock_model_repository,
+                                                         mock_external_metadata_port,
+                                                         sample_model, sample_external_metadata):
+        """Test that metadata is fetched once per hash until invalidated."""
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        await service.enrich_model_metadata(sample_model)
+        await service.enrich_model_metadata(sample_model)
+        assert mock_external_metadata_port.fetch_metadata.await_count == 1
+        
+        service.invalidate_metadata_cache(sample_model.hash)
+        await service.enrich_model_metadata(sample_model)
+        assert mock_external_metadata_port.fetch_metadata.await_count == 2
+    
+    async def test_enrich_model_metadata_retries_after_miss(self, mock_model_repository,
+                                                    mock_external_metadata_port,
+                                                    sample_model, sample_external_metadata):
+        """Test that a miss, e.g. from a transient API error, is not remembered."""
+        mock_external_metadata_port.fetch_metadata.side_effect = [None, sample_external_metadata]
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        first = await service.enrich_model_metadata(sample_model)
+        second = await service.enrich_model_metadata(sample_model)
+        
+        assert first is sample_model
+        assert second.user_metadata["external_metadata"] == sample_external_metadata.to_dict()
+    
+    async def test_enrich_model_metadata_bulk_retries_after_miss(self, mock_model_repository,
+                                                         mock_external_metadata_port,
+                                                         sample_model, sample_external_metadata):
+        """Test that hashes missing from a bulk fetch are fetched again next time."""
+        mock_external_metadata_port.fetch_metadata_bulk.side_effect = [
+            {},
+            {sample_model.hash: sample_external_metadata},
+        ]
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        first = await service.enrich_model_metadata_bulk([sample_model])
+        second = await service.enrich_model_metadata_bulk([sample_model])
+        
+        assert first == [sample_model]
+        assert "external_metadata" in second[0].user_metadata
+        assert mock_external_metadata_port.fetch_metadata_bulk.await_count == 2
+    
+    async def test_enrich_model_metadata_skips_model_without_hash(self, mock_model_repository,
+                                                          mock_external_metadata_port, sample_model):
+        """Test that a model without a hash is returned without a metadata lookup."""
+        sample_model.hash = ""
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        result = await service.enrich_model_metadata(sample_model)
+        
+        assert result is sample_model
+        mock_external_metadata_port.fetch_metadata.assert_not_called()
+        assert not service._metadata_cache
+    
+    async def test_enrich_model_metadata_returns_already_enriched_model(self, mock_model_repository,
+                                                                mock_external_metadata_port,
+                                                                sample_model, sample_external_metadata):
+        """Test that re-enriching a model with the same metadata does not copy it."""
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        enriched = await service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(enriched)
+        
+        assert enriched is not sample_model
+        assert result is enriched
+    
+    async def test_metadata_cache_is_bounded(self, mock_model_repository, mock_external_metadata_port,
+                                             sample_external_metadata):
+        """Test that the least recently used hashes are evicted first."""
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        with patch.object(ModelService, "MAX_METADATA_CACHE_ENTRIES", 2):
+            for model_hash in ["a", "b", "a", "c"]:
+                await service._fetch_metadata_cached(model_hash)
+        
+        assert list(service._metadata_cache) == ["a", "c"]
+    
+    async def test_enrich_model_metadata_merges_tags_in_stable_order(self, mock_model_repository,
+                                                             mock_external_metadata_port,
+                                                             sample_model, sample_external_metadata):
+        """Test that merged tags keep user tags first and drop duplicates."""
+        sample_model.user_metadata["tags"] = ["user_tag", "model"]
+        
+        mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
+        service = ModelService(mock_model_repository, mock_external_metadata_port)
+        
+        result = await service.enrich_model_metadata(sample_model)
+        
+        assert result.user_metadata["tags"] == ["user_tag", "model", "test"]
+    
+    async def test_enrich_model_metadata_preserves_existing_description(self, mock_model_repository,
                                                                 mock_external_metadata_port,
                                                                 sample_model, sample_external_metadata):
         """Test that enrichment preserves existing user description."""
@@ -294,18 +616,18 @@ class TestModelService:
         mock_external_metadata_port.fetch_metadata.return_value = sample_external_metadata
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should keep existing description, not overwrite with external
         assert result.user_metadata["description"] == "Existing user description"
     
-    def test_enrich_model_metadata_fails_gracefully(self, mock_model_repository, mock_external_metadata_port,
+    async def test_enrich_model_metadata_fails_gracefully(self, mock_model_repository, mock_external_metadata_port,
                                                    sample_model):
         """Test that enrichment fails gracefully when external service throws exception."""
         mock_external_metadata_port.fetch_metadata.side_effect = Exception("API Error")
         service = ModelService(mock_model_repository, mock_external_metadata_port)
         
-        result = service.enrich_model_metadata(sample_model)
+        result = await service.enrich_model_metadata(sample_model)
         
         # Should return original model when enrichment fails
         assert result == sample_model
\ No newline at end of file
@@ -156,6 +156,7 @@ class TestUpdateModelMetadata:
         
         assert exc_info.value.field == "tags"
         assert "non-empty string" in exc_info.value.message
+        assert "(tag 1)" in exc_info.value.message
     
     def test_update_model_metadata_invalid_description_type(self, model_service, mock_model_repository, sample_model):
         """Test update with invalid description type."""
@@ -192,6 +193,17 @@ class TestUpdateModelMetadata:
         
         assert exc_info.value.field == "rating"
         assert "must be an integer between 1 and 5" in exc_info.value.message
+    
+    def test_update_model_metadata_rejects_boolean_rating(self, model_service, mock_model_repository, sample_model):
+        """Test that booleans are not accepted as integer ratings."""
+        # Arrange
+        mock_model_repository.find_by_id.return_value = sample_model
+        
+        # Act & Assert
+        with pytest.raises(ValidationError) as exc_info:
+            model_service.update_model_metadata("test-model-1", {"rating": True})
+        
+        assert exc_info.value.field == "rating"
 
 
 class TestBulkUpdateMetadata:
@@ -211,8 +223,7 @@ class TestBulkUpdateMetadata:
             model_type=ModelType.LORA, hash="hash2", folder_id="folder1"
         )
         
-        mock_model_repository.find_by_id.side_effect = lambda id: model1 if id == "model-1" else model2
-        mock_model_repository.save.return_value = None
+        mock_model_repository.find_by_ids.return_value = {"model-1": model1, "model-2": model2}
         
         metadata_update = {"tags": ["bulk", "update"], "rating": 4}
         
@@ -220,10 +231,27 @@ class TestBulkUpdateMetadata:
         result = model_service.bulk_update_metadata(["model-1", "model-2"], metadata_update)
         
         # Assert
-        assert len(result) == 2
-        assert all(model.user_metadata["tags"] == ["bulk", "update"] for model in result)
-        assert all(model.user_metadata["rating"] == 4 for model in result)
-        assert mock_model_repository.save.call_count == 2
+        assert len(result.updated) == 2
+        assert result.failed == []
+        assert all(model.user_metadata["tags"] == ["bulk", "update"] for model in result.updated)
+        assert all(model.user_metadata["rating"] == 4 for model in result.updated)
+        mock_model_repository.find_by_ids.assert_called_once_with(["model-1", "model-2"])
+        mock_model_repository.save_all.assert_called_once_with(result.updated)
+        mock_model_repository.find_by_id.assert_not_called()
+    
+    def test_bulk_update_metadata_deduplicates_ids(self, model_service, mock_model_repository,
+                                                   sample_model):
+        """Test that repeated model IDs are fetched and saved once."""
+        mock_model_repository.find_by_ids.return_value = {"test-model-1": sample_model}
+        
+        result = model_service.bulk_update_metadata(
+            ["test-model-1", " test-model-1", "test-model-1"], {"rating": 5}
+        )
+        
+        assert len(result.updated) == 1
+        assert result.failed == []
+        mock_model_repository.find_by_ids.assert_called_once_with(["test-model-1"])
+        mock_model_repository.save_all.assert_called_once_with(result.updated)
     
     def test_bulk_update_metadata_empty_model_ids(self, model_service):
         """Test bulk update with empty model IDs list."""
@@ -250,25 +278,39 @@ class TestBulkUpdateMetadata:
             model_type=ModelType.CHECKPOINT, hash="hash1", folder_id="folder1"
         )
         
-        def mock_find_by_id(id):
-            if id == "model-1":
-                return model1
-            else:
-                return None
-        
-        mock_model_repository.find_by_id.side_effect = mock_find_by_id
-        mock_model_repository.save.return_value = None
+        mock_model_repository.find_by_ids.return_value = {"model-1": model1}
         
         metadata_update = {"tags": ["bulk", "update"]}
         
         # Act
-        result = model_service.bulk_update_metadata(["model-1", "nonexistent"], metadata_update)
+        result = model_service.bulk_update_metadata(["model-1", "nonexistent", " "], metadata_update)
         
         # Assert
-        assert len(result) == 1  # Only successful update
-        assert result[0].id == "model-1"
-        assert result[0].user_metadata["tags"] == ["bulk", "update"]
-        mock_model_repository.save.assert_called_once()
+        assert len(result.updated) == 1  # Only successful update
+        assert result.updated[0].id == "model-1"
+        assert result.updated[0].user_metadata["tags"] == ["bulk", "update"]
+        assert result.failed_ids == [" ", "nonexistent"]
+        assert result.failed[1]["error"] == "Model not found"
+        mock_model_repository.save_all.assert_called_once_with(result.updated)
+    
+    def test_bulk_update_metadata_removes_cleared_fields(self, model_service, mock_model_repository,
+                                                         sample_model):
+        """Test bulk update drops fields set to None and keeps the rest."""
+        mock_model_repository.find_by_ids.return_value = {"test-model-1": sample_model}
+        
+        result = model_service.bulk_update_metadata(
+            ["test-model-1"], {"description": None, "rating": None}
+        )
+        
+        assert result.updated[0].user_metadata == {"tags": ["existing"]}
+    
+    def test_bulk_update_metadata_invalid_metadata(self, model_service, mock_model_repository):
+        """Test bulk update validates the metadata before touching the repository."""
+        with pytest.raises(ValidationError) as exc_info:
+            model_service.bulk_update_metadata(["model-1"], {"rating": 9})
+        
+        assert exc_info.value.field == "rating"
+        mock_model_repository.find_by_ids.assert_not_called()
 
 
 class TestGetAllUserTags:
@@ -277,24 +319,24 @@ class TestGetAllUserTags:
     def test_get_all_user_tags_success(self, model_service, mock_model_repository):
         """Test successful retrieval of all user tags."""
         # Arrange
-        expected_tags = ["character", "style", "anime", "realistic"]
+        expected_tags = ("anime", "character", "realistic", "style")
         mock_model_repository.get_all_user_tags.return_value = expected_tags
         
         # Act
         result = model_service.get_all_user_tags()
         
         # Assert
-        assert result == expected_tags
+        assert result is expected_tags
         mock_model_repository.get_all_user_tags.assert_called_once()
     
     def test_get_all_user_tags_empty(self, model_service, mock_model_repository):
         """Test retrieval when no user tags exist."""
         # Arrange
-        mock_model_repository.get_all_user_tags.return_value = []
+        mock_model_repository.get_all_user_tags.return_value = ()
         
         # Act
         result = model_service.get_all_user_tags()
         
         # Assert
-        assert result == []
+        assert result == ()
         mock_model_repository.get_all_user_tags.assert_called_once()
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Tests for OutputService domain service."""
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 
@@ -9,6 +10,16 @@ from src.domain.entities.output import Output
 from src.domain.entities.base import ValidationError, NotFoundError
 
 
+def enrich_with(thumbnail_path, workflow_metadata):
+    """Build an enrich_batch side effect that fills in fixed values."""
+    def enrich_batch(outputs):
+        return [
+            replace(output, thumbnail_path=thumbnail_path, workflow_metadata=workflow_metadata)
+            for output in outputs
+        ]
+    return enrich_batch
+
+
 class TestOutputService:
     """Test cases for OutputService."""
     
@@ -52,8 +63,9 @@ class TestOutputService:
     def test_get_all_outputs_with_enrichment(self, output_service, mock_output_repository, sample_output):
         """Test retrieval of outputs with enrichment."""
         mock_output_repository.scan_output_directory.return_value = [sample_output]
-        mock_output_repository.generate_thumbnail.return_value = "/path/to/thumbnail.jpg"
-        mock_output_repository.extract_workflow_metadata.return_value = {"workflow_id": "test"}
+        mock_output_repository.enrich_batch.side_effect = enrich_with(
+            "/path/to/thumbnail.jpg", {"workflow_id": "test"}
+        )
         
         outputs = output_service.get_all_outputs()
         
@@ -61,6 +73,30 @@ class TestOutputService:
         enriched_output = outputs[0]
         assert enriched_output.thumbnail_path == "/path/to/thumbnail.jpg"
         assert enriched_output.workflow_metadata == {"workflow_id": "test"}
+        mock_output_repository.enrich_batch.assert_called_once_with([sample_output])
+    
+    def test_get_all_outputs_enriches_one_at_a_time_after_batch_failure(
+        self, output_service, mock_output_repository, sample_output
+    ):
+        """Test that one unreadable file does not blank enrichment for the whole listing."""
+        broken = replace(sample_output, id="output-2", file_path="/path/to/broken.png")
+        enrich = enrich_with("/path/to/thumbnail.jpg", {"workflow_id": "test"})
+        
+        def enrich_batch(outputs):
+            if any(output.id == broken.id for output in outputs):
+                raise OSError("cannot identify image file")
+            return enrich(outputs)
+        
+        mock_output_repository.scan_output_directory.return_value = [sample_output, broken]
+        mock_output_repository.enrich_batch.side_effect = enrich_batch
+        
+        outputs = output_service.get_all_outputs()
+        
+        assert outputs[0].thumbnail_path == "/path/to/thumbnail.jpg"
+        assert outputs[1] is broken
+        # The failed output is retried on the next listing
+        output_service.get_all_outputs()
+        assert mock_output_repository.enrich_batch.call_args[0][0] == [broken]
     
     def test_get_all_outputs_io_error(self, output_service, mock_output_repository):
         """Test handling of IO error during directory scan."""
@@ -83,6 +119,31 @@ class TestOutputService:
         assert output == sample_output
         mock_output_repository.get_output_by_id.assert_called_once_with("output-1")
     
+    def test_followup_action_reuses_resolved_output(self, output_service, mock_output_repository, sample_output):
+        """Test that an action right after viewing details skips the repository lookup."""
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.show_file_in_folder.return_value = True
+        
+        output_service.get_output_details("output-1")
+        result = output_service.show_in_folder(" output-1 ")
+        
+        assert result is True
+        mock_output_repository.get_output_by_id.assert_called_once_with("output-1")
+        mock_output_repository.show_file_in_folder.assert_called_once_with(sample_output)
+    
+    def test_resolved_output_expires_and_clears_on_refresh(self, output_service, mock_output_repository, sample_output):
+        """Test that resolved outputs are fetched again once stale or after a refresh."""
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.scan_output_directory.return_value = []
+        
+        output_service.get_output_details("output-1")
+        output_service.refresh_outputs()
+        output_service.get_output_details("output-1")
+        output_service.RESOLVED_OUTPUT_TTL_SECONDS = 0
+        output_service.get_output_details("output-1")
+        
+        assert mock_output_repository.get_output_by_id.call_count == 3
+    
     def test_get_output_details_not_found(self, output_service, mock_output_repository):
         """Test handling of output not found."""
         mock_output_repository.get_output_by_id.return_value = None
@@ -101,6 +162,27 @@ class TestOutputService:
         assert "output_id cannot be empty" in str(exc_info.value)
         assert exc_info.value.field == "output_id"
     
+    def test_get_output_details_bulk_success(self, output_service, mock_output_repository, sample_output):
+        """Test bulk retrieval resolves all IDs with a single repository call."""
+        mock_output_repository.get_outputs_by_ids.return_value = {"output-1": sample_output}
+        mock_output_repository.generate_thumbnail.return_value = None
+        mock_output_repository.extract_workflow_metadata.return_value = None
+        
+        outputs = output_service.get_output_details_bulk([" output-1 ", "output-1", "missing"])
+        
+        assert outputs == {"output-1": sample_output}
+        mock_output_repository.get_outputs_by_ids.assert_called_once_with(["output-1", "missing"])
+    
+    def test_get_output_details_bulk_invalid_ids(self, output_service, mock_output_repository):
+        """Test bulk retrieval with invalid ID lists."""
+        with pytest.raises(ValidationError):
+            output_service.get_output_details_bulk([])
+        
+        with pytest.raises(ValidationError):
+            output_service.get_output_details_bulk(["output-1", "  "])
+        
+        mock_output_repository.get_outputs_by_ids.assert_not_called()
+    
     def test_refresh_outputs(self, output_service, mock_output_repository, sample_output):
         """Test refreshing outputs."""
         mock_output_repository.scan_output_directory.return_value = [sample_output]
@@ -139,6 +221,17 @@ class TestOutputService:
         assert "start_date cannot be after end_date" in str(exc_info.value)
         assert exc_info.value.field == "date_range"
     
+    @pytest.mark.parametrize("start_date,end_date,field", [
+        ("2024-01-01", datetime(2024, 1, 2), "start_date"),
+        (datetime(2024, 1, 1), None, "end_date"),
+    ])
+    def test_get_outputs_by_date_range_rejects_non_datetimes(self, output_service, start_date, end_date, field):
+        """Test that the offending date is named when a date is not a datetime."""
+        with pytest.raises(ValidationError) as exc_info:
+            output_service.get_outputs_by_date_range(start_date, end_date)
+        
+        assert exc_info.value.field == field
+    
     def test_get_outputs_by_format_success(self, output_service, mock_output_repository, sample_output):
         """Test successful retrieval of outputs by format."""
         mock_output_repository.get_outputs_by_format.return_value = [sample_output]
@@ -282,7 +375,7 @@ class TestOutputService:
         with pytest.raises(ValidationError) as exc_info:
             output_service.sort_outputs("not a list", "date", ascending=True)
         
-        assert "outputs must be a list" in str(exc_info.value)
+        assert "outputs must be an iterable" in str(exc_info.value)
         assert exc_info.value.field == "outputs"    
 
     def test_load_workflow_success(self, output_service, mock_output_repository, sample_output):
@@ -352,6 +445,45 @@ class TestOutputService:
         
         assert result is False
     
+    def test_open_in_system_viewer_bulk(self, output_service, mock_output_repository, sample_output):
+        """Test opening several outputs with one repository call."""
+        mock_output_repository.get_outputs_by_ids.return_value = {"output-1": sample_output}
+        mock_output_repository.open_files_in_system.return_value = {"output-1": True}
+        
+        result = output_service.open_in_system_viewer_bulk(["output-1", " missing ", "output-1"])
+        
+        assert result == {"output-1": True, "missing": False}
+        mock_output_repository.get_outputs_by_ids.assert_called_once_with(["output-1", "missing"])
+        mock_output_repository.open_files_in_system.assert_called_once_with([sample_output])
+    
+    def test_open_in_system_viewer_bulk_failure(self, output_service, mock_output_repository, sample_output):
+        """Test that a failing bulk open reports every output as not opened."""
+        mock_output_repository.get_outputs_by_ids.return_value = {"output-1": sample_output}
+        mock_output_repository.open_files_in_system.side_effect = Exception("viewer failed")
+        
+        result = output_service.open_in_system_viewer_bulk(["output-1"])
+        
+        assert result == {"output-1": False}
+    
+    def test_open_in_system_viewer_bulk_invalid_ids(self, output_service):
+        """Test bulk open with invalid output IDs."""
+        with pytest.raises(ValidationError) as exc_info:
+            output_service.open_in_system_viewer_bulk([])
+        assert exc_info.value.field == "output_ids"
+        
+        with pytest.raises(ValidationError):
+            output_service.open_in_system_viewer_bulk(["output-1", ""])
+    
+    def test_open_in_system_viewer_bulk_caps_count(self, output_service, mock_output_repository):
+        """Test that one bulk open cannot launch an unbounded number of viewers."""
+        too_many = [f"output-{i}" for i in range(OutputService.MAX_BULK_OPEN + 1)]
+        
+        with pytest.raises(ValidationError) as exc_info:
+            output_service.open_in_system_viewer_bulk(too_many)
+        
+        assert exc_info.value.field == "output_ids"
+        mock_output_repository.open_files_in_system.assert_not_called()
+    
     def test_show_in_folder_success(self, output_service, mock_output_repository, sample_output):
         """Test successful showing in folder."""
         mock_output_repository.get_output_by_id.return_value = sample_output
@@ -379,4 +511,118 @@ class TestOutputService:
         
         result = output_service.show_in_folder("output-1")
         
-        assert result is False
\ No newline at end of file
+        assert result is False
+    
+    def test_enrichment_is_reused_until_file_changes(self, output_service, mock_output_repository,
+                                                     sample_output, tmp_path):
+        """Test that thumbnails and metadata are generated once per file version."""
+        thumbnail = tmp_path / "thumbnail.jpg"
+        thumbnail.write_bytes(b"jpg")
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.enrich_batch.side_effect = enrich_with(
+            str(thumbnail), {"workflow_id": "test"}
+        )
+        
+        first = output_service.get_output_details("output-1")
+        second = output_service.get_output_details("output-1")
+        
+        assert second.thumbnail_path == first.thumbnail_path == str(thumbnail)
+        assert second.workflow_metadata == {"workflow_id": "test"}
+        mock_output_repository.enrich_batch.assert_called_once()
+        assert output_service.get_cache_stats()["hits"] == 1
+        
+        # A new modification time is a new file version
+        output_service.RESOLVED_OUTPUT_TTL_SECONDS = 0
+        mock_output_repository.get_output_by_id.return_value = replace(
+            sample_output, modified_at=datetime(2024, 1, 2, 12, 0, 0)
+        )
+        output_service.get_output_details("output-1")
+        
+        assert mock_output_repository.enrich_batch.call_count == 2
+        assert output_service.get_cache_stats()["misses"] == 2
+    
+    def test_enrichment_cache_is_persisted_through_cache_port(self, mock_output_repository,
+                                                              sample_output, tmp_path):
+        """Test that remembered enrichment survives a restart via the cache port."""
+        thumbnail = tmp_path / "thumbnail.jpg"
+        thumbnail.write_bytes(b"jpg")
+        stored = {}
+        cache_port = Mock()
+        cache_port.get.side_effect = stored.get
+        cache_port.set.side_effect = lambda key, value, ttl=None: stored.__setitem__(key, value)
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.enrich_batch.side_effect = enrich_with(str(thumbnail), {})
+        
+        service = OutputService(mock_output_repository, cache_port=cache_port)
+        service.get_output_details("output-1")
+        service.save_enrichment_cache()
+        
+        restarted = OutputService(mock_output_repository, cache_port=cache_port)
+        output = restarted.get_output_details("output-1")
+        
+        assert output.thumbnail_path == str(thumbnail)
+        mock_output_repository.enrich_batch.assert_called_once()
+        assert cache_port.set.call_args.args[2] == OutputService.ENRICHMENT_CACHE_TTL_SECONDS
+    
+    def test_enrichment_cache_drops_missing_thumbnails(self, mock_output_repository,
+                                                       sample_output, tmp_path):
+        """Test that entries whose thumbnail was deleted are regenerated."""
+        thumbnail = tmp_path / "thumbnail.jpg"
+        thumbnail.write_bytes(b"jpg")
+        stored = {}
+        cache_port = Mock()
+        cache_port.get.side_effect = stored.get
+        cache_port.set.side_effect = lambda key, value, ttl=None: stored.__setitem__(key, value)
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.enrich_batch.side_effect = enrich_with(str(thumbnail), {})
+        
+        service = OutputService(mock_output_repository, cache_port=cache_port)
+        service.get_output_details("output-1")
+        service.save_enrichment_cache()
+        thumbnail.unlink()
+        
+        restarted = OutputService(mock_output_repository, cache_port=cache_port)
+        assert restarted.get_cache_stats()["entries"] == 0
+        
+        # The running service regenerates it on the next lookup too
+        service.RESOLVED_OUTPUT_TTL_SECONDS = 0
+        service.get_output_details("output-1")
+        assert mock_output_repository.enrich_batch.call_count == 2
+    
+    def test_enrichment_cache_ignores_other_versions(self, mock_output_repository):
+        """Test that a blob stored with another layout is not restored."""
+        cache_port = Mock()
+        cache_port.get.return_value = [["/path/a.png", 0.0, 1, None, {}]]
+        
+        service = OutputService(mock_output_repository, cache_port=cache_port)
+        
+        assert service.get_cache_stats()["entries"] == 0
+    
+    def test_cached_workflow_metadata_is_not_shared(self, output_service, mock_output_repository,
+                                                    sample_output):
+        """Test that mutating a returned output's metadata leaves the cache intact."""
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.enrich_batch.side_effect = enrich_with(
+            None, {"workflow": {"nodes": [1]}}
+        )
+        output_service.RESOLVED_OUTPUT_TTL_SECONDS = 0
+        
+        first = output_service.get_output_details("output-1")
+        first.workflow_metadata["workflow"]["nodes"].append(2)
+        second = output_service.get_output_details("output-1")
+        second.workflow_metadata["extra"] = True
+        third = output_service.get_output_details("output-1")
+        
+        assert third.workflow_metadata == {"workflow": {"nodes": [1]}}
+        assert mock_output_repository.enrich_batch.call_count == 1
+    
+    def test_enrichment_returns_same_output_when_nothing_is_added(self, output_service,
+                                                                  mock_output_repository, sample_output):
+        """Test that an output is not copied when enrichment finds nothing new."""
+        mock_output_repository.get_output_by_id.return_value = sample_output
+        mock_output_repository.enrich_batch.side_effect = lambda outputs: list(outputs)
+        
+        assert output_service.get_output_details("output-1") is sample_output
+        # Served from the cache the second time, still without a copy
+        assert output_service.get_output_details("output-1") is sample_output
+        assert output_service.get_cache_stats()["hits"] == 1
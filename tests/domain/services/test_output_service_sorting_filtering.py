@@ -7,6 +7,7 @@ from typing import List
 
 from src.domain.services.output_service import OutputService
 from src.domain.entities.output import Output
+from src.domain.entities.output_query import OutputFilter, OutputSort
 from src.domain.entities.base import ValidationError
 
 
@@ -146,7 +147,7 @@ class TestOutputServiceSortingFiltering:
         with pytest.raises(ValidationError) as exc_info:
             service.sort_outputs("not a list", "date", ascending=True)
         
-        assert "outputs must be a list" in str(exc_info.value)
+        assert "outputs must be an iterable" in str(exc_info.value)
         assert exc_info.value.field == "outputs"
     
     def test_sort_outputs_empty_list(self, service):
@@ -154,6 +155,74 @@ class TestOutputServiceSortingFiltering:
         sorted_outputs = service.sort_outputs([], "date", ascending=True)
         assert sorted_outputs == []
     
+    def test_sort_outputs_with_limit_from_iterator(self, service, sample_outputs):
+        """Test top-N sorting consumes a lazy iterator of outputs."""
+        newest = service.sort_outputs(iter(sample_outputs), "date", ascending=False, limit=2)
+        smallest = service.sort_outputs(iter(sample_outputs), "size", ascending=True, limit=1)
+        
+        assert [o.filename for o in newest] == ["image_c.webp", "image_b.jpg"]
+        assert [o.filename for o in smallest] == ["image_c.webp"]
+    
+    def test_sort_outputs_invalid_limit(self, service, sample_outputs):
+        """Test sorting with a negative limit."""
+        with pytest.raises(ValidationError) as exc_info:
+            service.sort_outputs(sample_outputs, "date", limit=-1)
+        
+        assert exc_info.value.field == "limit"
+    
+    def test_iter_all_outputs_streams_from_repository(self, service, mock_repository, sample_outputs):
+        """Test iterating outputs lazily without populating the cache."""
+        mock_repository.iter_output_directory.return_value = iter(sample_outputs)
+        
+        iterator = service.iter_all_outputs()
+        mock_repository.iter_output_directory.assert_not_called()
+        
+        result = list(iterator)
+        
+        assert [o.id for o in result] == ["output1", "output2", "output3"]
+        assert service._get_from_cache("all_outputs") is None
+    
+    def test_iter_all_outputs_uses_cache(self, service, mock_repository, sample_outputs):
+        """Test iterating outputs serves the cached list when present."""
+        service._set_cache("all_outputs", sample_outputs)
+        
+        result = list(service.iter_all_outputs())
+        
+        assert result == sample_outputs
+        mock_repository.iter_output_directory.assert_not_called()
+    
+    def test_list_outputs_pushes_query_down_when_cache_is_cold(self, service, mock_repository, sample_outputs):
+        """Test listing with a limit queries the repository and enriches only the page."""
+        mock_repository.query_outputs.return_value = [sample_outputs[1], sample_outputs[0]]
+        mock_repository.enrich_batch.side_effect = lambda outputs: list(outputs)
+        output_sort = OutputSort("size", ascending=False)
+        
+        result = service.list_outputs(output_sort=output_sort, limit=2)
+        
+        assert [o.id for o in result] == ["output2", "output1"]
+        mock_repository.query_outputs.assert_called_once_with(OutputFilter(), output_sort, 2)
+        mock_repository.enrich_batch.assert_called_once_with(result)
+        mock_repository.scan_output_directory.assert_not_called()
+    
+    def test_list_outputs_filters_cached_outputs(self, service, mock_repository, sample_outputs):
+        """Test listing applies filter and sort to the cached outputs."""
+        service._set_cache("all_outputs", sample_outputs)
+        
+        result = service.list_outputs(
+            output_filter=OutputFilter(start_date=sample_outputs[1].created_at),
+            output_sort=OutputSort("date", ascending=True)
+        )
+        
+        assert [o.id for o in result] == ["output2", "output3"]
+        mock_repository.iter_output_directory.assert_not_called()
+    
+    def test_list_outputs_invalid_limit(self, service):
+        """Test listing with a negative limit."""
+        with pytest.raises(ValidationError) as exc_info:
+            service.list_outputs(limit=-5)
+        
+        assert exc_info.value.field == "limit"
+    
     def test_get_outputs_by_format_png(self, service, mock_repository, sample_outputs):
         """Test filtering outputs by PNG format."""
         png_outputs = [output for output in sample_outputs if output.file_format == "png"]
@@ -1,8 +1,11 @@
 """Integration tests for complete application setup and dependency injection."""
 
+import asyncio
+import json
 import pytest
 import tempfile
 import shutil
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -194,6 +197,30 @@ class TestDIContainer:
         
         # Cleanup should not raise exceptions
         container.cleanup()
+    
+    def test_container_cleanup_closes_output_repository(self, test_config):
+        """Test that cleanup shuts down the output adapter's enrichment pool."""
+        container = DIContainer(test_config)
+        output_repository = container.get_output_repository()
+        
+        with patch.object(output_repository, "close") as close:
+            container.cleanup()
+        
+        close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_container_aclose_closes_http_adapters(self, test_config):
+        """Test that aclose closes the sessions of every built HTTP adapter."""
+        container = DIContainer(test_config)
+        civitai_adapter = container.get_civitai_adapter()
+        external_model_adapter = container.get_external_model_adapter()
+        
+        with patch.object(civitai_adapter, "close") as civitai_close, \
+                patch.object(external_model_adapter, "close", side_effect=RuntimeError("boom")) as external_close:
+            await container.aclose()
+        
+        civitai_close.assert_awaited_once()
+        external_close.assert_awaited_once()
 
 
 class TestAssetManagerApplication:
@@ -208,7 +235,22 @@ class TestAssetManagerApplication:
         
         app.initialize()
         assert app._initialized
-    
+
+    def test_initialization_defers_service_construction(self, test_config):
+        """Test that services are only built on first use."""
+        app = AssetManagerApplication(test_config)
+
+        app.initialize()
+
+        assert not any(app.container.prepare_index().values())
+        assert app.get_health_status()["services"]["model_service"] == "not_loaded"
+
+        app.container.get_model_service()
+
+        assert app.container.prepare_index()["model_service"] is True
+        with patch.object(AssetManagerApplication, "HEALTH_TTL_SECONDS", 0):
+            assert app.get_health_status()["services"]["model_service"] == "available"
+
     def test_application_double_initialization(self, test_config):
         """Test that double initialization is handled gracefully."""
         app = AssetManagerApplication(test_config)
@@ -236,6 +278,24 @@ class TestAssetManagerApplication:
         # Verify middlewares were added
         assert mock_web_app.middlewares.append.call_count >= 1
     
+    @pytest.mark.asyncio
+    async def test_error_middleware_returns_generic_json_error(self, test_config):
+        """Test that unhandled errors become a generic JSON 500 response."""
+        app = AssetManagerApplication(test_config)
+
+        async def failing_handler(request):
+            raise RuntimeError("boom")
+
+        response = await app._error_middleware(MagicMock(), failing_handler)
+
+        assert response.status == 500
+        assert response.content_type == "application/json"
+        assert json.loads(response.body) == {
+            "success": False,
+            "error": "An internal server error occurred",
+            "error_type": "internal_error"
+        }
+    
     def test_health_status_not_initialized(self, test_config):
         """Test health status when application is not initialized."""
         app = AssetManagerApplication(test_config)
@@ -252,11 +312,115 @@ class TestAssetManagerApplication:
         
         health = app.get_health_status()
         
-        assert health["status"] == "healthy"
+        assert health["status"] == "ready"
         assert health["initialized"] is True
         assert "services" in health
         assert "cache_stats" in health
     
+    def test_eager_initialization_builds_services(self, test_config):
+        """Test that eager initialization builds services and reports healthy."""
+        app = AssetManagerApplication(test_config)
+        app.initialize(eager=True)
+        
+        assert all(app.container.prepare_index().values())
+        assert app.get_health_status()["status"] == "healthy"
+    
+    def test_eager_initialization_fails_fast(self, test_config):
+        """Test that eager initialization surfaces service construction errors."""
+        app = AssetManagerApplication(test_config)
+        
+        with patch('src.container.ModelService', side_effect=ValueError("bad config")):
+            with pytest.raises(ValueError, match="bad config"):
+                app.initialize(eager=True)
+        
+        assert not app._initialized
+    
+    def test_health_status_reports_disabled_external_service(self, test_config):
+        """Test that disabled external APIs do not keep the status at ready."""
+        test_config.external_apis.civitai_enabled = False
+        test_config.external_apis.huggingface_enabled = False
+        app = AssetManagerApplication(test_config)
+        app.initialize(eager=True)
+        
+        health = app.get_health_status()
+        
+        assert health["services"]["external_model_service"] == "disabled"
+        assert health["status"] == "healthy"
+    
+    def test_health_status_is_cached_within_ttl(self, test_config):
+        """Test that repeated health checks reuse the cached report."""
+        app = AssetManagerApplication(test_config)
+        app.initialize()
+
+        with patch.object(app, "_compute_health_status", wraps=app._compute_health_status) as compute:
+            first = app.get_health_status()
+            second = app.get_health_status()
+
+        assert first is second
+        compute.assert_called_once()
+
+    def test_health_status_serves_stale_report_on_failure(self, test_config):
+        """Test that a failed refresh falls back to the last good report."""
+        app = AssetManagerApplication(test_config)
+        app.initialize()
+        healthy = app.get_health_status()
+
+        with patch.object(AssetManagerApplication, "HEALTH_TTL_SECONDS", 0), \
+                patch.object(app, "_compute_health_status", side_effect=RuntimeError("boom")):
+            assert app.get_health_status() is healthy
+
+            with patch.object(AssetManagerApplication, "HEALTH_STALE_IF_ERROR_SECONDS", 0):
+                assert app.get_health_status()["status"] == "unhealthy"
+
+    @pytest.mark.asyncio
+    async def test_async_health_status_revalidates_in_background(self, test_config):
+        """Test that a stale report is returned while a refresh runs."""
+        app = AssetManagerApplication(test_config)
+        app.initialize()
+        stale = await app.get_health_status_async()
+
+        with patch.object(AssetManagerApplication, "HEALTH_TTL_SECONDS", 0):
+            assert await app.get_health_status_async() is stale
+            await app._health_refresh
+
+        assert app.get_health_status() is not stale
+
+    @pytest.mark.asyncio
+    async def test_async_health_refresh_runs_off_event_loop(self, test_config):
+        """Test that the background refresh does not run on the loop thread."""
+        app = AssetManagerApplication(test_config)
+        app.initialize()
+        await app.get_health_status_async()
+        threads = []
+
+        def compute():
+            threads.append(threading.get_ident())
+            return {"status": "healthy"}
+
+        with patch.object(AssetManagerApplication, "HEALTH_TTL_SECONDS", 0), \
+                patch.object(app, "_compute_health_status", side_effect=compute):
+            await app.get_health_status_async()
+            await app._health_refresh
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_health_refresh(self, test_config):
+        """Test that shutdown cancels a pending background refresh."""
+        app = AssetManagerApplication(test_config)
+        app.initialize()
+        await app.get_health_status_async()
+
+        with patch.object(AssetManagerApplication, "HEALTH_TTL_SECONDS", 0):
+            await app.get_health_status_async()
+        refresh = app._health_refresh
+
+        app.shutdown()
+
+        with pytest.raises(asyncio.CancelledError):
+            await refresh
+        assert app._health_refresh is None
+
     def test_application_shutdown(self, test_config):
         """Test application shutdown."""
         app = AssetManagerApplication(test_config)
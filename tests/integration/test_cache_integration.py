@@ -3,7 +3,7 @@
 import tempfile
 import time
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -67,10 +67,10 @@ def sample_external_metadata():
 class TestCacheIntegration:
     """Integration tests for cache adapter with domain services."""
     
-    def test_metadata_service_with_cache_adapter(self, cache_adapter, sample_model, sample_external_metadata):
+    async def test_metadata_service_with_cache_adapter(self, cache_adapter, sample_model, sample_external_metadata):
         """Test MetadataService using FileCacheAdapter for caching."""
         # Create mock external metadata ports
-        mock_civitai_port = Mock()
+        mock_civitai_port = AsyncMock()
         mock_civitai_port.fetch_metadata.return_value = sample_external_metadata
         
         # Create metadata service with cache adapter
@@ -82,7 +82,7 @@ class TestCacheIntegration:
         )
         
         # First call should fetch from external source and cache
-        result1 = metadata_service.enrich_metadata(sample_model)
+        result1 = await metadata_service.enrich_metadata(sample_model)
         
         assert result1 is not None
         assert result1.civitai is not None
@@ -90,7 +90,7 @@ class TestCacheIntegration:
         assert mock_civitai_port.fetch_metadata.call_count == 1
         
         # Second call should use cached data
-        result2 = metadata_service.enrich_metadata(sample_model)
+        result2 = await metadata_service.enrich_metadata(sample_model)
         
         assert result2 is not None
         assert result2.civitai is not None
@@ -102,10 +102,10 @@ class TestCacheIntegration:
         assert result1.model_hash == result2.model_hash
         assert result1.civitai.model_id == result2.civitai.model_id
     
-    def test_cache_expiration_with_metadata_service(self, cache_adapter, sample_model):
+    async def test_cache_expiration_with_metadata_service(self, cache_adapter, sample_model):
         """Test that expired cache entries are handled correctly."""
         # Create mock external metadata port
-        mock_civitai_port = Mock()
+        mock_civitai_port = AsyncMock()
         civitai_metadata = CivitAIMetadata(
             model_id=12345,
             name="Test Model",
@@ -133,7 +133,7 @@ class TestCacheIntegration:
         )
         
         # First call should fetch and cache
-        result1 = metadata_service.enrich_metadata(sample_model)
+        result1 = await metadata_service.enrich_metadata(sample_model)
         assert result1 is not None
         assert mock_civitai_port.fetch_metadata.call_count == 1
         
@@ -141,14 +141,14 @@ class TestCacheIntegration:
         time.sleep(1.1)
         
         # Second call should fetch again due to expiration
-        result2 = metadata_service.enrich_metadata(sample_model)
+        result2 = await metadata_service.enrich_metadata(sample_model)
         assert result2 is not None
         assert mock_civitai_port.fetch_metadata.call_count == 2
     
-    def test_cache_persistence_across_service_instances(self, cache_adapter, sample_model):
+    async def test_cache_persistence_across_service_instances(self, cache_adapter, sample_model):
         """Test that cache persists across different service instances."""
         # Create mock external metadata port
-        mock_civitai_port = Mock()
+        mock_civitai_port = AsyncMock()
         civitai_metadata = CivitAIMetadata(
             model_id=12345,
             name="Test Model",
@@ -175,7 +175,7 @@ class TestCacheIntegration:
         )
         
         # Fetch and cache data
-        result1 = service1.enrich_metadata(sample_model)
+        result1 = await service1.enrich_metadata(sample_model)
         assert result1 is not None
         assert mock_civitai_port.fetch_metadata.call_count == 1
         
@@ -187,7 +187,7 @@ class TestCacheIntegration:
         )
         
         # Should use cached data from first instance
-        result2 = service2.enrich_metadata(sample_model)
+        result2 = await service2.enrich_metadata(sample_model)
         assert result2 is not None
         # Should not call external port again
         assert mock_civitai_port.fetch_metadata.call_count == 1
@@ -196,7 +196,7 @@ class TestCacheIntegration:
         assert result1.model_hash == result2.model_hash
         assert result1.civitai.model_id == result2.civitai.model_id
     
-    def test_cache_error_handling_in_service(self, sample_model):
+    async def test_cache_error_handling_in_service(self, sample_model):
         """Test that cache errors don't break the metadata service."""
         # Create a mock cache that always raises errors
         mock_cache = Mock()
@@ -204,7 +204,7 @@ class TestCacheIntegration:
         mock_cache.set.side_effect = Exception("Cache error")
         
         # Create mock external metadata port
-        mock_civitai_port = Mock()
+        mock_civitai_port = AsyncMock()
         civitai_metadata = CivitAIMetadata(
             model_id=12345,
             name="Test Model",
@@ -231,7 +231,7 @@ class TestCacheIntegration:
         )
         
         # Should still work despite cache errors
-        result = metadata_service.enrich_metadata(sample_model)
+        result = await metadata_service.enrich_metadata(sample_model)
         assert result is not None
         assert result.civitai is not None
         assert result.civitai.name == "Test Model"
@@ -263,10 +263,10 @@ class TestCacheIntegration:
         assert result.civitai is not None
         assert result.civitai.name == "Test Model"
     
-    def test_clear_cache_functionality(self, cache_adapter, sample_model):
+    async def test_clear_cache_functionality(self, cache_adapter, sample_model):
         """Test cache clearing functionality."""
         # Create mock external metadata port
-        mock_civitai_port = Mock()
+        mock_civitai_port = AsyncMock()
         civitai_metadata = CivitAIMetadata(
             model_id=12345,
             name="Test Model",
@@ -293,7 +293,7 @@ class TestCacheIntegration:
         )
         
         # Fetch and cache data
-        result1 = metadata_service.enrich_metadata(sample_model)
+        result1 = await metadata_service.enrich_metadata(sample_model)
         assert result1 is not None
         assert mock_civitai_port.fetch_metadata.call_count == 1
         
@@ -301,7 +301,7 @@ class TestCacheIntegration:
         metadata_service.clear_cache()
         
         # Next call should fetch again
-        result2 = metadata_service.enrich_metadata(sample_model)
+        result2 = await metadata_service.enrich_metadata(sample_model)
         assert result2 is not None
         assert mock_civitai_port.fetch_metadata.call_count == 2
     
@@ -1,8 +1,6 @@
 """Integration tests for output functionality."""
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from PIL import Image
 import json
@@ -14,25 +12,6 @@ from src.domain.services.output_service import OutputService
 class TestOutputIntegration:
     """Integration tests for output functionality."""
     
-    @pytest.fixture
-    def temp_comfyui_dir(self):
-        """Create a temporary ComfyUI directory structure."""
-        temp_dir = tempfile.mkdtemp()
-        comfyui_dir = Path(temp_dir) / "ComfyUI"
-        comfyui_dir.mkdir()
-        
-        # Create ComfyUI indicator files
-        (comfyui_dir / "main.py").write_text("# ComfyUI main file")
-        (comfyui_dir / "nodes.py").write_text("# ComfyUI nodes")
-        (comfyui_dir / "execution.py").write_text("# ComfyUI execution")
-        (comfyui_dir / "folder_paths.py").write_text("# ComfyUI folder paths")
-        (comfyui_dir / "custom_nodes").mkdir()
-        (comfyui_dir / "models").mkdir()
-        (comfyui_dir / "output").mkdir()
-        
-        yield str(comfyui_dir)
-        shutil.rmtree(temp_dir)
-    
     @pytest.fixture
     def output_adapter(self, temp_comfyui_dir):
         """Create output adapter for testing."""
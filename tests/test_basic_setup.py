@@ -159,13 +159,13 @@ class TestBasicSetup:
                 file_format="png"
             )
     
-    def test_container_integration(self):
+    def test_container_integration(self, tmp_path):
         """Test that the dependency injection container can create output service."""
         from src.container import DIContainer
-        from src.config import ApplicationConfig
+        from src.config import ApplicationConfig, CacheConfig
         
         # Create test config
-        config = ApplicationConfig()
+        config = ApplicationConfig(cache=CacheConfig(cache_dir=str(tmp_path)))
         
         # Create container
         container = DIContainer(config)
@@ -42,3 +42,23 @@ def test_prefix_constant():
     assert logger.PREFIX == "[ComfyUI-Asset-Manager]"
 
 
+def test_log_writes_to_explicit_stream():
+    from unittest.mock import Mock
+    from src.utils import logger
+
+    stream = Mock()
+    logger.log("to", "stream", file=stream)
+    # The whole line goes out in a single write
+    stream.write.assert_called_once_with("[ComfyUI-Asset-Manager] to stream\n")
+
+
+def test_log_without_console_is_silent(monkeypatch, capsys):
+    from src.utils import logger
+
+    monkeypatch.setattr("sys.stdout", None)
+    assert logger.info("nobody listening") is None
+    monkeypatch.undo()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""